@@ -1,140 +1,163 @@
-from PyQt5 import QtCore
-from PyQt5.QtWidgets import QApplication, QVBoxLayout, QMainWindow, QWidget, QLabel
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-import folium
-from pymavlink import mavutil
-import threading
-import os
-from folium import CustomIcon
-
-
-class HaritaPenceresi(QMainWindow):
-    update_signal = QtCore.pyqtSignal(float, float, float)  # Haritayı güncellemek için sinyal
-
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Harita Uygulaması")
-        self.setGeometry(100, 100, 800, 600)
-
-        # Harita widget'ı
-        self.webView = QWebEngineView()
-        self.map_path = os.path.abspath("Map1.html")
-        self.path = []  # Yol çizgisi için koordinat listesi
-        self.initialize_map(0, 0)  # Varsayılan başlangıç konumu
-        self.webView.setUrl(QtCore.QUrl.fromLocalFile(self.map_path))
-
-        # GPS verileri için etiket
-        self.gps_label = QLabel("GPS Verileri Bekleniyor...", self)
-        self.gps_label.setAlignment(QtCore.Qt.AlignCenter)
-
-        # Layout
-        layout = QVBoxLayout()
-        layout.addWidget(self.webView)
-        layout.addWidget(self.gps_label)
-
-        container = QWidget()
-        container.setLayout(layout)
-        self.setCentralWidget(container)
-
-        # GPS log dosyasını aç
-        self.gps_log = open("gps_log.txt", "w")  # GPS verilerini kaydetmek için dosya
-
-        # Signal bağlantısı
-        self.update_signal.connect(self.update_map)
-
-        # MAVLink verilerini Pixhawk'tan almak için bir iş parçacığı başlat
-        self.thread = threading.Thread(target=self.mavlink_reader, daemon=True)
-        self.thread.start()
-
-    def initialize_map(self, latitude, longitude):
-        """Harita dosyasını oluşturur ve başlangıç konumunu işaretler."""
-        # Eğer harita daha önce oluşturulmadıysa, sadece başlat
-        if not hasattr(self, 'map'):
-            self.map = folium.Map(location=[latitude, longitude], zoom_start=20)
-
-            # Geçmiş yol çizgisi varsa, haritaya ekleyin
-            if self.path:
-                folium.PolyLine(self.path, color="blue", weight=2.5, opacity=0.8).add_to(self.map)
-
-            # Uçak simgesini oluştur
-            airplane_icon = CustomIcon('plane.png', icon_size=(40, 40))
-
-            # Mevcut konumu uçak simgesiyle işaretle
-            folium.Marker(
-                location=[latitude, longitude],
-                popup="Mevcut İHA Konumu",
-                icon=airplane_icon
-            ).add_to(self.map)
-
-            # Haritayı kaydet
-            self.map.save(self.map_path)
-        else:
-            # Harita zaten varsa, sadece konum ekleyin
-            airplane_icon = CustomIcon('plane.png', icon_size=(40, 40))
-            folium.Marker(
-                location=[latitude, longitude],
-                popup="Mevcut İHA Konumu",
-                icon=airplane_icon
-            ).add_to(self.map)
-
-        # Haritayı kaydet
-        self.map.save(self.map_path)
-
-    def update_map(self, latitude, longitude, altitude):
-        """Harita üzerindeki konumu günceller."""
-        self.path.append((latitude, longitude))  # Yol çizgisine yeni konumu ekle
-        self.initialize_map(latitude, longitude)  # Haritayı güncelle
-
-        # WebEngineView'i yeniden yükle
-        self.webView.setUrl(QtCore.QUrl.fromLocalFile(self.map_path))
-
-        # GPS verisini ekranda güncelle
-        self.gps_label.setText(f"Latitude: {latitude}, Longitude: {longitude}, Altitude: {altitude} m")
-
-    def mavlink_reader(self):
-        """Pixhawk'tan GPS verilerini MAVLink protokolüyle okur."""
-        try:
-            # Pixhawk'a bağlan (seri portu ve baudrate'i kendi sisteminize göre ayarlayın)
-            connection = mavutil.mavlink_connection('COM9', baud=115200)  # Doğru COM portunu kullanın
-            connection.wait_heartbeat()  # Pixhawk ile bağlantıyı doğrula
-            print("Pixhawk ile bağlantı kuruldu!")
-
-            connection.mav.request_data_stream_send(
-                connection.target_system,
-                connection.target_component,
-                mavutil.mavlink.MAV_DATA_STREAM_ALL,
-                2,  # Frekans (Hz)
-                1  # Başlat (1) veya durdur (0)
-            )
-
-            while True:
-                # GPS_RAW_INT mesajını al
-                msg = connection.recv_match(type='GPS_RAW_INT', blocking=True)
-                if msg:
-                    # GPS verilerini çöz
-                    latitude = msg.lat / 1e7  # Enlem
-                    longitude = msg.lon / 1e7  # Boylam
-                    altitude = msg.alt / 1000  # Yükseklik (metre)
-
-                    # Sinyali tetikle
-                    self.update_signal.emit(latitude, longitude, altitude)
-                    print(f"Latitude: {latitude}, Longitude: {longitude}, Altitude: {altitude}")
-                    self.gps_log.write(f"{latitude}, {longitude}, {altitude}\n")
-                    self.gps_log.flush()
-
-
-        except Exception as e:
-            print(f"MAVLink Error: {e}")
-            self.gps_label.setText(f"GPS Bağlantı Hatası: {e}")
-
-    def __del__(self):
-        """Kapanışta dosyayı kapat."""
-        if hasattr(self, 'gps_log'):
-            self.gps_log.close()
-
-
-if __name__ == "__main__":
-    app = QApplication([])
-    pencere = HaritaPenceresi()
-    pencere.show()
-    app.exec_()
+from PyQt5 import QtCore
+from PyQt5.QtWidgets import QApplication, QVBoxLayout, QMainWindow, QWidget, QLabel
+from PyQt5.QtWebEngineWidgets import QWebEngineView
+import argparse
+import folium
+from telemetri import TelemetriMerkezi, UcusKaydedici
+from telemetri.cozucu import konum_coz
+import os
+import sys
+from folium import CustomIcon
+from harita_koprusu import CanliHarita, harita_olustur
+from karo_onbellegi import paylasilan_sunucu
+from iz_kaydi import IzDeposu
+from varliklar import depo
+
+
+class HaritaPenceresi(QMainWindow):
+    update_signal = QtCore.pyqtSignal(float, float, float)  # Haritayı güncellemek için sinyal
+    heading_signal = QtCore.pyqtSignal(float)  # Uçak simgesinin yönü için sinyal
+
+    def __init__(self, canli=True, kaydet=False):
+        """``kaydet`` verilirse merkezin ham MAVLink mesajları tlog'a kaydedilir.
+
+        Kaydedici merkez başına paylaşılır; aynı merkezi kaydeden başka bir
+        pencere varsa ikinci bir kayıt açılmaz.
+        """
+        super().__init__()
+        self.setWindowTitle("Harita Uygulaması")
+        self.setGeometry(100, 100, 800, 600)
+
+        # Harita widget'ı
+        self.webView = QWebEngineView()
+        self.map_path = os.path.abspath("Map1.html")
+        self.iz = IzDeposu()  # Sadeleştirilmiş geçmiş + tam çözünürlüklü son noktalar
+        self.heading = None  # Son bilinen rota (derece)
+
+        # Karolar yerel önbellek sunucusundan gelir (karolar.mbtiles)
+        self.karo_url = paylasilan_sunucu().url_sablonu
+
+        # Canlı modda sayfa bir kez yüklenir, sonraki güncellemeler JS ile yapılır
+        self.canli = canli
+        if self.canli:
+            self.canli_harita = CanliHarita(self.webView, self.map_path, self.iz, ikon=depo.dosya_yolu('plane.png'),
+                                            karo_url=self.karo_url)
+            self.canli_harita.yukle(0, 0)  # Varsayılan başlangıç konumu
+        else:
+            self.initialize_map(0, 0)  # Varsayılan başlangıç konumu
+            self.webView.setUrl(QtCore.QUrl.fromLocalFile(self.map_path))
+
+        # GPS verileri için etiket
+        self.gps_label = QLabel("GPS Verileri Bekleniyor...", self)
+        self.gps_label.setAlignment(QtCore.Qt.AlignCenter)
+
+        # Layout
+        layout = QVBoxLayout()
+        layout.addWidget(self.webView)
+        layout.addWidget(self.gps_label)
+
+        container = QWidget()
+        container.setLayout(layout)
+        self.setCentralWidget(container)
+
+        # Signal bağlantısı
+        self.update_signal.connect(self.update_map)
+        self.heading_signal.connect(self.update_heading)
+
+        # MAVLink verilerini paylaşılan telemetri merkezinden al
+        # (seri portu ve baudrate'i kendi sisteminize göre ayarlayın)
+        self.merkez = TelemetriMerkezi.paylasilan('COM9', 115200)  # Doğru COM portunu kullanın
+        self.merkez.hiz.talep_et(self, {'GPS_RAW_INT': 5})  # Yalnızca GPS, 5 Hz
+        self.abone = self.merkez.abone_ol(self.gps_mesaji, tipler=('GPS_RAW_INT',), ad="Harita paneli")
+
+        # İstenirse tüm ham MAVLink mesajlarını oturum başına yeni bir tlog dosyasına kaydet
+        self.kaydedici = UcusKaydedici.paylasilan(self.merkez) if kaydet else None
+
+    def initialize_map(self, latitude, longitude):
+        """Harita dosyasını oluşturur ve başlangıç konumunu işaretler."""
+        # Eğer harita daha önce oluşturulmadıysa, sadece başlat
+        if not hasattr(self, 'map'):
+            self.map = harita_olustur(latitude, longitude, 20, self.karo_url)
+
+            # Geçmiş yol çizgisi varsa, haritaya ekleyin
+            if len(self.iz):
+                folium.PolyLine(self.iz.noktalar(), color="blue", weight=2.5, opacity=0.8).add_to(self.map)
+
+            # Uçak simgesini oluştur
+            airplane_icon = CustomIcon(depo.dosya_yolu('plane.png'), icon_size=(40, 40))
+
+            # Mevcut konumu uçak simgesiyle işaretle
+            folium.Marker(
+                location=[latitude, longitude],
+                popup="Mevcut İHA Konumu",
+                icon=airplane_icon
+            ).add_to(self.map)
+
+            # Haritayı kaydet
+            self.map.save(self.map_path)
+        else:
+            # Harita zaten varsa, sadece konum ekleyin
+            airplane_icon = CustomIcon(depo.dosya_yolu('plane.png'), icon_size=(40, 40))
+            folium.Marker(
+                location=[latitude, longitude],
+                popup="Mevcut İHA Konumu",
+                icon=airplane_icon
+            ).add_to(self.map)
+
+        # Haritayı kaydet
+        self.map.save(self.map_path)
+
+    def update_heading(self, heading):
+        """Uçak simgesinin yönünü saklar; bir sonraki konum güncellemesiyle gönderilir."""
+        self.heading = heading
+
+    def update_map(self, latitude, longitude, altitude):
+        """Harita üzerindeki konumu günceller."""
+        degisiklik = self.iz.ekle(latitude, longitude)  # Yol çizgisine yeni konumu ekle
+
+        if self.canli:
+            # Sayfayı yeniden yüklemeden işaretçiyi ve izin değişen kısmını güncelle
+            self.canli_harita.guncelle(latitude, longitude, self.heading, degisiklik)
+        else:
+            self.initialize_map(latitude, longitude)  # Haritayı güncelle
+
+            # WebEngineView'i yeniden yükle
+            self.webView.setUrl(QtCore.QUrl.fromLocalFile(self.map_path))
+
+        # GPS verisini ekranda güncelle
+        self.gps_label.setText(f"Latitude: {latitude}, Longitude: {longitude}, Altitude: {altitude} m")
+
+    def gps_mesaji(self, msg):
+        """Telemetri merkezinin iş parçacığında her GPS_RAW_INT mesajı için çağrılır."""
+        # GPS verilerini çöz ve doğrula (enlem, boylam derece; irtifa metre)
+        try:
+            kayit = konum_coz(msg)
+        except ValueError as e:
+            print(f"Invalid GPS data: {e}")
+            return
+
+        # Sinyali tetikle (rota bilinmiyorsa None gelir)
+        if kayit.rota is not None:
+            self.heading_signal.emit(kayit.rota)
+        self.update_signal.emit(kayit.enlem, kayit.boylam, kayit.irtifa)
+        print(f"Latitude: {kayit.enlem}, Longitude: {kayit.boylam}, Altitude: {kayit.irtifa}")
+
+    def closeEvent(self, event):
+        """Pencere kapanırken kaydı bırak ve telemetri aboneliğini kaldır."""
+        if self.kaydedici is not None:
+            self.kaydedici.birak()
+            self.kaydedici = None
+        self.merkez.hiz.talebi_kaldir(self)
+        self.merkez.abonelikten_cik(self.abone)
+        self.merkez.birak()
+        event.accept()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--kaydet", action="store_true", help="ham MAVLink mesajlarını kayitlar/ altına tlog olarak kaydet")
+    args, qt_args = parser.parse_known_args()
+    app = QApplication(sys.argv[:1] + qt_args)
+    pencere = HaritaPenceresi(kaydet=args.kaydet)
+    pencere.show()
+    app.exec_()
@@ -1,85 +1,99 @@
-from PyQt5.QtWidgets import QApplication, QMainWindow, QGraphicsView, QGraphicsScene, QGraphicsPixmapItem
-from PyQt5.QtCore import QThread, pyqtSignal, Qt
-from PyQt5.QtGui import QImage, QPixmap
-import sys
-import cv2  # OpenCV kütüphanesi
-
-class CameraThread(QThread):
-    frame_ready = pyqtSignal(QImage)
-
-    def __init__(self, camera_index=0):
-        super().__init__()
-        self.camera_index = camera_index
-        self.running = True
-        self.cap = cv2.VideoCapture(self.camera_index)
-        self.cap.set(3, 500)  # Genişlik
-        self.cap.set(4, 500)  # Yükseklik
-
-    def run(self):
-        while self.running:
-            ret, frame = self.cap.read()
-            if ret:
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = frame.shape
-                qimg = QImage(frame.data, w, h, ch * w, QImage.Format_RGB888)
-                self.frame_ready.emit(qimg)
-
-    def stop(self):
-        self.running = False
-        if self.cap.isOpened():
-            self.cap.release()
-        self.quit()
-        self.wait()
-
-
-class CameraDisplay(QGraphicsView):
-    def __init__(self):
-        super().__init__()
-        self.scene = QGraphicsScene()
-        self.setScene(self.scene)
-        self.setFixedSize(500, 400)  # Kamera görüntüsü boyutu
-
-        # Kamera görüntüsü için QGraphicsPixmapItem
-        self.image_item = QGraphicsPixmapItem()
-        self.scene.addItem(self.image_item)
-
-        # Ekranı ortalamak için
-        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-    def update_image(self, qimg):
-        """ Kamera görüntüsünü günceller """
-        self.image_item.setPixmap(QPixmap.fromImage(qimg))
-
-
-class MainApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Kamera Görüntüsü")
-        self.setGeometry(0, 0, 500, 400)  # Pencere boyutu
-        self.setFixedSize(500, 400)
-
-        # Ekranın tam ortasında başlasın
-        screen_rect = self.frameGeometry()
-        screen_center = QApplication.primaryScreen().availableGeometry().center()
-        screen_rect.moveCenter(screen_center)
-        self.move(screen_rect.topLeft())
-
-        self.camera_display = CameraDisplay()
-        self.setCentralWidget(self.camera_display)
-
-        self.camera_thread = CameraThread()
-        self.camera_thread.frame_ready.connect(self.camera_display.update_image)
-        self.camera_thread.start()
-
-    def closeEvent(self, event):
-        """ Uygulama kapatılırken thread'leri güvenli şekilde durdurur """
-        self.camera_thread.stop()
-        event.accept()
-
-
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = MainApp()
-    window.show()
-    sys.exit(app.exec_())
+from PyQt5.QtWidgets import QApplication, QMainWindow, QGraphicsView, QGraphicsScene, QShortcut
+from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtGui import QKeySequence
+import sys
+from kamera_hatti import CameraThread, KameraOgesi, TespitOgesi
+
+class CameraDisplay(QGraphicsView):
+    def __init__(self):
+        super().__init__()
+        self.scene = QGraphicsScene()
+        self.setScene(self.scene)
+        self.setFixedSize(500, 400)  # Kamera görüntüsü boyutu
+
+        # Kamera görüntüsü için doğrudan çizen öğe
+        self.image_item = KameraOgesi()
+        self.scene.addItem(self.image_item)
+        self.tespit_item = TespitOgesi(self.image_item)
+
+        # Ekranı ortalamak için
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+    def update_image(self, kare):
+        """ Kamera görüntüsünü günceller """
+        self.image_item.kare_goster(kare)
+
+    def update_tespit(self, tespit):
+        self.tespit_item.tespit_goster(tespit)
+
+
+class MainApp(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Kamera Görüntüsü")
+        self.setGeometry(0, 0, 500, 400)  # Pencere boyutu
+        self.setFixedSize(500, 400)
+
+        # Ekranın tam ortasında başlasın
+        screen_rect = self.frameGeometry()
+        screen_center = QApplication.primaryScreen().availableGeometry().center()
+        screen_rect.moveCenter(screen_center)
+        self.move(screen_rect.topLeft())
+
+        self.camera_display = CameraDisplay()
+        self.setCentralWidget(self.camera_display)
+
+        self.camera_thread = CameraThread(genislik=500, yukseklik=500)
+        self.camera_thread.frame_ready.connect(self.camera_display.update_image)
+        self.camera_thread.tespit_ready.connect(self.camera_display.update_tespit)
+        self.camera_thread.start()
+
+        # Yakalanan/gösterilen/düşen kareler ve gecikme saniyede bir durum çubuğunda
+        self.durum_zamanlayici = QTimer(self)
+        self.durum_zamanlayici.timeout.connect(self.durum_guncelle)
+        self.durum_zamanlayici.start(1000)
+
+        # F9: görüntüyü kayitlar/ altına video olarak kaydetmeyi aç/kapat
+        QShortcut(QKeySequence(Qt.Key_F9), self, self.kayit_ac_kapat)
+        # F8: hedef tespitini aç/kapat
+        QShortcut(QKeySequence(Qt.Key_F8), self, self.tespit_ac_kapat)
+
+    def tespit_ac_kapat(self):
+        if self.camera_thread.tespit is None:
+            self.camera_thread.tespit_baslat()
+        else:
+            self.camera_thread.tespit_durdur()
+
+    def kayit_ac_kapat(self):
+        if self.camera_thread.kaydedici is None:
+            self.camera_thread.kayit_baslat()
+        else:
+            self.camera_thread.kayit_durdur()
+        self.durum_guncelle()
+
+    def durum_guncelle(self):
+        d = self.camera_thread.yayici.istatistik()
+        self.statusBar().showMessage(
+            f"Yakalanan {d['yakalanan']}  Gösterilen {d['gosterilen']}  Düşen {d['dusurulen']}  "
+            f"Gecikme {d['son_gecikme_ms']:.0f} ms (p99 {d['gecikme_p99_ms']:.0f})"
+            + self.kayit_durumu())
+
+    def kayit_durumu(self):
+        kaydedici = self.camera_thread.kaydedici
+        if kaydedici is None:
+            return ""
+        k = kaydedici.istatistik()
+        return f"  ● KAYIT {k['kaydedilen']} kare, {k['segment']} parça, düşen {k['dusurulen']}"
+
+    def closeEvent(self, event):
+        """ Uygulama kapatılırken thread'leri güvenli şekilde durdurur """
+        self.camera_thread.stop()
+        event.accept()
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = MainApp()
+    window.show()
+    sys.exit(app.exec_())
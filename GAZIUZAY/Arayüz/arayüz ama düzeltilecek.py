@@ -1,440 +1,597 @@
-from PyQt5 import QtCore, QtWidgets, QtGui
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel,
-                             QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QGridLayout,
-                             QSpacerItem, QSizePolicy, QHBoxLayout)
-from PyQt5.QtGui import QPixmap, QTransform, QColor, QPen, QImage
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-from pymavlink import mavutil
-import os
-import sys
-import folium
-from folium import CustomIcon
-import cv2
-import sqlite3
-
-
-# ---------------------- Harita Penceresi ----------------------
-class HaritaPenceresi(QMainWindow):
-    update_signal = QtCore.pyqtSignal(float, float, float)
-
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Harita Uygulaması")
-        self.setGeometry(100, 100, 800, 600)
-        self.webView = QWebEngineView()
-        self.map_path = os.path.abspath("Map1.html")
-        self.path = []
-        self.initialize_map(0, 0)
-        self.webView.setUrl(QtCore.QUrl.fromLocalFile(self.map_path))
-
-        self.gps_label = QLabel("GPS Verileri Bekleniyor...", self)
-        self.gps_label.setAlignment(Qt.AlignCenter)
-
-        layout = QVBoxLayout()
-        layout.addWidget(self.webView)
-        layout.addWidget(self.gps_label)
-
-        container = QWidget()
-        container.setLayout(layout)
-        self.setCentralWidget(container)
-
-        self.update_signal.connect(self.update_map)
-
-    def initialize_map(self, latitude, longitude):
-        self.map = folium.Map(location=[latitude, longitude], zoom_start=20)
-        if self.path:
-            folium.PolyLine(self.path, color="blue", weight=2.5, opacity=0.8).add_to(self.map)
-        airplane_icon = CustomIcon('plane.png', icon_size=(40, 40))
-        folium.Marker(
-            location=[latitude, longitude],
-            popup="Mevcut İHA Konumu",
-            icon=airplane_icon
-        ).add_to(self.map)
-        self.map.save(self.map_path)
-
-    def update_map(self, latitude, longitude, altitude):
-        self.path.append((latitude, longitude))
-        self.initialize_map(latitude, longitude)
-        self.webView.setUrl(QtCore.QUrl.fromLocalFile(self.map_path))
-        self.gps_label.setText(f"Latitude: {latitude}, Longitude: {longitude}, Altitude: {altitude} m")
-
-
-# ---------------------- Hareket Penceresi ----------------------
-class HaraketPenceresi(QGraphicsView):
-    def __init__(self):
-        super().__init__()
-        self.scene = QGraphicsScene()
-        self.setScene(self.scene)
-        self.setFixedSize(400, 300)
-        self.image_width = 2000
-        self.image_height = 6608
-        # Load image
-        self.image_item = QGraphicsPixmapItem(QPixmap("Horizon_GroundSky5.bmp"))
-        self.scene.addItem(self.image_item)
-        # Cross lines in the center
-        self.cross_horizontal = self.scene.addLine(-20, 0, 20, 0, pen=QPen(QColor("red"), 2))
-        self.cross_vertical = self.scene.addLine(0, -20, 0, 20, pen=QPen(QColor("red"), 2))
-        # Place the cross in the image center
-        self.cross_horizontal.setPos(self.width() / 2, self.height() / 2)
-        self.cross_vertical.setPos(self.width() / 2, self.height() / 2)
-
-    def yatay_guncelleme(self, pitch, roll):
-        center_x = self.image_width / 2
-        center_y = self.image_height / 2
-        transform = QTransform()
-        transform.translate(center_x, center_y)
-        transform.rotate(-roll)
-        transform.translate(-center_x, -center_y)
-        self.image_item.setTransform(transform)
-        self.image_item.setPos(
-            (self.width() - self.image_width) / 2,
-            (self.height() - self.image_height) / 2 + pitch * 12.8
-        )
-
-
-# ---------------------- Pixhawk Thread ----------------------
-class PixhawkThread(QThread):
-    update_gps = pyqtSignal(float, float, float)
-    update_horizon = pyqtSignal(float, float)
-    update_speed = pyqtSignal(float)
-    update_vertical_speed = pyqtSignal(float)
-
-    def __init__(self, port='COM5', baud=115200):
-        super().__init__()
-        self.port = port
-        self.baud = baud
-        self.running = True
-
-    def validate_gps_data(self, latitude, longitude, altitude):
-        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180 and altitude >= -500):
-            raise ValueError("Invalid GPS data")
-
-    def run(self):
-        try:
-            master = mavutil.mavlink_connection(self.port, baud=self.baud)
-            master.wait_heartbeat()
-            print("Pixhawk bağlantısı kuruldu!")
-            while self.running:
-                msg = master.recv_match(blocking=True)
-                if msg:
-                    if msg.get_type() == 'GPS_RAW_INT':
-                        latitude = msg.lat / 1e7
-                        longitude = msg.lon / 1e7
-                        altitude = msg.alt / 1000
-                        try:
-                            self.validate_gps_data(latitude, longitude, altitude)
-                            self.update_gps.emit(latitude, longitude, altitude)
-                        except ValueError as e:
-                            print(f"Invalid GPS data: {e}")
-                    elif msg.get_type() == 'ATTITUDE':
-                        pitch = msg.pitch * 60
-                        roll = msg.roll * 60
-                        self.update_horizon.emit(pitch, roll)
-                    elif msg.get_type() == 'VFR_HUD':
-                        speed = msg.groundspeed
-                        vertical_speed = msg.climb
-                        self.update_speed.emit(speed)
-                        self.update_vertical_speed.emit(vertical_speed)
-        except Exception as e:
-            print(f"Pixhawk bağlantı hatası: {e}")
-
-    def stop(self):
-        self.running = False
-        self.quit()
-        self.wait()
-
-
-# ---------------------- Kamera Thread ----------------------
-class CameraThread(QThread):
-    frame_ready = pyqtSignal(QImage)
-
-    def __init__(self, camera_index=0):
-        super().__init__()
-        self.camera_index = camera_index
-        self.running = True
-        self.cap = cv2.VideoCapture(self.camera_index)
-        self.cap.set(3, 400)  # Width
-        self.cap.set(4, 300)  # Height
-
-    def run(self):
-        while self.running:
-            ret, frame = self.cap.read()
-            if ret:
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = frame.shape
-                qimg = QImage(frame.data, w, h, ch * w, QImage.Format_RGB888)
-                self.frame_ready.emit(qimg)
-
-    def stop(self):
-        self.running = False
-        if self.cap.isOpened():
-            self.cap.release()
-        self.quit()
-        self.wait()
-
-
-# ---------------------- Kamera Görüntüleme ----------------------
-class CameraDisplay(QGraphicsView):
-    def __init__(self):
-        super().__init__()
-        self.scene = QGraphicsScene()
-        self.setScene(self.scene)
-        self.setFixedSize(400, 300)
-        self.image_item = QGraphicsPixmapItem()
-        self.scene.addItem(self.image_item)
-        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-
-    def update_image(self, qimg):
-        self.image_item.setPixmap(QPixmap.fromImage(qimg))
-
-
-# ---------------------- Air Speed Indicator ----------------------
-class AirSpeedIndicator(QGraphicsView):
-    update_speed = pyqtSignal(float)
-
-    def __init__(self):
-        super().__init__()
-        self.scene = QGraphicsScene()
-        self.setScene(self.scene)
-        self.setFixedSize(250, 250)
-        self.background = QGraphicsPixmapItem(QPixmap("AirSpeedIndicator_Background.PNG"))
-        self.scene.addItem(self.background)
-        self.background.setPos(0, 0)
-        self.mark_icon = QGraphicsPixmapItem(QPixmap("AirSpeedNeedle.PNG"))
-        self.scene.addItem(self.mark_icon)
-        bg_width = self.background.pixmap().width()
-        bg_height = self.background.pixmap().height()
-        ac_width = self.mark_icon.pixmap().width()
-        ac_height = self.mark_icon.pixmap().height()
-        self.mark_icon.setPos((bg_width - ac_width) / 2, ((bg_height - ac_height) / 2) - 30)
-        self.update_speed.connect(self.update_display)
-
-    def update_display(self, speed):
-        center_x = 12
-        center_y = 96
-        transform = QTransform()
-        transform.translate(center_x, center_y)
-        transform.rotate(180 + speed * 7.2)
-        transform.translate(-center_x, -center_y)
-        self.mark_icon.setTransform(transform)
-
-
-# ---------------------- Vertical Speed Indicator ----------------------
-class VerticalSpeedIndicator(QGraphicsView):
-    update_speed = pyqtSignal(float)
-
-    def __init__(self):
-        super().__init__()
-        self.scene = QGraphicsScene()
-        self.setScene(self.scene)
-        self.setFixedSize(250, 250)
-        self.background = QGraphicsPixmapItem(QPixmap("VerticalSpeedIndicator_Background.PNG"))
-        self.scene.addItem(self.background)
-        self.background.setPos(0, 0)
-        self.mark_icon = QGraphicsPixmapItem(QPixmap("VerticalSpeedNeedle.PNG"))
-        self.scene.addItem(self.mark_icon)
-        bg_width = self.background.pixmap().width()
-        bg_height = self.background.pixmap().height()
-        ac_width = self.mark_icon.pixmap().width()
-        ac_height = self.mark_icon.pixmap().height()
-        self.mark_icon.setPos((bg_width - ac_width) / 2, ((bg_height - ac_height) / 2) - 30)
-        self.update_speed.connect(self.update_display)
-
-    def update_display(self, speed):
-        center_x = 12
-        center_y = 96
-        transform = QTransform()
-        transform.translate(center_x, center_y)
-        transform.rotate(270 + speed * 25)
-        transform.translate(-center_x, -center_y)
-        self.mark_icon.setTransform(transform)
-
-
-# ---------------------- Turn Coordinator ----------------------
-class TurnCoordinator(QGraphicsView):
-    update_horizon = pyqtSignal(float, float)
-
-    def __init__(self):
-        super().__init__()
-        self.scene = QGraphicsScene()
-        self.setScene(self.scene)
-        self.setFixedSize(250, 250)
-        self.background = QGraphicsPixmapItem(QPixmap("TurnCoordinator_Background2.png"))
-        self.scene.addItem(self.background)
-        self.background.setPos(0, 0)
-        self.aircraft_icon = QGraphicsPixmapItem(QPixmap("DJV JUL 2357-12.png"))
-        self.scene.addItem(self.aircraft_icon)
-        bg_width = self.background.pixmap().width()
-        bg_height = self.background.pixmap().height()
-        ac_width = self.aircraft_icon.pixmap().width()
-        ac_height = self.aircraft_icon.pixmap().height()
-        self.aircraft_icon.setPos((bg_width - ac_width) / 2, ((bg_height - ac_height) / 2) - 15)
-        self.mark_icon = QGraphicsPixmapItem(QPixmap("TurnCoordinatorMarks.png"))
-        self.scene.addItem(self.mark_icon)
-        self.mark_icon.setPos(96, 158)
-        self.ball_indicator = QGraphicsPixmapItem(QPixmap("TurnCoordinatorBall,png.PNG"))
-        self.scene.addItem(self.ball_indicator)
-        self.ball_indicator.setPos(98, 158)
-        self.update_horizon.connect(self.update_display)
-
-    def update_display(self, roll, ball_position):
-        center_x = self.aircraft_icon.boundingRect().center().x()
-        center_y = self.aircraft_icon.boundingRect().center().y()
-        transform = QTransform()
-        transform.translate(center_x, center_y)
-        transform.rotate(roll / 1.587)
-        transform.translate(-center_x, -center_y)
-        self.aircraft_icon.setTransform(transform)
-        center_x = 99
-        y_base = 159
-        k = -1.84
-        a = -0.00198
-        ball_x = center_x + (k * roll)
-        ball_y = y_base + a * (ball_x - center_x) ** 2
-        self.ball_indicator.setPos(ball_x, ball_y)
-
-
-# ---------------------- Login Page ----------------------
-class LoginPage(QWidget):
-    def __init__(self):
-        super().__init__()
-        self.baglanti_olusturur()
-        self.init_ui()
-
-    def baglanti_olusturur(self):
-        baglanti = sqlite3.connect("database.db")
-        self.cursor = baglanti.cursor()
-        self.cursor.execute("CREATE TABLE IF NOT EXISTS üyeler (kullanıcı_adı TEXT, şifre TEXT)")
-        baglanti.commit()
-
-    def init_ui(self):
-        self.resim = QLabel()
-        pixmap = QtGui.QPixmap("logo.png")
-        scaled_pixmap = pixmap.scaled(200, 200, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
-        self.resim.setPixmap(scaled_pixmap)
-        self.yazi1 = QLabel("Kullanıcı Adı")
-        self.yazi1.setAlignment(QtCore.Qt.AlignCenter)
-        self.kullaniciadi = QtWidgets.QLineEdit()
-        self.kullaniciadi.setFixedWidth(200)
-        self.yazi2 = QLabel("Parola")
-        self.yazi2.setAlignment(QtCore.Qt.AlignCenter)
-        self.sifre = QtWidgets.QLineEdit()
-        self.sifre.setFixedWidth(200)
-        self.sifre.setEchoMode(QtWidgets.QLineEdit.Password)
-        self.giris = QtWidgets.QPushButton("Giriş Yap")
-        self.yazi3 = QLabel("")
-
-        v_box = QVBoxLayout()
-        v_box.addStretch()
-        v_box.addWidget(self.resim)
-        v_box.addStretch()
-        v_box.addWidget(self.yazi1)
-        v_box.addWidget(self.kullaniciadi)
-        v_box.addWidget(self.yazi2)
-        v_box.addWidget(self.sifre)
-        v_box.addWidget(self.yazi3)
-        v_box.addStretch()
-        v_box.addWidget(self.giris)
-        v_box.addStretch()
-
-        h_box = QHBoxLayout()
-        h_box.addStretch()
-        h_box.addLayout(v_box)
-        h_box.addStretch()
-
-        self.setLayout(h_box)
-        self.giris.clicked.connect(self.login)
-        # Fixed size for the login page remains 300 x 400.
-        self.setFixedSize(300, 400)
-
-    def login(self):
-        adi = self.kullaniciadi.text()
-        par = self.sifre.text()
-        self.cursor.execute("SELECT * FROM üyeler WHERE kullanıcı_adı = ? AND şifre = ?", (adi, par))
-        data = self.cursor.fetchall()
-        if len(data) == 0:
-            self.yazi3.setText("Kullanıcı bulunamadı\nLütfen tekrar deneyiniz...")
-        else:
-            self.yazi3.setText("Sistem Başlatılıyor...")
-
-
-# ---------------------- Main Window ----------------------
-class MainApp(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("Ana Pencere")
-        self.setGeometry(0, 0, 1400, 900)
-
-        main_container = QWidget()
-        self.setCentralWidget(main_container)
-        layout = QGridLayout()
-        main_container.setLayout(layout)
-
-        # Map, Motion, and Camera windows
-        self.map_window = HaritaPenceresi()
-        self.map_window.setFixedSize(800, 600)
-        self.motion_window = HaraketPenceresi()
-        self.motion_window.setFixedSize(400, 300)
-        self.camera_display = CameraDisplay()
-        self.camera_display.setFixedSize(400, 300)
-
-        # Create the instrument indicators vertical layout
-        indicators_layout = QVBoxLayout()
-        self.airspeed_indicator = AirSpeedIndicator()
-        self.airspeed_indicator.setFixedSize(250, 250)
-        self.vertical_speed_indicator = VerticalSpeedIndicator()
-        self.vertical_speed_indicator.setFixedSize(250, 250)
-        self.turn_coordinator = TurnCoordinator()
-        self.turn_coordinator.setFixedSize(250, 250)
-        indicators_layout.addWidget(self.airspeed_indicator)
-        indicators_layout.addSpacerItem(QSpacerItem(0, 25, QSizePolicy.Minimum, QSizePolicy.Fixed))
-        indicators_layout.addWidget(self.vertical_speed_indicator)
-        indicators_layout.addSpacerItem(QSpacerItem(0, 25, QSizePolicy.Minimum, QSizePolicy.Fixed))
-        indicators_layout.addWidget(self.turn_coordinator)
-
-        indicators_widget = QWidget()
-        indicators_widget.setLayout(indicators_layout)
-
-        # Create a container that places the indicators and the login page side by side.
-        instruments_and_login = QWidget()
-        h_layout = QHBoxLayout()
-        h_layout.addWidget(indicators_widget)
-        h_layout.addSpacing(30)  # 30 pixels spacing
-        self.login_page = LoginPage()
-        h_layout.addWidget(self.login_page)
-        # Align the login page at the top (instead of its default vertical center)
-        h_layout.setAlignment(self.login_page, Qt.AlignTop)
-        instruments_and_login.setLayout(h_layout)
-
-        # Add widgets to the grid layout
-        layout.addWidget(self.map_window, 0, 0, 2, 2, Qt.AlignTop | Qt.AlignLeft)
-        layout.addWidget(self.motion_window, 2, 0, Qt.AlignTop | Qt.AlignLeft)
-        layout.addWidget(self.camera_display, 2, 1, Qt.AlignTop | Qt.AlignLeft)
-        layout.addWidget(instruments_and_login, 0, 2, 3, 1, Qt.AlignTop | Qt.AlignLeft)
-
-        # Start Pixhawk thread and Camera thread.
-        self.pixhawk_thread = PixhawkThread(port='COM5', baud=115200)
-        self.pixhawk_thread.update_gps.connect(self.map_window.update_signal.emit)
-        self.pixhawk_thread.update_horizon.connect(self.motion_window.yatay_guncelleme)
-        self.pixhawk_thread.update_speed.connect(self.airspeed_indicator.update_speed)
-        self.pixhawk_thread.update_vertical_speed.connect(self.vertical_speed_indicator.update_speed)
-        self.pixhawk_thread.update_horizon.connect(self.turn_coordinator.update_horizon)
-        self.pixhawk_thread.start()
-
-        self.camera_thread = CameraThread()
-        self.camera_thread.frame_ready.connect(self.camera_display.update_image)
-        self.camera_thread.start()
-
-    def closeEvent(self, event):
-        self.pixhawk_thread.stop()
-        self.camera_thread.stop()
-        event.accept()
-
-
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = MainApp()
-    window.show()
+from PyQt5 import QtCore, QtWidgets
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QLabel,
+                             QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QGridLayout,
+                             QSpacerItem, QSizePolicy, QHBoxLayout)
+from panel_kayitcisi import PanelKayitcisi, modul_yukle, webengine_hazirla
+from telemetri import (Cozucu, GecikmeIzleyici, KayitDinleyici, OturumDeposu, TekrarOynatici, TelemetriMerkezi,
+                       UcusKaydedici)
+from telemetri.gecmis import TelemetriGecmisi
+from telemetri.zaman_hizalama import ZamanHizalayici
+from guncelleme_toplayici import GuncellemeToplayici
+from gecikme_katmani import GecikmeKatmani
+from yapay_ufuk import YapayUfuk
+from ibre_onbellegi import DonukKareler, IbreOgesi
+from varliklar import depo, varlik
+from gosterge_paneli import GostergePaneli
+import argparse
+import os
+import sys
+from iz_kaydi import IzDeposu
+from kamera_hatti import CameraThread, KameraOgesi, TespitOgesi
+import sqlite3
+from contextlib import closing
+# QtWebEngine, folium (harita_koprusu), cv2, video_kaydedici ve hedef_tespiti
+# kullanıldıkları yerde içe aktarılır; pencere bunları beklemeden açılır
+
+
+# ---------------------- Harita Penceresi ----------------------
+class HaritaPenceresi(QMainWindow):
+    update_signal = QtCore.pyqtSignal(float, float, float)
+
+    def __init__(self, canli=True, ertele=False):
+        """``ertele`` doğruysa sayfa ``sayfa_yukle`` çağrılana kadar yüklenmez."""
+        super().__init__()
+        from PyQt5.QtWebEngineWidgets import QWebEngineView
+        self.setWindowTitle("Harita Uygulaması")
+        self.setGeometry(100, 100, 800, 600)
+        self.webView = QWebEngineView()
+        self.map_path = os.path.abspath("Map1.html")
+        self.iz = IzDeposu()
+        self.heading = None
+        self.konum = (0, 0)
+        self.karo_url = None
+        self.canli_harita = None
+        # Canlı modda sayfa bir kez yüklenir, sonrası JS ile güncellenir
+        self.canli = canli
+        if not ertele:
+            self.sayfa_yukle()
+
+        self.gps_label = QLabel("GPS Verileri Bekleniyor...", self)
+        self.gps_label.setAlignment(Qt.AlignCenter)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.webView)
+        layout.addWidget(self.gps_label)
+
+        container = QWidget()
+        container.setLayout(layout)
+        self.setCentralWidget(container)
+
+        self.update_signal.connect(self.update_map)
+        self.gecikme = None
+
+    def sayfa_yukle(self):
+        """Harita sayfasını son konumla kurup yükler; o ana kadarki iz de çizilir."""
+        from harita_koprusu import CanliHarita
+        from karo_onbellegi import paylasilan_sunucu
+        # Karolar yerel önbellekten gelir; ağ yokken de harita açılır
+        self.karo_url = paylasilan_sunucu().url_sablonu
+        if self.canli:
+            self.canli_harita = CanliHarita(self.webView, self.map_path, self.iz, ikon=depo.dosya_yolu('plane.png'),
+                                            karo_url=self.karo_url)
+            # Web görünümünün çizimi ayrı süreçte; JS dönüşü çizim anı sayılır
+            self.canli_harita.uygulandi.connect(self.harita_uygulandi)
+            self.canli_harita.yukle(*self.konum)
+        else:
+            self.initialize_map(*self.konum)
+            self.webView.setUrl(QtCore.QUrl.fromLocalFile(self.map_path))
+
+    def harita_uygulandi(self):
+        if self.gecikme is not None:
+            self.gecikme.cizildi("HaritaPenceresi")
+
+    def initialize_map(self, latitude, longitude):
+        import folium
+        from folium import CustomIcon
+        from harita_koprusu import harita_olustur
+        self.map = harita_olustur(latitude, longitude, 20, self.karo_url)
+        path = self.iz.noktalar()
+        if path:
+            folium.PolyLine(path, color="blue", weight=2.5, opacity=0.8).add_to(self.map)
+        airplane_icon = CustomIcon(depo.dosya_yolu('plane.png'), icon_size=(40, 40))
+        folium.Marker(
+            location=[latitude, longitude],
+            popup="Mevcut İHA Konumu",
+            icon=airplane_icon
+        ).add_to(self.map)
+        self.map.save(self.map_path)
+
+    def update_heading(self, heading):
+        self.heading = heading
+
+    def update_map(self, latitude, longitude, altitude):
+        degisiklik = self.iz.ekle(latitude, longitude)
+        self.konum = (latitude, longitude)
+        # Sayfa henüz yüklenmediyse iz ve konum yüklenirken kullanılır
+        if self.karo_url is not None:
+            if self.canli:
+                self.canli_harita.guncelle(latitude, longitude, self.heading, degisiklik)
+            else:
+                self.initialize_map(latitude, longitude)
+                self.webView.setUrl(QtCore.QUrl.fromLocalFile(self.map_path))
+        self.gps_label.setText(f"Latitude: {latitude}, Longitude: {longitude}, Altitude: {altitude} m")
+
+
+# ---------------------- Hareket Penceresi ----------------------
+class HaraketPenceresi(YapayUfuk):
+    """Yapay ufuk; bitmap yerine ``yapay_ufuk.UfukCizici`` ile çizilir."""
+
+    def __init__(self):
+        super().__init__()
+        self.setFixedSize(400, 300)
+        self.gecikme = None  # MainApp gecikme izleyicisini atar
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.gecikme is not None:
+            self.gecikme.cizildi("HaraketPenceresi")
+
+
+# ---------------------- Pixhawk Thread ----------------------
+class PixhawkThread(QtCore.QObject, KayitDinleyici):
+    """Paylaşılan telemetri merkezine abone olup çözülen kayıtları Qt sinyallerine çevirir.
+
+    Bağlantıyı ``TelemetriMerkezi`` okur, mesajları ``telemetri.Cozucu`` çözer;
+    adı eski QThread sürümüyle uyum için korunmuştur. ``baglanti`` verilirse
+    (ör. ``TekrarOynatici``) seri port yerine o kullanılır.
+    """
+    update_gps = pyqtSignal(float, float, float)
+    update_heading = pyqtSignal(float)
+    update_horizon = pyqtSignal(float, float)
+    update_speed = pyqtSignal(float)
+    update_vertical_speed = pyqtSignal(float)
+
+    def __init__(self, port='COM5', baud=115200, hizlar=None, baglanti=None, ekran_hz=60):
+        super().__init__()
+        self.port = port
+        self.baud = baud
+        self.baglanti = baglanti
+        # Panellerin ihtiyaç duyduğu mesajlar ve hızları (Hz)
+        self.hizlar = hizlar or {'ATTITUDE': 50, 'VFR_HUD': 10, 'GPS_RAW_INT': 5}
+        self.merkez = None
+        self.abone = None
+        self.gecikme = None
+        self.cozucu = Cozucu(self)
+        # Sinyaller her mesajda değil, ekran hızında son değerle yayılır
+        self.toplayici = GuncellemeToplayici(self, ekran_hz)
+
+    def start(self):
+        self.toplayici.baslat()
+        self.merkez = TelemetriMerkezi.paylasilan(self.port, self.baud, self.baglanti)
+        self.merkez.hiz.talep_et(self, self.hizlar)
+        self.abone = self.merkez.abone_ol(self.mesaj_isle, tipler=self.cozucu.tipler(), ad="PixhawkThread")
+
+    def mesaj_isle(self, msg):
+        self.cozucu.isle(msg)
+
+    # ---------------------- KayitDinleyici ----------------------
+    def konum(self, kayit, msg):
+        if kayit.rota is not None:
+            self._yay('update_heading', msg, kayit.rota)
+        self._yay('update_gps', msg, kayit.enlem, kayit.boylam, kayit.irtifa)
+
+    def tutum(self, kayit, msg):
+        self._yay('update_horizon', msg, kayit.pitch, kayit.roll)
+
+    def hiz(self, kayit, msg):
+        self._yay('update_speed', msg, kayit.yer_hizi)
+        self._yay('update_vertical_speed', msg, kayit.dikey_hiz)
+
+    def gecersiz(self, msg, hata):
+        print(f"Invalid GPS data: {hata}")
+
+    def _yay(self, kanal, msg, *degerler):
+        if self.gecikme is not None:
+            self.gecikme.alindi(kanal, msg)
+        self.toplayici.koy(kanal, *degerler)
+
+    def stop(self):
+        self.toplayici.durdur()
+        if self.merkez is not None:
+            self.merkez.hiz.talebi_kaldir(self)
+            self.merkez.abonelikten_cik(self.abone)
+            self.merkez.birak()
+            self.merkez = None
+
+
+# ---------------------- Kamera Görüntüleme ----------------------
+class CameraDisplay(QGraphicsView):
+    def __init__(self):
+        super().__init__()
+        self.scene = QGraphicsScene()
+        self.setScene(self.scene)
+        self.setFixedSize(400, 300)
+        self.image_item = KameraOgesi()
+        self.scene.addItem(self.image_item)
+        self.tespit_item = TespitOgesi(self.image_item)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+
+    def update_image(self, kare):
+        self.image_item.kare_goster(kare)
+
+    def update_tespit(self, tespit):
+        self.tespit_item.tespit_goster(tespit)
+
+
+# ---------------------- Air Speed Indicator ----------------------
+class AirSpeedIndicator(QGraphicsView):
+    update_speed = pyqtSignal(float)
+
+    def __init__(self):
+        super().__init__()
+        self.scene = QGraphicsScene()
+        self.setScene(self.scene)
+        self.setFixedSize(250, 250)
+        self.background = QGraphicsPixmapItem(varlik("AirSpeedIndicator_Background.PNG"))
+        self.scene.addItem(self.background)
+        self.background.setPos(0, 0)
+        self.mark_icon = IbreOgesi(DonukKareler(varlik("AirSpeedNeedle.PNG"), (12, 96)))
+        self.scene.addItem(self.mark_icon)
+        bg_width = self.background.pixmap().width()
+        bg_height = self.background.pixmap().height()
+        ac_width = self.mark_icon.pixmap().width()
+        ac_height = self.mark_icon.pixmap().height()
+        self.mark_icon.setPos((bg_width - ac_width) / 2, ((bg_height - ac_height) / 2) - 30)
+        self.update_speed.connect(self.update_display)
+        self.gecikme = None
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.gecikme is not None:
+            self.gecikme.cizildi("AirSpeedIndicator")
+
+    def update_display(self, speed):
+        self.mark_icon.aci_ayarla(180 + speed * 7.2)
+
+
+# ---------------------- Vertical Speed Indicator ----------------------
+class VerticalSpeedIndicator(QGraphicsView):
+    update_speed = pyqtSignal(float)
+
+    def __init__(self):
+        super().__init__()
+        self.scene = QGraphicsScene()
+        self.setScene(self.scene)
+        self.setFixedSize(250, 250)
+        self.background = QGraphicsPixmapItem(varlik("VerticalSpeedIndicator_Background.PNG"))
+        self.scene.addItem(self.background)
+        self.background.setPos(0, 0)
+        self.mark_icon = IbreOgesi(DonukKareler(varlik("VerticalSpeedNeedle.PNG"), (12, 96)))
+        self.scene.addItem(self.mark_icon)
+        bg_width = self.background.pixmap().width()
+        bg_height = self.background.pixmap().height()
+        ac_width = self.mark_icon.pixmap().width()
+        ac_height = self.mark_icon.pixmap().height()
+        self.mark_icon.setPos((bg_width - ac_width) / 2, ((bg_height - ac_height) / 2) - 30)
+        self.update_speed.connect(self.update_display)
+        self.gecikme = None
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.gecikme is not None:
+            self.gecikme.cizildi("VerticalSpeedIndicator")
+
+    def update_display(self, speed):
+        self.mark_icon.aci_ayarla(270 + speed * 25)
+
+
+# ---------------------- Turn Coordinator ----------------------
+class TurnCoordinator(QGraphicsView):
+    update_horizon = pyqtSignal(float, float)
+
+    def __init__(self):
+        super().__init__()
+        self.scene = QGraphicsScene()
+        self.setScene(self.scene)
+        self.setFixedSize(250, 250)
+        self.background = QGraphicsPixmapItem(varlik("TurnCoordinator_Background2.png"))
+        self.scene.addItem(self.background)
+        self.background.setPos(0, 0)
+        self.aircraft_icon = IbreOgesi(DonukKareler(varlik("DJV JUL 2357-12.png")))
+        self.scene.addItem(self.aircraft_icon)
+        bg_width = self.background.pixmap().width()
+        bg_height = self.background.pixmap().height()
+        ac_width = self.aircraft_icon.pixmap().width()
+        ac_height = self.aircraft_icon.pixmap().height()
+        self.aircraft_icon.setPos((bg_width - ac_width) / 2, ((bg_height - ac_height) / 2) - 15)
+        self.mark_icon = QGraphicsPixmapItem(varlik("TurnCoordinatorMarks.png"))
+        self.scene.addItem(self.mark_icon)
+        self.mark_icon.setPos(96, 158)
+        self.ball_indicator = QGraphicsPixmapItem(varlik("TurnCoordinatorBall,png.PNG"))
+        self.scene.addItem(self.ball_indicator)
+        self.ball_indicator.setPos(98, 158)
+        self.update_horizon.connect(self.update_display)
+        self.gecikme = None
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.gecikme is not None:
+            self.gecikme.cizildi("TurnCoordinator")
+
+    def update_display(self, roll, ball_position):
+        self.aircraft_icon.aci_ayarla(roll / 1.587)
+        center_x = 99
+        y_base = 159
+        k = -1.84
+        a = -0.00198
+        ball_x = center_x + (k * roll)
+        ball_y = y_base + a * (ball_x - center_x) ** 2
+        self.ball_indicator.setPos(ball_x, ball_y)
+
+
+# ---------------------- Login Page ----------------------
+class LoginPage(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.baglanti_olusturur()
+        self.init_ui()
+
+    def baglanti_olusturur(self):
+        # Bağlantı açık tutulmaz: her işlem kısa ömürlü bir bağlantıyla yapılıp kapatılır
+        with closing(sqlite3.connect("database.db")) as baglanti, baglanti:
+            baglanti.execute("CREATE TABLE IF NOT EXISTS üyeler (kullanıcı_adı TEXT, şifre TEXT)")
+
+    def init_ui(self):
+        self.resim = QLabel()
+        pixmap = varlik("logo.png")
+        scaled_pixmap = pixmap.scaled(200, 200, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        self.resim.setPixmap(scaled_pixmap)
+        self.yazi1 = QLabel("Kullanıcı Adı")
+        self.yazi1.setAlignment(QtCore.Qt.AlignCenter)
+        self.kullaniciadi = QtWidgets.QLineEdit()
+        self.kullaniciadi.setFixedWidth(200)
+        self.yazi2 = QLabel("Parola")
+        self.yazi2.setAlignment(QtCore.Qt.AlignCenter)
+        self.sifre = QtWidgets.QLineEdit()
+        self.sifre.setFixedWidth(200)
+        self.sifre.setEchoMode(QtWidgets.QLineEdit.Password)
+        self.giris = QtWidgets.QPushButton("Giriş Yap")
+        self.yazi3 = QLabel("")
+
+        v_box = QVBoxLayout()
+        v_box.addStretch()
+        v_box.addWidget(self.resim)
+        v_box.addStretch()
+        v_box.addWidget(self.yazi1)
+        v_box.addWidget(self.kullaniciadi)
+        v_box.addWidget(self.yazi2)
+        v_box.addWidget(self.sifre)
+        v_box.addWidget(self.yazi3)
+        v_box.addStretch()
+        v_box.addWidget(self.giris)
+        v_box.addStretch()
+
+        h_box = QHBoxLayout()
+        h_box.addStretch()
+        h_box.addLayout(v_box)
+        h_box.addStretch()
+
+        self.setLayout(h_box)
+        self.giris.clicked.connect(self.login)
+        # Fixed size for the login page remains 300 x 400.
+        self.setFixedSize(300, 400)
+
+    def login(self):
+        adi = self.kullaniciadi.text()
+        par = self.sifre.text()
+        with closing(sqlite3.connect("database.db")) as baglanti:
+            data = baglanti.execute("SELECT * FROM üyeler WHERE kullanıcı_adı = ? AND şifre = ?", (adi, par)).fetchall()
+        if len(data) == 0:
+            self.yazi3.setText("Kullanıcı bulunamadı\nLütfen tekrar deneyiniz...")
+        else:
+            self.yazi3.setText("Sistem Başlatılıyor...")
+
+
+# ---------------------- Main Window ----------------------
+class MainApp(QMainWindow):
+    # Kamera arka planda açılıp CameraThread başladığında
+    kamera_hazir = pyqtSignal(object)
+
+    def __init__(self, tekrar=None, tek_panel=True):
+        """``tekrar`` verilirse Pixhawk yerine bu ``TekrarOynatici`` oynatılır.
+
+        ``tek_panel`` ufuk ve üç göstergeyi tek ``GostergePaneli``'nde çizer;
+        False ise eski ayrı widget'lar kurulur. Paneller ``self.paneller`` üzerinden
+        kurulur; telemetri, kamera ve harita sayfası pencere gösterildikten
+        sonra başlatılır.
+        """
+        super().__init__()
+        self.setWindowTitle("Ana Pencere")
+        self.setGeometry(0, 0, 1400, 900)
+
+        main_container = QWidget()
+        self.setCentralWidget(main_container)
+        layout = QGridLayout()
+        main_container.setLayout(layout)
+
+        # Panel kurulum süreleri açılış raporuna girer (--acilis-raporu)
+        self.paneller = PanelKayitcisi(self)
+        self.paneller.kaydet("HaritaPenceresi", lambda: HaritaPenceresi(ertele=True),
+                             moduller=("PyQt5.QtWebEngineWidgets",))
+        self.paneller.kaydet("CameraDisplay", CameraDisplay)
+        self.paneller.kaydet("GostergePaneli", GostergePaneli)
+        self.paneller.kaydet("HaraketPenceresi", HaraketPenceresi)
+        self.paneller.kaydet("AirSpeedIndicator", AirSpeedIndicator)
+        self.paneller.kaydet("VerticalSpeedIndicator", VerticalSpeedIndicator)
+        self.paneller.kaydet("TurnCoordinator", TurnCoordinator)
+        self.paneller.kaydet("LoginPage", LoginPage)
+
+        # Map, Motion, and Camera windows
+        self.map_window = self.paneller.ac("HaritaPenceresi")
+        self.map_window.setFixedSize(800, 600)
+        self.camera_display = self.paneller.ac("CameraDisplay")
+        self.camera_display.setFixedSize(400, 300)
+
+        self.tek_panel = tek_panel
+        if tek_panel:
+            # Ufuk ve göstergeler tek widget'ta; gösterge sütununun yerini alır
+            self.gosterge_paneli = self.paneller.ac("GostergePaneli")
+            self.gosterge_paneli.setFixedSize(self.gosterge_paneli.sizeHint())
+            self.gostergeler = [self.gosterge_paneli]
+            indicators_widget = self.gosterge_paneli
+        else:
+            self.motion_window = self.paneller.ac("HaraketPenceresi")
+            self.motion_window.setFixedSize(400, 300)
+
+            # Create the instrument indicators vertical layout
+            indicators_layout = QVBoxLayout()
+            self.airspeed_indicator = self.paneller.ac("AirSpeedIndicator")
+            self.airspeed_indicator.setFixedSize(250, 250)
+            self.vertical_speed_indicator = self.paneller.ac("VerticalSpeedIndicator")
+            self.vertical_speed_indicator.setFixedSize(250, 250)
+            self.turn_coordinator = self.paneller.ac("TurnCoordinator")
+            self.turn_coordinator.setFixedSize(250, 250)
+            indicators_layout.addWidget(self.airspeed_indicator)
+            indicators_layout.addSpacerItem(QSpacerItem(0, 25, QSizePolicy.Minimum, QSizePolicy.Fixed))
+            indicators_layout.addWidget(self.vertical_speed_indicator)
+            indicators_layout.addSpacerItem(QSpacerItem(0, 25, QSizePolicy.Minimum, QSizePolicy.Fixed))
+            indicators_layout.addWidget(self.turn_coordinator)
+
+            indicators_widget = QWidget()
+            indicators_widget.setLayout(indicators_layout)
+            self.gostergeler = [self.motion_window, self.airspeed_indicator, self.vertical_speed_indicator,
+                                self.turn_coordinator]
+
+        # Create a container that places the indicators and the login page side by side.
+        instruments_and_login = QWidget()
+        h_layout = QHBoxLayout()
+        h_layout.addWidget(indicators_widget)
+        h_layout.addSpacing(30)  # 30 pixels spacing
+        self.login_page = self.paneller.ac("LoginPage")
+        h_layout.addWidget(self.login_page)
+        # Align the login page at the top (instead of its default vertical center)
+        h_layout.setAlignment(self.login_page, Qt.AlignTop)
+        instruments_and_login.setLayout(h_layout)
+
+        # Add widgets to the grid layout
+        layout.addWidget(self.map_window, 0, 0, 2, 2, Qt.AlignTop | Qt.AlignLeft)
+        if tek_panel:
+            layout.addWidget(self.camera_display, 2, 0, Qt.AlignTop | Qt.AlignLeft)
+        else:
+            layout.addWidget(self.motion_window, 2, 0, Qt.AlignTop | Qt.AlignLeft)
+            layout.addWidget(self.camera_display, 2, 1, Qt.AlignTop | Qt.AlignLeft)
+        layout.addWidget(instruments_and_login, 0, 2, 3, 1, Qt.AlignTop | Qt.AlignLeft)
+
+        # Start Pixhawk thread and Camera thread.
+        if tekrar is None:
+            self.pixhawk_thread = PixhawkThread(port='COM5', baud=115200)
+        else:
+            self.pixhawk_thread = PixhawkThread(port='tekrar', baglanti=tekrar)
+        self.pixhawk_thread.update_heading.connect(self.map_window.update_heading)
+        self.pixhawk_thread.update_gps.connect(self.map_window.update_signal.emit)
+        if tek_panel:
+            self.pixhawk_thread.update_horizon.connect(self.gosterge_paneli.yatay_guncelleme)
+            self.pixhawk_thread.update_speed.connect(self.gosterge_paneli.hiz_guncelle)
+            self.pixhawk_thread.update_vertical_speed.connect(self.gosterge_paneli.dikey_hiz_guncelle)
+        else:
+            self.pixhawk_thread.update_horizon.connect(self.motion_window.yatay_guncelleme)
+            self.pixhawk_thread.update_speed.connect(self.airspeed_indicator.update_speed)
+            self.pixhawk_thread.update_vertical_speed.connect(self.vertical_speed_indicator.update_speed)
+            self.pixhawk_thread.update_horizon.connect(self.turn_coordinator.update_horizon)
+
+        # Otopilottan çizime gecikme izleme (F12: katman, Ctrl+F12: dosyaya yaz)
+        self.gecikme = GecikmeIzleyici()
+        self.gecikme.bagla('update_horizon', "HaraketPenceresi", "TurnCoordinator")
+        self.gecikme.bagla('update_speed', "AirSpeedIndicator")
+        self.gecikme.bagla('update_vertical_speed', "VerticalSpeedIndicator")
+        self.gecikme.bagla('update_gps', "HaritaPenceresi")
+        self.pixhawk_thread.gecikme = self.gecikme
+        self.pixhawk_thread.toplayici.gecikme = self.gecikme
+        for panel in self.gostergeler + [self.map_window]:
+            panel.gecikme = self.gecikme
+        self.gecikme_katmani = GecikmeKatmani(self, self.gecikme)
+        self.gecikme_dosyasi = None
+
+        # Kareler ile tutum/konum tek monotonik saatte: hizalayici.kare_icin(sira)
+        self.hizalayici = ZamanHizalayici(en_fazla=1 << 18)
+        # Tutum, hız ve konum geçmişi (sabit 64 MB, 50 Hz tutumda ~4 saat)
+        self.gecmis = TelemetriGecmisi()
+        self.pixhawk_thread.cozucu.dinleyici_ekle(self.gecmis)
+        self.tekrar = tekrar
+        self.kaydedici = None
+        self.oturum_deposu = None
+        self.camera_thread = None
+
+        # Pencere gösterildikten sonra: telemetri olay döngüsünde, kamera açılışı
+        # ve folium'un içe aktarılması ayrı iş parçacıklarında
+        self.paneller.arka_planda("telemetri", self.telemetri_baslat)
+        self.paneller.arka_planda("kamera", CameraThread.kamera_ac, sonra=self.kamera_baslat, is_parcacigi=True)
+        self.paneller.arka_planda("harita sayfası", lambda: modul_yukle("harita_koprusu"),
+                                  sonra=lambda _: self.map_window.sayfa_yukle(), is_parcacigi=True)
+
+    def telemetri_baslat(self):
+        self.pixhawk_thread.start()
+        # Tekrar oynatılırken yeni kayıt açılmaz
+        if self.tekrar is None:
+            self.kaydedici = UcusKaydedici.paylasilan(self.pixhawk_thread.merkez)
+            # Tutum, konum ve hız kayıtları ucuslar.db'de oturum olarak
+            self.oturum_deposu = OturumDeposu(kaynak=self.pixhawk_thread.port).baslat()
+            self.pixhawk_thread.cozucu.dinleyici_ekle(self.oturum_deposu)
+        self.hizalayici.abone_ol(self.pixhawk_thread.merkez)
+
+    def kamera_baslat(self, cap):
+        self.camera_thread = CameraThread(cap=cap)
+        self.camera_thread.frame_ready.connect(self.camera_display.update_image)
+        self.camera_thread.tespit_ready.connect(self.camera_display.update_tespit)
+        self.camera_thread.hizalayici = self.hizalayici
+        self.camera_thread.start()
+        self.kamera_hazir.emit(self.camera_thread)
+
+    def closeEvent(self, event):
+        if self.kaydedici is not None:
+            self.kaydedici.birak()
+        if self.oturum_deposu is not None:
+            self.pixhawk_thread.cozucu.dinleyici_cikar(self.oturum_deposu)
+            self.oturum_deposu.durdur()
+        self.pixhawk_thread.stop()
+        if self.camera_thread is not None:
+            self.camera_thread.stop()
+        if self.gecikme_dosyasi:
+            self.gecikme_katmani.dosyaya_yaz(self.gecikme_dosyasi)
+        event.accept()
+
+
+if __name__ == "__main__":
+    # Donanımsız deneme: python "arayüz ama düzeltilecek.py" --tekrar kayitlar/ucus.tlog --hiz 20 --dongu
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tekrar", help="Pixhawk yerine oynatılacak tlog dosyası")
+    parser.add_argument("--hiz", type=float, default=1.0, help="oynatma hızı (0: beklemeden)")
+    parser.add_argument("--dongu", action="store_true", help="kayıt bitince başa sar")
+    parser.add_argument("--gecikme-dosyasi", help="kapanışta gecikme ölçümlerinin yazılacağı JSON")
+    parser.add_argument("--video", action="store_true", help="kamera görüntüsünü kayitlar/ altına kaydet")
+    parser.add_argument("--video-parca", type=float, default=300.0, help="video parça süresi (s)")
+    parser.add_argument("--tespit", type=int, default=0, help="hedef tespiti işçi süreç sayısı (0: kapalı)")
+    parser.add_argument("--ibre-donusumu", action="store_true",
+                        help="ibreleri önbellek yerine her güncellemede döndür (eski yol)")
+    parser.add_argument("--varlik-paketi", help="görsellerin okunacağı .rcc dosyası ya da modül (varsayılan varliklar_rc)")
+    parser.add_argument("--varlik-raporu", action="store_true", help="açılışta görsel yükleme ölçümlerini yazdır")
+    parser.add_argument("--ayri-gostergeler", action="store_true",
+                        help="ufuk ve göstergeleri tek panel yerine ayrı widget'larda çiz (eski yol)")
+    parser.add_argument("--acilis-raporu", action="store_true",
+                        help="arka plan işleri bitince panel başına açılış sürelerini yazdır")
+    args, qt_args = parser.parse_known_args()
+    # QtWebEngine harita paneli kurulurken içe aktarılır
+    webengine_hazirla()
+    app = QApplication(sys.argv[:1] + qt_args)
+    IbreOgesi.onbellekli = not args.ibre_donusumu
+    # Derlenmiş paket yoksa görseller modül klasöründen okunur
+    depo.paket_yukle(args.varlik_paketi)
+    tekrar = TekrarOynatici(args.tekrar, args.hiz, args.dongu) if args.tekrar else None
+    window = MainApp(tekrar, not args.ayri_gostergeler)
+    window.gecikme_dosyasi = args.gecikme_dosyasi
+
+    def kamera_ayarla(camera_thread):
+        if args.video:
+            camera_thread.kayit_baslat(segment_s=args.video_parca)
+        if args.tespit:
+            camera_thread.tespit_baslat(args.tespit)
+    window.kamera_hazir.connect(kamera_ayarla)
+    if args.varlik_raporu:
+        print(depo.rapor())
+    if args.acilis_raporu:
+        window.paneller.isler_bitti.connect(lambda: print(window.paneller.rapor()))
+    window.show()
+    window.paneller.isaretle("pencere gösterildi")
     sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""Qt'siz telemetri çözücüsünün hızını ve doğruluğunu ölçer.
+
+Sentetik bir uçuş tlog dosyası üretilir, ``TekrarOynatici`` ile beklemeden
+okunur ve mesajlar üç yoldan geçirilir:
+
+* ``PixhawkThread``'lerdeki eski satır içi dönüşüm (``msg.lat / 1e7`` vb.),
+* ``Cozucu``, dinleyicisiz,
+* ``Cozucu``, ``--dinleyici`` adet boş ``KayitDinleyici`` ile.
+
+Her yol için mesaj/s ve mesaj başına süre raporlanır. Çözülen kayıtlar eski
+dönüşümle aynı değilse, geçersiz GPS verisi ayıklanmıyorsa ya da çözücü
+çalışırken PyQt5 içe aktarılmışsa betik hata ile çıkar.
+
+Kullanım: python benchmarks/bench_cozucu.py [--sure 600] [--dinleyici 4] [--json sonuc.json]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import ortak
+
+from telemetri import Cozucu, KayitDinleyici, TekrarOynatici
+from telemetri.cozucu import coz
+from telemetri.sentetik import SentetikUcus, tlog_yaz
+
+
+def mesajlari_oku(dosya):
+    tekrar = TekrarOynatici(dosya, hiz=0)
+    mesajlar = []
+    while True:
+        msg = tekrar.recv_match(blocking=False)
+        if msg is None:
+            return mesajlar
+        mesajlar.append(msg)
+
+
+def eski_donusum(msg):
+    """``PixhawkThread.mesaj_isle``'nin çözücüden önceki hali."""
+    tip = msg.get_type()
+    if tip == 'GPS_RAW_INT':
+        latitude, longitude, altitude = msg.lat / 1e7, msg.lon / 1e7, msg.alt / 1000
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180 and altitude >= -500):
+            return None
+        return latitude, longitude, altitude, None if msg.cog == 65535 else msg.cog / 100
+    if tip == 'ATTITUDE':
+        return msg.pitch * 60, msg.roll * 60
+    if tip == 'VFR_HUD':
+        return msg.groundspeed, msg.climb
+    return None
+
+
+def olc(ad, isle, mesajlar):
+    bas = time.perf_counter()
+    for msg in mesajlar:
+        isle(msg)
+    gecen = time.perf_counter() - bas
+    return {"ad": ad, "adet": len(mesajlar), "mesaj_s": round(len(mesajlar) / gecen),
+            "mesaj_us": round(1e6 * gecen / len(mesajlar), 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sure", type=float, default=600.0, help="sentetik uçuş süresi (s)")
+    parser.add_argument("--dinleyici", type=int, default=4, help="boş dinleyici sayısı")
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as dizin:
+        dosya = os.path.join(dizin, "ucus.tlog")
+        tlog_yaz(dosya, args.sure)
+        mesajlar = mesajlari_oku(dosya)
+
+    hatalar = []
+    for msg in mesajlar:
+        kayit, eski = coz(msg), eski_donusum(msg)
+        if kayit is None:
+            if eski is not None:
+                hatalar.append(f"{msg.get_type()} çözülmedi")
+            continue
+        if msg.get_type() == 'GPS_RAW_INT':
+            yeni = (kayit.enlem, kayit.boylam, kayit.irtifa, kayit.rota)
+        elif msg.get_type() == 'ATTITUDE':
+            yeni = (kayit.pitch, kayit.roll)
+        else:
+            yeni = (kayit.yer_hizi, kayit.dikey_hiz)
+        if yeni != eski:
+            hatalar.append(f"{msg.get_type()}: {yeni} != {eski}")
+            break
+
+    gecersiz = SentetikUcus().mesaj('GPS_RAW_INT', 1.0)
+    gecersiz.lat = 95 * 10 ** 7
+    cozucu = Cozucu(KayitDinleyici())
+    if cozucu.isle(gecersiz) is not None or cozucu.gecersiz.get('GPS_RAW_INT') != 1:
+        hatalar.append("geçersiz GPS verisi ayıklanmadı")
+
+    sonuclar = [
+        olc("eski satır içi dönüşüm", eski_donusum, mesajlar),
+        olc("Cozucu", Cozucu().isle, mesajlar),
+        olc(f"Cozucu + {args.dinleyici} dinleyici",
+            Cozucu(*(KayitDinleyici() for _ in range(args.dinleyici))).isle, mesajlar),
+    ]
+    if "PyQt5" in sys.modules:
+        hatalar.append("çözücü PyQt5'i içe aktardı")
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""Yük altında otopilottan çizime telemetri gecikmesini ölçer.
+
+``SanalArac`` UDP üzerinden ATTITUDE ve VFR_HUD yayınlar; ``TelemetriMerkezi``
+mesajları ana penceredekiyle aynı zincirden (``GecikmeIzleyici.alindi`` ->
+``GuncellemeToplayici`` -> gösterge -> ``paintEvent``) ekransız göstergelere
+taşır. ATTITUDE hızı adım adım artırılır; her adım için panel ve aşama başına
+p50/p95/p99 raporlanır. Alış -> çizim p99'u üç ekran karesini aşarsa betik
+hata ile çıkar.
+
+Kullanım: python benchmarks/bench_gecikme.py [--hz 50 200 800] [--sure 3]
+          [--ekran-hz 60] [--dokum gecikme.json] [--json sonuc.json]
+"""
+import argparse
+import os
+import sys
+
+import ortak
+
+from telemetri import GecikmeIzleyici, SanalArac, TelemetriMerkezi
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hz", type=int, nargs="+", default=[50, 200, 800], help="ATTITUDE hızları")
+    parser.add_argument("--sure", type=float, default=3.0, help="adım süresi (s)")
+    parser.add_argument("--ekran-hz", type=int, default=60)
+    parser.add_argument("--dokum", help="son adımın ham ölçümlerinin yazılacağı JSON")
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    app = ortak.qt_uygulamasi()
+    os.chdir(ortak.ARAYUZ_DIZINI)
+    from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+    from guncelleme_toplayici import GuncellemeToplayici
+
+    dengeleyici = ortak.betik_yukle("Dengeleyici göstergesi.py", "dengeleyici_gostergesi")
+    dikey = ortak.betik_yukle("Dikey hız göstergesi.py", "dikey_hiz_gostergesi")
+
+    izleyici = GecikmeIzleyici()
+
+    class IzliDonus(dengeleyici.TurnCoordinator):
+        def paintEvent(self, event):
+            super().paintEvent(event)
+            izleyici.cizildi("TurnCoordinator")
+
+    class IzliDikeyHiz(dikey.VerticalSpeedIndicator):
+        def paintEvent(self, event):
+            super().paintEvent(event)
+            izleyici.cizildi("VerticalSpeedIndicator")
+
+    class Kaynak(QObject):
+        update_horizon = pyqtSignal(float, float)
+        update_vertical_speed = pyqtSignal(float)
+
+        def mesaj_isle(self, msg):
+            if msg.get_type() == 'ATTITUDE':
+                izleyici.alindi('update_horizon', msg)
+                toplayici.koy('update_horizon', msg.roll * 60, msg.roll * 30)
+            else:
+                izleyici.alindi('update_vertical_speed', msg)
+                toplayici.koy('update_vertical_speed', msg.climb)
+
+    donus, dikey_hiz = IzliDonus(), IzliDikeyHiz()
+    for gosterge in (donus, dikey_hiz):
+        gosterge.show()
+    kaynak = Kaynak()
+    kaynak.update_horizon.connect(donus.update_horizon)
+    kaynak.update_vertical_speed.connect(dikey_hiz.update_speed)
+    toplayici = GuncellemeToplayici(kaynak, args.ekran_hz)
+
+    port = ortak.bos_port()
+    merkez = TelemetriMerkezi(port=f"udpin:127.0.0.1:{port}").baslat()
+    merkez.abone_ol(lambda msg: kaynak.mesaj_isle(msg), tipler=('ATTITUDE', 'VFR_HUD'))
+    arac = SanalArac(("127.0.0.1", port)).baslat()
+
+    sonuclar = []
+    hatalar = []
+    sinir_ms = 3 * 1000 / args.ekran_hz
+    try:
+        if not ortak.bekle(lambda: merkez.bagli):
+            print("HATA: sanal araçtan heartbeat alınamadı")
+            return 1
+        toplayici.baslat()
+        for hz in args.hz:
+            arac.hiz_ayarla('ATTITUDE', hz)
+            arac.hiz_ayarla('VFR_HUD', 10)
+            izleyici = GecikmeIzleyici()
+            izleyici.bagla('update_horizon', "TurnCoordinator")
+            izleyici.bagla('update_vertical_speed', "VerticalSpeedIndicator")
+            toplayici.gecikme = izleyici
+            QTimer.singleShot(int(args.sure * 1000), app.quit)
+            app.exec_()
+            for panel, asamalar in izleyici.ozet().items():
+                for asama, d in asamalar.items():
+                    sonuclar.append(dict({"ad": f"{hz} Hz {panel}/{asama}"}, **d))
+                toplam = asamalar.get("toplam", {}).get("p99", 0.0)
+                if toplam > sinir_ms:
+                    hatalar.append(f"{hz} Hz: {panel} alış -> çizim p99 {toplam} ms (sınır {sinir_ms:.1f})")
+            if args.dokum:
+                izleyici.dosyaya_yaz(args.dokum)
+    finally:
+        toplayici.durdur()
+        arac.durdur()
+        merkez.durdur()
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""Telemetri geçmişinin ekleme hızını, sorgu gecikmesini ve belleğini ölçer.
+
+``TelemetriGecmisi`` ``--saat`` saatlik akışla doldurulur: tutum ``--hz``,
+hız 10 Hz, konum 5 Hz, zaman sırasıyla ve canlıdaki gibi kayıt kayıt
+(``KayitDinleyici`` yöntemleriyle). Sonra tampon %10 taşırılıp halkanın
+dönmesi sınanır ve tutum kanalında rastgele konumlarda 1 s, 1 dk, 10 dk ve
+1 saatlik pencereler sorgulanır. Karşılaştırma için aynı sorgular kopyalanmış
+dizide maske ile tam taramayla da yapılır. Ayrıca aynı veri ``toplu_ekle`` ile
+yüklenir.
+
+Sorgu sonucu tam taramayla aynı değilse, dilim görünüm değil kopyaysa, bellek
+bütçeyi %20'den fazla aşıyorsa, sorgu p99'u 1 ms'yi geçiyorsa ya da ekleme
+hızı akış hızının 100 katından azsa betik hata ile çıkar.
+
+Kullanım: python benchmarks/bench_gecmis.py [--saat 4] [--hz 50] [--butce 64] [--sorgu 500] [--json sonuc.json]
+"""
+import argparse
+import math
+import sys
+import time
+
+import numpy as np
+
+import ortak
+
+from telemetri import HizKaydi, KonumKaydi, TutumKaydi
+from telemetri.gecmis import KANALLAR, TelemetriGecmisi
+
+PARTI = 1024
+PENCERELER = {"1 s": 1.0, "1 dk": 60.0, "10 dk": 600.0, "1 saat": 3600.0}
+
+
+def akis(baslangic, sure, hz):
+    """(kanal, kayıt) çiftlerini zaman sırasıyla üretir."""
+    hizlar = {"tutum": hz, "hiz": 10, "konum": 5}
+    adimlar = {kanal: 0 for kanal in hizlar}
+    while True:
+        kanal = min(adimlar, key=lambda k: adimlar[k] / hizlar[k])
+        t = adimlar[kanal] / hizlar[kanal]
+        if t > sure:
+            return
+        adimlar[kanal] += 1
+        z = baslangic + t
+        if kanal == "tutum":
+            yield kanal, TutumKaydi(z, 1, 5 * math.sin(0.7 * t), 30 * math.sin(0.4 * t), 0.1 * t % 360)
+        elif kanal == "hiz":
+            yield kanal, HizKaydi(z, 1, 20.0, math.cos(0.1 * t), 21.0)
+        else:
+            yield kanal, KonumKaydi(z, 1, 39.93 + 1e-6 * t, 32.85, 100.0, None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--saat", type=float, default=4.0, help="doldurulacak akış süresi (saat)")
+    parser.add_argument("--hz", type=float, default=50.0, help="tutum hızı")
+    parser.add_argument("--butce", type=float, default=64.0, help="bellek bütçesi (MB)")
+    parser.add_argument("--sorgu", type=int, default=500, help="pencere başına sorgu sayısı")
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    sure = args.saat * 3600
+    kanallar = dict(KANALLAR, tutum=(KANALLAR["tutum"][0], args.hz))
+    rss_once = ortak.rss_mb()
+    gecmis = TelemetriGecmisi(args.butce, kanallar)
+    tutum = gecmis["tutum"]
+    sonuclar = []
+    hatalar = []
+    if gecmis.kapsam_s < sure:
+        print(f"Not: {args.butce} MB bütçe {gecmis.kapsam_s / 3600:.2f} saati kapsıyor; "
+              f"eski örnekler üzerine yazılacak")
+
+    # Canlıdaki gibi kayıt kayıt ekleme; tampon %10 taşırılır
+    yontemler = {"tutum": gecmis.tutum, "hiz": gecmis.hiz, "konum": gecmis.konum}
+    sureler = []
+    adet = 0
+    parti = 0.0
+    baslangic = 1.7e9
+    saat = time.perf_counter
+    for kanal, kayit in akis(baslangic, max(sure, 1.1 * gecmis.kapsam_s), args.hz):
+        # Yalnızca ekleme ölçülür; kayıt üretimi dışarıda kalır
+        bas = saat()
+        yontemler[kanal](kayit, None)
+        parti += saat() - bas
+        adet += 1
+        if adet % PARTI == 0:
+            sureler.append(parti / PARTI)
+            parti = 0.0
+    sonuc = ortak.ozet("ekle (kayıt başına)", sureler)
+    toplam_s = sum(sureler) * PARTI
+    sonuc.update({
+        "adet": adet,
+        "toplam_s": round(toplam_s, 2),
+        "ekleme_hz": round(adet / toplam_s),
+        "bellek_mb": round(gecmis.nbayt / 2 ** 20, 2),
+        "rss_artis_mb": round(ortak.rss_mb() - rss_once, 1) if rss_once is not None else None,
+        "kapsam_saat": round(gecmis.kapsam_s / 3600, 2),
+    })
+    sonuclar.append(sonuc)
+    if sonuc["ekleme_hz"] < 100 * sum(hz for _, hz in kanallar.values()):
+        hatalar.append(f"ekleme hızı {sonuc['ekleme_hz']}/s")
+    if sonuc["rss_artis_mb"] is not None and sonuc["rss_artis_mb"] > 1.2 * args.butce:
+        hatalar.append(f"bellek {sonuc['rss_artis_mb']} MB arttı, bütçe {args.butce} MB")
+    if len(tutum) != tutum.kapasite or tutum.sirasiz:
+        hatalar.append(f"halka dolmadı ya da sırasız örnek: {gecmis.istatistik()['tutum']}")
+
+    # Sorgular: rastgele konumda sabit genişlikli pencereler
+    ilk, son = tutum.aralik
+    kopya = tutum.dilim().zaman.copy()
+    rastgele = np.random.default_rng(1)
+    for ad, genislik in PENCERELER.items():
+        if genislik > son - ilk:
+            continue
+        baslar = rastgele.uniform(ilk, son - genislik, args.sorgu)
+        sorgu_sureleri, tarama_sureleri, boyutlar = [], [], []
+        for t0 in baslar:
+            bas = time.perf_counter()
+            dilim = tutum.dilim(t0, t0 + genislik)
+            sorgu_sureleri.append(time.perf_counter() - bas)
+            boyutlar.append(len(dilim.zaman))
+            if len(tarama_sureleri) < 20:
+                bas = time.perf_counter()
+                beklenen = kopya[(kopya >= t0) & (kopya <= t0 + genislik)]
+                tarama_sureleri.append(time.perf_counter() - bas)
+                if not np.array_equal(dilim.zaman, beklenen):
+                    hatalar.append(f"{ad}: dilim tam taramadan farklı ({len(dilim.zaman)} / {len(beklenen)})")
+                if not np.shares_memory(dilim.degerler, tutum._v) or dilim.zaman.flags.writeable:
+                    hatalar.append(f"{ad}: dilim salt okunur görünüm değil")
+        sonuc = ortak.ozet(f"dilim {ad}", sorgu_sureleri)
+        for anahtar in ("toplam_s", "guncelleme_hz"):
+            sonuc.pop(anahtar)
+        sonuc["ornek"] = int(np.median(boyutlar))
+        sonuc["tarama_p50_ms"] = round(1000 * ortak.yuzdelik(tarama_sureleri, 50), 3)
+        sonuclar.append(sonuc)
+        if sonuc["p99_ms"] > 1.0:
+            hatalar.append(f"dilim {ad}: p99 {sonuc['p99_ms']} ms")
+
+    # Kayıttan yükleme: aynı tutum verisi tek partide
+    yeni = TelemetriGecmisi(args.butce, kanallar)["tutum"]
+    zamanlar = baslangic + np.arange(int(sure * args.hz)) / args.hz
+    degerler = np.column_stack([np.sin(zamanlar), np.cos(zamanlar), zamanlar % 360])
+    bas = time.perf_counter()
+    yeni.toplu_ekle(zamanlar, degerler)
+    gecen = time.perf_counter() - bas
+    sonuclar.append({"ad": "toplu_ekle", "adet": len(zamanlar), "toplam_s": round(gecen, 3),
+                     "ekleme_hz": round(len(zamanlar) / gecen)})
+    son_dilim = yeni.son(len(yeni))
+    if not np.array_equal(son_dilim.zaman, zamanlar[-len(yeni):]):
+        hatalar.append("toplu_ekle sonrası son örnekler yanlış")
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""Tek ``GostergePaneli`` ile dört ayrı gösterge widget'ının CPU kullanımını karşılaştırır.
+
+Eski düzen ana penceredeki gibidir: ``YapayUfuk`` ve ibreleri ``IbreOgesi``
+olan üç ``QGraphicsView`` (hava hızı, dikey hız, dönüş). İki düzen de
+ekransız, ``--sure`` saniye boyunca 50 Hz'lik sentetik tutum ve 10 Hz'lik
+hız akışıyla beslenir; iki düzen ``--tur`` kez sırayla çalıştırılıp her
+birinin en az CPU harcayan turu alınır. Süreç CPU zamanı, saniyedeki çizim
+sayısı ve güncelleme başına süre raporlanır. Depoda olmayan görseller sentetik
+üretilir.
+
+Panel ufuk sınırı ``--ufuk-hz`` ile çalışır; karşılaştırma için ufku sınırsız
+panel de raporlanır (tik maliyetini ufkun tam yeniden çizimi belirler, sınırsız
+panel eski düzene yakındır). Sınırlı panel eski düzenden daha sık çiziyorsa ya
+da tik başına CPU zamanı eski düzenin %90'ını aşıyorsa betik hata ile çıkar.
+
+Kullanım: python benchmarks/bench_gosterge_paneli.py [--sure 3] [--tur 3] [--hz 50] [--ufuk-hz 30]
+          [--json sonuc.json]
+"""
+import argparse
+import math
+import sys
+import tempfile
+import time
+
+import ortak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sure", type=float, default=3.0, help="tur başına süre (s)")
+    parser.add_argument("--tur", type=int, default=3, help="karşılaştırma turu sayısı")
+    parser.add_argument("--hz", type=float, default=50.0, help="tutum güncelleme hızı")
+    parser.add_argument("--ufuk-hz", type=float, help="paneldeki ufuk çizim sınırı (varsayılan UFUK_HZ)")
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    app = ortak.qt_uygulamasi()
+    from PyQt5.QtCore import QEventLoop, Qt, QTimer
+    from PyQt5.QtWidgets import QGraphicsPixmapItem, QGraphicsScene, QGraphicsView, QGridLayout, QWidget
+    from gosterge_paneli import UFUK_HZ, GostergePaneli
+    from ibre_onbellegi import DonukKareler, IbreOgesi
+    from varliklar import varlik
+    from yapay_ufuk import YapayUfuk
+
+    class Sayac:
+        boyama = 0
+
+    class Ufuk(YapayUfuk):
+        def paintEvent(self, event):
+            Sayac.boyama += 1
+            super().paintEvent(event)
+
+    class IbreliGorunum(QGraphicsView):
+        """Ana penceredeki ``AirSpeedIndicator``/``VerticalSpeedIndicator``."""
+
+        def __init__(self, arka, ibre, merkez, aci, dikey=-30):
+            super().__init__()
+            self.scene = QGraphicsScene()
+            self.setScene(self.scene)
+            self.setFixedSize(250, 250)
+            self.background = QGraphicsPixmapItem(varlik(arka))
+            self.scene.addItem(self.background)
+            self.mark_icon = IbreOgesi(DonukKareler(varlik(ibre), merkez))
+            self.scene.addItem(self.mark_icon)
+            bg, ac = self.background.pixmap(), self.mark_icon.pixmap()
+            self.mark_icon.setPos((bg.width() - ac.width()) / 2, (bg.height() - ac.height()) / 2 + dikey)
+            self.aci = aci
+
+        def update_display(self, deger):
+            self.mark_icon.aci_ayarla(self.aci(deger))
+
+        def paintEvent(self, event):
+            Sayac.boyama += 1
+            super().paintEvent(event)
+
+    class DonusGorunumu(IbreliGorunum):
+        """Ana penceredeki ``TurnCoordinator``."""
+
+        def __init__(self):
+            super().__init__("TurnCoordinator_Background2.png", "DJV JUL 2357-12.png", None,
+                             lambda roll: roll / 1.587, dikey=-15)
+            self.mark_icon2 = QGraphicsPixmapItem(varlik("TurnCoordinatorMarks.png"))
+            self.scene.addItem(self.mark_icon2)
+            self.mark_icon2.setPos(96, 158)
+            self.ball_indicator = QGraphicsPixmapItem(varlik("TurnCoordinatorBall,png.PNG"))
+            self.scene.addItem(self.ball_indicator)
+
+        def update_display(self, roll):
+            super().update_display(roll)
+            ball_x = 99 + -1.84 * roll
+            self.ball_indicator.setPos(ball_x, 159 + -0.00198 * (ball_x - 99) ** 2)
+
+    def eski_duzen():
+        pencere = QWidget()
+        izgara = QGridLayout(pencere)
+        ufuk = Ufuk()
+        ufuk.setFixedSize(400, 300)
+        hiz = IbreliGorunum("AirSpeedIndicator_Background.PNG", "AirSpeedNeedle.PNG", (12, 96),
+                            lambda v: 180 + v * 7.2)
+        dikey = IbreliGorunum("VerticalSpeedIndicator_Background.PNG", "VerticalSpeedNeedle.PNG", (12, 96),
+                              lambda v: 270 + v * 25)
+        donus = DonusGorunumu()
+        izgara.addWidget(ufuk, 0, 0, 1, 2, Qt.AlignHCenter)
+        izgara.addWidget(hiz, 1, 0)
+        izgara.addWidget(dikey, 1, 1)
+        izgara.addWidget(donus, 2, 0, 1, 2, Qt.AlignHCenter)
+
+        def tutum(pitch, roll):
+            ufuk.yatay_guncelleme(pitch, roll)
+            donus.update_display(roll)
+        return pencere, tutum, hiz.update_display, dikey.update_display, lambda: Sayac.boyama
+
+    def panel_duzeni(ufuk_hz):
+        def kur():
+            panel = GostergePaneli()
+            panel.hiz_siniri_ayarla(ufuk_hz, panel.ufuk)
+            panel.resize(panel.sizeHint())
+            return panel, panel.yatay_guncelleme, panel.hiz_guncelle, panel.dikey_hiz_guncelle, lambda: panel.boyama
+        return kur
+
+    def calistir(ad, kur):
+        pencere, tutum, hiz, dikey, boyama = kur()
+        pencere.show()
+        app.processEvents()
+        ilk_boyama = boyama()
+        sureler = []
+        tik = [0]
+
+        def besle():
+            i = tik[0]
+            tik[0] += 1
+            t = i / args.hz
+            bas = time.perf_counter()
+            tutum(8 * math.sin(0.7 * t), 30 * math.sin(0.4 * t))
+            if i % max(1, round(args.hz / 10)) == 0:
+                hiz(20 + 8 * math.sin(0.3 * t))
+                dikey(3 * math.sin(0.5 * t))
+            sureler.append(time.perf_counter() - bas)
+
+        zamanlayici = QTimer()
+        zamanlayici.setTimerType(Qt.PreciseTimer)
+        zamanlayici.timeout.connect(besle)
+        dongu = QEventLoop()
+        QTimer.singleShot(round(1000 * args.sure), dongu.quit)
+        cpu_bas = time.process_time()
+        duvar_bas = time.perf_counter()
+        zamanlayici.start(round(1000 / args.hz))
+        dongu.exec_()
+        zamanlayici.stop()
+        cpu = time.process_time() - cpu_bas
+        gecen = time.perf_counter() - duvar_bas
+        pencere.close()
+
+        sonuc = ortak.ozet(ad, sureler)
+        for anahtar in ("toplam_s", "guncelleme_hz"):
+            sonuc.pop(anahtar)
+        sonuc.update({
+            "cpu_yuzde": round(100 * cpu / gecen, 2),
+            "cpu_ms_tik": round(1000 * cpu / max(1, len(sureler)), 3),
+            "boyama_hz": round((boyama() - ilk_boyama) / gecen, 1),
+        })
+        return sonuc
+
+    ufuk_hz = UFUK_HZ if args.ufuk_hz is None else args.ufuk_hz
+    duzenler = [
+        ("ayrı widget'lar", eski_duzen),
+        ("GostergePaneli (ufuk sınırsız)", panel_duzeni(0)),
+        (f"GostergePaneli (ufuk {ufuk_hz:g} Hz)", panel_duzeni(ufuk_hz)),
+    ]
+    en_iyi = {}
+    with tempfile.TemporaryDirectory() as dizin:
+        ortak.varliklari_hazirla(dizin)
+        for _ in range(args.tur):
+            for ad, kur in duzenler:
+                sonuc = calistir(ad, kur)
+                if ad not in en_iyi or sonuc["cpu_ms_tik"] < en_iyi[ad]["cpu_ms_tik"]:
+                    en_iyi[ad] = sonuc
+    sonuclar = [en_iyi[ad] for ad, _ in duzenler]
+    eski, yeni = sonuclar[0], sonuclar[-1]
+
+    hatalar = []
+    if yeni["boyama_hz"] >= eski["boyama_hz"]:
+        hatalar.append(f"panel saniyede {yeni['boyama_hz']} kez çiziyor, eski düzen {eski['boyama_hz']}")
+    if yeni["cpu_ms_tik"] > 0.9 * eski["cpu_ms_tik"]:
+        hatalar.append(f"panel tik başına {yeni['cpu_ms_tik']} ms CPU, eski düzen {eski['cpu_ms_tik']} ms")
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Harita güncelleme kıyaslaması: sayfa yeniden üretimi ve canlı JS köprüsü.
+
+Eski yol her GPS düzeltmesinde folium haritasını kurar, ``Map1.html`` dosyasına
+yazar ve görünümü yeniden yükler. Canlı yol yalnızca ``ihaGuncelle`` çağrısını
+gönderir. Her iki yol için saniyedeki güncelleme ve düzeltme başına UI iş
+parçacığı süresi raporlanır. ``PyQtWebEngine`` kuruluysa sayfa yükleme ve JS
+çalıştırma da ölçüme dahildir; değilse yalnızca Python tarafı ölçülür.
+
+Kullanım: python benchmarks/bench_harita.py [--adet 200] [--json sonuc.json]
+"""
+import argparse
+import math
+import os
+import tempfile
+import time
+
+import ortak
+
+try:
+    from PyQt5.QtWebEngineWidgets import QWebEngineView
+except ImportError:
+    QWebEngineView = None
+
+import folium
+from folium import CustomIcon
+from PyQt5 import QtCore
+from PyQt5.QtGui import QColor, QImage
+
+from harita_koprusu import CanliHarita, guncelleme_betigi
+from iz_kaydi import IzDeposu
+
+
+def sentetik_iz(adet, lat0=39.93, lon0=32.85):
+    """Bir merkez etrafında dairesel uçuş izi üretir."""
+    for i in range(adet):
+        aci = 2 * math.pi * i / 600
+        yield lat0 + 0.001 * math.sin(aci), lon0 + 0.001 * math.cos(aci), math.degrees(aci) % 360
+
+
+def yukleme_bekle(web_view, zaman_asimi_ms=10000):
+    dongu = QtCore.QEventLoop()
+    web_view.loadFinished.connect(dongu.quit)
+    QtCore.QTimer.singleShot(zaman_asimi_ms, dongu.quit)
+    dongu.exec_()
+    web_view.loadFinished.disconnect(dongu.quit)
+
+
+def eski_yol(adet, map_path, web_view):
+    sureler = []
+    path = []
+    for latitude, longitude, _ in sentetik_iz(adet):
+        baslangic = time.perf_counter()
+        path.append((latitude, longitude))
+        harita = folium.Map(location=[latitude, longitude], zoom_start=20)
+        folium.PolyLine(path, color="blue", weight=2.5, opacity=0.8).add_to(harita)
+        folium.Marker(
+            location=[latitude, longitude],
+            popup="Mevcut İHA Konumu",
+            icon=CustomIcon('plane.png', icon_size=(40, 40))
+        ).add_to(harita)
+        harita.save(map_path)
+        if web_view is not None:
+            web_view.setUrl(QtCore.QUrl.fromLocalFile(map_path))
+            yukleme_bekle(web_view)
+        sureler.append(time.perf_counter() - baslangic)
+    return ortak.ozet("eski (folium + save + setUrl)", sureler)
+
+
+def canli_yol(adet, map_path, web_view):
+    sureler = []
+    iz = IzDeposu()
+    if web_view is not None:
+        canli = CanliHarita(web_view, map_path, iz)
+        canli.yukle(0, 0)
+        yukleme_bekle(web_view)
+    for latitude, longitude, yon in sentetik_iz(adet):
+        baslangic = time.perf_counter()
+        degisiklik = iz.ekle(latitude, longitude)
+        if web_view is not None:
+            canli.guncelle(latitude, longitude, yon, degisiklik)
+            QtCore.QCoreApplication.processEvents()
+        else:
+            guncelleme_betigi(latitude, longitude, yon, degisiklik)
+        sureler.append(time.perf_counter() - baslangic)
+    return ortak.ozet("canli (runJavaScript)", sureler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--adet", type=int, default=200, help="GPS düzeltmesi sayısı")
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    app = ortak.qt_uygulamasi()
+    with tempfile.TemporaryDirectory() as dizin:
+        os.chdir(dizin)
+        ikon = QImage(40, 40, QImage.Format_ARGB32)
+        ikon.fill(QColor("red"))
+        ikon.save("plane.png")
+        map_path = os.path.abspath("Map1.html")
+
+        web_view = QWebEngineView() if QWebEngineView is not None else None
+        if web_view is None:
+            print("PyQtWebEngine bulunamadı: yalnızca Python tarafı ölçülüyor.")
+        sonuclar = [
+            eski_yol(args.adet, map_path, web_view),
+            canli_yol(args.adet, map_path, web_view),
+        ]
+        os.chdir(ortak.ARAYUZ_DIZINI)
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Çok süreçli hedef tespitinin işçi sayısına göre verimini ölçer.
+
+Dokulu bir arka plan üzerinde dairesel yol izleyen kırmızı bir hedef içeren
+sentetik kareler ``--kamera-fps`` hızında ``TespitHavuzu``'na verilir. Her işçi
+sayısı için saniyede işlenen kare, yakalamadan sonuca gecikme, düşürülen kare
+ve yakalama tarafında ``gonder`` çağrısının süresi raporlanır; satır içi
+(tek iş parçacığında) tespit hızı karşılaştırma için verilir.
+
+``gonder`` p50'si 2 ms'yi aşarsa (yakalama bekletiliyor), hedef yanlış yerde
+bulunursa ya da en az iki çekirdekli makinede iki işçi tek işçiden %30 hızlı
+değilse betik hata ile çıkar.
+
+Kullanım: python benchmarks/bench_hedef_tespiti.py [--isci 1 2 4] [--sure 4]
+          [--boyut 1280x720] [--kamera-fps 120] [--json sonuc.json]
+"""
+import argparse
+import math
+import os
+import sys
+import threading
+import time
+
+import cv2
+import numpy as np
+
+import ortak
+
+from hedef_tespiti import RenkDedektoru, TespitHavuzu
+
+
+def kareler_uret(genislik, yukseklik, adet):
+    """(kare, hedef merkezi) listesi; hedef görüntü ortasında daire çizer."""
+    rastgele = np.random.default_rng(1)
+    zemin = rastgele.integers(0, 120, (yukseklik, genislik, 3), dtype=np.uint8)
+    zemin[:, :, 1] = np.linspace(40, 160, genislik, dtype=np.uint8)
+    sonuc = []
+    for i in range(adet):
+        aci = 2 * math.pi * i / adet
+        merkez = (int(genislik / 2 + 0.25 * genislik * math.cos(aci)),
+                  int(yukseklik / 2 + 0.25 * yukseklik * math.sin(aci)))
+        kare = zemin.copy()
+        cv2.circle(kare, merkez, yukseklik // 20, (20, 20, 230), -1)
+        sonuc.append((kare, merkez))
+    return sonuc
+
+
+def calistir(isci, kareler, sure, kamera_fps, hatalar):
+    gecikmeler = []
+    merkez_hatalari = []
+    kilit = threading.Lock()
+
+    def sonuc_geldi(tespit):
+        simdi = time.monotonic()
+        with kilit:
+            gecikmeler.append(simdi - tespit.zaman)
+            if tespit.kutular:
+                x, y, g, h = tespit.kutular[0][:4]
+                mx, my = kareler[(tespit.sira - 1) % len(kareler)][1]
+                merkez_hatalari.append(math.hypot(x + g / 2 - mx, y + h / 2 - my))
+            else:
+                merkez_hatalari.append(float("inf"))
+
+    sekil = kareler[0][0].shape
+    havuz = TespitHavuzu(sekil, isci, RenkDedektoru(), sonuc_geldi).baslat()
+    try:
+        # İşçiler ayağa kalkana kadar ısınma
+        havuz.gonder(kareler[0][0], 1, time.monotonic())
+        if not ortak.bekle(lambda: havuz.islenen >= 1, 30.0):
+            hatalar.append(f"{isci} işçi: ilk sonuç gelmedi")
+            return None
+        with kilit:
+            gecikmeler.clear()
+            merkez_hatalari.clear()
+        ilk = havuz.istatistik()
+
+        gonder_sureleri = []
+        aralik = 1.0 / kamera_fps
+        baslangic = time.monotonic()
+        sira = 1
+        while time.monotonic() - baslangic < sure:
+            sira += 1
+            bas = time.perf_counter()
+            havuz.gonder(kareler[(sira - 1) % len(kareler)][0], sira, time.monotonic())
+            gonder_sureleri.append(time.perf_counter() - bas)
+            kalan = baslangic + (sira - 1) * aralik - time.monotonic()
+            if kalan > 0:
+                time.sleep(kalan)
+        gecen = time.monotonic() - baslangic
+        son = havuz.istatistik()
+    finally:
+        havuz.durdur()
+
+    with kilit:
+        sonuc = ortak.ozet(f"{isci} işçi", gecikmeler)
+        en_kotu = max(merkez_hatalari) if merkez_hatalari else float("inf")
+    sonuc.pop("toplam_s")
+    sonuc.pop("guncelleme_hz")
+    sonuc.update({
+        "islenen_fps": round((son["islenen"] - ilk["islenen"]) / gecen, 1),
+        "gonderilen": son["gonderilen"] - ilk["gonderilen"],
+        "dusurulen": son["dusurulen"] - ilk["dusurulen"],
+        "gonder_p50_ms": round(1000 * ortak.yuzdelik(gonder_sureleri, 50), 3),
+        "gonder_p99_ms": round(1000 * ortak.yuzdelik(gonder_sureleri, 99), 3),
+        "merkez_hata_px": round(en_kotu, 1),
+    })
+    # İşçiler çekirdeklerden fazlayken p99 işletim sistemi zamanlamasını da ölçer
+    if sonuc["gonder_p50_ms"] > 2.0:
+        hatalar.append(f"{isci} işçi: gonder p50 {sonuc['gonder_p50_ms']} ms, yakalama bekletiliyor")
+    if en_kotu > 3.0:
+        hatalar.append(f"{isci} işçi: hedef merkezi {en_kotu:.1f} px sapıyor")
+    return sonuc
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--isci", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--sure", type=float, default=4.0, help="işçi sayısı başına süre (s)")
+    parser.add_argument("--boyut", default="1280x720")
+    parser.add_argument("--kamera-fps", type=float, default=120.0)
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    genislik, yukseklik = (int(d) for d in args.boyut.split("x"))
+    kareler = kareler_uret(genislik, yukseklik, 90)
+
+    # Satır içi başvuru: aynı dedektör, tek iş parçacığı, tek çekirdek
+    cv2.setNumThreads(1)
+    dedektor = RenkDedektoru()
+    sureler = []
+    for kare, _ in kareler:
+        bas = time.perf_counter()
+        dedektor(kare)
+        sureler.append(time.perf_counter() - bas)
+    satir_ici = ortak.ozet("satır içi", sureler)
+    satir_ici.pop("toplam_s")
+    satir_ici["islenen_fps"] = satir_ici.pop("guncelleme_hz")
+
+    sonuclar = [satir_ici]
+    hatalar = []
+    verim = {}
+    for isci in args.isci:
+        sonuc = calistir(isci, kareler, args.sure, args.kamera_fps, hatalar)
+        if sonuc is not None:
+            sonuclar.append(sonuc)
+            verim[isci] = sonuc["islenen_fps"]
+
+    cekirdek = os.cpu_count() or 1
+    if cekirdek >= 2 and 1 in verim and 2 in verim and verim[2] < 1.3 * verim[1]:
+        hatalar.append(f"iki işçi tek işçiden yeterince hızlı değil: {verim}")
+    elif cekirdek < 2:
+        print(f"Not: {cekirdek} çekirdek; işçi sayısıyla ölçeklenme sınanmadı")
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""Gösterge ibrelerinde döndürülmüş kare önbelleğinin saniyedeki güncelleme sayısını ölçer.
+
+Hava hızı, dikey hız ve dönüş göstergeleri ekransız 250x250 görünümde kurulur.
+Her gösterge aynı 50 Hz'lik sentetik örnek dizisiyle eski yolla (öğe
+dönüşümü) ve ``IbreOgesi`` önbelleğiyle beslenir; her örnekte ``aci_ayarla``
+ve bekleyen çizim olayları işlenir. Önbelleğin ilk geçişi (soğuk) ayrıca
+raporlanır; sonra iki yol ``--tur`` kez sırayla ölçülüp her birinin en iyi
+turu alınır. Depoda olmayan görseller aynı boyutta sentetik olarak üretilir.
+
+Sıcak önbellekle saniyedeki güncelleme eski yolun %90'ının altındaysa betik
+hata ile çıkar (yalnızca ibre değişen küçük göstergelerde iki yol yakındır).
+
+Kullanım: python benchmarks/bench_ibre_onbellegi.py [--ornek 2000] [--tur 3] [--json sonuc.json]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+import ortak
+
+# (ad, arka plan, ibre, ibre boyutu, dönme merkezi, örnek -> açı)
+GOSTERGELER = [
+    ("AirSpeedIndicator", "AirSpeedIndicator_Background.PNG", "AirSpeedNeedle.PNG", (24, 129), (12, 96),
+     lambda t, g: 180 + 7.2 * (20 + 8 * math.sin(0.3 * t) + g)),
+    ("VerticalSpeedIndicator", "VerticalSpeedIndicator_Background.PNG", "VerticalSpeedNeedle.PNG", (24, 129),
+     (12, 96), lambda t, g: 270 + 25 * (3 * math.sin(0.5 * t) + 0.1 * g)),
+    ("TurnCoordinator", "TurnCoordinator_Background2.png", "DJV JUL 2357-12.png", (250, 184), None,
+     lambda t, g: (40 * math.sin(0.4 * t) + g) / 1.587),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ornek", type=int, default=2000, help="gösterge başına örnek sayısı")
+    parser.add_argument("--tur", type=int, default=3, help="karşılaştırma turu sayısı")
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    app = ortak.qt_uygulamasi()
+    from PyQt5.QtCore import QPointF, Qt
+    from PyQt5.QtGui import QColor, QPainter, QPixmap, QPolygonF
+    from PyQt5.QtWidgets import QGraphicsPixmapItem, QGraphicsScene, QGraphicsView
+    from ibre_onbellegi import DonukKareler, IbreOgesi
+
+    def gorsel(dosya, genislik, yukseklik, ibre):
+        yol = os.path.join(ortak.ARAYUZ_DIZINI, dosya)
+        if os.path.exists(yol):
+            return QPixmap(yol)
+        pixmap = QPixmap(genislik, yukseklik)
+        pixmap.fill(Qt.transparent)
+        p = QPainter(pixmap)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(Qt.NoPen)
+        if ibre:
+            p.setBrush(QColor(240, 240, 240))
+            p.drawPolygon(QPolygonF([QPointF(genislik / 2, 0), QPointF(genislik, yukseklik * 0.75),
+                                     QPointF(genislik / 2, yukseklik), QPointF(0, yukseklik * 0.75)]))
+        else:
+            p.setBrush(QColor(30, 30, 30))
+            p.drawEllipse(0, 0, genislik, yukseklik)
+        p.end()
+        return pixmap
+
+    class Gosterge(QGraphicsView):
+        def __init__(self, arka, ibre, merkez, onbellekli):
+            super().__init__()
+            self.scene = QGraphicsScene()
+            self.setScene(self.scene)
+            self.setFixedSize(250, 250)
+            self.boyama = 0
+            self.background = QGraphicsPixmapItem(arka)
+            self.scene.addItem(self.background)
+            self.mark_icon = IbreOgesi(DonukKareler(ibre, merkez), onbellekli=onbellekli)
+            self.scene.addItem(self.mark_icon)
+            self.mark_icon.setPos((arka.width() - ibre.width()) / 2, (arka.height() - ibre.height()) / 2 - 30)
+
+        def paintEvent(self, event):
+            self.boyama += 1
+            super().paintEvent(event)
+
+    def calistir(ad, gosterge, acilar):
+        sureler = []
+        boyama = gosterge.boyama
+        for aci in acilar:
+            bas = time.perf_counter()
+            gosterge.mark_icon.aci_ayarla(aci)
+            app.processEvents()
+            sureler.append(time.perf_counter() - bas)
+        sonuc = ortak.ozet(ad, sureler)
+        sonuc.pop("toplam_s")
+        sonuc["boyama"] = gosterge.boyama - boyama
+        return sonuc
+
+    sonuclar = []
+    hatalar = []
+    for ad, arka_dosya, ibre_dosya, (genislik, yukseklik), merkez, aci in GOSTERGELER:
+        arka = gorsel(arka_dosya, 230, 230, False)
+        ibre = gorsel(ibre_dosya, genislik, yukseklik, True)
+        rastgele = random.Random(1)
+        acilar = [aci(i / 50, rastgele.gauss(0, 0.3)) for i in range(args.ornek)]
+
+        eski_gosterge = Gosterge(arka, ibre, merkez, onbellekli=False)
+        gosterge = Gosterge(arka, ibre, merkez, onbellekli=True)
+        for g in (eski_gosterge, gosterge):
+            g.show()
+        app.processEvents()
+        soguk = calistir(f"{ad} önbellek (soğuk)", gosterge, acilar)
+        eski = sicak = None
+        for _ in range(args.tur):
+            sonuc = calistir(f"{ad} dönüşüm", eski_gosterge, acilar)
+            if eski is None or sonuc["guncelleme_hz"] > eski["guncelleme_hz"]:
+                eski = sonuc
+            sonuc = calistir(f"{ad} önbellek (sıcak)", gosterge, acilar)
+            if sicak is None or sonuc["guncelleme_hz"] > sicak["guncelleme_hz"]:
+                sicak = sonuc
+        sicak.update(gosterge.mark_icon.kareler.istatistik())
+        for g in (eski_gosterge, gosterge):
+            g.close()
+
+        sonuclar += [eski, soguk, sicak]
+        if sicak["guncelleme_hz"] < 0.9 * eski["guncelleme_hz"]:
+            hatalar.append(f"{ad}: önbellekle {sicak['guncelleme_hz']} güncelleme/s, "
+                           f"eski yol {eski['guncelleme_hz']}")
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""İz deposu dayanıklılık kıyaslaması.
+
+2 saatlik, 10 Hz'lik sentetik bir uçuşu (72 000 nokta) ``IzDeposu`` üzerinden
+oynatır. Her 10 dakikalık pencere için bellek kullanımı, güncelleme başına
+gecikme ve haritaya gönderilen JS metninin boyutu raporlanır. Kayıt boyunca
+p99 gecikme, geçmiş nokta sınırına ulaşıldıktan sonra da bellek düz
+kalmazsa betik hata koduyla çıkar.
+
+Kullanım: python benchmarks/bench_iz_kaydi.py [--saat 2] [--hz 10] [--json sonuc.json]
+"""
+import argparse
+import math
+import random
+import sys
+import time
+import tracemalloc
+
+import ortak
+
+from harita_koprusu import guncelleme_betigi
+from iz_kaydi import IzDeposu
+
+
+def sentetik_ucus(adet, hz, lat0=39.93, lon0=32.85, tohum=1):
+    """Tarama, daire ve gürültü içeren tekrarlanabilir bir iz üretir."""
+    rastgele = random.Random(tohum)
+    lat, lon, yon = lat0, lon0, 0.0
+    hiz_m_s = 20.0
+    for i in range(adet):
+        dakika = i / hz / 60
+        if int(dakika) % 3 == 2:
+            yon += 360 / (60 * hz)  # Bir dakikada tam daire
+        elif i % (hz * 30) == 0:
+            yon += 180  # Tarama deseninde dönüş
+        adim = hiz_m_s / hz
+        lat += adim * math.cos(math.radians(yon)) / 111320.0 + rastgele.gauss(0, 2e-7)
+        lon += adim * math.sin(math.radians(yon)) / (111320.0 * math.cos(math.radians(lat))) + rastgele.gauss(0, 2e-7)
+        yield lat, lon, yon % 360
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--saat", type=float, default=2.0)
+    parser.add_argument("--hz", type=int, default=10)
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    adet = int(args.saat * 3600 * args.hz)
+    pencere = 10 * 60 * args.hz
+    iz = IzDeposu()
+    sonuclar = []
+    sureler, bayt = [], 0
+
+    tracemalloc.start()
+    for i, (latitude, longitude, yon) in enumerate(sentetik_ucus(adet, args.hz), 1):
+        baslangic = time.perf_counter()
+        degisiklik = iz.ekle(latitude, longitude)
+        betik = guncelleme_betigi(latitude, longitude, yon, degisiklik)
+        sureler.append(time.perf_counter() - baslangic)
+        bayt += len(betik)
+        if i % pencere == 0:
+            sonuc = ortak.ozet(f"{i / args.hz / 60:.0f}. dk", sureler)
+            sonuc["bellek_kb"] = round(tracemalloc.get_traced_memory()[0] / 1024, 1)
+            sonuc["iz_noktasi"] = len(iz)
+            sonuc["ort_betik_bayt"] = round(bayt / len(sureler), 1)
+            sonuclar.append(sonuc)
+            sureler, bayt = [], 0
+    tracemalloc.stop()
+    ortak.sonuc_yazdir(sonuclar, args.json)
+
+    # Geçmiş sınırına ulaşılana kadar bellek büyür; ikinci yarı düz kalmalı
+    kararli = sonuclar[len(sonuclar) // 2:] or sonuclar
+    bellek = [s["bellek_kb"] for s in kararli]
+    p99 = [s["p99_ms"] for s in kararli]
+    hatalar = []
+    if max(bellek) > 1.5 * min(bellek) + 64:
+        hatalar.append(f"bellek düz değil: {min(bellek)}-{max(bellek)} KB")
+    if max(p99) > 3 * min(p99) + 0.5:
+        hatalar.append(f"p99 gecikme düz değil: {min(p99)}-{max(p99)} ms")
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+"""Kamera kare hattının kare hızını ve kare başına CPU süresini ölçer.
+
+640x480 ve 1280x720 sentetik MJPG videoları ``cv2.VideoCapture`` ile okunur ve
+ekransız bir ``CameraDisplay``'de gösterilir. Eski yol (``cvtColor`` + yeni
+``QImage`` + ``QPixmap.fromImage``) ile havuzlu BGR888 yol aynı karelerle
+karşılaştırılır. Her kare okunur, gösterilir ve görünüm hemen yeniden çizilir;
+süre ve süreç CPU zamanı kare başına raporlanır. Havuzlu yol eski yoldan
+yavaşsa ya da tampon sızdırırsa betik hata ile çıkar.
+
+Kullanım: python benchmarks/bench_kamera.py [--kare 300] [--json sonuc.json]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import cv2
+
+import ortak
+
+COZUNURLUKLER = ((640, 480), (1280, 720))
+
+
+def eski_yol(cap, gorunum, oge):
+    from PyQt5.QtGui import QImage, QPixmap
+    ret, frame = cap.read()
+    if not ret:
+        return False
+    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    h, w, ch = frame.shape
+    qimg = QImage(frame.data, w, h, ch * w, QImage.Format_RGB888)
+    oge.setPixmap(QPixmap.fromImage(qimg))
+    return True
+
+
+def calistir(ad, dosya, kare_isle):
+    cap = cv2.VideoCapture(dosya)
+    gorunum, durum = kare_isle(cap)
+    adet = 0
+    sureler = []
+    cpu_bas = time.process_time()
+    duvar_bas = time.perf_counter()
+    while True:
+        baslangic = time.perf_counter()
+        if not durum():
+            break
+        gorunum.viewport().repaint()
+        sureler.append(time.perf_counter() - baslangic)
+        adet += 1
+    duvar = time.perf_counter() - duvar_bas
+    cpu = time.process_time() - cpu_bas
+    cap.release()
+    sonuc = ortak.ozet(ad, sureler)
+    sonuc.update({"fps": round(adet / duvar, 1), "cpu_ms_kare": round(1000 * cpu / max(1, adet), 3)})
+    return sonuc, gorunum
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--kare", type=int, default=300)
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    ortak.qt_uygulamasi()
+    from PyQt5.QtWidgets import QGraphicsPixmapItem
+    kamera = ortak.betik_yukle("Görüntü kamerası.py", "goruntu_kamerasi")
+    from kamera_hatti import KareHavuzu, kare_oku
+
+    sonuclar = []
+    hatalar = []
+    with tempfile.TemporaryDirectory() as dizin:
+        for genislik, yukseklik in COZUNURLUKLER:
+            dosya = os.path.join(dizin, f"{genislik}x{yukseklik}.avi")
+            ortak.video_yaz(dosya, genislik, yukseklik, args.kare)
+
+            def eski(cap):
+                gorunum = kamera.CameraDisplay()
+                oge = QGraphicsPixmapItem()
+                gorunum.scene.removeItem(gorunum.image_item)
+                gorunum.scene.addItem(oge)
+                gorunum.show()
+                return gorunum, lambda: eski_yol(cap, gorunum, oge)
+
+            havuzlar = []
+
+            def havuzlu(cap):
+                gorunum = kamera.CameraDisplay()
+                gorunum.show()
+                havuz = KareHavuzu.kamera_icin(cap)
+                havuzlar.append(havuz)
+
+                def adim():
+                    kare = kare_oku(cap, havuz)
+                    if kare is None:
+                        return False
+                    gorunum.update_image(kare)
+                    return True
+                return gorunum, adim
+
+            eski_sonuc, _ = calistir(f"eski {genislik}x{yukseklik}", dosya, eski)
+            yeni_sonuc, _ = calistir(f"havuzlu {genislik}x{yukseklik}", dosya, havuzlu)
+            havuz = havuzlar[-1]
+            yeni_sonuc.update(havuz.istatistik())
+            sonuclar += [eski_sonuc, yeni_sonuc]
+
+            if yeni_sonuc["cpu_ms_kare"] > eski_sonuc["cpu_ms_kare"]:
+                hatalar.append(f"{genislik}x{yukseklik}: havuzlu yol kare başına daha çok CPU harcıyor")
+            # Gösterilen son kare dışında tüm tamponlar havuza dönmüş olmalı
+            if havuz.bos != havuz.boyut - 1:
+                hatalar.append(f"{genislik}x{yukseklik}: {havuz.boyut - 1 - havuz.bos} tampon havuza dönmedi")
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
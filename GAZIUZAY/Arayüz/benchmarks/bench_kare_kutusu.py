@@ -0,0 +1,118 @@
+"""Meşgul GUI altında kamera gösterim gecikmesini ve kare düşürmeyi ölçer.
+
+Sentetik bir video 60 fps'lik bir kamera gibi okunur; GUI iş parçacığı her
+yarım saniyede bir 150 ms bloklanır (harita yenileme, dosya diyaloğu vb.).
+Her kareyi sinyalle gönderen eski yol ile tek kareli ``KareKutusu`` ve
+``KareYayici`` (gösterim üst sınırı ``--ekran-fps``) karşılaştırılır; yakalama
+ile gösterim arasındaki süre, gösterilen/düşen kare sayıları raporlanır.
+Kutulu yolun p95/p99 gecikmesi eski yoldan kötüyse, gösterim hızı üst sınırı
+aşarsa ya da tampon sızarsa betik hata ile çıkar.
+
+Kullanım: python benchmarks/bench_kare_kutusu.py [--sure 4] [--kamera-fps 60]
+          [--ekran-fps 30] [--blok-ms 150] [--json sonuc.json]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import ortak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sure", type=float, default=4.0, help="senaryo süresi (s)")
+    parser.add_argument("--kamera-fps", type=int, default=60)
+    parser.add_argument("--ekran-fps", type=int, default=30)
+    parser.add_argument("--blok-ms", type=int, default=150, help="GUI'nin her yarım saniyede bloklandığı süre")
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    app = ortak.qt_uygulamasi()
+    from PyQt5.QtCore import QThread, QTimer
+    from kamera_hatti import kare_oku
+    kamera = ortak.betik_yukle("Görüntü kamerası.py", "goruntu_kamerasi")
+
+    class SinyalliThread(kamera.CameraThread):
+        """Her kareyi doğrudan yayan eski yol."""
+
+        def start(self):
+            QThread.start(self)
+
+        def run(self):
+            while self.running:
+                kare = kare_oku(self.cap, self.havuz)
+                if kare is not None:
+                    self.frame_ready.emit(kare)
+
+    def senaryo(ad, sinif, dosya):
+        gecikmeler = []
+        gorunum = kamera.CameraDisplay()
+        gorunum.show()
+
+        def goster(kare):
+            gecikmeler.append(time.monotonic() - kare.zaman)
+            gorunum.update_image(kare)
+
+        is_parcacigi = sinif(dosya, ekran_fps=args.ekran_fps)
+        is_parcacigi.cap.release()
+        is_parcacigi.cap = ortak.SanalKamera(dosya, args.kamera_fps)
+        is_parcacigi.frame_ready.connect(goster)
+
+        bloklayici = QTimer()
+        bloklayici.timeout.connect(lambda: time.sleep(args.blok_ms / 1000))
+        bloklayici.start(500)
+        cpu_bas = time.process_time()
+        is_parcacigi.start()
+        QTimer.singleShot(int(args.sure * 1000), app.quit)
+        app.exec_()
+        bloklayici.stop()
+        is_parcacigi.stop()
+        # Kuyrukta kalan eski yol kareleri de gösterilir
+        app.processEvents()
+        cpu = time.process_time() - cpu_bas
+
+        havuz = is_parcacigi.havuz
+        sonuc = ortak.ozet(ad, gecikmeler)
+        sonuc.update({
+            "yakalanan": havuz.yakalanan,
+            "gosterilen": len(gecikmeler),
+            "dusurulen": havuz.dusurulen + is_parcacigi.kutu.dusurulen,
+            "gosterim_fps": round(len(gecikmeler) / args.sure, 1),
+            "cpu_ms_s": round(1000 * cpu / args.sure, 1),
+            "bos_tampon": havuz.bos,
+        })
+        # ortak.ozet süreleri güncelleme süresi sayar; burada gecikmedir
+        for anahtar in ("toplam_s", "guncelleme_hz"):
+            sonuc.pop(anahtar)
+        return sonuc, havuz
+
+    sonuclar = []
+    hatalar = []
+    with tempfile.TemporaryDirectory() as dizin:
+        dosya = os.path.join(dizin, "kamera.avi")
+        ortak.video_yaz(dosya, 640, 480, 120)
+        eski, _ = senaryo("sinyal (her kare)", SinyalliThread, dosya)
+        yeni, havuz = senaryo(f"kutu ({args.ekran_fps} fps)", kamera.CameraThread, dosya)
+        sonuclar += [eski, yeni]
+
+    # Kutulu yol boşta bir ekran karesine kadar bekletir; kuyruk birikmesini p95/p99 gösterir
+    if yeni["p95_ms"] > eski["p95_ms"] or yeni["p99_ms"] > eski["p99_ms"]:
+        hatalar.append("kutulu yolun gecikmesi eski yoldan yüksek")
+    if yeni["gosterim_fps"] > 1.1 * args.ekran_fps:
+        hatalar.append(f"gösterim {yeni['gosterim_fps']} fps, üst sınır {args.ekran_fps}")
+    if yeni["gosterilen"] + yeni["dusurulen"] < yeni["yakalanan"]:
+        hatalar.append("yakalanan kareler gösterilen ve düşürülenlerle uyuşmuyor")
+    # Gösterilen son kare dışında tüm tamponlar havuza dönmüş olmalı
+    if havuz.bos != havuz.boyut - 1:
+        hatalar.append(f"{havuz.boyut - 1 - havuz.bos} tampon havuza dönmedi")
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Uçuş kaydedicinin telemetri dağıtımına eklediği gecikmeyi ölçer.
+
+Aynı sentetik MAVLink akışı ``TelemetriMerkezi.dagit`` üzerinden önce yalnızca
+bir arayüz abonesiyle, sonra ek olarak ``UcusKaydedici`` ile dağıtılır. Mesaj
+başına dağıtım süresi karşılaştırılır ve yazılan tlog dosyası
+``mavutil`` ile geri okunarak mesaj sayısı doğrulanır.
+
+Kullanım: python benchmarks/bench_kaydedici.py [--adet 50000] [--hz 0] [--json sonuc.json]
+(--hz 0: olabildiğince hızlı; ör. --hz 50 gerçek zamanlı akış)
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import ortak
+
+from pymavlink import mavutil
+from pymavlink.dialects.v20 import ardupilotmega as mavlink
+
+from telemetri import TelemetriMerkezi, UcusKaydedici
+
+
+def sentetik_mesajlar(adet):
+    """Paketlenmiş (ham baytları hazır) ATTITUDE/VFR_HUD/GPS_RAW_INT mesajları."""
+    mav = mavlink.MAVLink(None, srcSystem=1, srcComponent=1)
+    mesajlar = []
+    for i in range(adet):
+        if i % 10 == 0:
+            msg = mavlink.MAVLink_gps_raw_int_message(i, 3, 399300000, 328500000, 900000, 100, 100, 2000, 9000, 12)
+        elif i % 5 == 0:
+            msg = mavlink.MAVLink_vfr_hud_message(20.0, 21.0, 90, 50, 900.0, 1.5)
+        else:
+            msg = mavlink.MAVLink_attitude_message(i, 0.1, 0.05, 1.0, 0.0, 0.0, 0.0)
+        msg.pack(mav)
+        msg._timestamp = time.time()
+        mesajlar.append(msg)
+    return mesajlar
+
+
+def dagit(merkez, mesajlar, hz):
+    sureler = []
+    aralik = 1.0 / hz if hz else 0.0
+    sonraki = time.perf_counter()
+    for msg in mesajlar:
+        if aralik:
+            sonraki += aralik
+            while time.perf_counter() < sonraki:
+                pass
+        baslangic = time.perf_counter()
+        merkez.dagit(msg)
+        sureler.append(time.perf_counter() - baslangic)
+    return sureler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--adet", type=int, default=50000)
+    parser.add_argument("--hz", type=float, default=0.0)
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    mesajlar = sentetik_mesajlar(args.adet)
+    son_deger = {}
+
+    def arayuz_abonesi(msg):
+        son_deger[msg.get_type()] = msg  # Sinyal gönderimi yerine
+
+    merkez = TelemetriMerkezi()
+    merkez.abone_ol(arayuz_abonesi, tipler=('ATTITUDE', 'VFR_HUD', 'GPS_RAW_INT'))
+    sonuclar = [ortak.ozet("yalnızca arayüz abonesi", dagit(merkez, mesajlar, args.hz))]
+
+    with tempfile.TemporaryDirectory() as dizin:
+        dosya = os.path.join(dizin, "ucus.tlog")
+        kaydedici = UcusKaydedici(merkez, dosya).baslat()
+        sonuc = ortak.ozet("arayüz + uçuş kaydedici", dagit(merkez, mesajlar, args.hz))
+        kaydedici.durdur()
+        sonuc.update({k: v for k, v in kaydedici.istatistik().items() if k != "dosya"})
+
+        okunan = 0
+        tlog = mavutil.mavlink_connection(dosya)
+        while tlog.recv_match() is not None:
+            okunan += 1
+        tlog.close()
+        sonuc["geri_okunan"] = okunan
+        sonuclar.append(sonuc)
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    if okunan != args.adet:
+        print(f"HATA: {args.adet} mesaj kaydedildi, {okunan} geri okundu")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""SQLite oturum deposunun yazma hızını, kuyruğa ekleme süresini ve sorgu gecikmesini ölçer.
+
+Geçici bir dosyaya ``--oturum`` adet ``--sure`` saniyelik oturum yazılır:
+tutum ``--hz``, hız 10 Hz, konum 5 Hz, kayıtlar canlıdaki gibi dinleyici
+yöntemleriyle ve beklemeden. Kayıt başına kuyruğa ekleme süresi ile ilk
+kayıttan yazıcının bitişine kadar kayıt/s raporlanır. Karşılaştırma için
+``--tekil`` kayıt, kayıt başına bir işlemle (``INSERT`` + ``commit``) hem
+WAL hem varsayılan günlük kipinde yazılır.
+
+Sonra ortadaki oturumda rastgele 1 s, 1 dk ve 10 dk'lık tutum pencereleri
+``OturumOkuyucu.pencere`` ile, ilk 20'si dizinsiz (``NOT INDEXED``) de
+sorgulanır. Son olarak ``--canli`` saniye boyunca bir iş parçacığı gerçek
+zamanlı 50 Hz tutum yazarken ana iş parçacığı 60 Hz'lik bir GUI döngüsünün
+gecikmesini ölçer.
+
+Yazılan kayıt sayısı gönderilenden farklıysa, toplu yazma akış hızının 100
+katından yavaşsa, pencere sorgusu dizini kullanmıyorsa ya da sonucu dizinsiz
+sorgudan farklıysa, 1 s'lik pencerenin p99'u 5 ms'yi ya da p50'si dizinsiz
+sorgunun onda birini aşıyorsa, canlı kipte kuyruğa ekleme p99'u 1 ms'yi ya da GUI
+döngüsü gecikmesi p99'u bir kareyi aşıyorsa betik hata ile çıkar.
+
+Kullanım: python benchmarks/bench_oturum_deposu.py [--sure 3600] [--oturum 3] [--hz 50] [--json sonuc.json]
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from contextlib import closing
+
+import numpy as np
+
+import ortak
+
+from bench_gecmis import akis
+from telemetri import OturumDeposu, OturumOkuyucu, TutumKaydi
+from telemetri.oturum_deposu import _EKLE, _sema
+
+PARTI = 1024
+PENCERELER = {"1 s": 1.0, "1 dk": 60.0, "10 dk": 600.0}
+
+
+def tekil_yaz(dosya, kayitlar, wal):
+    """Kayıt başına bir işlem: deposuz, doğrudan yazmanın hızı."""
+    with closing(sqlite3.connect(dosya)) as baglanti:
+        if wal:
+            baglanti.execute("PRAGMA journal_mode=WAL")
+            baglanti.execute("PRAGMA synchronous=NORMAL")
+        baglanti.executescript(_sema())
+        bas = time.perf_counter()
+        for tablo, kayit in kayitlar:
+            baglanti.execute(_EKLE[tablo], (1, *kayit))
+            baglanti.commit()
+        return time.perf_counter() - bas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sure", type=float, default=3600.0, help="oturum başına akış süresi (s)")
+    parser.add_argument("--oturum", type=int, default=3, help="oturum sayısı")
+    parser.add_argument("--hz", type=float, default=50.0, help="tutum hızı")
+    parser.add_argument("--tekil", type=int, default=2000, help="kayıt başına işlemle yazılacak kayıt")
+    parser.add_argument("--sorgu", type=int, default=200, help="pencere başına sorgu sayısı")
+    parser.add_argument("--canli", type=float, default=3.0, help="gerçek zamanlı kip süresi (s)")
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    akis_hz = args.hz + 10 + 5
+    sonuclar = []
+    hatalar = []
+    with tempfile.TemporaryDirectory() as dizin:
+        dosya = os.path.join(dizin, "ucuslar.db")
+
+        # Toplu yazma: oturumlar sırayla, kayıtlar beklemeden
+        oturumlar = []
+        sureler = []
+        toplam_adet = 0
+        toplam_s = 0.0
+        for sira in range(args.oturum):
+            kayitlar = list(akis(1.7e9 + sira * 10 * args.sure, args.sure, args.hz))
+            depo = OturumDeposu(dosya, kaynak=f"bench {sira}").baslat()
+            yontemler = {"tutum": depo.tutum, "hiz": depo.hiz, "konum": depo.konum}
+            bas = time.perf_counter()
+            for i in range(0, len(kayitlar), PARTI):
+                parti_bas = time.perf_counter()
+                for kanal, kayit in kayitlar[i:i + PARTI]:
+                    yontemler[kanal](kayit, None)
+                sureler.append((time.perf_counter() - parti_bas) / len(kayitlar[i:i + PARTI]))
+            depo.durdur()
+            toplam_s += time.perf_counter() - bas
+            toplam_adet += len(kayitlar)
+            yazilan = sum(depo.yazilan.values())
+            if yazilan != len(kayitlar):
+                hatalar.append(f"oturum {depo.oturum}: {len(kayitlar)} kayıt gönderildi, {yazilan} yazıldı")
+            oturumlar.append((depo.oturum, kayitlar[0][1].zaman, depo.islem))
+        sonuc = ortak.ozet("kuyruğa ekleme (kayıt başına)", sureler)
+        for anahtar in ("toplam_s", "guncelleme_hz"):
+            sonuc.pop(anahtar)
+        sonuclar.append(sonuc)
+        sonuclar.append({"ad": "toplu yazma (WAL, yazıcı iş parçacığı)", "adet": toplam_adet,
+                         "toplam_s": round(toplam_s, 3), "kayit_s": round(toplam_adet / toplam_s),
+                         "islem": sum(islem for _, _, islem in oturumlar),
+                         "dosya_mb": round(os.path.getsize(dosya) / 2 ** 20, 1)})
+        if toplam_adet / toplam_s < 100 * akis_hz:
+            hatalar.append(f"toplu yazma {toplam_adet / toplam_s:.0f} kayıt/s")
+
+        ornek = kayitlar[:args.tekil]
+        for wal in (True, False):
+            gecen = tekil_yaz(os.path.join(dizin, f"tekil_{wal}.db"), ornek, wal)
+            sonuclar.append({"ad": f"kayıt başına işlem ({'WAL' if wal else 'varsayılan günlük'})",
+                             "adet": len(ornek), "toplam_s": round(gecen, 3), "kayit_s": round(len(ornek) / gecen)})
+
+        # Pencere sorguları: ortadaki oturum
+        oturum, ilk, _ = oturumlar[len(oturumlar) // 2]
+        okuyucu = OturumOkuyucu(dosya)
+        plan = " ".join(str(satir[-1]) for satir in okuyucu._baglanti.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM tutum WHERE oturum = ? AND zaman BETWEEN ? AND ? ORDER BY zaman",
+            (oturum, 0, 1)))
+        if "tutum_oturum_zaman" not in plan or "ORDER BY" in plan:
+            hatalar.append(f"pencere sorgusu dizini kullanmıyor: {plan}")
+        rastgele = np.random.default_rng(1)
+        for ad, genislik in PENCERELER.items():
+            if genislik > args.sure:
+                continue
+            sorgu_sureleri, tarama_sureleri, boyutlar = [], [], []
+            for t0 in rastgele.uniform(ilk, ilk + args.sure - genislik, args.sorgu):
+                bas = time.perf_counter()
+                pencere = okuyucu.pencere(oturum, "tutum", t0, t0 + genislik)
+                sorgu_sureleri.append(time.perf_counter() - bas)
+                boyutlar.append(len(pencere))
+                if len(tarama_sureleri) < 20:
+                    bas = time.perf_counter()
+                    beklenen = okuyucu._baglanti.execute(
+                        "SELECT * FROM tutum NOT INDEXED WHERE oturum = ? AND zaman BETWEEN ? AND ? ORDER BY zaman",
+                        (oturum, t0, t0 + genislik)).fetchall()
+                    tarama_sureleri.append(time.perf_counter() - bas)
+                    if [tuple(kayit) for kayit in pencere] != [satir[1:] for satir in beklenen]:
+                        hatalar.append(f"{ad}: dizinli sorgu dizinsizden farklı")
+            sonuc = ortak.ozet(f"pencere {ad}", sorgu_sureleri)
+            for anahtar in ("toplam_s", "guncelleme_hz"):
+                sonuc.pop(anahtar)
+            sonuc["kayit"] = int(np.median(boyutlar))
+            sonuc["dizinsiz_p50_ms"] = round(1000 * ortak.yuzdelik(tarama_sureleri, 50), 3)
+            sonuclar.append(sonuc)
+            # Kısa pencere (kare başına sorgu) dizinle taramadan çok daha hızlı olmalı
+            if genislik == 1.0 and (sonuc["p99_ms"] > 5.0 or sonuc["p50_ms"] > sonuc["dizinsiz_p50_ms"] / 10):
+                hatalar.append(f"pencere {ad}: p50 {sonuc['p50_ms']} ms, p99 {sonuc['p99_ms']} ms, "
+                               f"dizinsiz p50 {sonuc['dizinsiz_p50_ms']} ms")
+        okuyucu.kapat()
+
+        # Gerçek zamanlı: 50 Hz yazarken 60 Hz GUI döngüsü
+        depo = OturumDeposu(dosya, kaynak="bench canlı").baslat()
+        ekleme = []
+        dur = threading.Event()
+
+        def uretici():
+            adim = 0
+            baslangic = time.perf_counter()
+            while not dur.is_set():
+                adim += 1
+                kayit = TutumKaydi(time.time(), 1, 0.1, 0.2, 0.3)
+                bas = time.perf_counter()
+                depo.tutum(kayit, None)
+                ekleme.append(time.perf_counter() - bas)
+                time.sleep(max(0.0, baslangic + adim / 50 - time.perf_counter()))
+
+        thread = threading.Thread(target=uretici, daemon=True)
+        thread.start()
+        gecikmeler = []
+        kare = 1 / 60
+        hedef = time.perf_counter() + kare
+        bitis = time.perf_counter() + args.canli
+        while hedef < bitis:
+            time.sleep(max(0.0, hedef - time.perf_counter()))
+            gecikmeler.append(max(0.0, time.perf_counter() - hedef))
+            hedef += kare
+        dur.set()
+        thread.join()
+        depo.durdur()
+        sonuc = ortak.ozet("canlı 50 Hz: kuyruğa ekleme", ekleme)
+        for anahtar in ("toplam_s", "guncelleme_hz"):
+            sonuc.pop(anahtar)
+        sonuc["islem"] = depo.islem
+        sonuclar.append(sonuc)
+        if sonuc["p99_ms"] > 1.0:
+            hatalar.append(f"canlı kuyruğa ekleme p99 {sonuc['p99_ms']} ms")
+        sonuc = ortak.ozet("canlı 50 Hz: 60 Hz döngü gecikmesi", gecikmeler)
+        for anahtar in ("toplam_s", "guncelleme_hz"):
+            sonuc.pop(anahtar)
+        sonuclar.append(sonuc)
+        if sonuc["p99_ms"] > 1000 * kare:
+            hatalar.append(f"GUI döngüsü gecikmesi p99 {sonuc['p99_ms']} ms")
+        if depo.yazilan["tutum"] != len(ekleme):
+            hatalar.append(f"canlı: {len(ekleme)} kayıt gönderildi, {depo.yazilan['tutum']} yazıldı")
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
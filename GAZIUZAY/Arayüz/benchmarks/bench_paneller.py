@@ -0,0 +1,347 @@
+"""Ana penceredeki panellerin ekransız çizim kıyaslama takımı.
+
+``HaraketPenceresi``, ``AirSpeedIndicator``, ``VerticalSpeedIndicator``,
+``TurnCoordinator``, ``CameraDisplay``, harita paneli (``HaritaPenceresi``),
+``GostergePaneli`` ve MDI şerit grafiği (``SeritGrafik``) sırayla, her biri ayrı bir süreçte ``QT_QPA_PLATFORM=offscreen``
+ile kurulur. Bir iş parçacığı sabit hızlarda sentetik telemetri (tutum 50 Hz,
+hız ve dikey hız 10 Hz, GPS 5 Hz) ve 30 fps kamera karesi üretir; değerler
+telemetri merkezindeki gibi kuyruklu sinyalle GUI iş parçacığına geçer.
+
+Panel başına raporlanan değerler:
+
+* kurulum süresi, güncelleme (yuva) ve ``paintEvent`` süreleri (p50/p95/p99),
+  harita için ``runJavaScript`` dönüşüne kadar geçen süre,
+* tepe RSS ve kurulumdan sonuna RSS artışı,
+* olay kuyruğu derinliği: üretilip henüz işlenmemiş sinyal sayısı (en çok,
+  p95) ve üretimden yuvaya geçen süre.
+
+Sınıflar önce ana pencere betiğinden alınır; betik yüklenemezse aynı sınıfı
+tanımlayan tek panel betiği denenir. Hiçbiri yüklenemiyor ya da panel kurulurken
+bir bağımlılık eksik çıkıyorsa (ör. QtWebEngine) panel ``atlandi`` nedeniyle
+kaydedilir. Depoda olmayan görseller sentetik üretilir.
+
+Sonuçlar sürüm bilgisiyle birlikte ``--cikti`` JSON dosyasına yazılır.
+``--onceki`` ile önceki bir sürümün dosyası verilirse p95 süreleri, tepe RSS ya
+da kuyruk derinliği ``--tolerans`` oranından fazla artan paneller için betik
+hata ile çıkar.
+
+Kullanım: python benchmarks/bench_paneller.py [--sure 5] [--panel AD ...]
+          [--cikti paneller.json] [--onceki eski.json] [--tolerans 0.5]
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+import ortak
+
+ANA_PENCERE = "arayüz ama düzeltilecek.py"
+
+# Kanal: (Hz, t -> yuva argümanları)
+KANALLAR = {
+    "tutum": (50, lambda t: (8 * math.sin(0.7 * t), 30 * math.sin(0.4 * t))),
+    "donus": (50, lambda t: (30 * math.sin(0.4 * t), 0.0)),
+    "hiz": (10, lambda t: (20 + 8 * math.sin(0.3 * t),)),
+    "dikey_hiz": (10, lambda t: (3 * math.sin(0.5 * t),)),
+    "gps": (5, lambda t: (39.93 + 0.001 * math.sin(t / 20), 32.85 + 0.001 * math.cos(t / 20), 100.0)),
+    "yon": (5, lambda t: (math.degrees(t / 20) % 360,)),
+    "kare": (30, None),
+}
+
+# Panel: (aday (betik, sınıf) listesi, kanal -> yuva adı)
+PANELLER = {
+    "HaraketPenceresi": (
+        [(ANA_PENCERE, "HaraketPenceresi"), ("ANA HARAKET SENSÖR PENCERESİ.py", "haraketpenceresi1")],
+        {"tutum": "yatay_guncelleme"}),
+    "AirSpeedIndicator": (
+        [(ANA_PENCERE, "AirSpeedIndicator")],
+        {"hiz": "update_display"}),
+    "VerticalSpeedIndicator": (
+        [(ANA_PENCERE, "VerticalSpeedIndicator"), ("Dikey hız göstergesi.py", "VerticalSpeedIndicator")],
+        {"dikey_hiz": "update_display"}),
+    "TurnCoordinator": (
+        [(ANA_PENCERE, "TurnCoordinator"), ("Dengeleyici göstergesi.py", "TurnCoordinator")],
+        {"donus": "update_display"}),
+    "CameraDisplay": (
+        [(ANA_PENCERE, "CameraDisplay"), ("Görüntü kamerası.py", "CameraDisplay")],
+        {"kare": "update_image"}),
+    "HaritaPenceresi": (
+        [(ANA_PENCERE, "HaritaPenceresi"), ("ANA HARİTA PANELİ GELİŞTİRMELİ.py", "HaritaPenceresi")],
+        {"gps": "update_map", "yon": "update_heading"}),
+    "GostergePaneli": (
+        [("gosterge_paneli.py", "GostergePaneli")],
+        {"tutum": "yatay_guncelleme", "hiz": "hiz_guncelle", "dikey_hiz": "dikey_hiz_guncelle"}),
+    "SeritGrafik": (
+        [("serit_grafik.py", "SeritGrafik")],
+        {"tutum": "yatay_guncelleme", "hiz": "hiz_guncelle", "dikey_hiz": "dikey_hiz_guncelle",
+         "gps": "konum_guncelle"}),
+}
+
+# Önceki sürümle karşılaştırılan değerler ve gürültü için mutlak alt sınırları
+KARSILASTIRMA = {
+    "guncelleme_p95_ms": 0.1,
+    "cizim_p95_ms": 0.25,
+    "tepe_rss_mb": 5.0,
+    "kuyruk_derinligi_max": 2,
+}
+
+
+def surum_bilgisi():
+    """Sonuç dosyasını sürüme bağlayan bilgiler."""
+    from PyQt5.QtCore import PYQT_VERSION_STR, QT_VERSION_STR
+    try:
+        revizyon = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ortak.ARAYUZ_DIZINI,
+                                  capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revizyon = None
+    return {
+        "revizyon": revizyon,
+        "tarih": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "pyqt": PYQT_VERSION_STR,
+        "platform": platform.platform(),
+    }
+
+
+def sinif_yukle(adaylar):
+    """İlk yüklenebilen adayın sınıfını ve kaynağını döndürür; yoksa (None, neden)."""
+    nedenler = []
+    for betik, sinif in adaylar:
+        try:
+            modul = ortak.betik_yukle(betik, os.path.splitext(betik)[0].replace(" ", "_"))
+        except ImportError as hata:
+            nedenler.append(f"{betik}: {hata}")
+            continue
+        return getattr(modul, sinif), f"{betik}:{sinif}"
+    return None, "; ".join(nedenler)
+
+
+def panel_olc(ad, sure):
+    """Tek paneli kurar, ``sure`` saniye besler ve ölçümleri döndürür."""
+    app = ortak.qt_uygulamasi()
+    from PyQt5.QtCore import QEventLoop, QObject, Qt, QTimer, pyqtSignal, pyqtSlot
+    from kamera_hatti import KareHavuzu
+
+    adaylar, yuvalar = PANELLER[ad]
+    sinif, kaynak = sinif_yukle(adaylar)
+    if sinif is None:
+        return {"ad": ad, "atlandi": kaynak}
+
+    cizimler = []
+
+    def paintEvent(self, event):
+        bas = time.perf_counter()
+        sinif.paintEvent(self, event)
+        cizimler.append(time.perf_counter() - bas)
+
+    Olculen = type(sinif.__name__, (sinif,), {"paintEvent": paintEvent})
+
+    class Alici(QObject):
+        """Kuyruklu sinyalleri GUI iş parçacığında panele aktarır."""
+
+        def __init__(self, panel):
+            super().__init__()
+            self.panel = panel
+            self.uretilen = 0
+            self.islenen = 0
+            self.guncellemeler = []
+            self.derinlikler = []
+            self.bekleme = []
+
+        @pyqtSlot(object)
+        def al(self, ornek):
+            yuva, degerler, uretim = ornek
+            self.islenen += 1
+            self.derinlikler.append(self.uretilen - self.islenen)
+            bas = time.perf_counter()
+            self.bekleme.append(bas - uretim)
+            getattr(self.panel, yuva)(*degerler)
+            self.guncellemeler.append(time.perf_counter() - bas)
+
+    class Uretici(QObject):
+        ornek = pyqtSignal(object)
+
+    rss_once = ortak.rss_mb()
+    bas = time.perf_counter()
+    try:
+        panel = Olculen()
+    except ImportError as hata:
+        # Ağır bağımlılıklar (ör. QtWebEngine) panel kurulurken içe aktarılır
+        return {"ad": ad, "atlandi": f"{kaynak}: {hata}"}
+    kurulum = time.perf_counter() - bas
+    panel.show()
+    app.processEvents()
+    ilk_cizim = len(cizimler)
+
+    alici = Alici(panel)
+    uretici = Uretici()
+    uretici.ornek.connect(alici.al, Qt.QueuedConnection)
+
+    # Harita çizimi ayrı süreçte; güncellemenin sayfada uygulanması beklenir
+    uygulamalar = []
+    canli = getattr(panel, "canli_harita", None)
+    if canli is not None:
+        son_gps = [None]
+        gps_yuvasi = yuvalar["gps"]
+        asil = getattr(panel, gps_yuvasi)
+
+        def gps_olc(*degerler):
+            son_gps[0] = time.perf_counter()
+            asil(*degerler)
+        setattr(panel, gps_yuvasi, gps_olc)
+        canli.uygulandi.connect(
+            lambda: son_gps[0] is not None and uygulamalar.append(time.perf_counter() - son_gps[0]))
+
+    havuz = KareHavuzu(6, (300, 400, 3))
+    desen = np.linspace(0, 255, 400, dtype=np.float32)
+    kareler = [np.broadcast_to(((desen + 8 * i) % 256).astype(np.uint8)[None, :, None], (300, 400, 3))
+               for i in range(32)]
+    dusurulen = [0]
+    dur = threading.Event()
+
+    def uret():
+        sonraki = {kanal: time.perf_counter() for kanal in yuvalar}
+        baslangic = time.perf_counter()
+        while not dur.is_set():
+            kanal = min(sonraki, key=sonraki.get)
+            kalan = sonraki[kanal] - time.perf_counter()
+            if kalan > 0:
+                dur.wait(kalan)
+                continue
+            hz, deger = KANALLAR[kanal]
+            sonraki[kanal] += 1.0 / hz
+            t = sonraki[kanal] - baslangic
+            if kanal == "kare":
+                kare = havuz.al()
+                if kare is None:
+                    dusurulen[0] += 1
+                    continue
+                np.copyto(kare.dizi, kareler[havuz.yakalanan % len(kareler)])
+                havuz.yakalanan += 1
+                kare.sira, kare.zaman = havuz.yakalanan, time.monotonic()
+                degerler = (kare,)
+            else:
+                degerler = deger(t)
+            alici.uretilen += 1
+            uretici.ornek.emit((yuvalar[kanal], degerler, time.perf_counter()))
+
+    is_parcacigi = threading.Thread(target=uret, name="bench-uretici", daemon=True)
+    dongu = QEventLoop()
+    QTimer.singleShot(round(1000 * sure), dongu.quit)
+    cpu_bas = time.process_time()
+    duvar_bas = time.perf_counter()
+    is_parcacigi.start()
+    dongu.exec_()
+    dur.set()
+    is_parcacigi.join()
+    app.processEvents()
+    gecen = time.perf_counter() - duvar_bas
+    cpu = time.process_time() - cpu_bas
+    rss_sonra = ortak.rss_mb()
+    panel.close()
+
+    guncelleme = ortak.ozet(ad, alici.guncellemeler)
+    cizim = ortak.ozet(ad, cizimler[ilk_cizim:])
+    sonuc = {
+        "ad": ad,
+        "kaynak": kaynak,
+        "kurulum_ms": round(1000 * kurulum, 2),
+        "guncelleme_adet": guncelleme["adet"],
+        "guncelleme_p50_ms": guncelleme["p50_ms"],
+        "guncelleme_p95_ms": guncelleme["p95_ms"],
+        "guncelleme_p99_ms": guncelleme["p99_ms"],
+        "cizim_hz": round(cizim["adet"] / gecen, 1),
+        "cizim_p50_ms": cizim["p50_ms"],
+        "cizim_p95_ms": cizim["p95_ms"],
+        "cizim_p99_ms": cizim["p99_ms"],
+        "cpu_yuzde": round(100 * cpu / gecen, 1),
+        "tepe_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "rss_artisi_mb": round(rss_sonra - rss_once, 1) if rss_once is not None else None,
+        "kuyruk_derinligi_max": max(alici.derinlikler, default=0),
+        "kuyruk_derinligi_p95": ortak.yuzdelik(alici.derinlikler, 95),
+        "kuyruk_bekleme_p99_ms": round(1000 * ortak.yuzdelik(alici.bekleme, 99), 3),
+    }
+    if "kare" in yuvalar:
+        sonuc["dusurulen_kare"] = dusurulen[0]
+    if canli is not None:
+        uygulama = ortak.ozet(ad, uygulamalar)
+        sonuc.update({"uygulama_adet": uygulama["adet"], "uygulama_p95_ms": uygulama["p95_ms"]})
+    return sonuc
+
+
+def gerilemeler(sonuclar, onceki, tolerans):
+    """Önceki sürüme göre ``tolerans``'tan fazla kötüleşen değerler."""
+    eskiler = {s["ad"]: s for s in onceki.get("paneller", []) if "atlandi" not in s}
+    hatalar = []
+    for sonuc in sonuclar:
+        eski = eskiler.get(sonuc["ad"])
+        if eski is None or "atlandi" in sonuc:
+            continue
+        for anahtar, taban in KARSILASTIRMA.items():
+            yeni_deger, eski_deger = sonuc.get(anahtar), eski.get(anahtar)
+            if yeni_deger is None or eski_deger is None:
+                continue
+            if yeni_deger > eski_deger * (1 + tolerans) and yeni_deger - eski_deger > taban:
+                hatalar.append(f"{sonuc['ad']}: {anahtar} {eski_deger} -> {yeni_deger}")
+    return hatalar
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sure", type=float, default=5.0, help="panel başına süre (s)")
+    parser.add_argument("--panel", nargs="+", choices=list(PANELLER), help="yalnızca bu paneller")
+    parser.add_argument("--cikti", default="paneller.json", help="sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--onceki", help="karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument("--tolerans", type=float, default=0.5, help="izin verilen göreli kötüleşme")
+    parser.add_argument("--tek", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.tek:
+        # Alt süreç: tek paneli ölçer, sonucu --cikti dosyasına yazar
+        with tempfile.TemporaryDirectory() as dizin:
+            ortak.qt_uygulamasi()
+            ortak.varliklari_hazirla(dizin)
+            os.chdir(dizin)
+            sonuc = panel_olc(args.tek, args.sure)
+            os.chdir(ortak.ARAYUZ_DIZINI)
+        with open(args.cikti, "w", encoding="utf-8") as f:
+            json.dump(sonuc, f, ensure_ascii=False)
+        return 0
+
+    ortam = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    sonuclar = []
+    hatalar = []
+    with tempfile.TemporaryDirectory() as dizin:
+        for ad in args.panel or PANELLER:
+            dosya = os.path.join(dizin, f"{ad}.json")
+            surec = subprocess.run([sys.executable, os.path.abspath(__file__), "--tek", ad,
+                                    "--sure", str(args.sure), "--cikti", dosya], env=ortam)
+            if surec.returncode != 0 or not os.path.exists(dosya):
+                hatalar.append(f"{ad}: ölçüm süreci {surec.returncode} koduyla çıktı")
+                continue
+            with open(dosya, encoding="utf-8") as f:
+                sonuclar.append(json.load(f))
+
+    ortak.sonuc_yazdir(sonuclar)
+    with open(args.cikti, "w", encoding="utf-8") as f:
+        json.dump({"surum": surum_bilgisi(), "paneller": sonuclar}, f, ensure_ascii=False, indent=2)
+    if args.onceki:
+        with open(args.onceki, encoding="utf-8") as f:
+            hatalar += gerilemeler(sonuclar, json.load(f), args.tolerans)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""Telemetri merkezini UDP sanal araçla yük ve dayanıklılık altında sınar.
+
+``SanalArac`` yerel bir UDP portuna yayın yapar, ``TelemetriMerkezi`` bu porta
+``udpin`` ile bağlanır. Önce ``SET_MESSAGE_INTERVAL`` gidiş-dönüşü denetlenir,
+sonra ATTITUDE hızı adım adım artırılarak gönderilen ve merkeze ulaşan mesaj
+oranı ölçülür; oranın %95'in altına düştüğü ilk adım kırılma noktası olarak
+raporlanır. ``--dayaniklilik`` verilirse sabit hızda saatlerce çalıştırılıp
+dakikalık özetler yazdırılır.
+
+Kullanım: python benchmarks/bench_sanal_arac.py [--sistem 2] [--adim 3]
+          [--dayaniklilik 7200 --dayaniklilik-hz 200] [--json sonuc.json]
+"""
+import argparse
+import resource
+import sys
+import time
+
+import ortak
+
+from telemetri import TelemetriMerkezi
+from telemetri.sanal_arac import SanalArac
+
+ADIMLAR = (50, 100, 200, 400, 800, 1600, 3200)
+
+
+def olc(arac, merkez, sure):
+    """``sure`` boyunca gönderilen ve ulaşan ATTITUDE sayıları."""
+    gonderilen = arac.gonderilen.get('ATTITUDE', 0)
+    ulasan = merkez.toplam.get('ATTITUDE', 0)
+    time.sleep(sure)
+    # Yoldaki paketlerin ulaşması için kısa bekleme
+    time.sleep(0.05)
+    return (arac.gonderilen.get('ATTITUDE', 0) - gonderilen,
+            merkez.toplam.get('ATTITUDE', 0) - ulasan)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sistem", type=int, default=2, help="sanal araç sayısı")
+    parser.add_argument("--adim", type=float, default=3.0, help="her hız adımının süresi (s)")
+    parser.add_argument("--kayip", type=float, default=0.0)
+    parser.add_argument("--titreme", type=float, default=0.0)
+    parser.add_argument("--dayaniklilik", type=float, default=0.0, help="dayanıklılık süresi (s)")
+    parser.add_argument("--dayaniklilik-hz", type=float, default=200.0)
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    port = ortak.bos_port()
+    merkez = TelemetriMerkezi(port=f"udpin:127.0.0.1:{port}").baslat()
+    # Panelin yapacağı kadar iş: son değeri sakla
+    son = {}
+    merkez.abone_ol(lambda msg: son.__setitem__(msg.get_srcSystem(), msg), tipler=('ATTITUDE',))
+    arac = SanalArac(("127.0.0.1", port), sistemler=range(1, args.sistem + 1),
+                     kayip=args.kayip, titreme=args.titreme, tohum=1).baslat()
+
+    hatalar = []
+    sonuclar = []
+    try:
+        if not ortak.bekle(lambda: merkez.bagli):
+            print("HATA: sanal araçtan heartbeat alınamadı")
+            return 1
+
+        # Hız yöneticisi -> SET_MESSAGE_INTERVAL -> COMMAND_ACK gidiş-dönüşü
+        merkez.hiz.talep_et("kiyaslama", {'VFR_HUD': 4})
+        if not ortak.bekle(lambda: merkez.hiz.onaylanan > 0 and arac.hizlar(1).get('VFR_HUD') == 4, 2.0):
+            hatalar.append("SET_MESSAGE_INTERVAL onaylanmadı")
+        sonuclar.append({"ad": "hız isteği", "onaylanan": merkez.hiz.onaylanan,
+                         "arac_hizlari": arac.hizlar(1)})
+
+        kirilma = None
+        for hz in ADIMLAR:
+            arac.hiz_ayarla('ATTITUDE', hz)
+            time.sleep(0.2)
+            gonderilen, ulasan = olc(arac, merkez, args.adim)
+            oran = ulasan / gonderilen if gonderilen else 0.0
+            sonuclar.append({
+                "ad": f"ATTITUDE {hz} Hz x {args.sistem}",
+                "gonderilen_hz": round(gonderilen / args.adim),
+                "ulasan_hz": round(ulasan / args.adim),
+                "oran": round(oran, 4),
+                "arac_gecikme_ms": arac.istatistik()["en_buyuk_gecikme_ms"],
+            })
+            if kirilma is None and oran < 0.95:
+                kirilma = hz * args.sistem
+            if hz == ADIMLAR[0] and oran < 0.99:
+                hatalar.append(f"{hz} Hz'de bile mesajların yalnızca %{100 * oran:.1f}'i ulaştı")
+        sonuclar.append({"ad": "kırılma noktası", "toplam_hz": kirilma or f"> {ADIMLAR[-1] * args.sistem}"})
+
+        if args.dayaniklilik:
+            arac.hiz_ayarla('ATTITUDE', args.dayaniklilik_hz)
+            bitis = time.monotonic() + args.dayaniklilik
+            while time.monotonic() < bitis:
+                adim = min(60.0, bitis - time.monotonic())
+                gonderilen, ulasan = olc(arac, merkez, adim)
+                ozet = {
+                    "ad": "dayanıklılık",
+                    "gecen_s": round(args.dayaniklilik - (bitis - time.monotonic())),
+                    "oran": round(ulasan / gonderilen, 4) if gonderilen else 0.0,
+                    "rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+                    "mesaj_hz": {t: round(h, 1) for t, h in merkez.mesaj_hz.items()},
+                }
+                print(ozet, flush=True)
+                if gonderilen and ulasan / gonderilen < 0.99 - args.kayip:
+                    hatalar.append(f"dayanıklılıkta oran %{100 * ulasan / gonderilen:.1f}")
+                    break
+            sonuclar.append(ozet)
+    finally:
+        arac.durdur()
+        merkez.durdur()
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
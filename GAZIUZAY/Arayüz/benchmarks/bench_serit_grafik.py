@@ -0,0 +1,221 @@
+"""Şerit grafiğin 1M örnek/kanal ile çizim, kaydırma ve canlı kare sürelerini ölçer.
+
+``SeritGrafik``'in beş kanalına ``--nokta`` örnek (50 Hz, ~5,5 saat) yüklenir
+ve piramit kurulumu ölçülür. Sonra ekransız:
+
+* tüm uçuş, 1 saat ve 1 dk görünümlerinde tam yeniden çizim; aynı sütun
+  zarfı çizimsiz olarak piramitten ve ham örneklerin ``reduceat`` ile yeniden
+  taranmasıyla da hesaplanır, bir kanalın bütün ham örnekleri de tek çizgi
+  olarak çizilir,
+* canlı kip: ``--kare`` kare boyunca 30 fps'de tutum 50 Hz, hız 10 Hz,
+  konum 5 Hz örnek eklenip ``ilerle`` ve boyama,
+* 1 saatlik görünümde sürükleme ve tekerlek yakınlaştırması.
+
+Piramit zarfı ham örneklerin sütun başına min/max'ından farklıysa, canlı kipte
+kare başına ortalama ikiden fazla sütun çiziliyor ya da tam yeniden çizim
+yapılıyorsa, ya da canlı kare, kaydırma veya yakınlaştırma p99'u bir kare
+süresini (``1000 / fps`` ms) aşıyorsa betik hata ile çıkar.
+
+Kullanım: python benchmarks/bench_serit_grafik.py [--nokta 1000000] [--genislik 1200] [--kare 600] [--json sonuc.json]
+"""
+import argparse
+import math
+import sys
+import time
+
+import numpy as np
+
+import ortak
+
+HZ = 50.0
+FPS = 30
+# Canlı akışta kanal hızları (tutum, hız, konum)
+CANLI_HZ = {"pitch": 50, "roll": 50, "yer_hizi": 10, "dikey_hiz": 10, "irtifa": 5}
+
+
+def sinyal(kanal, t, rastgele):
+    """Uzun süre aynı aralıkta kalan sentetik kanal değerleri."""
+    gurultu = rastgele.normal(0, 1, np.shape(t))
+    if kanal == "irtifa":
+        return 100 + 20 * np.sin(2 * np.pi * t / 40) + 0.5 * gurultu
+    if kanal == "dikey_hiz":
+        return 2 * np.cos(2 * np.pi * t / 40) + 0.3 * gurultu
+    if kanal == "yer_hizi":
+        return 20 + 3 * np.sin(2 * np.pi * t / 25) + 0.2 * gurultu
+    if kanal == "pitch":
+        return 10 * np.sin(2 * np.pi * t / 9) + gurultu
+    return 40 * np.sin(2 * np.pi * t / 13) + 2 * gurultu
+
+
+def ham_zarf(zaman, deger, t_bas, sutun_suresi, sutun):
+    """Referans: her sütunun min/max'ı ham örneklerden."""
+    kenarlar = np.searchsorted(zaman, t_bas + sutun_suresi * np.arange(sutun + 1))
+    mn, mx = np.full(sutun, np.nan), np.full(sutun, np.nan)
+    for i, (a, b) in enumerate(zip(kenarlar[:-1], kenarlar[1:])):
+        if b > a:
+            mn[i], mx[i] = deger[a:b].min(), deger[a:b].max()
+    return mn, mx
+
+
+def ham_tarama(zaman, deger, t_bas, sutun_suresi, sutun):
+    """Piramitsiz yeniden örnekleme: görünür ham örnekler her seferinde taranır."""
+    kenarlar = np.searchsorted(zaman, t_bas + sutun_suresi * np.arange(sutun + 1))
+    i0, i1 = kenarlar[0], kenarlar[-1]
+    baslar = np.minimum(kenarlar[:-1], i1 - 1) - i0
+    parca = deger[i0:i1]
+    return np.minimum.reduceat(parca, baslar), np.maximum.reduceat(parca, baslar)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nokta", type=int, default=1_000_000, help="kanal başına örnek")
+    parser.add_argument("--genislik", type=int, default=1200, help="grafik genişliği (piksel)")
+    parser.add_argument("--yukseklik", type=int, default=600, help="grafik yüksekliği (piksel)")
+    parser.add_argument("--tekrar", type=int, default=20, help="görünüm başına tam çizim sayısı")
+    parser.add_argument("--kare", type=int, default=600, help="canlı kip kare sayısı")
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    app = ortak.qt_uygulamasi()
+    from PyQt5.QtCore import QPointF
+    from PyQt5.QtGui import QPainter, QPixmap, QPolygonF
+    from serit_grafik import SeritGrafik
+
+    rastgele = np.random.default_rng(1)
+    baslangic = 1.7e9
+    zaman = baslangic + np.arange(args.nokta) / HZ
+    veriler = {kanal: sinyal(kanal, zaman - baslangic, rastgele) for kanal in CANLI_HZ}
+    grafik = SeritGrafik(en_fazla=2 * args.nokta)
+    grafik.resize(args.genislik, args.yukseklik)
+    grafik.show()
+    app.processEvents()
+    W = grafik.width()
+    butce_ms = 1000 / FPS
+    sonuclar = []
+    hatalar = []
+
+    bas = time.perf_counter()
+    for serit in grafik.seritler:
+        serit.piramit.toplu_ekle(zaman, veriler[serit.kanal])
+        serit.piramit.ozetle()
+    sonuclar.append({"ad": "piramit kurulumu", "adet": 5 * args.nokta,
+                     "toplam_s": round(time.perf_counter() - bas, 3)})
+
+    def ciz():
+        grafik.yeniden_ciz()
+        grafik.repaint()
+
+    # Tam yeniden çizim ve ham tarama, üç görünüm
+    son = float(zaman[-1])
+    gorunumler = {"tüm uçuş": son - baslangic, "1 saat": 3600.0, "1 dk": 60.0}
+    for ad, sure in gorunumler.items():
+        grafik.canli = False
+        grafik.piksel_saniye = W / sure
+        grafik.sag_zaman = baslangic + sure + 0.37 * (son - baslangic - sure)
+        t_bas = (grafik._sag_sutun() - W + 1) / grafik.piksel_saniye
+        for serit in grafik.seritler:
+            beklenen = ham_zarf(zaman, veriler[serit.kanal], t_bas, 1 / grafik.piksel_saniye, W)
+            bulunan = serit.piramit.zarf(t_bas, 1 / grafik.piksel_saniye, W)
+            if not all(np.array_equal(x, y, equal_nan=True) for x, y in zip(bulunan, beklenen)):
+                hatalar.append(f"{ad}: {serit.kanal} zarfı ham min/max'tan farklı")
+        sureler = []
+        for _ in range(args.tekrar):
+            bas = time.perf_counter()
+            ciz()
+            sureler.append(time.perf_counter() - bas)
+        sonuc = ortak.ozet(f"tam çizim {ad}", sureler)
+        sonuc["ornek_sutun"] = round(sure * HZ / W, 1)
+        sonuclar.append(sonuc)
+        # Çizimsiz karşılaştırma: aynı zarf piramitten ve ham örneklerden
+        for yol, zarf in (("piramit", lambda serit: serit.piramit.zarf(t_bas, 1 / grafik.piksel_saniye, W)),
+                          ("ham tarama", lambda serit: ham_tarama(zaman, veriler[serit.kanal], t_bas,
+                                                                  1 / grafik.piksel_saniye, W))):
+            sureler = []
+            for _ in range(args.tekrar):
+                bas = time.perf_counter()
+                for serit in grafik.seritler:
+                    zarf(serit)
+                sureler.append(time.perf_counter() - bas)
+            sonuclar.append(ortak.ozet(f"{yol} zarfı {ad} (5 kanal, çizimsiz)", sureler))
+
+    # Ham çizgi: bir kanalın bütün örnekleri tek QPolygonF
+    poligon = QPolygonF()
+    poligon.fill(QPointF(), args.nokta)
+    tampon = poligon.data()
+    tampon.setsize(16 * args.nokta)
+    dizi = np.frombuffer(tampon, dtype=np.float64).reshape(-1, 2)
+    dizi[:, 0] = (zaman - baslangic) * W / (son - baslangic)
+    dizi[:, 1] = 60 - veriler["irtifa"] / 3
+    tuval = QPixmap(W, 120)
+    tuval.fill()
+    bas = time.perf_counter()
+    painter = QPainter(tuval)
+    painter.drawPolyline(poligon)
+    painter.end()
+    sonuclar.append({"ad": "ham çizgi tüm uçuş (1 kanal)", "adet": args.nokta,
+                     "toplam_s": round(time.perf_counter() - bas, 3)})
+
+    # Canlı kip: yalnızca yeni sütunlar çizilmeli
+    grafik.piksel_saniye = 10.0
+    grafik.canliya_don()
+    tam, serit_cizim, sutun = grafik.tam_cizim, grafik.serit_cizim, grafik.cizilen_sutun
+    sayac = {kanal: 0 for kanal in CANLI_HZ}
+    sureler = []
+    for kare in range(1, args.kare + 1):
+        simdi = son + kare / FPS
+        for kanal, hz in CANLI_HZ.items():
+            while (sayac[kanal] + 1) / hz <= kare / FPS:
+                sayac[kanal] += 1
+                t = son + sayac[kanal] / hz
+                grafik.ekle(kanal, t, float(sinyal(kanal, t - baslangic, rastgele)))
+        bas = time.perf_counter()
+        grafik.ilerle()
+        grafik.repaint()
+        sureler.append(time.perf_counter() - bas)
+    tam = grafik.tam_cizim - tam
+    serit_cizim = grafik.serit_cizim - serit_cizim
+    sutun_basina = (grafik.cizilen_sutun - sutun - tam * W) / max(serit_cizim, 1)
+    sonuc = ortak.ozet(f"canlı kare {FPS} fps", sureler)
+    sonuc.update({"serit_cizim": serit_cizim, "tam_cizim": tam, "kare_basina_sutun": round(sutun_basina, 2),
+                  "son_zaman_farki_s": round(simdi - grafik.sag_zaman, 3)})
+    sonuclar.append(sonuc)
+    if tam:
+        hatalar.append(f"canlı kipte {tam} tam yeniden çizim")
+    if sutun_basina > 2:
+        hatalar.append(f"canlı kipte kare başına {sutun_basina:.1f} sütun çizildi")
+    if sonuc["p99_ms"] > butce_ms:
+        hatalar.append(f"canlı kare p99 {sonuc['p99_ms']} ms")
+
+    # Kaydırma ve yakınlaştırma: 1 saatlik görünüm, uçuşun ortası
+    grafik.piksel_saniye = W / 3600
+    grafik.canli = False
+    grafik.sag_zaman = baslangic + (son - baslangic) / 2
+    grafik.yeniden_ciz()
+    sureler = []
+    for adim in range(100):
+        bas = time.perf_counter()
+        grafik.kaydir(40 if adim % 50 < 25 else -40)
+        grafik.repaint()
+        sureler.append(time.perf_counter() - bas)
+    sonuclar.append(ortak.ozet("kaydırma 40 piksel", sureler))
+    sureler = []
+    for adim in range(40):
+        bas = time.perf_counter()
+        grafik.yakinlastir(1.25 if adim % 20 < 10 else 0.8, W // 2)
+        grafik.repaint()
+        sureler.append(time.perf_counter() - bas)
+    sonuclar.append(ortak.ozet("yakınlaştırma", sureler))
+    for sonuc in sonuclar[-2:]:
+        if sonuc["p99_ms"] > butce_ms:
+            hatalar.append(f"{sonuc['ad']}: p99 {sonuc['p99_ms']} ms")
+    if not math.isclose(grafik.piksel_saniye, W / 3600):
+        hatalar.append("yakınlaştırma ölçeği geri dönmedi")
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
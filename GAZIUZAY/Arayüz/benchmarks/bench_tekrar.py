@@ -0,0 +1,183 @@
+"""Tekrar oynatıcının hızını, zamanlama doğruluğunu ve arayüz yükünü ölçer.
+
+Sentetik bir uçuş tlog dosyası üretilir ve ``TekrarOynatici`` ile
+``TelemetriMerkezi`` üzerinden oynatılır:
+
+* beklemeden (``--hiz 0``) ulaşılan mesaj/s,
+* ``--hiz`` katında oynatmada ulaşılan gerçek hız katı,
+* Qt sinyalleriyle beslenen ekransız bir olay döngüsünün gecikmesi
+  (ana pencere QtWebEngine gerektirir; kurulu değilse bu bölüm atlanır).
+
+Ayrıca iki oynatmanın aynı mesaj sırasını verdiği ve ``ara`` ile atlanan
+konumun doğru olduğu denetlenir.
+
+Kullanım: python benchmarks/bench_tekrar.py [--sure 300] [--hiz 20] [--json sonuc.json]
+"""
+import argparse
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+
+import ortak
+
+from telemetri import TekrarOynatici, TelemetriMerkezi
+from telemetri.sentetik import tlog_yaz
+
+
+def imza(dosya, adet=2000):
+    """İlk ``adet`` mesajın (tip, zaman) sırası."""
+    tekrar = TekrarOynatici(dosya, hiz=0)
+    sira = []
+    while len(sira) < adet:
+        msg = tekrar.recv_match(timeout=0.5)
+        if msg is None:
+            break
+        sira.append((msg.get_type(), msg._timestamp))
+    return sira
+
+
+def merkezden_oynat(dosya, hiz, abone):
+    """Dosyayı merkez üzerinden sonuna kadar oynatır; (süre, oynatıcı) döndürür."""
+    tekrar = TekrarOynatici(dosya, hiz=hiz)
+    merkez = TelemetriMerkezi(baglanti=tekrar)
+    merkez.abone_ol(abone)
+    baslangic = time.perf_counter()
+    merkez.baslat()
+    while not tekrar.bitti:
+        time.sleep(0.01)
+    gecen = time.perf_counter() - baslangic
+    merkez.durdur()
+    return gecen, tekrar
+
+
+def olay_dongusu_gecikmesi(dosya, hiz, sure):
+    """Merkez mesajlarını Qt sinyaliyle ana iş parçacığına taşır; 10 ms'lik
+    zamanlayıcının gecikmesini ve iletilen sinyal hızını ölçer."""
+    app = ortak.qt_uygulamasi()
+    from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+    class Kopru(QObject):
+        mesaj = pyqtSignal(object)
+
+    kopru = Kopru()
+    alinan = [0]
+    kopru.mesaj.connect(lambda msg: alinan.__setitem__(0, alinan[0] + 1))
+
+    tekrar = TekrarOynatici(dosya, hiz=hiz)
+    merkez = TelemetriMerkezi(baglanti=tekrar)
+    merkez.abone_ol(kopru.mesaj.emit, tipler=('ATTITUDE', 'VFR_HUD', 'GPS_RAW_INT'))
+
+    gecikmeler = []
+    beklenen = [time.perf_counter() + 0.01]
+
+    def tik():
+        simdi = time.perf_counter()
+        gecikmeler.append(max(0.0, simdi - beklenen[0]))
+        beklenen[0] = simdi + 0.01
+
+    zamanlayici = QTimer()
+    zamanlayici.setTimerType(0)  # Qt.PreciseTimer
+    zamanlayici.timeout.connect(tik)
+    zamanlayici.start(10)
+    QTimer.singleShot(int(sure * 1000), app.quit)
+    merkez.baslat()
+    baslangic = time.perf_counter()
+    app.exec_()
+    gecen = time.perf_counter() - baslangic
+    zamanlayici.stop()
+    merkez.durdur()
+    tekrar.close()
+    sonuc = ortak.ozet(f"olay döngüsü gecikmesi ({hiz:g}x)", gecikmeler)
+    sonuc["sinyal_hz"] = round(alinan[0] / gecen, 1)
+    return sonuc
+
+
+def ana_pencere_yukle():
+    """Ana pencere betiğini modül olarak yükler; içe aktarılamazsa None."""
+    yol = os.path.join(ortak.ARAYUZ_DIZINI, "arayüz ama düzeltilecek.py")
+    spec = importlib.util.spec_from_file_location("ana_pencere", yol)
+    modul = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(modul)
+    except ImportError as hata:
+        print(f"Ana pencere atlandı: {hata}")
+        return None
+    return modul
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sure", type=float, default=300.0, help="sentetik uçuş süresi (s)")
+    parser.add_argument("--hiz", type=float, default=20.0, help="hızlandırılmış oynatma katı")
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    # QApplication tüm betik boyunca yaşamalı: ana pencere ondan sonra kurulur
+    app = ortak.qt_uygulamasi()
+    hatalar = []
+    sonuclar = []
+    with tempfile.TemporaryDirectory() as dizin:
+        dosya = os.path.join(dizin, "sentetik.tlog")
+        adet = tlog_yaz(dosya, args.sure)
+
+        baslangic = time.perf_counter()
+        tekrar = TekrarOynatici(dosya)
+        sonuclar.append({"ad": "indeksleme", "mesaj": len(tekrar),
+                         "sure_ms": round(1000 * (time.perf_counter() - baslangic), 1)})
+        if len(tekrar) != adet:
+            hatalar.append(f"{adet} mesaj yazıldı, {len(tekrar)} indekslendi")
+
+        if imza(dosya) != imza(dosya):
+            hatalar.append("iki oynatmanın mesaj sırası farklı")
+
+        tekrar.ara(args.sure / 2)
+        if abs(tekrar.konum - args.sure / 2) > 0.1:
+            hatalar.append(f"ara({args.sure / 2:g}) sonrası konum {tekrar.konum:.2f}")
+
+        sayac = [0]
+        abone = lambda msg: sayac.__setitem__(0, sayac[0] + 1)  # noqa: E731
+        gecen, _ = merkezden_oynat(dosya, 0, abone)
+        sonuclar.append({"ad": "beklemeden oynatma", "mesaj": sayac[0],
+                         "mesaj_s": round(sayac[0] / gecen)})
+
+        # Hızlandırılmış oynatmada kaydın yalnızca bir bölümü oynatılır
+        kisa = os.path.join(dizin, "kisa.tlog")
+        kisa_sure = min(args.sure, 3.0 * args.hiz)
+        tlog_yaz(kisa, kisa_sure)
+        sayac[0] = 0
+        gecen, _ = merkezden_oynat(kisa, args.hiz, abone)
+        ulasilan = kisa_sure / gecen
+        sonuclar.append({"ad": f"{args.hiz:g}x oynatma", "mesaj": sayac[0],
+                         "ulasilan_kat": round(ulasilan, 2)})
+        if ulasilan < 0.9 * args.hiz:
+            hatalar.append(f"{args.hiz:g}x istendi, {ulasilan:.1f}x ulaşıldı")
+
+        sonuclar.append(olay_dongusu_gecikmesi(dosya, args.hiz, 3.0))
+
+        modul = ana_pencere_yukle()
+        if modul is not None:
+            # Harita paneli (QtWebEngine) pencere kurulurken içe aktarılır
+            try:
+                pencere = modul.MainApp(TekrarOynatici(dosya, hiz=args.hiz))
+            except ImportError as hata:
+                sonuclar.append({"ad": "ana pencere", "atlandi": str(hata)})
+            else:
+                pencere.show()
+                from PyQt5.QtCore import QTimer
+                QTimer.singleShot(3000, app.quit)
+                app.exec_()
+                pencere.close()
+                merkez = pencere.pixhawk_thread.merkez
+                sonuclar.append({"ad": "ana pencere", "mesaj": sum(merkez.toplam.values()),
+                                 "abone": len(merkez.istatistik()["aboneler"])})
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""Ekran hızında birleştirmenin GUI yüküne etkisini ölçer.
+
+Hareket penceresinin ``PixhawkThread``'i ekransız Qt'de kurulur; bir üretici
+iş parçacığı ``mesaj_isle``'yi yüksek hızda ATTITUDE mesajlarıyla çağırır.
+Sinyal ufuk göstergesine ve dönüş koordinatörüne bağlıdır. Birleştirmesiz
+(``ekran_hz=0``, her mesaj ayrı kuyruklu sinyal) ve 60 Hz toplayıcılı
+durumlar için yuva çağrısı/s, çizim/s, değerin üretimden ekrana gecikmesi ve
+olay döngüsü gecikmesi karşılaştırılır.
+
+Kullanım: python benchmarks/bench_toplayici.py [--hz 100 400] [--sure 3] [--json sonuc.json]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+import ortak
+
+from pymavlink.dialects.v20 import ardupilotmega as mavlink
+
+
+def calistir(app, hareket, dengeleyici, uretim_hz, ekran_hz, sure):
+    from PyQt5.QtCore import QEvent, QObject, QTimer
+
+    class CizimSayaci(QObject):
+        def __init__(self):
+            super().__init__()
+            self.adet = 0
+
+        def eventFilter(self, nesne, olay):
+            if olay.type() == QEvent.Paint:
+                self.adet += 1
+            return False
+
+    ufuk = hareket.haraketpenceresi1()
+    donus = dengeleyici.TurnCoordinator()
+    sayac = CizimSayaci()
+    for gorunum in (ufuk, donus):
+        # Ufuk düz bir widget, dönüş göstergesi QGraphicsView (çizim viewport'ta)
+        getattr(gorunum, "viewport", lambda: gorunum)().installEventFilter(sayac)
+        gorunum.show()
+
+    pixhawk = hareket.PixhawkThread(ekran_hz=ekran_hz)
+    uretim = {}
+    gecikmeler = []
+    yuva = [0]
+
+    def goster(pitch, roll):
+        yuva[0] += 1
+        sira = round(pitch / 60)
+        gecikmeler.append(time.perf_counter() - uretim[sira])
+        ufuk.yatayguncelleme(pitch % 30, roll)
+        donus.update_horizon.emit(roll, roll / 2)
+
+    pixhawk.update_horizon.connect(goster)
+    pixhawk.toplayici.baslat()
+
+    calisiyor = [True]
+
+    def uretici():
+        aralik = 1.0 / uretim_hz
+        sonraki = time.perf_counter()
+        sira = 0
+        while calisiyor[0]:
+            sonraki += aralik
+            while time.perf_counter() < sonraki:
+                time.sleep(0.0002)
+            sira += 1
+            uretim[sira] = time.perf_counter()
+            pixhawk.mesaj_isle(mavlink.MAVLink_attitude_message(sira, 0.2, float(sira), 0.0, 0.0, 0.0, 0.0))
+
+    dongu = []
+    beklenen = [time.perf_counter() + 0.005]
+
+    def tik():
+        simdi = time.perf_counter()
+        dongu.append(max(0.0, simdi - beklenen[0]))
+        beklenen[0] = simdi + 0.005
+
+    zamanlayici = QTimer()
+    zamanlayici.timeout.connect(tik)
+    zamanlayici.start(5)
+    is_parcacigi = threading.Thread(target=uretici, daemon=True)
+    is_parcacigi.start()
+    QTimer.singleShot(int(sure * 1000), app.quit)
+    baslangic = time.perf_counter()
+    app.exec_()
+    gecen = time.perf_counter() - baslangic
+    calisiyor[0] = False
+    is_parcacigi.join()
+    zamanlayici.stop()
+    pixhawk.toplayici.durdur()
+    app.processEvents()
+
+    sonuc = ortak.ozet(f"{uretim_hz} Hz, ekran_hz={ekran_hz}", gecikmeler)
+    sonuc.update({
+        "yuva_s": round(yuva[0] / gecen, 1),
+        "cizim_s": round(sayac.adet / gecen, 1),
+        "dongu_p99_ms": round(1000 * ortak.yuzdelik(dongu, 99), 3),
+    })
+    sonuc.update({k: v for k, v in pixhawk.toplayici.istatistik().items() if k != "hz"})
+    for gorunum in (ufuk, donus):
+        gorunum.close()
+    return sonuc
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hz", type=int, nargs="+", default=[100, 400], help="üretim hızları")
+    parser.add_argument("--ekran-hz", type=int, default=60)
+    parser.add_argument("--sure", type=float, default=3.0)
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    app = ortak.qt_uygulamasi()
+    os.chdir(ortak.ARAYUZ_DIZINI)  # Göstergeler görselleri göreli yoldan yükler
+    hareket = ortak.betik_yukle("ANA HARAKET SENSÖR PENCERESİ.py", "hareket_penceresi")
+    dengeleyici = ortak.betik_yukle("Dengeleyici göstergesi.py", "dengeleyici_gostergesi")
+
+    sonuclar = []
+    hatalar = []
+    for hz in args.hz:
+        sonuclar.append(calistir(app, hareket, dengeleyici, hz, 0, args.sure))
+        sonuc = calistir(app, hareket, dengeleyici, hz, args.ekran_hz, args.sure)
+        sonuclar.append(sonuc)
+        if sonuc["yuva_s"] > 1.1 * args.ekran_hz:
+            hatalar.append(f"{hz} Hz üretimde {sonuc['yuva_s']} yuva/s (sınır {args.ekran_hz})")
+        if sonuc["p99_ms"] > 3 * 1000 / args.ekran_hz:
+            hatalar.append(f"{hz} Hz üretimde p99 gecikme {sonuc['p99_ms']} ms")
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""Gösterge görsellerinin yükleme süresini paylaşılan depo ve kaynak paketiyle ölçer.
+
+Varlıklar geçici bir klasöre toplanır (depoda olmayanlar sentetik PNG olarak
+üretilir). ``--pencere`` kez gösterge penceresi açılıyormuş gibi bütün
+görseller şu yollarla istenir:
+
+* eski yol: her pencerede ``QPixmap(dosya)``. Qt dosya adıyla ``QPixmapCache``'e
+  bakar; ikinci satırda bu önbellek her pencere arasında boşaltılır (toplam
+  görsel 10 MB'lik varsayılan sınırı aştığında, ör. eski 50 MB'lik ufuk
+  bitmap'iyle, olan budur),
+* ``VarlikDeposu``: ilk istekte diskten çözülür, sonra aynı pixmap paylaşılır,
+* derlenmiş paket (``pyrcc5`` modülü): ilk istekte süreç belleğinden çözülür.
+
+Her yoldan önce ``QPixmapCache`` boşaltılır. Paylaşılan depo tekrarlarda aynı
+pixmap'i vermezse, paketle diskten okuma yapılırsa ya da depo önbelleksiz
+eski yoldan yavaşsa betik hata ile çıkar.
+
+Kullanım: python benchmarks/bench_varliklar.py [--pencere 8] [--json sonuc.json]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import ortak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pencere", type=int, default=8, help="açılan gösterge penceresi sayısı")
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    ortak.qt_uygulamasi()
+    from PyQt5.QtGui import QImage, QPixmap, QPixmapCache
+    from varliklar import VARLIKLAR, VarlikDeposu, paket_derle
+
+    rastgele = np.random.default_rng(1)
+    sonuclar = []
+    hatalar = []
+    with tempfile.TemporaryDirectory() as dizin:
+        for ad in VARLIKLAR:
+            kaynak = os.path.join(ortak.ARAYUZ_DIZINI, ad)
+            if os.path.exists(kaynak):
+                shutil.copy(kaynak, dizin)
+            else:
+                dizi = rastgele.integers(0, 255, (230, 230, 4), dtype=np.uint8)
+                QImage(dizi.data, 230, 230, 4 * 230, QImage.Format_ARGB32).save(os.path.join(dizin, ad), "PNG")
+
+        # PNG eklentisinin ilk yüklenmesi ölçüme girmesin
+        QPixmap(os.path.join(dizin, VARLIKLAR[0]))
+        for ad, bosalt in (("eski yol", False), ("eski yol (QPixmapCache boşaltılmış)", True)):
+            QPixmapCache.clear()
+            sureler = []
+            for _ in range(args.pencere):
+                bas = time.perf_counter()
+                for varlik in VARLIKLAR:
+                    QPixmap(os.path.join(dizin, varlik))
+                sureler.append(time.perf_counter() - bas)
+                if bosalt:
+                    QPixmapCache.clear()
+            sonuc = ortak.ozet(ad, sureler)
+            sonuc["ilk_pencere_ms"] = round(1000 * sureler[0], 3)
+            sonuclar.append(sonuc)
+        eski_toplam = sonuc["toplam_s"]
+
+        paket, _ = paket_derle(os.path.join(dizin, "bench_varliklar_rc.py"), dizin)
+        sys.path.insert(0, dizin)
+        for ad, modul in (("depo", None), ("depo + paket", "bench_varliklar_rc")):
+            QPixmapCache.clear()
+            depo = VarlikDeposu(dizin)
+            if modul is not None and not depo.paket_yukle(modul):
+                hatalar.append(f"{paket} yüklenemedi")
+                continue
+            sureler = []
+            ilkler = {}
+            for _ in range(args.pencere):
+                bas = time.perf_counter()
+                for varlik in VARLIKLAR:
+                    pixmap = depo.pixmap(varlik)
+                    if ilkler.setdefault(varlik, pixmap.cacheKey()) != pixmap.cacheKey():
+                        hatalar.append(f"{ad}: {varlik} yeniden çözüldü")
+                sureler.append(time.perf_counter() - bas)
+            sonuc = ortak.ozet(ad, sureler)
+            istatistik = depo.istatistik()
+            sonuc.update({k: istatistik[k] for k in ("disk", "paket", "eksik", "yukleme_ms", "bellek_kb")})
+            sonuc["ilk_pencere_ms"] = round(1000 * sureler[0], 3)
+            sonuclar.append(sonuc)
+            if istatistik["eksik"]:
+                hatalar.append(f"{ad}: {istatistik['eksik']} varlık bulunamadı")
+            if modul is not None and istatistik["disk"]:
+                hatalar.append(f"{ad}: {istatistik['disk']} varlık diskten okundu")
+            if sonuc["toplam_s"] > eski_toplam:
+                hatalar.append(f"{ad}: {sonuc['toplam_s']} s, eski yol {eski_toplam} s")
+        sys.path.remove(dizin)
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""Video kaydının canlı kamera görüntüsünü yavaşlatmadığını doğrular.
+
+60 fps'lik sanal kamera ``CameraThread`` ile ekransız bir ``CameraDisplay``'e
+gösterilir. Üç senaryo karşılaştırılır: kayıtsız, normal kayıt ve her kareyi
+``--yavas-ms`` geciktiren (tıkanmış disk benzeri) yavaş kayıt. Parçalar
+``--parca`` saniyede bir döner. Yakalama ve gösterim hızı, yakalamadan
+gösterime gecikme ile kaydedilen/düşürülen kare sayıları raporlanır.
+
+Kayıtlı senaryolardan birinde yakalama ya da gösterim hızı kayıtsız durumun
+%90'ının altına düşerse, yavaş kayıt hiç kare düşürmezse (kuyruk sınırsız
+demektir) ya da zaman damgası dosyaları kaydedilen karelerle uyuşmazsa betik
+hata ile çıkar.
+
+Kullanım: python benchmarks/bench_video_kaydedici.py [--sure 5] [--parca 2]
+          [--yavas-ms 100] [--json sonuc.json]
+"""
+import argparse
+import csv
+import glob
+import os
+import sys
+import tempfile
+import time
+
+import ortak
+
+
+class YavasYazici:
+    """``cv2.VideoWriter``'ı her karede bekleterek disk tıkanmasını taklit eder."""
+
+    def __init__(self, yazici, gecikme):
+        self.yazici = yazici
+        self.gecikme = gecikme
+
+    def write(self, kare):
+        time.sleep(self.gecikme)
+        self.yazici.write(kare)
+
+    def release(self):
+        self.yazici.release()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sure", type=float, default=5.0, help="senaryo süresi (s)")
+    parser.add_argument("--kamera-fps", type=int, default=60)
+    parser.add_argument("--parca", type=float, default=2.0, help="video parça süresi (s)")
+    parser.add_argument("--yavas-ms", type=float, default=100.0, help="yavaş kayıtta kare başına bekleme")
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    app = ortak.qt_uygulamasi()
+    from PyQt5.QtCore import QTimer
+    kamera = ortak.betik_yukle("Görüntü kamerası.py", "goruntu_kamerasi")
+    from video_kaydedici import VideoKaydedici
+
+    class YavasKaydedici(VideoKaydedici):
+        def _segment_ac(self, sekil, baslangic):
+            super()._segment_ac(sekil, baslangic)
+            self._yazici = YavasYazici(self._yazici, args.yavas_ms / 1000)
+
+    def senaryo(ad, dosya, kaydedici_sinifi=None, dizin=None):
+        gorunum = kamera.CameraDisplay()
+        gorunum.show()
+        is_parcacigi = kamera.CameraThread(dosya, ekran_fps=60)
+        is_parcacigi.cap.release()
+        is_parcacigi.cap = ortak.SanalKamera(dosya, args.kamera_fps)
+        is_parcacigi.frame_ready.connect(gorunum.update_image)
+        kaydedici = None
+        if kaydedici_sinifi is not None:
+            kaydedici = kaydedici_sinifi(dizin=dizin, fps=args.kamera_fps, segment_s=args.parca)
+            is_parcacigi.kaydedici = kaydedici.baslat()
+
+        is_parcacigi.start()
+        QTimer.singleShot(int(args.sure * 1000), app.quit)
+        app.exec_()
+        # Kaydedici kuyruğu boşaltırken geçen süre canlı görüntüye sayılmaz
+        yayici = is_parcacigi.yayici.istatistik()
+        is_parcacigi.stop()
+
+        sonuc = {
+            "ad": ad,
+            "yakalama_fps": round(yayici["yakalanan"] / args.sure, 1),
+            "gosterim_fps": round(yayici["gosterilen"] / args.sure, 1),
+            "gecikme_p50_ms": yayici["gecikme_p50_ms"],
+            "gecikme_p99_ms": yayici["gecikme_p99_ms"],
+        }
+        if kaydedici is not None:
+            sonuc.update(kaydedici.istatistik())
+        return sonuc, kaydedici
+
+    sonuclar = []
+    hatalar = []
+    with tempfile.TemporaryDirectory() as dizin:
+        dosya = os.path.join(dizin, "kamera.avi")
+        ortak.video_yaz(dosya, 640, 480, 120)
+        temel, _ = senaryo("kayıtsız", dosya)
+        sonuclar.append(temel)
+        for ad, sinif in (("normal kayıt", VideoKaydedici), (f"yavaş kayıt ({args.yavas_ms:g} ms/kare)", YavasKaydedici)):
+            kayit_dizini = os.path.join(dizin, sinif.__name__)
+            sonuc, kaydedici = senaryo(ad, dosya, sinif, kayit_dizini)
+            sonuclar.append(sonuc)
+            for olcu in ("yakalama_fps", "gosterim_fps"):
+                if sonuc[olcu] < 0.9 * temel[olcu]:
+                    hatalar.append(f"{ad}: {olcu} {sonuc[olcu]}, kayıtsız {temel[olcu]}")
+
+            satir = 0
+            for yan in sorted(glob.glob(os.path.join(kayit_dizini, "*.csv"))):
+                with open(yan, encoding="utf-8") as f:
+                    satir += sum(1 for _ in csv.DictReader(f))
+            if satir != kaydedici.kaydedilen:
+                hatalar.append(f"{ad}: {satir} zaman damgası, {kaydedici.kaydedilen} kaydedilen kare")
+            beklenen_parca = int(args.sure // args.parca)
+            if len(kaydedici.segmentler) < beklenen_parca:
+                hatalar.append(f"{ad}: {len(kaydedici.segmentler)} parça, en az {beklenen_parca} bekleniyordu")
+
+        if sonuclar[-1]["dusurulen"] == 0:
+            hatalar.append("yavaş kayıt hiç kare düşürmedi; kuyruk sınırlı değil")
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
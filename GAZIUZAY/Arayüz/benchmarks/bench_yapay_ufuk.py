@@ -0,0 +1,146 @@
+"""Bitmap döndüren eski yapay ufuk ile QPainter ile çizilen yenisini karşılaştırır.
+
+Eski gösterge (``QGraphicsView`` içinde 2000x6608'lik bitmap; dosya depoda
+olmadığından aynı boyutta sentetik bir görüntü üretilir) ile ``YapayUfuk``
+ekransız 400x300 boyutta aynı yunuslama/yatış dizisiyle çizdirilir. Kare başına
+süre (güncelleme + yeniden çizim), süreç CPU zamanı ve göstergenin bellek
+maliyeti (piksel verisi ile kurulum öncesi/sonrası RSS farkı) raporlanır. İki
+gösterge ``--tur`` kez sırayla çalıştırılır; kare başına CPU zamanı medyan
+olan tur raporlanır, RSS farkı ilk turdandır.
+
+Yeni göstergenin kare başına CPU zamanı eskininkini ``--tolerans`` oranından
+fazla aşıyorsa ya da daha çok piksel belleği kullanıyorsa betik hata ile çıkar.
+
+Kullanım: python benchmarks/bench_yapay_ufuk.py [--kare 500] [--tur 5] [--tolerans 0.1] [--json sonuc.json]
+"""
+import argparse
+import math
+import sys
+import time
+
+import ortak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--kare", type=int, default=500)
+    parser.add_argument("--tur", type=int, default=5, help="karşılaştırma turu sayısı")
+    parser.add_argument("--tolerans", type=float, default=0.1,
+                        help="kare başına CPU zamanında kabul edilen göreli fark")
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    app = ortak.qt_uygulamasi()
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QColor, QPainter, QPen, QPixmap, QTransform
+    from PyQt5.QtWidgets import QGraphicsPixmapItem, QGraphicsScene, QGraphicsView
+    from yapay_ufuk import YapayUfuk
+
+    def eski_bitmap():
+        genislik, yukseklik = 2000, 6608
+        bitmap = QPixmap(genislik, yukseklik)
+        bitmap.fill(QColor(58, 130, 206))
+        p = QPainter(bitmap)
+        p.fillRect(0, yukseklik // 2, genislik, yukseklik // 2, QColor(140, 90, 40))
+        p.setPen(QPen(Qt.white, 2))
+        for y in range(0, yukseklik, 64):
+            p.drawLine(genislik // 2 - 40, y, genislik // 2 + 40, y)
+        p.end()
+        return bitmap
+
+    class EskiUfuk(QGraphicsView):
+        """Değişiklikten önceki ``HaraketPenceresi``."""
+
+        def __init__(self):
+            super().__init__()
+            self.scene = QGraphicsScene()
+            self.setScene(self.scene)
+            self.setFixedSize(400, 300)
+            self.image_width = 2000
+            self.image_height = 6608
+            self.image_item = QGraphicsPixmapItem(eski_bitmap())
+            self.scene.addItem(self.image_item)
+            self.cross_horizontal = self.scene.addLine(-20, 0, 20, 0, pen=QPen(QColor("red"), 2))
+            self.cross_vertical = self.scene.addLine(0, -20, 0, 20, pen=QPen(QColor("red"), 2))
+            self.cross_horizontal.setPos(self.width() / 2, self.height() / 2)
+            self.cross_vertical.setPos(self.width() / 2, self.height() / 2)
+
+        def yatay_guncelleme(self, pitch, roll):
+            center_x = self.image_width / 2
+            center_y = self.image_height / 2
+            transform = QTransform()
+            transform.translate(center_x, center_y)
+            transform.rotate(-roll)
+            transform.translate(-center_x, -center_y)
+            self.image_item.setTransform(transform)
+            self.image_item.setPos(
+                (self.width() - self.image_width) / 2,
+                (self.height() - self.image_height) / 2 + pitch * 12.8
+            )
+
+        def piksel_bayt(self):
+            bitmap = self.image_item.pixmap()
+            return bitmap.width() * bitmap.height() * bitmap.depth() // 8
+
+    class YeniUfuk(YapayUfuk):
+        def __init__(self):
+            super().__init__()
+            self.setFixedSize(400, 300)
+
+        def piksel_bayt(self):
+            ortu = self.cizici._ortu
+            return ortu.width() * ortu.height() * ortu.depth() // 8 if ortu is not None else 0
+
+    def olc(ad, sinif):
+        rss_once = ortak.rss_mb()
+        gosterge = sinif()
+        gosterge.show()
+        app.processEvents()
+        rss_sonra = ortak.rss_mb()
+        boyanan = gosterge.viewport() if isinstance(gosterge, QGraphicsView) else gosterge
+        sureler = []
+        cpu_bas = time.process_time()
+        for i in range(args.kare):
+            t = i / 50
+            bas = time.perf_counter()
+            gosterge.yatay_guncelleme(10 * math.sin(0.7 * t), 35 * math.sin(0.4 * t))
+            boyanan.repaint()
+            sureler.append(time.perf_counter() - bas)
+        cpu = time.process_time() - cpu_bas
+        sonuc = ortak.ozet(ad, sureler)
+        sonuc.pop("toplam_s")
+        sonuc.update({
+            "cpu_ms_kare": round(1000 * cpu / args.kare, 3),
+            "piksel_mb": round(gosterge.piksel_bayt() / 2 ** 20, 2),
+            "rss_artisi_mb": round(rss_sonra - rss_once, 1) if rss_once is not None else None,
+        })
+        gosterge.close()
+        return sonuc
+
+    def medyan(turlar):
+        sonuc = sorted(turlar, key=lambda tur: tur["cpu_ms_kare"])[len(turlar) // 2]
+        sonuc["rss_artisi_mb"] = turlar[0]["rss_artisi_mb"]
+        return sonuc
+
+    # Yeni gösterge her turda önce ölçülür; eski bitmap'in belleği ilk turun RSS farkını kirletmesin
+    yeni_turlar, eski_turlar = [], []
+    for _ in range(max(1, args.tur)):
+        yeni_turlar.append(olc("QPainter", YeniUfuk))
+        eski_turlar.append(olc("bitmap", EskiUfuk))
+    eski, yeni = medyan(eski_turlar), medyan(yeni_turlar)
+    sonuclar = [eski, yeni]
+    hatalar = []
+    if yeni["cpu_ms_kare"] > (1 + args.tolerans) * eski["cpu_ms_kare"]:
+        hatalar.append(f"çizim kare başına daha çok CPU harcıyor: {yeni['cpu_ms_kare']} ms, "
+                       f"eski {eski['cpu_ms_kare']} ms")
+    if yeni["piksel_mb"] > eski["piksel_mb"]:
+        hatalar.append("yeni gösterge daha çok piksel belleği kullanıyor")
+
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
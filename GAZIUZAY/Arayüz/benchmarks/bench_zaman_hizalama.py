@@ -0,0 +1,145 @@
+"""Kare–telemetri zaman hizalamasının doğruluğunu ve sorgu maliyetini ölçer.
+
+Doğruluk: ``SentetikUcus`` ile bir tlog ve 30 fps'lik bir kameranın
+``VideoKaydedici`` zaman damgası dosyası yazılır, ``ZamanHizalayici.kayittan``
+ile indeks kurulur. Her karenin en yakın ve ara değerli tutumu modelin gerçek
+değeriyle karşılaştırılır; yaw ±π sınırını geçtiği için açı sarması da
+sınanır.
+
+Maliyet: 10^4..10^6 örneklik dizilerde ekleme ve tek sorgu süreleri ile tüm
+kareler için toplu ara değer süresi raporlanır.
+
+Ara değer en yakın örnekten kötüyse, yaw hatası ``--yaw-sinir`` radyanı
+aşarsa ya da sorgu süresi n ile logaritmikten hızlı büyürse betik hata ile
+çıkar.
+
+Kullanım: python benchmarks/bench_zaman_hizalama.py [--sure 60] [--json sonuc.json]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import ortak
+
+from telemetri import SentetikUcus
+from telemetri.zaman_hizalama import ZamanDizisi, ZamanHizalayici
+from telemetri.sentetik import tlog_yaz
+
+
+def aci_farki(a, b):
+    return abs((a - b + math.pi) % (2 * math.pi) - math.pi)
+
+
+def dogruluk(sure, fps, hatalar, yaw_siniri):
+    ucus = SentetikUcus()
+    baslangic_unix, baslangic_mono = 1.7e9, 5000.0
+    sonuclar = []
+    with tempfile.TemporaryDirectory() as dizin:
+        tlog = os.path.join(dizin, "ucus.tlog")
+        tlog_yaz(tlog, sure, {'HEARTBEAT': 1, 'ATTITUDE': 50, 'GPS_RAW_INT': 5},
+                 baslangic=baslangic_unix, ucus=ucus)
+        yan = os.path.join(dizin, "kamera_000.csv")
+        kareler = []
+        with open(yan, "w", encoding="utf-8") as f:
+            f.write("kare,sira,unix_s,monotonik_s\n")
+            # Kamera telemetriyle aynı fazda değil: ilk kare 7 ms sonra
+            for kare in range(int(sure * fps)):
+                t = 0.007 + kare / fps
+                kareler.append(t)
+                f.write(f"{kare},{kare + 1},{baslangic_unix + t:.6f},{baslangic_mono + t:.6f}\n")
+
+        bas = time.perf_counter()
+        hizalayici = ZamanHizalayici.kayittan(tlog, [yan])
+        kurma = time.perf_counter() - bas
+
+    for ara in (False, True):
+        yaw_hatalari, roll_hatalari, sureler = [], [], []
+        for sira, t in enumerate(kareler, 1):
+            bas = time.perf_counter()
+            sonuc = hizalayici.kare_icin(sira, ara=ara)
+            sureler.append(time.perf_counter() - bas)
+            tutum = sonuc['ATTITUDE']
+            gercek = ucus.durum(t)
+            yaw_hatalari.append(aci_farki(tutum["yaw"], gercek["yaw"]))
+            roll_hatalari.append(abs(tutum["roll"] - gercek["roll"]))
+        sonuc = ortak.ozet("ara değer" if ara else "en yakın", sureler)
+        sonuc.update({
+            "yaw_max_hata_rad": round(max(yaw_hatalari), 6),
+            "roll_max_hata_rad": round(max(roll_hatalari), 6),
+            "kurma_s": round(kurma, 3),
+        })
+        sonuclar.append(sonuc)
+    en_yakin, ara_deger = sonuclar
+    if ara_deger["yaw_max_hata_rad"] > en_yakin["yaw_max_hata_rad"]:
+        hatalar.append("ara değer yaw hatası en yakın örnekten büyük")
+    if ara_deger["yaw_max_hata_rad"] > yaw_siniri:
+        hatalar.append(f"ara değer yaw hatası {ara_deger['yaw_max_hata_rad']} rad (sınır {yaw_siniri})")
+
+    # Toplu sorgu: tüm karelerin zamanları tek çağrıda
+    zamanlar = [hizalayici.kare_zamani(sira) for sira in range(1, len(kareler) + 1)]
+    bas = time.perf_counter()
+    toplu = hizalayici.akislar['ATTITUDE'].toplu_ara_deger(zamanlar)
+    sure_toplu = time.perf_counter() - bas
+    gercek_yaw = np.array([ucus.durum(t)["yaw"] for t in kareler])
+    toplu_hata = np.abs((toplu[:, 2] - gercek_yaw + math.pi) % (2 * math.pi) - math.pi)
+    sonuclar.append({
+        "ad": "toplu ara değer",
+        "adet": len(zamanlar),
+        "toplam_ms": round(1000 * sure_toplu, 3),
+        "yaw_max_hata_rad": round(float(np.nanmax(toplu_hata)), 6),
+    })
+    if float(np.nanmax(toplu_hata)) > yaw_siniri:
+        hatalar.append("toplu ara değer yaw hatası sınırı aşıyor")
+    return sonuclar
+
+
+def olcek(hatalar):
+    sonuclar = []
+    rastgele = random.Random(1)
+    sorgu_suresi = {}
+    for n in (10 ** 4, 10 ** 5, 10 ** 6):
+        dizi = ZamanDizisi(("roll", "pitch", "yaw"), {"yaw": (2 * math.pi, -math.pi)})
+        bas = time.perf_counter()
+        for i in range(n):
+            dizi.ekle(i * 0.02, (0.1, 0.2, 0.3))
+        ekleme = time.perf_counter() - bas
+        zamanlar = [rastgele.uniform(0, n * 0.02) for _ in range(20000)]
+        sureler = []
+        for t in zamanlar:
+            bas = time.perf_counter()
+            dizi.ara_deger(t)
+            sureler.append(time.perf_counter() - bas)
+        sonuc = ortak.ozet(f"ara_deger n={n}", sureler)
+        sonuc["ekleme_us"] = round(1e6 * ekleme / n, 3)
+        sonuclar.append(sonuc)
+        sorgu_suresi[n] = sonuc["p50_ms"]
+    # log2(10^6) / log2(10^4) = 1.5; sabit maliyetler baskın olduğundan 3 kat pay
+    if sorgu_suresi[10 ** 6] > 3 * sorgu_suresi[10 ** 4]:
+        hatalar.append(f"sorgu süresi n ile hızlı büyüyor: {sorgu_suresi}")
+    return sonuclar
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sure", type=float, default=60.0, help="sentetik oturum süresi (s)")
+    parser.add_argument("--fps", type=float, default=30.0, help="kamera kare hızı")
+    parser.add_argument("--yaw-sinir", type=float, default=2e-3, help="ara değer yaw hata sınırı (rad)")
+    parser.add_argument("--json", help="sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    hatalar = []
+    sonuclar = dogruluk(args.sure, args.fps, hatalar, args.yaw_sinir) + olcek(hatalar)
+    ortak.sonuc_yazdir(sonuclar, args.json)
+    for hata in hatalar:
+        print("HATA:", hata)
+    return 1 if hatalar else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""Kıyaslama betikleri için ortak yardımcılar.
+
+Betikler ``Arayüz`` klasöründeki modülleri içe aktarır; bu modül klasörü
+``sys.path``'e ekler ve ekransız Qt uygulaması, süre özeti ve sonuç yazdırma
+fonksiyonlarını, sentetik video, sanal kamera ve gösterge görseli
+yardımcılarını sağlar.
+"""
+import importlib.util
+import json
+import math
+import os
+import socket
+import sys
+import time
+
+import cv2
+import numpy as np
+
+ARAYUZ_DIZINI = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ARAYUZ_DIZINI not in sys.path:
+    sys.path.insert(0, ARAYUZ_DIZINI)
+
+
+_uygulama = None
+
+
+def qt_uygulamasi():
+    """Ekransız (offscreen) platformda tek bir QApplication döndürür.
+
+    Uygulama modülde tutulur; dönüş değerini saklamayan betiklerde de yaşar.
+    """
+    global _uygulama
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt5.QtWidgets import QApplication
+    if _uygulama is None:
+        _uygulama = QApplication.instance() or QApplication(sys.argv)
+    return _uygulama
+
+
+def rss_mb():
+    """Linux'ta sürecin yerleşik belleği (MB); ölçülemezse None."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError):
+        return None
+
+
+def varliklari_hazirla(dizin, tohum=1):
+    """Gösterge görsellerini ``dizin``'e toplar ve ``varliklar.depo``'yu oraya yönlendirir.
+
+    Depoda olmayan görseller aynı boyutta (ibreler 24x129, diğerleri 230x230)
+    dokulu, yarı saydam sentetik PNG olarak üretilir. QApplication kurulmuş olmalıdır.
+    """
+    import shutil
+    from PyQt5.QtGui import QImage
+    import varliklar
+
+    rastgele = np.random.default_rng(tohum)
+    for ad in varliklar.VARLIKLAR:
+        kaynak = os.path.join(ARAYUZ_DIZINI, ad)
+        if os.path.exists(kaynak):
+            shutil.copy(kaynak, dizin)
+            continue
+        genislik, yukseklik = (24, 129) if "Needle" in ad else (230, 230)
+        dizi = rastgele.integers(0, 255, (yukseklik, genislik, 4), dtype=np.uint8)
+        QImage(dizi.data, genislik, yukseklik, 4 * genislik, QImage.Format_ARGB32).save(
+            os.path.join(dizin, ad), "PNG")
+    varliklar.depo.dizin = dizin
+
+
+def betik_yukle(dosya, ad):
+    """Adında boşluk olan arayüz betiğini ``ad`` modülü olarak yükler."""
+    spec = importlib.util.spec_from_file_location(ad, os.path.join(ARAYUZ_DIZINI, dosya))
+    modul = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modul)
+    return modul
+
+
+def bos_port():
+    """Yerel UDP sanal araç bağlantıları için boş bir port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def bekle(kosul, sure=5.0):
+    """``kosul()`` doğru olana kadar en fazla ``sure`` saniye bekler."""
+    bitis = time.monotonic() + sure
+    while not kosul():
+        if time.monotonic() > bitis:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+def video_yaz(dosya, genislik, yukseklik, adet, fps=30):
+    """Kayan renk geçişli sentetik bir MJPG video yazar."""
+    yazici = cv2.VideoWriter(dosya, cv2.VideoWriter_fourcc(*"MJPG"), fps, (genislik, yukseklik))
+    x = np.linspace(0, 255, genislik, dtype=np.float32)
+    for i in range(adet):
+        satir = ((x + 4 * i) % 256).astype(np.uint8)
+        kare = np.empty((yukseklik, genislik, 3), np.uint8)
+        kare[:, :, 0] = satir
+        kare[:, :, 1] = 255 - satir
+        kare[:, :, 2] = i % 256
+        yazici.write(kare)
+    yazici.release()
+
+
+class SanalKamera:
+    """Videoyu sabit kare hızında, başa sararak veren kamera benzeri."""
+
+    def __init__(self, dosya, fps):
+        self.cap = cv2.VideoCapture(dosya)
+        self.aralik = 1.0 / fps
+        self.sonraki = time.perf_counter()
+
+    def _bekle(self):
+        kalan = self.sonraki - time.perf_counter()
+        if kalan > 0:
+            time.sleep(kalan)
+        self.sonraki = max(self.sonraki + self.aralik, time.perf_counter() - self.aralik)
+
+    def read(self, dizi=None):
+        self._bekle()
+        ret, kare = self.cap.read(dizi)
+        if not ret:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, kare = self.cap.read(dizi)
+        return ret, kare
+
+    def grab(self):
+        self._bekle()
+        return self.cap.grab()
+
+    def get(self, ozellik):
+        return self.cap.get(ozellik)
+
+    def isOpened(self):
+        return self.cap.isOpened()
+
+    def release(self):
+        self.cap.release()
+
+
+def yuzdelik(ornekler, oran):
+    """Sıralı olmayan örneklerden yüzdelik değeri hesaplar."""
+    if not ornekler:
+        return 0.0
+    sirali = sorted(ornekler)
+    indeks = min(len(sirali) - 1, max(0, math.ceil(oran / 100 * len(sirali)) - 1))
+    return sirali[indeks]
+
+
+def ozet(ad, sureler):
+    """Saniye cinsinden güncelleme sürelerini özetler."""
+    toplam = sum(sureler)
+    return {
+        "ad": ad,
+        "adet": len(sureler),
+        "toplam_s": round(toplam, 4),
+        "guncelleme_hz": round(len(sureler) / toplam, 1) if toplam else 0.0,
+        "ort_ms": round(1000 * toplam / len(sureler), 3) if sureler else 0.0,
+        "p50_ms": round(1000 * yuzdelik(sureler, 50), 3),
+        "p95_ms": round(1000 * yuzdelik(sureler, 95), 3),
+        "p99_ms": round(1000 * yuzdelik(sureler, 99), 3),
+    }
+
+
+def sonuc_yazdir(sonuclar, dosya=None):
+    """Sonuçları tablo olarak yazdırır, istenirse JSON dosyasına kaydeder."""
+    for sonuc in sonuclar:
+        print(", ".join(f"{anahtar}={deger}" for anahtar, deger in sonuc.items()))
+    if dosya:
+        with open(dosya, "w", encoding="utf-8") as f:
+            json.dump(sonuclar, f, ensure_ascii=False, indent=2)
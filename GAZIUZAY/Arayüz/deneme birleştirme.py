@@ -1,147 +1,193 @@
-from PyQt5.QtWidgets import QApplication, QMainWindow, QMdiArea, QMdiSubWindow, QLabel, QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QAction, QVBoxLayout, QWidget, QTextEdit
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QPixmap, QTransform, QImage, QPen, QColor
-from pymavlink import mavutil
-import sys
-import cv2
-
-class MDIWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("MDI Window")
-        self.setGeometry(0, 0, 1920, 1080)  # Ana pencere boyutlarını 1920 x 1080 olarak ayarla
-
-        # MDI Area oluştur
-        self.mdi = QMdiArea()
-        self.setCentralWidget(self.mdi)
-
-        # Menü çubuğu oluştur
-        self.menu = self.menuBar()
-        self.window_menu = self.menu.addMenu("Window")
-
-        # Yeni alt pencere açma eylemi (örnek olarak)
-        new_action = QAction("New Text Window", self)
-        new_action.triggered.connect(self.new_text_window)
-        self.window_menu.addAction(new_action)
-
-        # Pencere ekleme eylemleri (sizin pencere kodlarınızı ekleyin)
-        add_horizon_action = QAction("Add Horizon Display", self)
-        add_horizon_action.triggered.connect(self.add_horizon_display)
-        self.window_menu.addAction(add_horizon_action)
-
-    def new_text_window(self):
-        # Yeni alt pencere oluştur (örnek olarak)
-        sub = QMdiSubWindow()
-        sub.setWidget(QTextEdit())
-        sub.setWindowTitle("Sub Text Window")
-        self.mdi.addSubWindow(sub)
-        sub.show()
-
-    def add_horizon_display(self):
-        sub = QMdiSubWindow()
-        horizon_display = HorizonDisplay()
-        sub.setWidget(horizon_display)
-        sub.setWindowTitle("Horizon Display")
-        self.mdi.addSubWindow(sub)
-        sub.show()
-
-class HorizonDisplay(QGraphicsView):
-    def __init__(self):
-        super().__init__()
-        self.scene = QGraphicsScene()
-        self.setScene(self.scene)
-        self.setFixedSize(250, 250)
-
-        self.image_item = QGraphicsPixmapItem()
-        self.scene.addItem(self.image_item)
-
-        # Döndürülebilir PNG göstergesi
-        self.horizon_indicator = QGraphicsPixmapItem(QPixmap("Dedector.PNG"))
-        self.horizon_indicator.setTransformationMode(Qt.SmoothTransformation)
-        self.scene.addItem(self.horizon_indicator)
-
-        # Artı işareti (Kamera görüntüsünün merkezinde sabit)
-        self.cross_horizontal = self.scene.addLine(-20, 0, 20, 0, pen=QPen(QColor("red"), 2))
-        self.cross_vertical = self.scene.addLine(0, -20, 0, 20, pen=QPen(QColor("red"), 2))
-        self.cross_horizontal.setPos(self.width() / 2, self.height() / 2)
-        self.cross_vertical.setPos(self.width() / 2, self.height() / 2)
-
-        # Göstergenin başlangıç konumu (Tam ortada)
-        self.horizon_indicator.setPos((self.width() - 200) / 2, (self.height() - 200) / 2)
-
-    def update_image(self, qimg):
-        """ Kamera görüntüsünü günceller """
-        self.image_item.setPixmap(QPixmap.fromImage(qimg))
-
-    def update_horizon(self, pitch, roll):
-        """ PNG göstergesini roll ile döndürür, pitch ile yukarı-aşağı hareket ettirir """
-        transform = QTransform()
-        transform.translate(100, 100)  # PNG'nin merkezine git
-        transform.rotate(-roll)  # Roll açısına göre döndür
-        transform.translate(-100, -100)  # Merkez dönüşü geri al
-        self.horizon_indicator.setTransform(transform)
-
-        # Pitch değerine göre yukarı-aşağı hareket ettir
-        self.horizon_indicator.setPos((self.width() - 200) / 2, (self.height() - 200) / 2 + pitch * 5)
-
-class CameraThread(QThread):
-    frame_ready = pyqtSignal(QImage)
-
-    def __init__(self, camera_index=0):
-        super().__init__()
-        self.camera_index = camera_index
-        self.running = True
-        self.cap = cv2.VideoCapture(self.camera_index)
-        self.cap.set(3, 400)  # Genişlik
-        self.cap.set(4, 300)  # Yükseklik
-
-    def run(self):
-        while self.running:
-            ret, frame = self.cap.read()
-            if ret:
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                h, w, ch = frame.shape
-                qimg = QImage(frame.data, w, h, ch * w, QImage.Format_RGB888)
-                self.frame_ready.emit(qimg)
-
-    def stop(self):
-        self.running = False
-        if self.cap.isOpened():
-            self.cap.release()
-        self.quit()
-        self.wait()
-
-class PixhawkThread(QThread):
-    update_horizon = pyqtSignal(float, float)
-
-    def __init__(self, port='COM9', baud=115200):
-        super().__init__()
-        self.port = port
-        self.baud = baud
-        self.running = True
-
-    def run(self):
-        try:
-            master = mavutil.mavlink_connection(self.port, baud=self.baud)
-            master.wait_heartbeat()
-            print("Pixhawk bağlantısı kuruldu!")
-
-            while self.running:
-                msg = master.recv_match(type='ATTITUDE', blocking=True, timeout=1)
-                if msg:
-                    pitch = msg.pitch * 60
-                    roll = msg.roll * 60
-                    self.update_horizon.emit(pitch, roll)
-        except Exception as e:
-            print(f"Pixhawk bağlantı hatası: {e}")
-
-    def stop(self):
-        self.running = False
-        self.quit()
-        self.wait()
-
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    window = MDIWindow()
-    window.show()
-    sys.exit(app.exec_())
+from PyQt5.QtWidgets import QApplication, QMainWindow, QMdiArea, QMdiSubWindow, QLabel, QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QAction, QVBoxLayout, QWidget, QTextEdit
+from PyQt5.QtCore import Qt, QObject, pyqtSignal
+from PyQt5.QtGui import QTransform, QPen, QColor
+from panel_kayitcisi import PanelKayitcisi, webengine_hazirla
+from telemetri import Cozucu, KayitDinleyici, TelemetriMerkezi
+from guncelleme_toplayici import GuncellemeToplayici
+import sys
+from kamera_hatti import KameraOgesi
+from varliklar import varlik
+
+# Menüden açılan paneller: (menü adı, "betik.py:Sınıf"). Betik ve ağır bağımlılıkları
+# (QtWebEngine, folium, cv2) panel ilk açıldığında içe aktarılır; her panel kendi
+# telemetri/kamera bağlantısını kurar ve kapanınca bırakır.
+PANELLER = (
+    ("Hareket Penceresi", "ANA HARAKET SENSÖR PENCERESİ.py:haraketpenceresi"),
+    ("Dikey Hız Göstergesi", "Dikey hız göstergesi.py:MainApp"),
+    ("Dönüş Göstergesi", "Dengeleyici göstergesi.py:MainApp"),
+    ("Kamera", "Görüntü kamerası.py:MainApp"),
+    ("Harita", "ANA HARİTA PANELİ GELİŞTİRMELİ.py:HaritaPenceresi"),
+    ("Telemetri Grafiği", "serit_grafik:SeritGrafikPenceresi"),
+)
+
+class MDIWindow(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("MDI Window")
+        self.setGeometry(0, 0, 1920, 1080)  # Ana pencere boyutlarını 1920 x 1080 olarak ayarla
+
+        # MDI Area oluştur
+        self.mdi = QMdiArea()
+        self.setCentralWidget(self.mdi)
+
+        # Menü çubuğu oluştur
+        self.menu = self.menuBar()
+        self.window_menu = self.menu.addMenu("Window")
+
+        # Yeni alt pencere açma eylemi (örnek olarak)
+        new_action = QAction("New Text Window", self)
+        new_action.triggered.connect(self.new_text_window)
+        self.window_menu.addAction(new_action)
+
+        # Pencere ekleme eylemleri (sizin pencere kodlarınızı ekleyin)
+        add_horizon_action = QAction("Add Horizon Display", self)
+        add_horizon_action.triggered.connect(self.add_horizon_display)
+        self.window_menu.addAction(add_horizon_action)
+
+        # Paneller ilk seçildiklerinde kurulur
+        self.paneller = PanelKayitcisi(self)
+        self.alt_pencereler = {}
+        self.panel_menu = self.menu.addMenu("Paneller")
+        for ad, fabrika in PANELLER:
+            self.paneller.kaydet(ad, fabrika)
+            action = QAction(ad, self)
+            action.triggered.connect(lambda _, ad=ad: self.panel_ac(ad))
+            self.panel_menu.addAction(action)
+        self.panel_menu.addSeparator()
+        rapor_action = QAction("Açılış Raporu", self)
+        rapor_action.triggered.connect(self.acilis_raporu)
+        self.panel_menu.addAction(rapor_action)
+
+    def new_text_window(self):
+        # Yeni alt pencere oluştur (örnek olarak)
+        sub = QMdiSubWindow()
+        sub.setWidget(QTextEdit())
+        sub.setWindowTitle("Sub Text Window")
+        self.mdi.addSubWindow(sub)
+        sub.show()
+
+    def panel_ac(self, ad):
+        """Paneli alt pencerede gösterir; açıksa öne getirir."""
+        sub = self.alt_pencereler.get(ad)
+        if sub is None:
+            try:
+                panel = self.paneller.ac(ad)
+            except ImportError as e:
+                # Ör. PyQtWebEngine kurulu değilse harita açılamaz
+                self.statusBar().showMessage(f"{ad} açılamadı: {e}")
+                return
+            sub = QMdiSubWindow()
+            sub.setAttribute(Qt.WA_DeleteOnClose)
+            sub.setWidget(panel)
+            sub.setWindowTitle(ad)
+            # Kapanınca panel bağlantılarını bırakır; sonraki açılış yeniden kurar
+            sub.destroyed.connect(lambda _, ad=ad: self.panel_kapandi(ad))
+            self.mdi.addSubWindow(sub)
+            self.alt_pencereler[ad] = sub
+        sub.show()
+        self.mdi.setActiveSubWindow(sub)
+
+    def panel_kapandi(self, ad):
+        self.alt_pencereler.pop(ad, None)
+        self.paneller.birak(ad)
+
+    def acilis_raporu(self):
+        sub = QMdiSubWindow()
+        sub.setWidget(QTextEdit(self.paneller.rapor()))
+        sub.setWindowTitle("Açılış Raporu")
+        self.mdi.addSubWindow(sub)
+        sub.show()
+
+    def closeEvent(self, event):
+        # Açık panellerin closeEvent'i telemetri ve kamera bağlantılarını kapatır
+        self.mdi.closeAllSubWindows()
+        event.accept()
+
+    def add_horizon_display(self):
+        sub = QMdiSubWindow()
+        horizon_display = HorizonDisplay()
+        sub.setWidget(horizon_display)
+        sub.setWindowTitle("Horizon Display")
+        self.mdi.addSubWindow(sub)
+        sub.show()
+
+class HorizonDisplay(QGraphicsView):
+    def __init__(self):
+        super().__init__()
+        self.scene = QGraphicsScene()
+        self.setScene(self.scene)
+        self.setFixedSize(250, 250)
+
+        self.image_item = KameraOgesi()
+        self.scene.addItem(self.image_item)
+
+        # Döndürülebilir PNG göstergesi
+        self.horizon_indicator = QGraphicsPixmapItem(varlik("Dedector.PNG"))
+        self.horizon_indicator.setTransformationMode(Qt.SmoothTransformation)
+        self.scene.addItem(self.horizon_indicator)
+
+        # Artı işareti (Kamera görüntüsünün merkezinde sabit)
+        self.cross_horizontal = self.scene.addLine(-20, 0, 20, 0, pen=QPen(QColor("red"), 2))
+        self.cross_vertical = self.scene.addLine(0, -20, 0, 20, pen=QPen(QColor("red"), 2))
+        self.cross_horizontal.setPos(self.width() / 2, self.height() / 2)
+        self.cross_vertical.setPos(self.width() / 2, self.height() / 2)
+
+        # Göstergenin başlangıç konumu (Tam ortada)
+        self.horizon_indicator.setPos((self.width() - 200) / 2, (self.height() - 200) / 2)
+
+    def update_image(self, kare):
+        """ Kamera görüntüsünü günceller """
+        self.image_item.kare_goster(kare)
+
+    def update_horizon(self, pitch, roll):
+        """ PNG göstergesini roll ile döndürür, pitch ile yukarı-aşağı hareket ettirir """
+        transform = QTransform()
+        transform.translate(100, 100)  # PNG'nin merkezine git
+        transform.rotate(-roll)  # Roll açısına göre döndür
+        transform.translate(-100, -100)  # Merkez dönüşü geri al
+        self.horizon_indicator.setTransform(transform)
+
+        # Pitch değerine göre yukarı-aşağı hareket ettir
+        self.horizon_indicator.setPos((self.width() - 200) / 2, (self.height() - 200) / 2 + pitch * 5)
+
+class PixhawkThread(QObject, KayitDinleyici):
+    update_horizon = pyqtSignal(float, float)
+
+    def __init__(self, port='COM9', baud=115200, ekran_hz=60):
+        super().__init__()
+        self.port = port
+        self.baud = baud
+        self.merkez = None
+        self.abone = None
+        self.cozucu = Cozucu(self)
+        # Sinyaller her mesajda değil, ekran hızında son değerle yayılır
+        self.toplayici = GuncellemeToplayici(self, ekran_hz)
+
+    def start(self):
+        self.toplayici.baslat()
+        self.merkez = TelemetriMerkezi.paylasilan(self.port, self.baud)
+        self.merkez.hiz.talep_et(self, {'ATTITUDE': 50})
+        self.abone = self.merkez.abone_ol(self.mesaj_isle, tipler=('ATTITUDE',), ad="MDI ufuk göstergesi")
+
+    def mesaj_isle(self, msg):
+        self.cozucu.isle(msg)
+
+    def tutum(self, kayit, msg):
+        self.toplayici.koy('update_horizon', kayit.pitch, kayit.roll)
+
+    def stop(self):
+        self.toplayici.durdur()
+        if self.merkez is not None:
+            self.merkez.hiz.talebi_kaldir(self)
+            self.merkez.abonelikten_cik(self.abone)
+            self.merkez.birak()
+            self.merkez = None
+
+if __name__ == "__main__":
+    # Harita paneli QtWebEngine'i uygulama kurulduktan sonra içe aktarır
+    webengine_hazirla()
+    app = QApplication(sys.argv)
+    window = MDIWindow()
+    window.show()
+    window.paneller.isaretle("pencere gösterildi")
+    sys.exit(app.exec_())
@@ -0,0 +1,53 @@
+"""Telemetri gecikmelerini pencerenin üzerinde gösteren hata ayıklama katmanı.
+
+F12 katmanı açıp kapatır, Ctrl+F12 ölçümleri ``kayitlar/`` altına JSON
+olarak yazar. Katman görünürken yarım saniyede bir yenilenir.
+"""
+import os
+import time
+
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont, QKeySequence
+from PyQt5.QtWidgets import QLabel, QShortcut
+
+# Çalışma dizininden bağımsız: modülün yanında
+KAYIT_DIZINI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kayitlar")
+
+
+class GecikmeKatmani(QLabel):
+    def __init__(self, pencere, izleyici, dizin=KAYIT_DIZINI):
+        super().__init__(pencere)
+        self.izleyici = izleyici
+        self.dizin = dizin
+        self.setFont(QFont("Monospace", 9))
+        self.setStyleSheet("background-color: rgba(0, 0, 0, 170); color: #7CFC00; padding: 6px;")
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.move(10, 10)
+        self.hide()
+
+        self._zamanlayici = QTimer(self)
+        self._zamanlayici.timeout.connect(self.yenile)
+        QShortcut(QKeySequence(Qt.Key_F12), pencere, self.ac_kapat)
+        QShortcut(QKeySequence(Qt.CTRL + Qt.Key_F12), pencere, self.dosyaya_yaz)
+
+    def ac_kapat(self):
+        if self.isVisible():
+            self._zamanlayici.stop()
+            self.hide()
+        else:
+            self.yenile()
+            self.show()
+            self.raise_()
+            self._zamanlayici.start(500)
+
+    def yenile(self):
+        self.setText(self.izleyici.metin())
+        self.adjustSize()
+
+    def dosyaya_yaz(self, dosya=None):
+        if dosya is None:
+            os.makedirs(self.dizin, exist_ok=True)
+            dosya = os.path.join(self.dizin, time.strftime("gecikme_%Y%m%d_%H%M%S.json"))
+        self.izleyici.dosyaya_yaz(dosya)
+        print(f"Gecikme ölçümleri yazıldı: {dosya}")
+        return dosya
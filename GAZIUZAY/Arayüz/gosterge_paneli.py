@@ -0,0 +1,297 @@
+"""Bütün uçuş göstergelerini tek widget'ta çizen panel.
+
+Ana pencerede yapay ufuk ve üç yuvarlak gösterge ayrı widget'lardı; üçü kendi
+``QGraphicsView``/sahnesiyle, bir telemetri tıkı birkaç bağımsız çizime yol
+açıyordu. ``GostergePaneli`` göstergeleri kendi alanlarında tek ``paintEvent``
+içinde çizer:
+
+* her gösterge değeri değişince yalnızca değişen yeri kirli işaretler; ibreli
+  göstergelerde bu eski ve yeni ibre kutusudur, bütün gösterge değil,
+* kirli bölgeler birleştirilip en fazla ``en_fazla_hz`` hızında tek bir
+  ``update(bolge)`` ile istenir; aradaki güncellemeler yalnızca bölgeyi büyütür,
+* her göstergenin kendi üst sınırı olabilir (``hiz_siniri_ayarla(hz, gosterge)``).
+  Ufuk her tıkta 400x300'ün tamamını yeniden çizer ve panelin en pahalı
+  kısmıdır; varsayılan olarak ``UFUK_HZ``'de sınırlanır, ibreler panelin
+  sınırıyla çizilir. Sınırı dolmamış göstergenin kirli bölgesi bir sonraki
+  isteğe kalır, son değer yine çizilir,
+* çizimde yalnızca bölgeyle kesişen göstergeler çizilir.
+
+İbreli göstergelerin arka planı panel zeminiyle birlikte bir kez opak bir
+katmana çizilir; yeniden çizimde saydam arka plan karıştırılmaz, katman
+kopyalanır. İbreler ``ibre_onbellegi.DonukKareler``'den, görseller
+``varliklar``'dan gelir. Geometri eski widget'larla aynıdır (250x250 alan,
+ortalanmış arka plan).
+"""
+import time
+
+from PyQt5.QtCore import QPoint, QRect, QSize, Qt, QTimer
+from PyQt5.QtGui import QPainter, QPixmap, QRegion
+from PyQt5.QtWidgets import QWidget
+
+from ibre_onbellegi import DonukKareler
+from varliklar import varlik
+from yapay_ufuk import UfukCizici
+
+# Ana pencerenin gösterge sütunu yerine: üstte ufuk, altında 2 + 1 gösterge
+VARSAYILAN_YERLESIM = {
+    "ufuk": QRect(50, 0, 400, 300),
+    "hiz": QRect(0, 310, 250, 250),
+    "dikey_hiz": QRect(250, 310, 250, 250),
+    "donus": QRect(125, 570, 250, 250),
+}
+UFUK_HZ = 25
+# Süresine bu kadar kalmış gösterge o anki çizime katılır; ayrı bir çizim açılmaz
+ERKEN_S = 0.002
+
+
+class Gosterge:
+    """Paneldeki bir gösterge: ``alan`` içinde çizilir, değişince kirli bölge verir.
+
+    ``ad`` gecikme izleyicideki panel adıdır; ``opak`` göstergeler alanlarının
+    tamamını boyar. ``en_fazla_hz`` göstergenin kendi çizim sınırıdır, None
+    ise panelinki geçerlidir.
+    """
+
+    ad = ""
+    opak = False
+    en_fazla_hz = None
+
+    def __init__(self, alan):
+        self.alan = QRect(alan)
+        self.kirli = QRegion()
+        self.son_istek = 0.0
+
+    def zemin_ayarla(self, zemin, oran):
+        """Panel zemini ya da piksel oranı değişince çağrılır."""
+
+    def ciz(self, painter):
+        raise NotImplementedError
+
+
+class UfukGostergesi(Gosterge):
+    ad = "HaraketPenceresi"
+    opak = True
+    en_fazla_hz = UFUK_HZ
+
+    def __init__(self, alan, cizici=None):
+        super().__init__(alan)
+        self.cizici = cizici or UfukCizici()
+        self.pitch = 0.0
+        self.roll = 0.0
+
+    def ayarla(self, pitch, roll):
+        if pitch == self.pitch and roll == self.roll:
+            return None
+        self.pitch, self.roll = pitch, roll
+        return self.alan
+
+    def ciz(self, painter):
+        painter.save()
+        painter.translate(self.alan.topLeft())
+        painter.setClipRect(0, 0, self.alan.width(), self.alan.height(), Qt.IntersectClip)
+        self.cizici.ciz(painter, self.alan.width(), self.alan.height(), self.pitch, self.roll)
+        painter.restore()
+
+
+class IbreliGosterge(Gosterge):
+    """Ortalanmış arka plan ve ``merkez`` etrafında dönen ibre.
+
+    ``aci`` gösterge değerini dereceye çevirir; ibrenin dinlenme yeri eski
+    widget'lardaki gibi arka planın ortasının ``dikey`` piksel üstüdür. Zemin
+    verildikten sonra gösterge opaktır: alan, zemin ve arka planın önceden
+    çizildiği katmandan kopyalanır.
+    """
+
+    def __init__(self, ad, alan, arka, ibre, merkez, aci, dikey=-30):
+        super().__init__(alan)
+        self.ad = ad
+        self.arka = varlik(arka)
+        self.kareler = DonukKareler(varlik(ibre), merkez)
+        self.aci = aci
+        self.arka_yeri = self.alan.topLeft() + QPoint(
+            (self.alan.width() - self.arka.width()) // 2, (self.alan.height() - self.arka.height()) // 2)
+        kaynak = self.kareler.kaynak
+        self.ibre_yeri = self.arka_yeri + QPoint(
+            (self.arka.width() - kaynak.width()) // 2, (self.arka.height() - kaynak.height()) // 2 + dikey)
+        self._adim = None
+        self._kare = kaynak
+        self._kutu = QRect(self.ibre_yeri, kaynak.size())
+        self._katman = None
+
+    def zemin_ayarla(self, zemin, oran):
+        self._katman = QPixmap(self.alan.size() * oran)
+        self._katman.setDevicePixelRatio(oran)
+        p = QPainter(self._katman)
+        p.fillRect(0, 0, self.alan.width(), self.alan.height(), zemin)
+        self.statik_ciz(p, -self.alan.topLeft())
+        p.end()
+        self.opak = True
+
+    def statik_ciz(self, painter, kayma):
+        """Değerden bağımsız katman: arka plan."""
+        painter.drawPixmap(self.arka_yeri + kayma, self.arka)
+
+    def ayarla(self, deger):
+        adim = self.kareler.adim_no(self.aci(deger))
+        if adim == self._adim:
+            return None
+        self._adim = adim
+        self._kare, kayma = self.kareler.adim_karesi(adim)
+        eski = self._kutu
+        self._kutu = QRect(self.ibre_yeri + kayma.toPoint(), self._kare.size() / self._kare.devicePixelRatio())
+        return eski.united(self._kutu)
+
+    def ciz(self, painter):
+        if self._katman is not None:
+            painter.drawPixmap(self.alan.topLeft(), self._katman)
+        else:
+            self.statik_ciz(painter, QPoint())
+        painter.drawPixmap(self._kutu.topLeft(), self._kare)
+
+
+class DonusGostergesi(IbreliGosterge):
+    """Dönüş göstergesi: yatışla dönen uçak, sabit işaretler ve kayan top."""
+
+    def __init__(self, alan):
+        super().__init__("TurnCoordinator", alan, "TurnCoordinator_Background2.png", "DJV JUL 2357-12.png",
+                         None, lambda roll: roll / 1.587, dikey=-15)
+        self.isaretler = varlik("TurnCoordinatorMarks.png")
+        self.top = varlik("TurnCoordinatorBall,png.PNG")
+        self._top_kutusu = QRect(self._top_yeri(0.0), self.top.size())
+
+    def _top_yeri(self, roll):
+        # Eski TurnCoordinator'daki parabol: top yatışla yana ve yukarı kayar
+        x = 99 + -1.84 * roll
+        y = 159 + -0.00198 * (x - 99) ** 2
+        return self.arka_yeri + QPoint(round(x), round(y))
+
+    def ayarla(self, roll):
+        kirli = super().ayarla(roll)
+        top = QRect(self._top_yeri(roll), self.top.size())
+        if top != self._top_kutusu:
+            hareket = top.united(self._top_kutusu)
+            kirli = hareket if kirli is None else kirli.united(hareket)
+            self._top_kutusu = top
+        return kirli
+
+    def ciz(self, painter):
+        super().ciz(painter)
+        painter.drawPixmap(self.arka_yeri + QPoint(96, 158), self.isaretler)
+        painter.drawPixmap(self._top_kutusu.topLeft(), self.top)
+
+
+class GostergePaneli(QWidget):
+    """Ufuk, hava hızı, dikey hız ve dönüş göstergelerini tek geçişte çizen panel.
+
+    Yuvalar eski widget'larınkiyle aynı değerleri alır: ``yatay_guncelleme(pitch,
+    roll)``, ``hiz_guncelle(hiz)``, ``dikey_hiz_guncelle(hiz)``. Dönüş göstergesi
+    yatışı ``yatay_guncelleme``'den alır.
+    """
+
+    def __init__(self, parent=None, yerlesim=None, en_fazla_hz=60):
+        super().__init__(parent)
+        yerlesim = yerlesim or VARSAYILAN_YERLESIM
+        self.ufuk = UfukGostergesi(yerlesim["ufuk"])
+        self.hiz = IbreliGosterge("AirSpeedIndicator", yerlesim["hiz"], "AirSpeedIndicator_Background.PNG",
+                                  "AirSpeedNeedle.PNG", (12, 96), lambda hiz: 180 + hiz * 7.2)
+        self.dikey_hiz = IbreliGosterge("VerticalSpeedIndicator", yerlesim["dikey_hiz"],
+                                        "VerticalSpeedIndicator_Background.PNG", "VerticalSpeedNeedle.PNG",
+                                        (12, 96), lambda hiz: 270 + hiz * 25)
+        self.donus = DonusGostergesi(yerlesim["donus"])
+        self.gostergeler = [self.ufuk, self.hiz, self.dikey_hiz, self.donus]
+        self._boyut = QRect()
+        for gosterge in self.gostergeler:
+            self._boyut = self._boyut.united(gosterge.alan)
+        self.gecikme = None
+        self.boyama = 0
+        self._zemin_anahtari = None
+        self._zamanlayici = QTimer(self)
+        self._zamanlayici.setSingleShot(True)
+        self._zamanlayici.setTimerType(Qt.PreciseTimer)
+        self._zamanlayici.timeout.connect(self._iste)
+        self.hiz_siniri_ayarla(en_fazla_hz)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+    def sizeHint(self):
+        return QSize(self._boyut.right() + 1, self._boyut.bottom() + 1)
+
+    def hiz_siniri_ayarla(self, en_fazla_hz, gosterge=None):
+        """Saniyedeki en fazla yeniden çizim isteği; 0 ya da None sınırsız.
+
+        ``gosterge`` verilirse yalnızca onun sınırı değişir.
+        """
+        if gosterge is not None:
+            gosterge.en_fazla_hz = en_fazla_hz
+        else:
+            self.en_fazla_hz = en_fazla_hz
+
+    def _aralik(self, gosterge):
+        hz = self.en_fazla_hz if gosterge.en_fazla_hz is None else gosterge.en_fazla_hz
+        return 1.0 / hz if hz else 0.0
+
+    def yatay_guncelleme(self, pitch, roll):
+        self._isaretle(self.ufuk, self.ufuk.ayarla(pitch, roll))
+        self._isaretle(self.donus, self.donus.ayarla(roll))
+
+    def hiz_guncelle(self, hiz):
+        self._isaretle(self.hiz, self.hiz.ayarla(hiz))
+
+    def dikey_hiz_guncelle(self, hiz):
+        self._isaretle(self.dikey_hiz, self.dikey_hiz.ayarla(hiz))
+
+    def _isaretle(self, gosterge, bolge):
+        if bolge is None:
+            return
+        bekliyordu = not gosterge.kirli.isEmpty()
+        gosterge.kirli += bolge
+        if bekliyordu:
+            return
+        # Süre dolmuş olsa da olay döngüsüne bırakılır; aynı tıktaki işaretler birleşir
+        kalan = gosterge.son_istek + self._aralik(gosterge) - time.monotonic()
+        kalan_ms = max(0, round(1000 * kalan))
+        if not self._zamanlayici.isActive() or kalan_ms < self._zamanlayici.remainingTime():
+            self._zamanlayici.start(kalan_ms)
+
+    def _iste(self):
+        simdi = time.monotonic()
+        bolge = QRegion()
+        sonraki = None
+        for gosterge in self.gostergeler:
+            if gosterge.kirli.isEmpty():
+                continue
+            kalan = gosterge.son_istek + self._aralik(gosterge) - simdi
+            if kalan <= ERKEN_S:
+                bolge += gosterge.kirli
+                gosterge.kirli = QRegion()
+                gosterge.son_istek = simdi
+            elif sonraki is None or kalan < sonraki:
+                sonraki = kalan
+        if sonraki is not None:
+            self._zamanlayici.start(max(0, round(1000 * sonraki)))
+        if not bolge.isEmpty():
+            self.update(bolge)
+
+    def paintEvent(self, event):
+        bolge = event.region()
+        zemin = self.palette().window()
+        anahtar = (self.palette().cacheKey(), self.devicePixelRatioF())
+        if anahtar != self._zemin_anahtari:
+            for gosterge in self.gostergeler:
+                gosterge.zemin_ayarla(zemin, anahtar[1])
+            self._zemin_anahtari = anahtar
+        painter = QPainter(self)
+        # Opak göstergelerin altı boyanmaz; yalnızca saydam kenarlar ve boşluklar
+        zemin_bolgesi = QRegion(bolge)
+        for gosterge in self.gostergeler:
+            if gosterge.opak:
+                zemin_bolgesi -= QRegion(gosterge.alan)
+        for dikdortgen in zemin_bolgesi.rects():
+            painter.fillRect(dikdortgen, zemin)
+        cizilen = [g for g in self.gostergeler if bolge.intersects(g.alan)]
+        for gosterge in cizilen:
+            gosterge.ciz(painter)
+        painter.end()
+        self.boyama += 1
+        if self.gecikme is not None:
+            for gosterge in cizilen:
+                self.gecikme.cizildi(gosterge.ad)
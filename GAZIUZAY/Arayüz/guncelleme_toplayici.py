@@ -0,0 +1,110 @@
+"""Yüksek hızlı telemetri sinyallerini ekran hızında birleştiren toplayıcı.
+
+Okuma iş parçacığı her mesaj için Qt sinyali yaydığında 50-100 Hz'lik akış
+GUI olay kuyruğunu eskimiş güncellemelerle doldurur ve her biri ayrı bir
+sahne çizimine yol açar. ``GuncellemeToplayici`` araya kanal başına yalnızca
+en son değeri tutan bir posta kutusu koyar; tek bir zamanlayıcı (varsayılan
+60 Hz) her tıkta bekleyen kanalları hedef nesnenin aynı adlı sinyalleriyle
+bir kez yayar. Böylece göstergelere bağlı yuvalar değişmeden kalır.
+"""
+import threading
+
+from PyQt5.QtCore import QObject, Qt, QTimer
+
+
+class SonDegerKutusu:
+    """Kanal başına en son değeri tutan, iş parçacığı güvenli posta kutusu."""
+
+    def __init__(self):
+        self._kilit = threading.Lock()
+        self._bekleyen = {}
+        self.konulan = 0
+        self.birlestirilen = 0
+        self.en_buyuk_derinlik = 0
+
+    def koy(self, kanal, deger):
+        with self._kilit:
+            if kanal in self._bekleyen:
+                # Önceki değer ekrana hiç ulaşmadan eskidi
+                self.birlestirilen += 1
+            self._bekleyen[kanal] = deger
+            self.konulan += 1
+            self.en_buyuk_derinlik = max(self.en_buyuk_derinlik, len(self._bekleyen))
+
+    def al(self):
+        """Bekleyen tüm kanalları alıp kutuyu boşaltır."""
+        with self._kilit:
+            bekleyen, self._bekleyen = self._bekleyen, {}
+        return bekleyen
+
+    @property
+    def derinlik(self):
+        return len(self._bekleyen)
+
+
+class GuncellemeToplayici(QObject):
+    """``hedef`` nesnesinin sinyallerini ekran hızında, son değerle yayar.
+
+    ``koy(kanal, *degerler)`` herhangi bir iş parçacığından çağrılabilir;
+    ``kanal`` hedefteki sinyalin adıdır (ör. ``'update_horizon'``). ``hz``
+    None ya da 0 ise birleştirme yapılmaz, sinyal hemen yayılır.
+    ``gecikme`` bir ``telemetri.gecikme.GecikmeIzleyici`` ise her yayında
+    iletim anı işaretlenir.
+    """
+
+    def __init__(self, hedef, hz=60, parent=None):
+        super().__init__(parent)
+        self.hedef = hedef
+        self.hz = hz
+        self.kutu = SonDegerKutusu()
+        self.yayinlanan = 0
+        self.tik = 0
+        self.gecikme = None
+        self._zamanlayici = QTimer(self)
+        self._zamanlayici.setTimerType(Qt.PreciseTimer)
+        self._zamanlayici.timeout.connect(self.bosalt)
+        self.hz_ayarla(hz)
+
+    def hz_ayarla(self, hz):
+        self.hz = hz
+        if hz:
+            self._zamanlayici.setInterval(max(1, round(1000 / hz)))
+
+    def baslat(self):
+        if self.hz:
+            self._zamanlayici.start()
+
+    def durdur(self):
+        self._zamanlayici.stop()
+        self.bosalt()
+
+    def koy(self, kanal, *degerler):
+        if not self.hz:
+            # Kuyruklu sinyalin GUI'ye ulaşma anı burada bilinmez; bekleme
+            # süresi çizim aşamasına yansır
+            if self.gecikme is not None:
+                self.gecikme.iletildi(kanal)
+            getattr(self.hedef, kanal).emit(*degerler)
+            self.yayinlanan += 1
+            return
+        self.kutu.koy(kanal, degerler)
+
+    def bosalt(self):
+        """Bekleyen her kanal için sinyali bir kez yayar (GUI iş parçacığında)."""
+        self.tik += 1
+        for kanal, degerler in self.kutu.al().items():
+            if self.gecikme is not None:
+                self.gecikme.iletildi(kanal)
+            getattr(self.hedef, kanal).emit(*degerler)
+            self.yayinlanan += 1
+
+    def istatistik(self):
+        return {
+            "hz": self.hz,
+            "derinlik": self.kutu.derinlik,
+            "en_buyuk_derinlik": self.kutu.en_buyuk_derinlik,
+            "konulan": self.kutu.konulan,
+            "birlestirilen": self.kutu.birlestirilen,
+            "yayinlanan": self.yayinlanan,
+            "tik": self.tik,
+        }
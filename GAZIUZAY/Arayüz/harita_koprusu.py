@@ -0,0 +1,179 @@
+"""Canlı harita köprüsü.
+
+Folium sayfası yalnızca bir kez oluşturulup ``QWebEngineView`` içine yüklenir.
+Sonraki konum, yön ve iz güncellemeleri ``runJavaScript`` ile doğrudan sayfadaki
+Leaflet haritasına gönderilir; her GPS mesajında dosya yazma, HTML ayrıştırma ve
+karo indirme tekrarlanmaz.
+
+İz iki çizgiden oluşur: sadeleştirilmiş geçmiş ve tam çözünürlüklü kuyruk
+(bkz. ``iz_kaydi.IzDeposu``). Sayfaya yalnızca değişen kısımlar gönderilir.
+
+Karolar verilirse ``karo_onbellegi`` sunucusundan alınır; böylece sahada ağ
+olmadan da harita görünür.
+"""
+import json
+
+import folium
+from branca.element import MacroElement
+from folium import CustomIcon
+from jinja2 import Template
+from PyQt5 import QtCore
+
+from karo_onbellegi import OSM_ATTR
+
+
+class _CanliKatman(MacroElement):
+    """Haritaya iz çizgilerini ve ``ihaGuncelle`` JS fonksiyonunu ekler."""
+
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            window.ihaHarita = {{ this._parent.get_name() }};
+            window.ihaIsaret = {{ this.isaret.get_name() }};
+            window.ihaGecmis = L.polyline(
+                {{ this.gecmis|tojson }},
+                {color: "blue", weight: 2.5, opacity: 0.8}
+            ).addTo(window.ihaHarita);
+            window.ihaKuyruk = L.polyline(
+                {{ this.kuyruk|tojson }},
+                {color: "blue", weight: 2.5, opacity: 0.8}
+            ).addTo(window.ihaHarita);
+            window.ihaYon = null;
+
+            window.ihaIzUygula = function(cizgi, yenile, kes, ekle) {
+                if (yenile || kes > 0) {
+                    var noktalar = yenile ? [] : cizgi.getLatLngs().slice(kes);
+                    cizgi.setLatLngs(noktalar.concat(ekle));
+                } else {
+                    for (var i = 0; i < ekle.length; i++) { cizgi.addLatLng(ekle[i]); }
+                }
+            };
+
+            window.ihaYonUygula = function() {
+                var ikon = window.ihaIsaret._icon;
+                if (!ikon || window.ihaYon === null) { return; }
+                ikon.style.transformOrigin = "center";
+                ikon.style.transform = ikon.style.transform.replace(/ rotate\\([^)]*\\)/, "")
+                    + " rotate(" + window.ihaYon + "deg)";
+            };
+            window.ihaHarita.on("zoomend viewreset moveend", window.ihaYonUygula);
+
+            window.ihaGuncelle = function(lat, lon, yon, iz, takip) {
+                window.ihaIsaret.setLatLng([lat, lon]);
+                if (yon !== null) { window.ihaYon = yon; }
+                window.ihaYonUygula();
+                if (iz !== null) {
+                    window.ihaIzUygula(window.ihaGecmis, iz[1], 0, iz[0]);
+                    window.ihaIzUygula(window.ihaKuyruk, iz[4], iz[2], iz[3]);
+                }
+                if (takip) { window.ihaHarita.panTo([lat, lon], {animate: false}); }
+                return window.ihaHarita.getZoom();
+            };
+        {% endmacro %}
+    """)
+
+    def __init__(self, isaret, iz=None):
+        super().__init__()
+        self._name = "ihaIz"
+        self.isaret = isaret
+        self.gecmis = [list(nokta) for nokta in iz.gecmis] if iz else []
+        self.kuyruk = [list(nokta) for nokta in iz.kuyruk] if iz else []
+
+
+def harita_olustur(latitude, longitude, zoom_start=20, karo_url=None):
+    """Karo kaynağı ayarlanmış boş folium haritası oluşturur.
+
+    ``karo_url`` yerel karo sunucusunun şablonudur; OSM 19'dan büyük zoom
+    sunmadığından üst seviyelerde 19. seviye karolar büyütülür.
+    """
+    if karo_url is None:
+        return folium.Map(location=[latitude, longitude], zoom_start=zoom_start)
+    harita = folium.Map(location=[latitude, longitude], zoom_start=zoom_start, tiles=None, max_zoom=21)
+    folium.TileLayer(karo_url, attr=OSM_ATTR, max_zoom=21, max_native_zoom=19).add_to(harita)
+    return harita
+
+
+def canli_harita_olustur(latitude, longitude, iz=None, ikon='plane.png', zoom_start=20, karo_url=None):
+    """Canlı güncellemeye hazır folium haritasını oluşturur."""
+    harita = harita_olustur(latitude, longitude, zoom_start, karo_url)
+    isaret = folium.Marker(
+        location=[latitude, longitude],
+        popup="Mevcut İHA Konumu",
+        icon=CustomIcon(ikon, icon_size=(40, 40))
+    ).add_to(harita)
+    _CanliKatman(isaret, iz).add_to(harita)
+    return harita
+
+
+def guncelleme_betigi(latitude, longitude, heading=None, degisiklik=None, takip=True):
+    """``ihaGuncelle`` çağrısının JS metnini üretir.
+
+    ``degisiklik`` bir ``iz_kaydi.IzDegisikligi``'dir; JSON'da dizi olarak gider.
+    """
+    return "window.ihaGuncelle && window.ihaGuncelle({}, {}, {}, {}, {});".format(
+        float(latitude), float(longitude),
+        "null" if heading is None else float(heading),
+        json.dumps(degisiklik),
+        "true" if takip else "false"
+    )
+
+
+class CanliHarita(QtCore.QObject):
+    """Bir ``QWebEngineView`` üzerindeki haritayı yeniden yüklemeden günceller.
+
+    Sayfa yüklenirken gelen değişiklikler gönderilmez; yükleme bitince izin tamamı
+    tek çağrıyla gönderilir. Sayfanın zoom seviyesi her güncellemenin dönüş
+    değerinden okunup izin sadeleştirme toleransına aktarılır.
+    """
+
+    # Güncelleme sayfada uygulandığında (JS dönüşü) yayılır
+    uygulandi = QtCore.pyqtSignal()
+
+    def __init__(self, web_view, map_path, iz, ikon='plane.png', zoom_start=20, takip=True, karo_url=None):
+        super().__init__()
+        self.web_view = web_view
+        self.map_path = map_path
+        self.iz = iz
+        self.karo_url = karo_url
+        self.ikon = ikon
+        self.zoom_start = zoom_start
+        self.takip = takip
+        self.zoom = zoom_start
+        self.hazir = False
+        self._son_konum = None
+        self._son_yon = None
+        self.web_view.loadFinished.connect(self._yukleme_bitti)
+
+    def yukle(self, latitude, longitude):
+        """Haritayı bir kez diske yazar ve görünüme yükler."""
+        self.hazir = False
+        canli_harita_olustur(
+            latitude, longitude, self.iz, self.ikon, self.zoom_start, self.karo_url
+        ).save(self.map_path)
+        self.web_view.setUrl(QtCore.QUrl.fromLocalFile(self.map_path))
+
+    def guncelle(self, latitude, longitude, heading=None, degisiklik=None):
+        """Konumu, yönü ve izdeki değişikliği sayfaya gönderir."""
+        self._son_konum = (latitude, longitude)
+        if heading is not None:
+            self._son_yon = heading
+        if self.hazir:
+            self._gonder(degisiklik)
+
+    def _gonder(self, degisiklik):
+        if self._son_konum is None:
+            return
+        betik = guncelleme_betigi(
+            self._son_konum[0], self._son_konum[1], self._son_yon, degisiklik, self.takip
+        )
+        self.web_view.page().runJavaScript(betik, self._zoom_al)
+
+    def _zoom_al(self, zoom):
+        if zoom is not None:
+            self.zoom = zoom
+            self.iz.zoom_ayarla(zoom)
+        self.uygulandi.emit()
+
+    def _yukleme_bitti(self, basarili):
+        self.hazir = basarili
+        if basarili:
+            self._gonder(self.iz.tam_durum())
@@ -0,0 +1,289 @@
+"""Kamera karelerinde çok süreçli hedef tespiti.
+
+Tespit yakalama ya da GUI iş parçacığında yapılırsa görüntü birkaç fps'e düşer.
+``TespitHavuzu`` tespiti ayrı süreçlerde çalıştırır:
+
+* Kareler paylaşılan bellekteki (``multiprocessing.shared_memory``) yuvalara
+  kopyalanır; süreçlere yalnızca yuva numarası, kare sırası ve zamanı gider,
+  kare hiçbir zaman pickle edilmez.
+* Her işçi aynı anda tek kare işler. Boşta işçi yoksa kare bekleyen kuyruğuna
+  girer; kuyruk doluysa en eski bekleyen atılır. Böylece tespit geride kalsa
+  da sonuçlar hep en taze karelere aittir ve yakalama hiçbir zaman beklemez.
+* Sonuçlar ayrı bir iş parçacığında toplanıp ``sonuc`` geri çağırmasına
+  verilir (arayüzde bir sinyalin ``emit``'i).
+
+İşçiler ``spawn`` ile başlatılır; Qt ve kamera iş parçacıkları olan bir süreçte
+``fork`` güvenli değildir. Dedektör pickle edilebilir ve ``dizi -> kutular``
+çağrılabilir olmalıdır; başvuru olarak ``RenkDedektoru`` gelir. ``KilitSayaci``
+hedefin vuruş alanında tutulduğu süreyi sayar.
+
+cv2 modül düzeyinde içe aktarılmaz; yalnızca dedektör ve işçiler yükler. Kamera
+görünümü ``KilitSayaci`` için bu modülü alırken GUI iş parçacığı cv2'yi beklemez.
+"""
+import multiprocessing
+import threading
+import time
+from collections import deque, namedtuple
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+
+import numpy as np
+
+Tespit = namedtuple("Tespit", ["sira", "zaman", "kutular", "sure", "isci"])
+Tespit.__doc__ = """Bir karenin tespit sonucu.
+
+``kutular`` skora göre azalan (x, y, genişlik, yükseklik, skor) listesidir;
+``zaman`` karenin yakalanma anı (``time.monotonic``), ``sure`` işçideki tespit
+süresidir.
+"""
+
+
+class RenkDedektoru:
+    """HSV renk eşiği ve konturlarla çalışan başvuru (CPU) dedektörü.
+
+    Varsayılan aralıklar kırmızıdır; ton 0/180 sınırında ikiye bölünür. Skor
+    kontur alanıdır (piksel).
+    """
+
+    KIRMIZI = (((0, 120, 70), (10, 255, 255)), ((170, 120, 70), (180, 255, 255)))
+
+    def __init__(self, araliklar=KIRMIZI, en_kucuk_alan=150, bulaniklik=5):
+        import cv2
+        self.araliklar = [(np.array(alt, np.uint8), np.array(ust, np.uint8)) for alt, ust in araliklar]
+        self.en_kucuk_alan = en_kucuk_alan
+        self.bulaniklik = bulaniklik
+        self._cekirdek = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+
+    def __call__(self, dizi):
+        import cv2
+        if self.bulaniklik:
+            dizi = cv2.GaussianBlur(dizi, (self.bulaniklik, self.bulaniklik), 0)
+        hsv = cv2.cvtColor(dizi, cv2.COLOR_BGR2HSV)
+        maske = None
+        for alt, ust in self.araliklar:
+            parca = cv2.inRange(hsv, alt, ust)
+            maske = parca if maske is None else cv2.bitwise_or(maske, parca)
+        maske = cv2.morphologyEx(maske, cv2.MORPH_OPEN, self._cekirdek)
+        konturlar, _ = cv2.findContours(maske, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        kutular = []
+        for kontur in konturlar:
+            alan = cv2.contourArea(kontur)
+            if alan >= self.en_kucuk_alan:
+                x, y, g, h = cv2.boundingRect(kontur)
+                kutular.append((x, y, g, h, float(alan)))
+        kutular.sort(key=lambda kutu: -kutu[4])
+        return kutular
+
+
+def _isci_dongusu(isci, adlar, sekil, is_ucu, sonuc_ucu, dedektor):
+    import cv2
+    # Her süreç tek çekirdek kullanır; paralellik süreç sayısından gelir
+    cv2.setNumThreads(1)
+    yuvalar = [shared_memory.SharedMemory(name=ad) for ad in adlar]
+    diziler = [np.ndarray(sekil, np.uint8, buffer=yuva.buf) for yuva in yuvalar]
+    try:
+        while True:
+            is_ = is_ucu.recv()
+            if is_ is None:
+                break
+            yuva, sira, zaman = is_
+            baslangic = time.perf_counter()
+            kutular = dedektor(diziler[yuva])
+            sonuc_ucu.send((yuva, Tespit(sira, zaman, kutular, time.perf_counter() - baslangic, isci)))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        del diziler
+        for yuva in yuvalar:
+            yuva.close()
+
+
+class TespitHavuzu:
+    """Kareleri paylaşılan bellek üzerinden işçi süreçlere dağıtan tespit aşaması."""
+
+    def __init__(self, sekil, isci=2, dedektor=None, sonuc=None, bekleyen=1):
+        self.sekil = tuple(sekil)
+        self.isci_sayisi = isci
+        self.dedektor = dedektor or RenkDedektoru()
+        self.sonuc = sonuc
+        self.gonderilen = 0
+        self.islenen = 0
+        self.dusurulen = 0
+        self.uyumsuz = 0
+        self._bekleyen = deque()
+        self._en_fazla_bekleyen = bekleyen
+        self._kilit = threading.Lock()
+        self._yuvalar = []
+        self._diziler = []
+        self._bos_yuvalar = []
+        self._surecler = []
+        self._is_uclari = []
+        self._sonuc_uclari = []
+        self._bos_isciler = []
+        self._toplayici = None
+        self._calisiyor = False
+
+    def baslat(self):
+        boyut = int(np.prod(self.sekil))
+        # İşçi başına bir yuva + bekleyenler + yazılmakta olan kare
+        adet = self.isci_sayisi + self._en_fazla_bekleyen + 1
+        self._yuvalar = [shared_memory.SharedMemory(create=True, size=boyut) for _ in range(adet)]
+        self._diziler = [np.ndarray(self.sekil, np.uint8, buffer=yuva.buf) for yuva in self._yuvalar]
+        self._bos_yuvalar = list(range(adet))
+        adlar = [yuva.name for yuva in self._yuvalar]
+        baglam = multiprocessing.get_context("spawn")
+        for isci in range(self.isci_sayisi):
+            is_al, is_gonder = baglam.Pipe(duplex=False)
+            sonuc_al, sonuc_gonder = baglam.Pipe(duplex=False)
+            surec = baglam.Process(
+                target=_isci_dongusu, name=f"Tespit-{isci}", daemon=True,
+                args=(isci, adlar, self.sekil, is_al, sonuc_gonder, self.dedektor))
+            surec.start()
+            is_al.close()
+            sonuc_gonder.close()
+            self._surecler.append(surec)
+            self._is_uclari.append(is_gonder)
+            self._sonuc_uclari.append(sonuc_al)
+            self._bos_isciler.append(isci)
+        self._calisiyor = True
+        self._toplayici = threading.Thread(target=self._topla, name="TespitToplayici", daemon=True)
+        self._toplayici.start()
+        return self
+
+    def gonder(self, dizi, sira, zaman):
+        """Yakalama iş parçacığında çağrılır; kareyi kopyalar, hiç beklemez."""
+        if dizi.shape != self.sekil:
+            self.uyumsuz += 1
+            return False
+        # Kopya da kilit altında: durdur() yuvaları kapatırken yazılmasın
+        with self._kilit:
+            if not self._calisiyor:
+                return False
+            if not self._bos_yuvalar:
+                self.dusurulen += 1
+                return False
+            yuva = self._bos_yuvalar.pop()
+            np.copyto(self._diziler[yuva], dizi)
+            self.gonderilen += 1
+            self._bekleyen.append((yuva, sira, zaman))
+            if len(self._bekleyen) > self._en_fazla_bekleyen:
+                # En eski bekleyen kare atılır, yuvası boşa çıkar
+                eski = self._bekleyen.popleft()
+                self._bos_yuvalar.append(eski[0])
+                self.dusurulen += 1
+            self._dagit()
+        return True
+
+    def _dagit(self):
+        # Kilit alınmış olarak çağrılır; bekleyen kareler sırayla boştaki işçilere gider
+        while self._bekleyen and self._bos_isciler:
+            is_ = self._bekleyen.popleft()
+            self._is_uclari[self._bos_isciler.pop()].send(is_)
+
+    def _topla(self):
+        while self._calisiyor:
+            if not self._sonuc_uclari:
+                # Bütün işçiler kapanmış
+                time.sleep(0.2)
+                continue
+            for uc in wait(self._sonuc_uclari, timeout=0.2):
+                try:
+                    yuva, tespit = uc.recv()
+                except EOFError:
+                    self._sonuc_uclari.remove(uc)
+                    continue
+                with self._kilit:
+                    self._bos_yuvalar.append(yuva)
+                    self._bos_isciler.append(tespit.isci)
+                    self.islenen += 1
+                    self._dagit()
+                if self.sonuc is not None:
+                    self.sonuc(tespit)
+
+    def durdur(self):
+        with self._kilit:
+            if not self._calisiyor:
+                return
+            self._calisiyor = False
+        self._toplayici.join()
+        for uc in self._is_uclari:
+            try:
+                uc.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for surec in self._surecler:
+            surec.join(timeout=2.0)
+            if surec.is_alive():
+                surec.terminate()
+        for uc in self._is_uclari + self._sonuc_uclari:
+            uc.close()
+        self._diziler = []
+        for yuva in self._yuvalar:
+            yuva.close()
+            yuva.unlink()
+        self._surecler, self._is_uclari, self._sonuc_uclari, self._yuvalar = [], [], [], []
+
+    def istatistik(self):
+        return {
+            "isci": self.isci_sayisi,
+            "gonderilen": self.gonderilen,
+            "islenen": self.islenen,
+            "dusurulen": self.dusurulen,
+            "uyumsuz": self.uyumsuz,
+            "bekleyen": len(self._bekleyen),
+        }
+
+
+class KilitSayaci:
+    """Vuruş alanındaki en büyük hedefin kesintisiz tutulduğu süreyi sayar.
+
+    ``alan`` görüntü oranı olarak (sol, üst, sağ, alt) vuruş alanıdır. Hedef
+    ``tolerans_s``'den kısa süre kaybolursa kilit bozulmaz. Süre kare yakalama
+    zamanlarından hesaplanır; tespit gecikmesi sayacı etkilemez.
+    """
+
+    def __init__(self, alan=(0.25, 0.10, 0.75, 0.90), gerekli_s=4.0, tolerans_s=0.2):
+        self.alan = alan
+        self.gerekli_s = gerekli_s
+        self.tolerans_s = tolerans_s
+        self.tamamlanan = 0
+        self._baslangic = None
+        self._son_gorulme = None
+        self._sayildi = False
+
+    @property
+    def sure(self):
+        if self._baslangic is None:
+            return 0.0
+        return self._son_gorulme - self._baslangic
+
+    @property
+    def kilitli(self):
+        return self._baslangic is not None
+
+    def alan_piksel(self, genislik, yukseklik):
+        sol, ust, sag, alt = self.alan
+        return sol * genislik, ust * yukseklik, sag * genislik, alt * yukseklik
+
+    def guncelle(self, tespit, genislik, yukseklik):
+        """Tespiti işler; vuruş alanındaki hedef kutusunu (yoksa None) döndürür."""
+        sol, ust, sag, alt = self.alan_piksel(genislik, yukseklik)
+        hedef = None
+        for kutu in tespit.kutular:
+            x, y, g, h = kutu[:4]
+            if x >= sol and y >= ust and x + g <= sag and y + h <= alt:
+                hedef = kutu
+                break
+        t = tespit.zaman
+        kayip = self._son_gorulme is None or t - self._son_gorulme > self.tolerans_s
+        if hedef is not None:
+            if self._baslangic is None or kayip:
+                self._baslangic = t
+                self._sayildi = False
+            self._son_gorulme = t
+        elif self._baslangic is not None and kayip:
+            self._baslangic = None
+        if self.sure >= self.gerekli_s and not self._sayildi:
+            self._sayildi = True
+            self.tamamlanan += 1
+        return hedef
@@ -0,0 +1,141 @@
+"""Önceden döndürülmüş ibre kareleri.
+
+Göstergeler ibreyi (ya da dönüş göstergesindeki uçağı) her örnekte yeni bir
+``QTransform`` ile döndürüyordu; sahne de döndürülmüş pixmap'i her çizimde
+yeniden örnekliyordu. ``DonukKareler`` açıyı sabit adımlara (varsayılan 0.5°)
+yuvarlar, her adımı ilk istendiğinde bir kez yumuşak filtreyle çizer ve bayt
+sınırlı bir LRU önbellekte tutar. ``IbreOgesi`` güncellemede yalnızca pixmap'i
+ve kaymasını değiştirir; görünüm eski ve yeni kutuyu yeniden boyar, çizim
+dönüşümsüz bir kopyadır. Aynı adıma düşen örnekler hiç yeniden çizim istemez.
+
+``IbreOgesi.onbellekli = False`` eski davranışa (öğe dönüşümü) döner;
+karşılaştırma için ``benchmarks/bench_ibre_onbellegi.py``.
+"""
+import math
+from collections import OrderedDict
+
+from PyQt5.QtCore import QPointF, QRectF, Qt
+from PyQt5.QtGui import QPainter, QPixmap, QRegion, QTransform
+from PyQt5.QtWidgets import QGraphicsPixmapItem
+
+
+class DonukKareler:
+    """Bir pixmap'in ``merkez`` etrafında adım adım döndürülmüş kopyaları.
+
+    ``merkez`` (x, y) kaynak pixmap koordinatındadır, verilmezse pixmap'in
+    ortasıdır. ``kare(aci)`` (pixmap, kayma) döndürür; kayma, döndürülmüş
+    karenin sol üst köşesinin kaynak koordinatındaki yeridir. Kaynağın saydam
+    kenarları çizimden önce kırpılır; önbellek ``en_fazla_mb``'yi aşınca en
+    uzun süredir kullanılmayan kareler atılır.
+    """
+
+    def __init__(self, pixmap, merkez=None, adim=0.5, en_fazla_mb=16, oran=1.0):
+        self.kaynak = pixmap
+        if merkez is None:
+            merkez = (pixmap.width() / 2, pixmap.height() / 2)
+        self.merkez = QPointF(*merkez)
+        maske = pixmap.mask()
+        self._dolu = QRegion(maske).boundingRect() if not maske.isNull() else pixmap.rect()
+        self._kirpik = pixmap.copy(self._dolu)
+        self.adim = adim
+        self.adim_sayisi = max(1, round(360 / adim))
+        self.en_fazla_bayt = int(en_fazla_mb * 2 ** 20)
+        self.oran = oran
+        self.bayt = 0
+        self.isabet = 0
+        self.iskalama = 0
+        self.atilan = 0
+        self._kareler = OrderedDict()
+
+    def adim_no(self, aci):
+        return round(aci / self.adim) % self.adim_sayisi
+
+    def kare(self, aci):
+        return self.adim_karesi(self.adim_no(aci))
+
+    def adim_karesi(self, adim):
+        kayit = self._kareler.get(adim)
+        if kayit is not None:
+            self._kareler.move_to_end(adim)
+            self.isabet += 1
+            return kayit
+        self.iskalama += 1
+        kayit = self._ciz(adim * self.adim)
+        self._kareler[adim] = kayit
+        self.bayt += self._boyut(kayit[0])
+        while self.bayt > self.en_fazla_bayt and len(self._kareler) > 1:
+            _, (eski, _) = self._kareler.popitem(last=False)
+            self.bayt -= self._boyut(eski)
+            self.atilan += 1
+        return kayit
+
+    def hazirla(self, alt=0.0, ust=360.0):
+        """[alt, ust) aralığındaki adımları önceden çizer (ör. açılışta)."""
+        for i in range(math.floor(alt / self.adim), math.ceil(ust / self.adim)):
+            self.adim_karesi(i % self.adim_sayisi)
+        return self
+
+    @staticmethod
+    def _boyut(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def donusum(self, aci):
+        """Eski yoldaki öğe dönüşümü: ``merkez`` etrafında ``aci`` derece."""
+        donusum = QTransform()
+        donusum.translate(self.merkez.x(), self.merkez.y())
+        donusum.rotate(aci)
+        donusum.translate(-self.merkez.x(), -self.merkez.y())
+        return donusum
+
+    def _ciz(self, aci):
+        donusum = self.donusum(aci)
+        kutu = donusum.mapRect(QRectF(self._dolu))
+        sol, ust = math.floor(kutu.left()), math.floor(kutu.top())
+        genislik = math.ceil(kutu.right()) - sol
+        yukseklik = math.ceil(kutu.bottom()) - ust
+        kare = QPixmap(round(genislik * self.oran), round(yukseklik * self.oran))
+        kare.setDevicePixelRatio(self.oran)
+        kare.fill(Qt.transparent)
+        p = QPainter(kare)
+        p.setRenderHint(QPainter.SmoothPixmapTransform)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.translate(-sol, -ust)
+        p.setTransform(donusum, True)
+        p.drawPixmap(self._dolu.topLeft(), self._kirpik)
+        p.end()
+        return kare, QPointF(sol, ust)
+
+    def istatistik(self):
+        return {
+            "kare": len(self._kareler),
+            "bellek_mb": round(self.bayt / 2 ** 20, 2),
+            "isabet": self.isabet,
+            "iskalama": self.iskalama,
+            "atilan": self.atilan,
+        }
+
+
+class IbreOgesi(QGraphicsPixmapItem):
+    """``DonukKareler``'den beslenen ibre; ``aci_ayarla`` ile döndürülür."""
+
+    onbellekli = True
+
+    def __init__(self, kareler, parent=None, onbellekli=None):
+        super().__init__(kareler.kaynak, parent)
+        self.kareler = kareler
+        self.onbellekli = IbreOgesi.onbellekli if onbellekli is None else onbellekli
+        self._adim = None
+
+    def aci_ayarla(self, aci):
+        """Açıyı uygular; görünüm yeniden boyanacaksa True döner."""
+        if not self.onbellekli:
+            self.setTransform(self.kareler.donusum(aci))
+            return True
+        adim = self.kareler.adim_no(aci)
+        if adim == self._adim:
+            return False
+        self._adim = adim
+        kare, kayma = self.kareler.adim_karesi(adim)
+        self.setPixmap(kare)
+        self.setOffset(kayma)
+        return True
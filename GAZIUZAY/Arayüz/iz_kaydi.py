@@ -0,0 +1,140 @@
+"""Uçuş izi deposu.
+
+Gelen GPS noktaları önce tam çözünürlüklü bir kuyrukta tutulur. Kuyruk
+dolduğunda en eski parça Douglas–Peucker ile sadeleştirilip geçmişe eklenir;
+tolerans haritanın o anki zoom seviyesinde bir pikselin karşılığıdır. Geçmiş
+nokta sınırını aşarsa tolerans ikiye katlanarak yeniden sadeleştirilir, böylece
+bellek ve güncelleme maliyeti uçuş süresinden bağımsız kalır.
+
+Her ``ekle`` çağrısı haritaya gönderilecek değişikliği döndürür; tüm iz
+yeniden gönderilmez.
+"""
+import math
+from collections import deque, namedtuple
+
+# Web Mercator'da zoom 0'da ekvatordaki piksel başına metre
+_PIKSEL_METRE_Z0 = 156543.03392
+_DERECE_METRE = 111320.0
+
+IzDegisikligi = namedtuple(
+    "IzDegisikligi",
+    ["gecmis_ekle", "gecmis_yenile", "kuyruk_kes", "kuyruk_ekle", "kuyruk_yenile"]
+)
+IzDegisikligi.__doc__ = """Haritadaki iki çizgiye (geçmiş ve kuyruk) uygulanacak değişiklik.
+
+``gecmis_yenile``/``kuyruk_yenile`` doğruysa ilgili çizgi verilen noktalarla
+baştan kurulur; değilse noktalar sona eklenir. ``kuyruk_kes`` kuyruğun başından
+atılacak nokta sayısıdır.
+"""
+
+
+def douglas_peucker(noktalar, tolerans_m):
+    """(lat, lon) listesini metre cinsinden toleransla sadeleştirir.
+
+    Uç noktalar her zaman korunur. Küçük bölgeler için eşdikdörtgen izdüşüm
+    yeterlidir.
+    """
+    n = len(noktalar)
+    if n < 3:
+        return list(noktalar)
+    lat0 = noktalar[0][0]
+    kx = _DERECE_METRE * math.cos(math.radians(lat0))
+    xy = [((lon - noktalar[0][1]) * kx, (lat - lat0) * _DERECE_METRE) for lat, lon in noktalar]
+    tut = [False] * n
+    tut[0] = tut[-1] = True
+    yigin = [(0, n - 1)]
+    tolerans2 = tolerans_m * tolerans_m
+    while yigin:
+        bas, son = yigin.pop()
+        ax, ay = xy[bas]
+        bx, by = xy[son]
+        dx, dy = bx - ax, by - ay
+        uzunluk2 = dx * dx + dy * dy
+        en_uzak, en_uzak_i = -1.0, -1
+        for i in range(bas + 1, son):
+            px, py = xy[i]
+            if uzunluk2 == 0:
+                mesafe2 = (px - ax) ** 2 + (py - ay) ** 2
+            else:
+                capraz = dx * (py - ay) - dy * (px - ax)
+                mesafe2 = capraz * capraz / uzunluk2
+            if mesafe2 > en_uzak:
+                en_uzak, en_uzak_i = mesafe2, i
+        if en_uzak > tolerans2:
+            tut[en_uzak_i] = True
+            yigin.append((bas, en_uzak_i))
+            yigin.append((en_uzak_i, son))
+    return [nokta for nokta, t in zip(noktalar, tut) if t]
+
+
+class IzDeposu:
+    """Tam çözünürlüklü kuyruk ve sadeleştirilmiş geçmişten oluşan iz.
+
+    ``en_fazla_gecmis`` en az 4'tür: kabalaştırma geçmişi yarıya indirir ve
+    sadeleştirme iki uç noktayı her zaman tutar.
+    """
+
+    def __init__(self, kuyruk_boyu=600, parca_boyu=100, en_fazla_gecmis=2000,
+                 zoom=18, piksel_toleransi=1.0):
+        if en_fazla_gecmis < 4:
+            raise ValueError("en_fazla_gecmis en az 4 olmalı")
+        self.kuyruk_boyu = kuyruk_boyu
+        self.parca_boyu = parca_boyu
+        self.en_fazla_gecmis = en_fazla_gecmis
+        self.zoom = zoom
+        self.piksel_toleransi = piksel_toleransi
+        self.kabalastirma = 1.0  # Geçmiş sınırı aşıldıkça ikiye katlanır
+        self.gecmis = []
+        self.kuyruk = deque()
+        self.toplam_nokta = 0
+
+    def __len__(self):
+        return len(self.gecmis) + len(self.kuyruk)
+
+    def zoom_ayarla(self, zoom):
+        """Sonraki sadeleştirmelerde kullanılacak zoom seviyesini değiştirir."""
+        self.zoom = zoom
+
+    def tolerans_m(self, latitude):
+        """Geçerli zoom seviyesinde bir pikselin metre karşılığı."""
+        piksel = _PIKSEL_METRE_Z0 * math.cos(math.radians(latitude)) / (2 ** self.zoom)
+        return piksel * self.piksel_toleransi * self.kabalastirma
+
+    def noktalar(self):
+        """Haritada görünen tüm izi tek liste olarak döndürür."""
+        kuyruk = list(self.kuyruk)
+        if self.gecmis and kuyruk:
+            kuyruk = kuyruk[1:]  # Kuyruğun ilk noktası geçmişin son noktasıdır
+        return self.gecmis + kuyruk
+
+    def tam_durum(self):
+        """Haritayı baştan kurmak için gereken değişiklik."""
+        return IzDegisikligi(list(self.gecmis), True, 0, list(self.kuyruk), True)
+
+    def ekle(self, latitude, longitude):
+        """Yeni noktayı ekler ve haritaya gönderilecek değişikliği döndürür."""
+        nokta = (latitude, longitude)
+        self.toplam_nokta += 1
+        self.kuyruk.append(nokta)
+        if len(self.kuyruk) <= self.kuyruk_boyu + self.parca_boyu:
+            return IzDegisikligi([], False, 0, [nokta], False)
+
+        # Kuyruğun en eski parçasını sadeleştirip geçmişe taşı; parçanın son
+        # noktası kuyrukta kalır ki iki çizgi birbirine bağlı görünsün.
+        parca = [self.kuyruk[i] for i in range(self.parca_boyu + 1)]
+        sade = douglas_peucker(parca, self.tolerans_m(latitude))
+        yeni = sade[1:] if self.gecmis else sade
+        self.gecmis.extend(yeni)
+        for _ in range(self.parca_boyu):
+            self.kuyruk.popleft()
+
+        if len(self.gecmis) > self.en_fazla_gecmis:
+            self._gecmisi_kabalastir()
+            return IzDegisikligi(list(self.gecmis), True, self.parca_boyu, [nokta], False)
+        return IzDegisikligi(yeni, False, self.parca_boyu, [nokta], False)
+
+    def _gecmisi_kabalastir(self):
+        hedef = self.en_fazla_gecmis // 2
+        while len(self.gecmis) > hedef:
+            self.kabalastirma *= 2
+            self.gecmis = douglas_peucker(self.gecmis, self.tolerans_m(self.gecmis[-1][0]))
@@ -0,0 +1,378 @@
+"""Kopyasız, havuzlu kamera kare hattı.
+
+Eski yol her karede ``cv2.cvtColor`` ile yeni bir RGB dizisi ayırıyor, onu
+sahiplenmeyen bir ``QImage`` ile sarıp (dizi toplandığında geçersiz belleğe
+işaret eder) iş parçacıkları arasında gönderiyor ve GUI'de ``QPixmap.fromImage``
+ile bir kez daha dönüştürüyordu.
+
+Burada kareler önceden ayrılmış bir tampon havuzuna doğrudan okunur
+(``cap.read(dizi)``), her tampon için bir kez oluşturulan ``Format_BGR888``
+``QImage`` ile renk dönüşümü yapılmadan çizilir. Tamponun sahipliği ``Kare``
+nesnesiyle GUI'ye geçer; GUI kareyi bir sonrakiyle değiştirince havuza geri
+verir. Havuzda boş tampon yoksa (GUI geride kaldıysa) kare çözülmeden atlanır.
+
+Yakalama ile gösterim ``KareKutusu`` ile ayrılır: kutu tek kare tutar, yenisi
+gelince eskisi havuza döner. ``KareYayici`` GUI iş parçacığında, yakalama
+hızından bağımsız bir üst sınırla (ör. 30 fps) kutudaki en taze kareyi yayar;
+GUI meşgulken Qt olay kuyruğunda kare birikmez.
+
+``CameraThread`` bu hattı kameraya bağlayan, ana pencere ile kamera panelinin
+ortak kullandığı yakalama iş parçacığıdır.
+"""
+import threading
+import time
+
+import numpy as np
+from PyQt5.QtCore import QObject, QRectF, Qt, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QImage, QPen
+from PyQt5.QtWidgets import QGraphicsItem
+
+from telemetri.gecikme import KayanOrneklem
+
+
+class Kare:
+    """Havuzdaki bir tampon, üzerindeki ``QImage`` ve yakalama bilgisi."""
+
+    __slots__ = ("havuz", "dizi", "goruntu", "sira", "zaman")
+
+    def __init__(self, havuz, sekil):
+        self.havuz = havuz
+        self.dizi = np.empty(sekil, np.uint8)
+        yukseklik, genislik, kanal = sekil
+        # QImage belleği sahiplenmez; dizi bu nesne yaşadıkça yaşar
+        self.goruntu = QImage(self.dizi.data, genislik, yukseklik, genislik * kanal, QImage.Format_BGR888)
+        self.sira = 0
+        self.zaman = 0.0
+
+    def birak(self):
+        """Kareyi havuza geri verir; gösterim bittiğinde GUI çağırır."""
+        self.havuz.geri_al(self)
+
+
+class KareHavuzu:
+    """Sabit sayıda önceden ayrılmış kare tamponu."""
+
+    @classmethod
+    def kamera_icin(cls, cap, boyut=4):
+        """Kameranın bildirdiği çözünürlükte havuz kurar."""
+        genislik, yukseklik = int(cap.get(3)), int(cap.get(4))
+        if genislik > 0 and yukseklik > 0:
+            return cls(boyut, (yukseklik, genislik, 3))
+        return cls(boyut)
+
+    def __init__(self, boyut=4, sekil=(480, 640, 3)):
+        self.boyut = boyut
+        self.sekil = tuple(sekil)
+        self.yakalanan = 0
+        self.dusurulen = 0
+        self._kilit = threading.Lock()
+        self._bos = [Kare(self, self.sekil) for _ in range(boyut)]
+
+    def al(self):
+        with self._kilit:
+            return self._bos.pop() if self._bos else None
+
+    def geri_al(self, kare):
+        with self._kilit:
+            # Boyut değiştiyse eski şekildeki tampon havuza dönmez
+            if kare.dizi.shape == self.sekil:
+                self._bos.append(kare)
+
+    def yeniden_boyutla(self, sekil):
+        """Kamera farklı boyutta kare verirse havuzu yeni şekle göre kurar."""
+        with self._kilit:
+            self.sekil = tuple(sekil)
+            self._bos = [Kare(self, self.sekil) for _ in range(self.boyut)]
+
+    @property
+    def bos(self):
+        return len(self._bos)
+
+    def istatistik(self):
+        return {"yakalanan": self.yakalanan, "dusurulen": self.dusurulen, "bos_tampon": self.bos}
+
+
+def kare_oku(cap, havuz):
+    """``cap``'ten havuzdaki bir tampona kare okur; okunamazsa None.
+
+    Boş tampon yoksa kamera kuyruğu ``grab`` ile boşaltılır ve kare atlanır.
+    """
+    kare = havuz.al()
+    if kare is None:
+        if cap.grab():
+            havuz.dusurulen += 1
+        return None
+    ret, dizi = cap.read(kare.dizi)
+    if not ret:
+        havuz.geri_al(kare)
+        return None
+    if dizi is not kare.dizi:
+        if dizi.shape != kare.dizi.shape:
+            # Kamera havuzdan farklı boyut verdi; havuz yeni boyuta kurulur, bu kare bir kez kopyalanır
+            havuz.yeniden_boyutla(dizi.shape)
+            kare = havuz.al()
+        np.copyto(kare.dizi, dizi)
+    havuz.yakalanan += 1
+    kare.sira = havuz.yakalanan
+    kare.zaman = time.monotonic()
+    return kare
+
+
+class KareKutusu:
+    """Yakalama ile gösterim arasında yalnızca en taze kareyi tutan kutu."""
+
+    def __init__(self):
+        self._kilit = threading.Lock()
+        self._kare = None
+        self.konulan = 0
+        self.dusurulen = 0
+
+    def koy(self, kare):
+        with self._kilit:
+            onceki, self._kare = self._kare, kare
+            self.konulan += 1
+        if onceki is not None:
+            # Gösterilmeden eskiyen kare havuza döner
+            self.dusurulen += 1
+            onceki.birak()
+
+    def al(self):
+        with self._kilit:
+            kare, self._kare = self._kare, None
+        return kare
+
+    def bosalt(self):
+        kare = self.al()
+        if kare is not None:
+            self.dusurulen += 1
+            kare.birak()
+
+
+class KareYayici(QObject):
+    """Kutudaki kareyi ``hedef.frame_ready`` ile en fazla ``en_fazla_fps`` hızında yayar.
+
+    Yakalanan, gösterilen ve düşürülen kare sayıları ile yakalamadan gösterime
+    geçen süre (``kare.zaman``'dan itibaren) izlenir.
+    """
+
+    def __init__(self, hedef, havuz, kutu, en_fazla_fps=30, parent=None):
+        super().__init__(parent)
+        self.hedef = hedef
+        self.havuz = havuz
+        self.kutu = kutu
+        self.gosterilen = 0
+        self.son_gecikme = 0.0
+        self.gecikme = KayanOrneklem(256)
+        self._zamanlayici = QTimer(self)
+        self._zamanlayici.setTimerType(Qt.PreciseTimer)
+        self._zamanlayici.timeout.connect(self._tik)
+        self.fps_ayarla(en_fazla_fps)
+
+    def fps_ayarla(self, en_fazla_fps):
+        self.en_fazla_fps = en_fazla_fps
+        self._zamanlayici.setInterval(max(1, round(1000 / en_fazla_fps)))
+
+    def baslat(self):
+        self._zamanlayici.start()
+
+    def durdur(self):
+        self._zamanlayici.stop()
+        self.kutu.bosalt()
+
+    def _tik(self):
+        kare = self.kutu.al()
+        if kare is None:
+            return
+        self.son_gecikme = time.monotonic() - kare.zaman
+        self.gecikme.ekle(self.son_gecikme)
+        self.gosterilen += 1
+        self.hedef.frame_ready.emit(kare)
+
+    def istatistik(self):
+        yuzdelik = self.gecikme.yuzdelikler()
+        return {
+            "yakalanan": self.havuz.yakalanan,
+            "gosterilen": self.gosterilen,
+            "dusurulen": self.kutu.dusurulen + self.havuz.dusurulen,
+            "son_gecikme_ms": round(1000 * self.son_gecikme, 1),
+            "gecikme_p50_ms": round(1000 * yuzdelik["p50"], 1),
+            "gecikme_p99_ms": round(1000 * yuzdelik["p99"], 1),
+        }
+
+
+class CameraThread(QThread):
+    """Kameradan havuza kare okur; kareler ``KareKutusu`` ve ``KareYayici`` ile GUI'ye geçer.
+
+    Kaydedici (``kayit_baslat``), zaman hizalayıcı (``hizalayici``) ve hedef
+    tespiti (``tespit_baslat``) her kareyi yakalama iş parçacığında alır.
+    cv2, video_kaydedici ve hedef_tespiti kullanıldıkları yerde içe aktarılır.
+    """
+
+    # kamera_hatti.Kare; alıcı kareyi gösterdikten sonra havuza geri verir
+    frame_ready = pyqtSignal(object)
+    # hedef_tespiti.Tespit; işçi süreçlerden gelen sonuçlar
+    tespit_ready = pyqtSignal(object)
+
+    def __init__(self, camera_index=0, ekran_fps=30, cap=None, genislik=400, yukseklik=300):
+        """``cap`` verilirse (ör. ``kamera_ac`` ile arka planda açılmış) kamera yeniden açılmaz."""
+        super().__init__()
+        self.camera_index = camera_index
+        self.running = True
+        self.cap = cap if cap is not None else self.kamera_ac(camera_index, genislik, yukseklik)
+        self.havuz = KareHavuzu.kamera_icin(self.cap)
+        # Yakalama kendi hızında kutuya yazar; GUI en taze kareyi ekran_fps ile alır
+        self.kutu = KareKutusu()
+        self.yayici = KareYayici(self, self.havuz, self.kutu, ekran_fps)
+        self.kaydedici = None
+        # telemetri.zaman_hizalama.ZamanHizalayici verilirse her kare yakalama anıyla indekslenir
+        self.hizalayici = None
+        self.tespit = None
+
+    @staticmethod
+    def kamera_ac(camera_index=0, genislik=400, yukseklik=300):
+        """Kamerayı açar; sürücüye göre saniyeler sürebilir, GUI dışında çağrılabilir."""
+        import cv2
+        cap = cv2.VideoCapture(camera_index)
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, genislik)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, yukseklik)
+        return cap
+
+    def start(self):
+        self.yayici.baslat()
+        super().start()
+
+    def run(self):
+        while self.running:
+            kare = kare_oku(self.cap, self.havuz)
+            if kare is not None:
+                # Kutuya konan kare gösterilip havuza dönebilir; kaydedici önce kopyalar
+                kaydedici = self.kaydedici
+                if kaydedici is not None:
+                    kaydedici.kaydet(kare)
+                if self.hizalayici is not None:
+                    self.hizalayici.kare_ekle(kare)
+                tespit = self.tespit
+                if tespit is not None:
+                    tespit.gonder(kare.dizi, kare.sira, kare.zaman)
+                self.kutu.koy(kare)
+            elif not self.cap.isOpened():
+                break
+            else:
+                self.msleep(5)
+
+    def stop(self):
+        self.running = False
+        self.quit()
+        self.wait()
+        self.yayici.durdur()
+        self.kayit_durdur()
+        self.tespit_durdur()
+        if self.cap.isOpened():
+            self.cap.release()
+
+    def kayit_baslat(self, **ayarlar):
+        """Görüntüyü ``VideoKaydedici`` ile arka planda diske yazmaya başlar."""
+        if self.kaydedici is None:
+            import cv2
+            from video_kaydedici import VideoKaydedici
+            ayarlar.setdefault("fps", self.cap.get(cv2.CAP_PROP_FPS) or 30.0)
+            self.kaydedici = VideoKaydedici(**ayarlar).baslat()
+        return self.kaydedici
+
+    def kayit_durdur(self):
+        kaydedici, self.kaydedici = self.kaydedici, None
+        if kaydedici is not None:
+            kaydedici.durdur()
+
+    def tespit_baslat(self, isci=2, dedektor=None):
+        """Kareleri ``isci`` süreçli ``TespitHavuzu``'na verir; sonuçlar ``tespit_ready`` ile gelir."""
+        if self.tespit is None:
+            from hedef_tespiti import TespitHavuzu
+            self.tespit = TespitHavuzu(self.havuz.sekil, isci, dedektor, self.tespit_ready.emit).baslat()
+        return self.tespit
+
+    def tespit_durdur(self):
+        tespit, self.tespit = self.tespit, None
+        if tespit is not None:
+            tespit.durdur()
+
+
+class KameraOgesi(QGraphicsItem):
+    """Kareyi ``QPixmap``'e dönüştürmeden doğrudan çizen sahne öğesi."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.kare = None
+        self._dikdortgen = QRectF()
+        self.gosterilen = 0
+
+    def kare_goster(self, kare):
+        """Yeni kareyi gösterir, öncekini havuza geri verir."""
+        onceki, self.kare = self.kare, kare
+        if onceki is not None and onceki is not kare:
+            onceki.birak()
+        dikdortgen = QRectF(0, 0, kare.goruntu.width(), kare.goruntu.height())
+        if dikdortgen != self._dikdortgen:
+            self.prepareGeometryChange()
+            self._dikdortgen = dikdortgen
+        self.gosterilen += 1
+        self.update()
+
+    def boundingRect(self):
+        return self._dikdortgen
+
+    def paint(self, painter, option, widget=None):
+        if self.kare is not None:
+            painter.drawImage(0, 0, self.kare.goruntu)
+
+
+class TespitOgesi(QGraphicsItem):
+    """Tespit kutularını, vuruş alanını ve kilit süresini görüntünün üzerine çizer.
+
+    ``KameraOgesi``'nin çocuğu olarak eklenir; koordinatlar kare pikselidir.
+    Birden çok işçiden sırası karışık gelen eski sonuçlar yok sayılır.
+    """
+
+    def __init__(self, parent=None, sayac=None):
+        super().__init__(parent)
+        if sayac is None:
+            # hedef_tespiti cv2'yi yalnızca dedektörde yükler; sayaç saf Python'dur
+            from hedef_tespiti import KilitSayaci
+            sayac = KilitSayaci()
+        self.sayac = sayac
+        self.tespit = None
+        self.hedef = None
+        self._dikdortgen = QRectF()
+
+    def tespit_goster(self, tespit):
+        if self.tespit is not None and tespit.sira < self.tespit.sira:
+            return
+        dikdortgen = self.parentItem().boundingRect()
+        if dikdortgen.isEmpty():
+            return
+        if dikdortgen != self._dikdortgen:
+            self.prepareGeometryChange()
+            self._dikdortgen = QRectF(dikdortgen)
+        self.hedef = self.sayac.guncelle(tespit, dikdortgen.width(), dikdortgen.height())
+        self.tespit = tespit
+        self.update()
+
+    def boundingRect(self):
+        return self._dikdortgen
+
+    def paint(self, painter, option, widget=None):
+        if self.tespit is None:
+            return
+        kilitli = self.sayac.kilitli
+        sol, ust, sag, alt = self.sayac.alan_piksel(self._dikdortgen.width(), self._dikdortgen.height())
+        painter.setPen(QPen(QColor(255, 60, 60) if kilitli else QColor(255, 220, 0), 2, Qt.DashLine))
+        painter.drawRect(QRectF(sol, ust, sag - sol, alt - ust))
+        for kutu in self.tespit.kutular:
+            renk = QColor(255, 60, 60) if kutu is self.hedef else QColor(0, 255, 120)
+            painter.setPen(QPen(renk, 2))
+            painter.drawRect(QRectF(*kutu[:4]))
+        if kilitli:
+            painter.setFont(QFont("Monospace", 12, QFont.Bold))
+            painter.setPen(QColor(255, 60, 60))
+            painter.drawText(QRectF(sol, ust - 22, sag - sol, 20), Qt.AlignLeft,
+                             f"KİLİT {self.sayac.sure:.1f}/{self.sayac.gerekli_s:.0f} s")
@@ -0,0 +1,322 @@
+"""Çevrimdışı harita karo önbelleği.
+
+Karolar MBTiles biçimindeki bir SQLite dosyasında tutulur ve küçük bir yerel
+HTTP sunucusundan harita sayfasına verilir. Önbellekte olmayan karo, ağ varsa
+kaynaktan indirilip kaydedilir; ağ yoksa önceden tohumlanmış dosya yeterlidir.
+Dosya boyutu sınırı aşıldığında en uzun süredir kullanılmayan karolar silinir.
+
+Komut satırı:
+    python karo_onbellegi.py tohumla --kuzey 39.95 --guney 39.90 --bati 32.80 --dogu 32.90 --zoom 14 18
+    python karo_onbellegi.py sun --port 8765 --cevrimdisi
+    python karo_onbellegi.py istatistik
+"""
+import argparse
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+OSM_URL = "https://tile.openstreetmap.org/{z}/{x}/{y}.png"
+OSM_ATTR = "&copy; <a href=\"https://www.openstreetmap.org/copyright\">OpenStreetMap</a> contributors"
+KULLANICI_AJANI = "GaziUzay-YerIstasyonu/1.0"
+# Çalışma dizininden bağımsız: modülün yanında
+VARSAYILAN_DOSYA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "karolar.mbtiles")
+
+
+def karo_numarasi(latitude, longitude, zoom):
+    """Enlem/boylamı içeren XYZ karo numarasını döndürür."""
+    lat_rad = math.radians(max(min(latitude, 85.0511), -85.0511))
+    n = 2 ** zoom
+    x = int((longitude + 180.0) / 360.0 * n)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+class KaroOnbellegi:
+    """MBTiles dosyası üzerinde boyut sınırlı (LRU) karo önbelleği."""
+
+    def __init__(self, dosya=VARSAYILAN_DOSYA, en_fazla_bayt=512 * 1024 * 1024):
+        self.dosya = dosya
+        self.en_fazla_bayt = en_fazla_bayt
+        self.isabet = 0
+        self.iskalama = 0
+        self.indirilen = 0
+        self.tahliye = 0
+        self._kilit = threading.Lock()
+        self._bekleyen_erisim = {}
+        self._baglanti = sqlite3.connect(dosya, check_same_thread=False)
+        self._baglanti.execute("PRAGMA journal_mode=WAL")
+        self._baglanti.execute("PRAGMA synchronous=NORMAL")
+        self._baglanti.executescript("""
+            CREATE TABLE IF NOT EXISTS metadata (name TEXT, value TEXT);
+            CREATE TABLE IF NOT EXISTS tiles (
+                zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB);
+            CREATE UNIQUE INDEX IF NOT EXISTS tile_index ON tiles (zoom_level, tile_column, tile_row);
+            CREATE TABLE IF NOT EXISTS karo_erisim (
+                zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER,
+                son_erisim REAL, boyut INTEGER,
+                PRIMARY KEY (zoom_level, tile_column, tile_row));
+            CREATE INDEX IF NOT EXISTS karo_erisim_zaman ON karo_erisim (son_erisim);
+        """)
+        if not self._baglanti.execute("SELECT 1 FROM metadata LIMIT 1").fetchone():
+            self._baglanti.executemany("INSERT INTO metadata VALUES (?, ?)", [
+                ("name", "Gazi Uzay karo önbelleği"), ("format", "png"), ("type", "baselayer"),
+                ("version", "1.1"), ("attribution", OSM_ATTR),
+            ])
+        self._baglanti.commit()
+        self.toplam_bayt = self._baglanti.execute(
+            "SELECT COALESCE(SUM(boyut), 0) FROM karo_erisim").fetchone()[0]
+
+    @staticmethod
+    def _anahtar(z, x, y):
+        # MBTiles satırları TMS düzenindedir (y ekseni ters)
+        return z, x, (2 ** z - 1) - y
+
+    def al(self, z, x, y):
+        """Karo verisini döndürür; önbellekte yoksa None."""
+        anahtar = self._anahtar(z, x, y)
+        with self._kilit:
+            satir = self._baglanti.execute(
+                "SELECT tile_data FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                anahtar).fetchone()
+            if satir is None:
+                self.iskalama += 1
+                return None
+            self.isabet += 1
+            # Erişim zamanları her istekte diske yazılmaz, toplu güncellenir
+            self._bekleyen_erisim[anahtar] = time.time()
+            if len(self._bekleyen_erisim) >= 64:
+                self._erisimleri_yaz()
+                self._baglanti.commit()
+            return satir[0]
+
+    def var_mi(self, z, x, y):
+        with self._kilit:
+            return self._baglanti.execute(
+                "SELECT 1 FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                self._anahtar(z, x, y)).fetchone() is not None
+
+    def koy(self, z, x, y, veri, indirildi=False):
+        """Karoyu kaydeder, gerekirse eski karoları siler; ``indirildi`` ise indirme sayacını artırır."""
+        anahtar = self._anahtar(z, x, y)
+        with self._kilit:
+            if indirildi:
+                self.indirilen += 1
+            eski = self._baglanti.execute(
+                "SELECT boyut FROM karo_erisim WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+                anahtar).fetchone()
+            self._baglanti.execute("INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?)", anahtar + (veri,))
+            self._baglanti.execute("INSERT OR REPLACE INTO karo_erisim VALUES (?, ?, ?, ?, ?)",
+                                   anahtar + (time.time(), len(veri)))
+            self.toplam_bayt += len(veri) - (eski[0] if eski else 0)
+            if self.toplam_bayt > self.en_fazla_bayt:
+                self._tahliye_et()
+            self._baglanti.commit()
+
+    def _erisimleri_yaz(self):
+        self._baglanti.executemany(
+            "UPDATE karo_erisim SET son_erisim=? WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+            [(zaman,) + anahtar for anahtar, zaman in self._bekleyen_erisim.items()])
+        self._bekleyen_erisim.clear()
+
+    def _tahliye_et(self):
+        """Boyut sınırın %90'ına inene kadar en eski erişilen karoları siler."""
+        self._erisimleri_yaz()
+        hedef = int(self.en_fazla_bayt * 0.9)
+        while self.toplam_bayt > hedef:
+            eskiler = self._baglanti.execute(
+                "SELECT zoom_level, tile_column, tile_row, boyut FROM karo_erisim "
+                "ORDER BY son_erisim LIMIT 256").fetchall()
+            if not eskiler:
+                break
+            for z, x, satir, boyut in eskiler:
+                self._baglanti.execute(
+                    "DELETE FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?", (z, x, satir))
+                self._baglanti.execute(
+                    "DELETE FROM karo_erisim WHERE zoom_level=? AND tile_column=? AND tile_row=?", (z, x, satir))
+                self.toplam_bayt -= boyut
+                self.tahliye += 1
+                if self.toplam_bayt <= hedef:
+                    break
+
+    def istatistik(self):
+        with self._kilit:
+            karo_sayisi = self._baglanti.execute("SELECT COUNT(*) FROM karo_erisim").fetchone()[0]
+        return {
+            "isabet": self.isabet,
+            "iskalama": self.iskalama,
+            "indirilen": self.indirilen,
+            "tahliye": self.tahliye,
+            "karo_sayisi": karo_sayisi,
+            "toplam_bayt": self.toplam_bayt,
+        }
+
+    def kapat(self):
+        with self._kilit:
+            self._erisimleri_yaz()
+            self._baglanti.commit()
+            self._baglanti.close()
+
+
+def karo_indir(kaynak_url, z, x, y, zaman_asimi=5):
+    istek = urllib.request.Request(kaynak_url.format(z=z, x=x, y=y),
+                                   headers={"User-Agent": KULLANICI_AJANI})
+    with urllib.request.urlopen(istek, timeout=zaman_asimi) as yanit:
+        return yanit.read()
+
+
+class KaroSunucusu:
+    """Önbellekten karo veren yerel HTTP sunucusu.
+
+    Adres: ``http://127.0.0.1:<port>/karo/{z}/{x}/{y}.png``; sayaçlar
+    ``/istatistik`` adresinden JSON olarak okunabilir.
+    """
+
+    def __init__(self, onbellek, port=0, kaynak_url=OSM_URL, cevrimici=True):
+        self.onbellek = onbellek
+        self.kaynak_url = kaynak_url
+        self.cevrimici = cevrimici
+        self._sunucu = ThreadingHTTPServer(("127.0.0.1", port), self._istek_sinifi())
+        self._sunucu.daemon_threads = True
+        self.port = self._sunucu.server_address[1]
+        self._thread = None
+
+    @property
+    def url_sablonu(self):
+        return f"http://127.0.0.1:{self.port}/karo/{{z}}/{{x}}/{{y}}.png"
+
+    def _istek_sinifi(self):
+        sunucu = self
+
+        class KaroIstegi(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parcalar = self.path.split("?")[0].strip("/").split("/")
+                if parcalar == ["istatistik"]:
+                    self._yanitla(200, json.dumps(sunucu.onbellek.istatistik()).encode(), "application/json")
+                    return
+                try:
+                    _, z, x, y = parcalar
+                    z, x, y = int(z), int(x), int(y.split(".")[0])
+                except ValueError:
+                    self._yanitla(404, b"", "text/plain")
+                    return
+                veri = sunucu.karo_getir(z, x, y)
+                if veri is None:
+                    self._yanitla(404, b"", "text/plain")
+                else:
+                    self._yanitla(200, veri, "image/png")
+
+            def _yanitla(self, kod, veri, tur):
+                self.send_response(kod)
+                self.send_header("Content-Type", tur)
+                self.send_header("Content-Length", str(len(veri)))
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                self.wfile.write(veri)
+
+            def log_message(self, format, *args):
+                pass
+
+        return KaroIstegi
+
+    def karo_getir(self, z, x, y):
+        veri = self.onbellek.al(z, x, y)
+        if veri is not None or not self.cevrimici:
+            return veri
+        try:
+            veri = karo_indir(self.kaynak_url, z, x, y)
+        except OSError as e:
+            print(f"Karo indirilemedi ({z}/{x}/{y}): {e}")
+            return None
+        self.onbellek.koy(z, x, y, veri, indirildi=True)
+        return veri
+
+    def baslat(self):
+        self._thread = threading.Thread(target=self._sunucu.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def durdur(self):
+        self._sunucu.shutdown()
+        self._sunucu.server_close()
+
+
+_paylasilan_sunucu = None
+
+
+def paylasilan_sunucu(dosya=VARSAYILAN_DOSYA):
+    """Süreç içindeki tüm harita pencerelerinin kullandığı tek sunucuyu döndürür."""
+    global _paylasilan_sunucu
+    if _paylasilan_sunucu is None:
+        _paylasilan_sunucu = KaroSunucusu(KaroOnbellegi(dosya)).baslat()
+    return _paylasilan_sunucu
+
+
+def tohumla(onbellek, kuzey, guney, bati, dogu, zoom_min, zoom_max,
+            kaynak_url=OSM_URL, bekleme=0.05):
+    """Sınır kutusundaki karoları verilen zoom aralığı için önceden indirir."""
+    indirilen = atlanan = hatali = 0
+    for z in range(zoom_min, zoom_max + 1):
+        x0, y0 = karo_numarasi(kuzey, bati, z)
+        x1, y1 = karo_numarasi(guney, dogu, z)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                if onbellek.var_mi(z, x, y):
+                    atlanan += 1
+                    continue
+                try:
+                    onbellek.koy(z, x, y, karo_indir(kaynak_url, z, x, y))
+                    indirilen += 1
+                except OSError as e:
+                    print(f"Karo indirilemedi ({z}/{x}/{y}): {e}")
+                    hatali += 1
+                time.sleep(bekleme)  # Karo sunucusunu yormamak için
+        print(f"Zoom {z} tamamlandı: indirilen={indirilen}, atlanan={atlanan}, hatalı={hatali}")
+    return indirilen, atlanan, hatali
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Çevrimdışı harita karo önbelleği")
+    parser.add_argument("--dosya", default=VARSAYILAN_DOSYA)
+    parser.add_argument("--en-fazla-mb", type=int, default=512)
+    alt = parser.add_subparsers(dest="komut", required=True)
+
+    t = alt.add_parser("tohumla", help="sınır kutusundaki karoları indir")
+    t.add_argument("--kuzey", type=float, required=True)
+    t.add_argument("--guney", type=float, required=True)
+    t.add_argument("--bati", type=float, required=True)
+    t.add_argument("--dogu", type=float, required=True)
+    t.add_argument("--zoom", type=int, nargs=2, metavar=("MIN", "MAX"), default=(14, 18))
+    t.add_argument("--kaynak", default=OSM_URL)
+
+    s = alt.add_parser("sun", help="yerel karo sunucusunu çalıştır")
+    s.add_argument("--port", type=int, default=8765)
+    s.add_argument("--cevrimdisi", action="store_true", help="önbellekte olmayan karoyu indirme")
+
+    alt.add_parser("istatistik", help="önbellek sayaçlarını yazdır")
+
+    args = parser.parse_args()
+    onbellek = KaroOnbellegi(args.dosya, args.en_fazla_mb * 1024 * 1024)
+    try:
+        if args.komut == "tohumla":
+            tohumla(onbellek, args.kuzey, args.guney, args.bati, args.dogu,
+                    args.zoom[0], args.zoom[1], args.kaynak)
+        elif args.komut == "sun":
+            sunucu = KaroSunucusu(onbellek, args.port, cevrimici=not args.cevrimdisi).baslat()
+            print(f"Karo sunucusu: {sunucu.url_sablonu}")
+            try:
+                while True:
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                sunucu.durdur()
+        print(json.dumps(onbellek.istatistik(), ensure_ascii=False))
+    finally:
+        onbellek.kapat()
+
+
+if __name__ == "__main__":
+    main()
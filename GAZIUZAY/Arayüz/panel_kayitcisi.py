@@ -0,0 +1,197 @@
+"""Panelleri ilk açıldıklarında kuran kayıt ve açılış süresi ölçümü.
+
+Arayüz betikleri ``QtWebEngineWidgets``, ``folium``, ``cv2`` ve ``pymavlink``'i
+en üstte içe aktarıyor, pencere görünmeden bütün panelleri kurup kamerayı
+açıyordu. ``PanelKayitcisi``'ne panel adı, fabrikası ve gerektirdiği modüller
+kaydedilir; modüller içe aktarılıp widget yalnızca ``ac`` ilk çağrıldığında
+kurulur. Kritik olmayan işler (kamera açma, harita sayfası) ``arka_planda`` ile
+pencere gösterildikten sonraya ya da bir iş parçacığına bırakılır.
+
+Her panel için içe aktarma ve kurulum süresi, her arka plan işi için süre ve
+bitiş anı ölçülür; ``rapor`` bunları açılışın başından itibaren verir. Bir
+modülün içe aktarma maliyeti onu ilk isteyen panele yazılır.
+
+QtWebEngine, QApplication'dan sonra içe aktarılacaksa uygulama kurulmadan önce
+``Qt.AA_ShareOpenGLContexts`` ayarlanmalıdır (``webengine_hazirla``).
+"""
+import importlib
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+from PyQt5.QtCore import QCoreApplication, QObject, Qt, QTimer, pyqtSignal
+
+MODUL_DIZINI = os.path.dirname(os.path.abspath(__file__))
+# Açılış zaman çizelgesinin sıfırı; betikler bu modülü erken içe aktarmalıdır
+BASLANGIC = time.perf_counter()
+
+
+def webengine_hazirla():
+    """QtWebEngine'in sonradan içe aktarılabilmesi için QApplication'dan önce çağrılır."""
+    QCoreApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+
+
+def modul_yukle(ad, dizin=MODUL_DIZINI):
+    """Modülü içe aktarır; ``.py`` ile bitiyorsa ``dizin``'deki betik dosyasıdır.
+
+    Adında boşluk olan betikler ``sys.modules``'e boşlukları ``_`` ile
+    değiştirilmiş adla kaydedilir; ikinci istekte yeniden çalıştırılmaz.
+    """
+    if not ad.endswith(".py"):
+        return importlib.import_module(ad)
+    modul_adi = ad[:-3].replace(" ", "_")
+    modul = sys.modules.get(modul_adi)
+    if modul is None:
+        spec = importlib.util.spec_from_file_location(modul_adi, os.path.join(dizin, ad))
+        modul = importlib.util.module_from_spec(spec)
+        sys.modules[modul_adi] = modul
+        try:
+            spec.loader.exec_module(modul)
+        except BaseException:
+            del sys.modules[modul_adi]
+            raise
+    return modul
+
+
+class PanelTanimi:
+    """Kayıtlı bir panel: fabrika, önce içe aktarılacak modüller ve başlık.
+
+    ``fabrika`` bir çağrılabilir ya da ``"modül:Sınıf"`` metnidir
+    (ör. ``"Görüntü kamerası.py:MainApp"``).
+    """
+
+    def __init__(self, ad, fabrika, moduller=(), baslik=None):
+        self.ad = ad
+        self.fabrika = fabrika
+        self.moduller = tuple(moduller)
+        self.baslik = baslik or ad
+
+
+class PanelKayitcisi(QObject):
+    """Adla kayıtlı panelleri ilk istekte kurar; açılış ölçümlerini tutar."""
+
+    # (ad, widget): panel ilk kez kurulduğunda
+    acildi = pyqtSignal(str, object)
+    # Bekleyen arka plan işi kalmadığında
+    isler_bitti = pyqtSignal()
+    # İş parçacığındaki iş bitince sonucu GUI iş parçacığına taşır
+    _bitti = pyqtSignal(object, object)
+
+    def __init__(self, parent=None, baslangic=BASLANGIC):
+        super().__init__(parent)
+        self.baslangic = baslangic
+        self._tanimlar = {}
+        self._paneller = {}
+        self.olcumler = {}
+        self.isler = {}
+        self.isaretler = {}
+        self.bekleyen = 0
+        self._bitti.connect(self._is_bitti, Qt.QueuedConnection)
+
+    def _an(self):
+        return round(1000 * (time.perf_counter() - self.baslangic), 1)
+
+    # ---------------------- Kayıt ----------------------
+    def kaydet(self, ad, fabrika, moduller=(), baslik=None):
+        self._tanimlar[ad] = PanelTanimi(ad, fabrika, moduller, baslik)
+        return self._tanimlar[ad]
+
+    def tanim(self, ad):
+        return self._tanimlar[ad]
+
+    def kayitli(self):
+        return list(self._tanimlar)
+
+    def acik_mi(self, ad):
+        return ad in self._paneller
+
+    # ---------------------- Açma ----------------------
+    def ac(self, ad):
+        """Paneli döndürür; ilk çağrıda modülleri içe aktarıp kurar."""
+        panel = self._paneller.get(ad)
+        if panel is not None:
+            return panel
+        tanim = self._tanimlar[ad]
+        baslangic = time.perf_counter()
+        for modul in tanim.moduller:
+            modul_yukle(modul)
+        fabrika = tanim.fabrika
+        if isinstance(fabrika, str):
+            modul, _, nesne = fabrika.rpartition(":")
+            fabrika = getattr(modul_yukle(modul), nesne)
+        kurulum = time.perf_counter()
+        panel = fabrika()
+        bitis = time.perf_counter()
+        self._paneller[ad] = panel
+        if ad in self.olcumler:
+            # İlk açılışın ölçümü korunur; kapatılıp yeniden açılışlar sayılır
+            self.olcumler[ad]["acilma"] += 1
+        else:
+            self.olcumler[ad] = {
+                "ice_aktarma_ms": round(1000 * (kurulum - baslangic), 1),
+                "kurulum_ms": round(1000 * (bitis - kurulum), 1),
+                "acilis_ms": self._an(),
+                "acilma": 1,
+            }
+        self.acildi.emit(ad, panel)
+        return panel
+
+    def birak(self, ad):
+        """Kapatılan paneli unutur; sonraki ``ac`` yeniden kurar."""
+        self._paneller.pop(ad, None)
+
+    # ---------------------- Arka plan ----------------------
+    def arka_planda(self, ad, is_, sonra=None, is_parcacigi=False):
+        """``is_``'i olay döngüsü başladıktan sonra çalıştırır.
+
+        ``is_parcacigi`` doğruysa ``is_`` ayrı bir iş parçacığında çalışır ve
+        Qt nesnelerine dokunmamalıdır; ``sonra(sonuc)`` her durumda GUI iş
+        parçacığında çağrılır.
+        """
+        self.bekleyen += 1
+        self.isler[ad] = {"is_parcacigi": is_parcacigi, "baslangic_ms": None}
+
+        def calistir():
+            self.isler[ad]["baslangic_ms"] = self._an()
+            baslangic = time.perf_counter()
+            try:
+                sonuc = is_()
+            except Exception as e:
+                print(f"Arka plan işi başarısız ({ad}): {e}")
+                self.isler[ad]["hata"] = str(e)
+                sonuc = e
+            self.isler[ad]["sure_ms"] = round(1000 * (time.perf_counter() - baslangic), 1)
+            return sonuc
+
+        if is_parcacigi:
+            threading.Thread(target=lambda: self._bitti.emit((ad, sonra), calistir()),
+                             name=f"arka plan: {ad}", daemon=True).start()
+        else:
+            QTimer.singleShot(0, lambda: self._is_bitti((ad, sonra), calistir()))
+
+    def _is_bitti(self, is_bilgisi, sonuc):
+        ad, sonra = is_bilgisi
+        if sonra is not None and not isinstance(sonuc, Exception):
+            sonra(sonuc)
+        self.isler[ad]["bitis_ms"] = self._an()
+        self.bekleyen -= 1
+        if self.bekleyen == 0:
+            self.isler_bitti.emit()
+
+    # ---------------------- Rapor ----------------------
+    def isaretle(self, ad):
+        """Zaman çizelgesine bir an ekler (ör. "pencere gösterildi")."""
+        self.isaretler[ad] = self._an()
+
+    def rapor(self):
+        """Panel, arka plan işi ve işaret başına ölçümler (ms), okunabilir metin olarak."""
+        satirlar = [f"modül sayısı: {len(sys.modules)} ({self._an()} ms)"]
+        for ad, olcum in self.olcumler.items():
+            satirlar.append(f"panel {ad}: " + ", ".join(f"{k}={v}" for k, v in olcum.items()))
+        for ad, olcum in self.isler.items():
+            satirlar.append(f"arka plan {ad}: " + ", ".join(f"{k}={v}" for k, v in olcum.items()))
+        for ad, an in sorted(self.isaretler.items(), key=lambda oge: oge[1]):
+            satirlar.append(f"işaret {ad}: {an} ms")
+        return "\n".join(satirlar)
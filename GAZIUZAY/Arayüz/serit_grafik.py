@@ -0,0 +1,526 @@
+"""İrtifa, dikey hız, yer hızı, pitch ve roll için kayan şerit grafik.
+
+Saatlerce veri her çizimde baştan taranamaz. Her kanal bir ``ZarfPiramidi``'nde
+tutulur: ham örneklerin üstünde, her seviyesi bir alttakinin ``DAL`` bloğunun
+en küçük ve en büyük değerini tutan seviyeler. Piramit yeni örneklerle yalnızca
+sondan güncellenir. Ekrandaki her piksel sütununun (min, max) zarfı, sütun
+başına birkaç düzine blok düşen seviyeden okunur ve sütun kenarları alt
+seviyelerden tamamlanır. Sonuç ham örneklerin tam min/max'ıdır; maliyet toplam
+örnek sayısına değil, pencere genişliğine bağlıdır.
+
+``SeritGrafik`` çizimi bir tuvalde saklar. Canlı kiple yeni örnek gelince
+tuval kaydırılır ve yalnızca sağda açılan sütunlar çizilir. Tekerlek
+yakınlaştırır, sürükleme kaydırır (canlı kipten çıkar), çift tık canlı kipe
+döner; bu durumlarda görünür sütunlar piramitten yeniden çizilir.
+
+Grafik ``telemetri.KayitDinleyici``'dir: ``Cozucu``'ya eklenir ve kayıtları
+okuma iş parçacığından bir kuyruğa koyar; kuyruk GUI zamanlayıcısında boşaltılır.
+``PixhawkThread`` sinyallerine bağlanmak için aynı adlı yuvalar da vardır.
+"""
+import math
+import time
+from collections import deque
+
+import numpy as np
+from PyQt5.QtCore import QPointF, QRect, QSize, Qt, QTimer
+from PyQt5.QtGui import QColor, QPainter, QPen, QPixmap, QPolygonF
+from PyQt5.QtWidgets import QMainWindow, QWidget
+
+from telemetri import Cozucu, KayitDinleyici, TelemetriMerkezi
+
+# Bir üst seviye bloğunun özetlediği alt seviye bloğu sayısı
+DAL = 4
+# Zarfta en üst seviyeden sütun başına hedeflenen blok sayısı
+SUTUN_BLOK = 64
+
+# (kanal, başlık, birim, varsayılan aralık, renk)
+SERITLER = (
+    ("irtifa", "İrtifa", "m", (0.0, 100.0), "#1f77b4"),
+    ("dikey_hiz", "Dikey hız", "m/s", (-5.0, 5.0), "#2ca02c"),
+    ("yer_hizi", "Yer hızı", "m/s", (0.0, 30.0), "#ff7f0e"),
+    ("pitch", "Pitch", "°", (-30.0, 30.0), "#d62728"),
+    ("roll", "Roll", "°", (-60.0, 60.0), "#9467bd"),
+)
+
+
+class ZarfPiramidi:
+    """Zamana göre sıralı tek kanallı örnekler ve min/max özet seviyeleri.
+
+    ``seviye k`` (1'den başlar) ``DAL**k`` örneklik blokların en küçük ve en
+    büyük değeridir. ``en_fazla`` doluysa en eski yarı atılır ve piramit
+    yeniden kurulur. Sıradan eski zamanlı örnek atılır.
+    """
+
+    def __init__(self, kapasite=4096, en_fazla=1 << 21):
+        self.en_fazla = en_fazla
+        self._t = np.empty(kapasite)
+        self._v = np.empty(kapasite)
+        self._n = 0
+        self._seviyeler = []
+        self._ozetlenen = 0
+        self.kesilen = 0
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def aralik(self):
+        return (float(self._t[0]), float(self._t[self._n - 1])) if self._n else None
+
+    @property
+    def son(self):
+        """(zaman, değer) son örnek; boşsa None."""
+        return (float(self._t[self._n - 1]), float(self._v[self._n - 1])) if self._n else None
+
+    def _yer_ac(self, ek):
+        n = self._n
+        if n + ek > self.en_fazla:
+            kes = min(n, max(n // 2, n + ek - self.en_fazla))
+            self._t[:n - kes] = self._t[kes:n]
+            self._v[:n - kes] = self._v[kes:n]
+            self._n = n = n - kes
+            self.kesilen += kes
+            self._seviyeler = []
+            self._ozetlenen = 0
+        if n + ek > len(self._t):
+            # Toplu yüklemeden sonra da pay kalsın; ilk canlı örnek kopyalama yapmasın
+            kapasite = min(self.en_fazla, 2 * max(len(self._t), n + ek))
+            t, v = np.empty(kapasite), np.empty(kapasite)
+            t[:n], v[:n] = self._t[:n], self._v[:n]
+            self._t, self._v = t, v
+
+    def ekle(self, t, deger):
+        n = self._n
+        if n and t < self._t[n - 1]:
+            return False
+        if n == len(self._t) or n == self.en_fazla:
+            self._yer_ac(1)
+            n = self._n
+        self._t[n] = t
+        self._v[n] = deger
+        self._n = n + 1
+        return True
+
+    def toplu_ekle(self, zamanlar, degerler):
+        """Sıralı çok sayıda örneği ekler (ör. kayıttan yükleme)."""
+        zamanlar = np.asarray(zamanlar, dtype=float)
+        degerler = np.asarray(degerler, dtype=float)
+        if self._n:
+            gecerli = zamanlar >= self._t[self._n - 1]
+            zamanlar, degerler = zamanlar[gecerli], degerler[gecerli]
+        zamanlar, degerler = zamanlar[-self.en_fazla:], degerler[-self.en_fazla:]
+        self._yer_ac(len(zamanlar))
+        n = self._n
+        self._t[n:n + len(zamanlar)] = zamanlar
+        self._v[n:n + len(zamanlar)] = degerler
+        self._n = n + len(zamanlar)
+
+    def ozetle(self):
+        """Piramidi son ``ozetle``'den beri eklenen örneklerle günceller."""
+        n = self._n
+        if self._ozetlenen == n:
+            return
+        alt_mn = alt_mx = self._v[:n]
+        alt_n, bas, k = n, self._ozetlenen, 0
+        while alt_n > 1:
+            ust_n = -(-alt_n // DAL)
+            if k == len(self._seviyeler):
+                self._seviyeler.append([np.empty(2 * ust_n), np.empty(2 * ust_n), 0])
+            seviye = self._seviyeler[k]
+            if len(seviye[0]) < ust_n:
+                for i in (0, 1):
+                    yeni = np.empty(2 * max(len(seviye[i]), ust_n))
+                    yeni[:seviye[2]] = seviye[i][:seviye[2]]
+                    seviye[i] = yeni
+            mn, mx = seviye[0], seviye[1]
+            # Yalnızca değişen alt blokları içeren üst bloklar yeniden hesaplanır
+            j0 = bas // DAL
+            parca_mn, parca_mx = alt_mn[j0 * DAL:alt_n], alt_mx[j0 * DAL:alt_n]
+            tam = len(parca_mn) // DAL
+            mn[j0:j0 + tam] = parca_mn[:tam * DAL].reshape(-1, DAL).min(axis=1)
+            mx[j0:j0 + tam] = parca_mx[:tam * DAL].reshape(-1, DAL).max(axis=1)
+            if j0 + tam < ust_n:
+                mn[ust_n - 1] = parca_mn[tam * DAL:].min()
+                mx[ust_n - 1] = parca_mx[tam * DAL:].max()
+            seviye[2] = ust_n
+            alt_mn, alt_mx, alt_n, bas = mn[:ust_n], mx[:ust_n], ust_n, j0
+            k += 1
+        del self._seviyeler[k:]
+        self._ozetlenen = n
+
+    def _seviye(self, k):
+        # k = 0 ham örnekler; k >= 1 DAL**k örneklik blokların (min, max) dizileri
+        if k == 0:
+            return self._v[:self._n], self._v[:self._n]
+        mn, mx, adet = self._seviyeler[k - 1]
+        return mn[:adet], mx[:adet]
+
+    def zarf(self, t_bas, sutun_suresi, sutun):
+        """``t_bas``'tan başlayan ``sutun`` eşit zaman sütununun (min, max) dizileri.
+
+        Sonuç ham örneklerin sütun başına tam min/max'ıdır; boş sütunlar NaN'dır.
+        """
+        self.ozetle()
+        n = self._n
+        if not n or sutun < 1:
+            return np.full(sutun, np.nan), np.full(sutun, np.nan)
+        kenarlar = np.searchsorted(self._t[:n], t_bas + sutun_suresi * np.arange(sutun + 1))
+        return self.aralik_zarfi(kenarlar[:-1], kenarlar[1:])
+
+    def aralik_zarfi(self, a, b):
+        """Her ``[a[i], b[i])`` örnek aralığının (min, max) değeri; aralıklar sıralı ve örtüşmez.
+
+        Aralığın ortası sütun başına ~``SUTUN_BLOK`` bloğa denk gelen seviyenin
+        tam bloklarından, kenarları her alt seviyeden en çok ``2 * DAL`` blokla
+        okunur; ham örneğe yalnızca uçlarda inilir.
+        """
+        a, b = np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64)
+        mn, mx = np.full(len(a), np.inf), np.full(len(a), -np.inf)
+        ortalama = max(1, int(b[-1] - a[0])) / len(a) if len(a) else 1
+        # Sütun başına ~SUTUN_BLOK blok: her alt seviye kenarlar için bir tur daha demektir
+        k = min(max(0, int(math.log(ortalama / SUTUN_BLOK, DAL))) if ortalama > SUTUN_BLOK else 0,
+                len(self._seviyeler))
+        # En üst seviye: sütun başına değişken sayıda blok, reduceat ile
+        boyut = DAL ** k
+        ust_bas, ust_son = -(-a // boyut), b // boyut
+        dolu = np.flatnonzero(ust_son > ust_bas)
+        if len(dolu):
+            seviye_mn, seviye_mx = self._seviye(k)
+            # [bas0, son0, bas1, son1, ...]: çift sıradaki sonuçlar sütunlara ait
+            sinirlar = np.column_stack([ust_bas[dolu], ust_son[dolu]]).ravel()[:-1]
+            sol = sinirlar[0]
+            son = ust_son[dolu[-1]]
+            mn[dolu] = np.minimum.reduceat(seviye_mn[sol:son], sinirlar - sol)[::2]
+            mx[dolu] = np.maximum.reduceat(seviye_mx[sol:son], sinirlar - sol)[::2]
+        # Alt seviyeler: üstün kapsamadığı kenarlar. Sol kenar baştan ileri, sağ kenar
+        # sondan geri en çok DAL blok okunur; üst seviye boşsa aralık 2 * DAL'dan
+        # kısadır ve iki yarı onu örtüşerek kapsar (min/max için zararsız).
+        ileri = np.arange(DAL)[:, None]
+        for seviye in range(k - 1, -1, -1):
+            boyut //= DAL
+            ic_bas, ic_son = -(-a // boyut), b // boyut
+            kapsanan = ust_son > ust_bas
+            sol_son = np.where(kapsanan, ust_bas * DAL, ic_son)
+            sag_bas = np.where(kapsanan, ust_son * DAL, ic_bas)
+            sira = np.concatenate([ic_bas + ileri, ic_son - 1 - ileri])
+            gecerli = np.concatenate([sira[:DAL] < sol_son, sira[DAL:] >= sag_bas])
+            ust_bas, ust_son = ic_bas, ic_son
+            if not gecerli.any():
+                continue
+            seviye_mn, seviye_mx = self._seviye(seviye)
+            np.clip(sira, 0, len(seviye_mn) - 1, out=sira)
+            np.minimum(mn, np.minimum.reduce(seviye_mn[sira], axis=0, where=gecerli, initial=np.inf), out=mn)
+            np.maximum(mx, np.maximum.reduce(seviye_mx[sira], axis=0, where=gecerli, initial=-np.inf), out=mx)
+        bos = b <= a
+        mn[bos] = mx[bos] = np.nan
+        return mn, mx
+
+
+def _zarf_poligonu(x, mn, mx):
+    """Dolu sütunlardan (x, min), (x, max) sırasıyla QPolygonF; numpy ile doldurulur."""
+    dolu = ~np.isnan(mn)
+    adet = int(dolu.sum())
+    if not adet:
+        return None
+    poligon = QPolygonF()
+    poligon.fill(QPointF(), 2 * adet)
+    tampon = poligon.data()
+    tampon.setsize(2 * adet * 2 * 8)
+    dizi = np.frombuffer(tampon, dtype=np.float64).reshape(adet, 2, 2)
+    dizi[:, :, 0] = x[dolu, None]
+    dizi[:, 0, 1] = mn[dolu]
+    dizi[:, 1, 1] = mx[dolu]
+    return poligon
+
+
+class Serit:
+    """Grafikteki bir kanal: piramit, dikey aralık ve çizim rengi."""
+
+    def __init__(self, kanal, baslik, birim, aralik, renk, en_fazla):
+        self.kanal = kanal
+        self.baslik = baslik
+        self.birim = birim
+        self.varsayilan = aralik
+        self.alt, self.ust = aralik
+        # Genişlik 0: tek piksellik kozmetik kalem, raster çizimin hızlı yolu
+        self.kalem = QPen(QColor(renk), 0)
+        self.piramit = ZarfPiramidi(en_fazla=en_fazla)
+
+
+class SeritGrafik(QWidget, KayitDinleyici):
+    """Kanalları alt alta şeritlerde çizen, kayan ve yakınlaştırılabilen grafik.
+
+    ``piksel_saniye`` yatay ölçektir; ``fps`` canlı kipte tuvalin en fazla
+    güncellenme hızıdır.
+    """
+
+    def __init__(self, parent=None, piksel_saniye=10.0, fps=30, en_fazla=1 << 21):
+        super().__init__(parent)
+        self.seritler = [Serit(*tanim, en_fazla) for tanim in SERITLER]
+        self._kanallar = {serit.kanal: serit for serit in self.seritler}
+        self.piksel_saniye = piksel_saniye
+        self.canli = True
+        self.sag_zaman = None
+        self._kuyruk = deque()
+        self._tuval = None
+        self._cizilen_sag = None
+        self._surukleme = None
+        self._zemin = QColor("#101418")
+        # Ölçüm: tam yeniden çizimler, yalnızca yeni sütunların çizimleri, çizilen sütunlar
+        self.tam_cizim = 0
+        self.serit_cizim = 0
+        self.cizilen_sutun = 0
+        self._zamanlayici = QTimer(self)
+        self._zamanlayici.timeout.connect(self.ilerle)
+        self._zamanlayici.start(round(1000 / fps))
+        self.setMinimumSize(300, 50 * len(self.seritler))
+
+    def sizeHint(self):
+        return QSize(800, 100 * len(self.seritler))
+
+    # ---------------------- Veri ----------------------
+    def ekle(self, kanal, t, deger):
+        """Herhangi bir iş parçacığından örnek ekler; GUI'de bir sonraki tıkta işlenir."""
+        self._kuyruk.append((kanal, t, deger))
+
+    def toplu_ekle(self, kanal, zamanlar, degerler):
+        """GUI iş parçacığında sıralı çok sayıda örnek ekler; görünüm yeniden çizilir."""
+        self._kanallar[kanal].piramit.toplu_ekle(zamanlar, degerler)
+        self._cizilen_sag = None
+
+    def tutum(self, kayit, msg):
+        t = kayit.zaman or time.time()
+        self._kuyruk.append(("pitch", t, kayit.pitch))
+        self._kuyruk.append(("roll", t, kayit.roll))
+
+    def hiz(self, kayit, msg):
+        t = kayit.zaman or time.time()
+        self._kuyruk.append(("yer_hizi", t, kayit.yer_hizi))
+        self._kuyruk.append(("dikey_hiz", t, kayit.dikey_hiz))
+
+    def konum(self, kayit, msg):
+        self._kuyruk.append(("irtifa", kayit.zaman or time.time(), kayit.irtifa))
+
+    # PixhawkThread sinyalleriyle aynı imzalar
+    def yatay_guncelleme(self, pitch, roll):
+        t = time.time()
+        self.ekle("pitch", t, pitch)
+        self.ekle("roll", t, roll)
+
+    def hiz_guncelle(self, hiz):
+        self.ekle("yer_hizi", time.time(), hiz)
+
+    def dikey_hiz_guncelle(self, hiz):
+        self.ekle("dikey_hiz", time.time(), hiz)
+
+    def konum_guncelle(self, enlem, boylam, irtifa):
+        self.ekle("irtifa", time.time(), irtifa)
+
+    def _kuyrugu_bosalt(self):
+        kuyruk = self._kuyruk
+        yeni = False
+        while kuyruk:
+            kanal, t, deger = kuyruk.popleft()
+            yeni |= self._kanallar[kanal].piramit.ekle(t, deger)
+        return yeni
+
+    def _son_zaman(self):
+        sonlar = [s.piramit.son[0] for s in self.seritler if len(s.piramit)]
+        return max(sonlar) if sonlar else None
+
+    # ---------------------- Geometri ----------------------
+    def _serit_alani(self, i):
+        yukseklik = self.height() / len(self.seritler)
+        return QRect(0, round(i * yukseklik), self.width(), round((i + 1) * yukseklik) - round(i * yukseklik))
+
+    def _sag_sutun(self):
+        return math.floor(self.sag_zaman * self.piksel_saniye)
+
+    # ---------------------- Çizim ----------------------
+    def ilerle(self):
+        """Kuyruğu boşaltır; canlı kipte yalnızca yeni sütunları tuvale çizer."""
+        yeni = self._kuyrugu_bosalt()
+        if not self.canli:
+            # Duraklatılmış görünüm değişmez; yalnızca son değer etiketleri
+            if yeni:
+                self.update()
+            return
+        if not yeni and self._cizilen_sag is not None:
+            return
+        self.sag_zaman = self._son_zaman()
+        if self.sag_zaman is None:
+            return
+        sag = self._sag_sutun()
+        if (self._tuval is None or self._tuval.size() != self.size() or self._cizilen_sag is None
+                or not 0 <= sag - self._cizilen_sag < self.width()):
+            self.yeniden_ciz()
+            return
+        kayma = sag - self._cizilen_sag
+        if kayma:
+            self._tuval.scroll(-kayma, 0, self._tuval.rect())
+            self._cizilen_sag = sag
+        # Önceki son sütun yeni örnek almış olabilir; o da yeniden çizilir
+        if not self._sutunlari_ciz(sag - kayma, sag):
+            self.yeniden_ciz()
+            return
+        self.serit_cizim += 1
+        self.update()
+
+    def yeniden_ciz(self, sigdir=True):
+        """Görünür bütün sütunları piramitten çizer; ``sigdir`` dikey aralıkları görünür veriye uydurur."""
+        if self.sag_zaman is None or self.width() < 2:
+            return
+        if self._tuval is None or self._tuval.size() != self.size():
+            self._tuval = QPixmap(self.size())
+        sag = self._sag_sutun()
+        sol = sag - self.width() + 1
+        self._tuval.fill(self._zemin)
+        self._cizilen_sag = sag
+        self._sutunlari_ciz(sol, sag, genislet=False, sigdir=sigdir)
+        self.tam_cizim += 1
+        self.update()
+
+    def _araligi_uydur(self, serit, mn, mx, sadece_genislet=True):
+        """Aralık değiştiyse True; ``sadece_genislet`` değilse varsayılandan başlanır."""
+        if np.isnan(mn).all():
+            return False
+        en_kucuk, en_buyuk = float(np.nanmin(mn)), float(np.nanmax(mx))
+        if sadece_genislet and serit.alt <= en_kucuk and en_buyuk <= serit.ust:
+            return False
+        alt, ust = (serit.alt, serit.ust) if sadece_genislet else serit.varsayilan
+        pay = 0.1 * (max(ust, en_buyuk) - min(alt, en_kucuk))
+        serit.alt = en_kucuk - pay if en_kucuk < alt else alt
+        serit.ust = en_buyuk + pay if en_buyuk > ust else ust
+        return True
+
+    def _sutunlari_ciz(self, c0, c1, genislet=True, sigdir=False):
+        """Mutlak ``c0``..``c1`` sütunlarını tuvale çizer.
+
+        ``genislet``: yeni sütunlar; önce silinir, veri dikey aralığı taşarsa
+        çizilmeden False döndürülür. ``sigdir``: tam çizimde aralıklar çizilen
+        veriye uydurulur. ``c0 - 1`` de hesaplanır ki çizgi önceki sütuna bağlansın.
+        """
+        sol = self._cizilen_sag - self.width() + 1
+        sutun = c1 - c0 + 2
+        x = np.arange(c0 - 1 - sol, c1 - sol + 1, dtype=float) + 0.5
+        zarflar = []
+        for serit in self.seritler:
+            mn, mx = serit.piramit.zarf((c0 - 1) / self.piksel_saniye, 1 / self.piksel_saniye, sutun)
+            if genislet and self._araligi_uydur(serit, mn, mx):
+                return False
+            if sigdir:
+                self._araligi_uydur(serit, mn, mx, sadece_genislet=False)
+            zarflar.append((mn, mx))
+        painter = QPainter(self._tuval)
+        if genislet:
+            painter.fillRect(QRect(c0 - sol, 0, c1 - c0 + 1, self.height()), self._zemin)
+        for i, (serit, (mn, mx)) in enumerate(zip(self.seritler, zarflar)):
+            alan = self._serit_alani(i)
+            painter.setClipRect(alan)
+            olcek = (alan.height() - 4) / (serit.ust - serit.alt)
+            taban = alan.bottom() - 2
+            poligon = _zarf_poligonu(x, taban - (mn - serit.alt) * olcek, taban - (mx - serit.alt) * olcek)
+            if poligon is not None:
+                painter.setPen(serit.kalem)
+                painter.drawPolyline(poligon)
+        painter.end()
+        self.cizilen_sutun += c1 - c0 + 1
+        return True
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self._tuval is None:
+            painter.fillRect(self.rect(), self._zemin)
+        else:
+            painter.drawPixmap(event.rect(), self._tuval, event.rect())
+        # Etiketler tuvalde değil; her boyamada üstüne yazılır
+        painter.setPen(QColor("#c8d0d8"))
+        for i, serit in enumerate(self.seritler):
+            alan = self._serit_alani(i)
+            if i:
+                painter.drawLine(alan.topLeft(), alan.topRight())
+            son = serit.piramit.son
+            deger = "-" if son is None else f"{son[1]:.1f}"
+            painter.drawText(alan.adjusted(6, 4, -6, -4), Qt.AlignLeft | Qt.AlignTop,
+                             f"{serit.baslik}: {deger} {serit.birim}")
+            painter.drawText(alan.adjusted(6, 4, -6, -4), Qt.AlignRight | Qt.AlignTop, f"{serit.ust:.1f}")
+            painter.drawText(alan.adjusted(6, 4, -6, -4), Qt.AlignRight | Qt.AlignBottom, f"{serit.alt:.1f}")
+        kip = "canlı" if self.canli else "duraklatıldı (çift tık: canlı)"
+        painter.drawText(self.rect().adjusted(6, 4, -60, -4), Qt.AlignHCenter | Qt.AlignTop,
+                         f"{self.width() / self.piksel_saniye:.0f} s — {kip}")
+        painter.end()
+
+    def resizeEvent(self, event):
+        self._cizilen_sag = None
+        self.yeniden_ciz()
+
+    # ---------------------- Kaydırma ve yakınlaştırma ----------------------
+    def yakinlastir(self, kat, x=None):
+        """Yatay ölçeği ``kat`` ile çarpar; ``x`` pikselindeki an yerinde kalır."""
+        if self.sag_zaman is None:
+            return
+        if x is None or self.canli:
+            x = self.width() - 1
+        sabit = self.sag_zaman - (self.width() - 1 - x) / self.piksel_saniye
+        self.piksel_saniye = min(1000.0, max(1e-3, self.piksel_saniye * kat))
+        self.sag_zaman = sabit + (self.width() - 1 - x) / self.piksel_saniye
+        self.yeniden_ciz()
+
+    def kaydir(self, piksel):
+        """Görünümü ``piksel`` kadar geçmişe (pozitif) kaydırır; canlı kipten çıkar."""
+        if self.sag_zaman is None:
+            return
+        self.canli = False
+        self.sag_zaman -= piksel / self.piksel_saniye
+        self.yeniden_ciz(sigdir=False)
+
+    def canliya_don(self):
+        self.canli = True
+        self.sag_zaman = self._son_zaman()
+        self.yeniden_ciz()
+
+    def wheelEvent(self, event):
+        self.yakinlastir(1.25 ** (event.angleDelta().y() / 120), event.pos().x())
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._surukleme = event.pos().x()
+
+    def mouseMoveEvent(self, event):
+        if self._surukleme is not None:
+            fark = event.pos().x() - self._surukleme
+            self._surukleme = event.pos().x()
+            if fark:
+                self.kaydir(fark)
+
+    def mouseReleaseEvent(self, event):
+        self._surukleme = None
+        if not self.canli:
+            self.yeniden_ciz()
+
+    def mouseDoubleClickEvent(self, event):
+        self.canliya_don()
+
+
+class SeritGrafikPenceresi(QMainWindow):
+    """MDI paneli: paylaşılan telemetri merkezinden beslenen şerit grafik.
+
+    Değerler ``PixhawkThread`` sinyallerindekiyle aynı ``Cozucu`` kayıtlarıdır,
+    ancak ekran hızında birleştirilmeden, her örnek grafiğe girer.
+    """
+
+    def __init__(self, port='COM9', baud=115200, baglanti=None):
+        super().__init__()
+        self.setWindowTitle("Telemetri Grafiği")
+        self.grafik = SeritGrafik()
+        self.setCentralWidget(self.grafik)
+        self.merkez = TelemetriMerkezi.paylasilan(port, baud, baglanti)
+        self.merkez.hiz.talep_et(self, {'ATTITUDE': 50, 'VFR_HUD': 10, 'GPS_RAW_INT': 5})
+        self.cozucu = Cozucu(self.grafik)
+        self.abone = self.cozucu.merkeze_bagla(self.merkez, ad="Şerit grafik")
+
+    def closeEvent(self, event):
+        self.merkez.hiz.talebi_kaldir(self)
+        self.merkez.abonelikten_cik(self.abone)
+        self.merkez.birak()
+        event.accept()
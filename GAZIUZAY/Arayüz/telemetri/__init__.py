@@ -0,0 +1,24 @@
+"""Qt'den bağımsız telemetri katmanı.
+
+MAVLink bağlantısını tek bir merkez sahiplenir; paneller, kaydediciler ve
+diğer tüketiciler mesajlara abone olur. ``Cozucu`` mesajları tipli kayıtlara
+çevirir; ``python -m telemetri.izle`` aynı çözümü arayüz olmadan çalıştırır.
+``OturumDeposu`` kayıtları uçuş oturumları olarak SQLite'a yazar.
+
+NumPy dizileri üzerine kurulu ``gecmis`` (``TelemetriGecmisi``) ve
+``zaman_hizalama`` (``ZamanHizalayici``) paket kökünden aktarılmaz; yalnızca
+onları kullananlar alt modüllerinden içe aktarır.
+"""
+from .cozucu import Cozucu, HizKaydi, KayitDinleyici, KonumKaydi, TutumKaydi
+from .gecikme import GecikmeIzleyici
+from .hiz import HizYoneticisi
+from .kaydedici import UcusKaydedici
+from .merkez import Abone, TelemetriMerkezi
+from .oturum_deposu import OturumDeposu, OturumOkuyucu
+from .sanal_arac import SanalArac
+from .sentetik import SentetikUcus
+from .tekrar import TekrarOynatici
+
+__all__ = ["Abone", "Cozucu", "GecikmeIzleyici", "HizKaydi", "HizYoneticisi", "KayitDinleyici", "KonumKaydi",
+           "OturumDeposu", "OturumOkuyucu", "SanalArac", "SentetikUcus", "TekrarOynatici", "TelemetriMerkezi",
+           "TutumKaydi", "UcusKaydedici"]
@@ -0,0 +1,154 @@
+"""MAVLink mesajlarını tipli telemetri kayıtlarına çeviren çözme katmanı.
+
+Birim dönüşümleri ve GPS doğrulaması önceden her panelin ``PixhawkThread``'inde
+ayrı ayrı yapılıyordu (``msg.lat / 1e7``, ``msg.alt / 1000``,
+``msg.pitch * 60``). Burada bir kez tanımlanır; Qt gerektirmez, bu yüzden
+komut satırı araçları ve kıyaslamalar da aynı çözümü kullanır.
+
+``Cozucu`` mesajları kayda çevirip ``KayitDinleyici`` arayüzünü uygulayan
+dinleyicilere dağıtır. Paneller bu arayüzün ince Qt uyarlayıcılarıdır: kaydı
+alıp değerleri sinyal toplayıcısına koyarlar.
+"""
+import threading
+from collections import namedtuple
+
+# Panellerin beklediği tutum ölçeği (radyan x 60, yaklaşık derece)
+TUTUM_OLCEGI = 60
+# GPS_RAW_INT'te rota bilinmiyorsa cog bu değerle gelir
+ROTA_YOK = 65535
+
+KonumKaydi = namedtuple("KonumKaydi", ["zaman", "sistem", "enlem", "boylam", "irtifa", "rota"])
+TutumKaydi = namedtuple("TutumKaydi", ["zaman", "sistem", "pitch", "roll", "yaw"])
+HizKaydi = namedtuple("HizKaydi", ["zaman", "sistem", "yer_hizi", "dikey_hiz", "hava_hizi"])
+
+
+def gps_dogrula(enlem, boylam, irtifa):
+    """Geçersiz konumda ``ValueError`` yükseltir (eski ``validate_gps_data``)."""
+    if not (-90 <= enlem <= 90 and -180 <= boylam <= 180 and irtifa >= -500):
+        raise ValueError("Invalid GPS data")
+
+
+def _alim_zamani(msg):
+    # Alınan mesajlarda pymavlink doldurur; elle üretilenlerde yoktur
+    return getattr(msg, "_timestamp", None)
+
+
+def konum_coz(msg):
+    enlem = msg.lat / 1e7
+    boylam = msg.lon / 1e7
+    irtifa = msg.alt / 1000
+    gps_dogrula(enlem, boylam, irtifa)
+    rota = None if msg.cog == ROTA_YOK else msg.cog / 100
+    return KonumKaydi(_alim_zamani(msg), msg.get_srcSystem(), enlem, boylam, irtifa, rota)
+
+
+def tutum_coz(msg):
+    return TutumKaydi(_alim_zamani(msg), msg.get_srcSystem(), msg.pitch * TUTUM_OLCEGI,
+                      msg.roll * TUTUM_OLCEGI, msg.yaw * TUTUM_OLCEGI)
+
+
+def hiz_coz(msg):
+    return HizKaydi(_alim_zamani(msg), msg.get_srcSystem(), msg.groundspeed, msg.climb, msg.airspeed)
+
+
+# Mesaj tipi -> (çözücü, dinleyici yöntemi)
+COZUCULER = {
+    'GPS_RAW_INT': (konum_coz, "konum"),
+    'ATTITUDE': (tutum_coz, "tutum"),
+    'VFR_HUD': (hiz_coz, "hiz"),
+}
+
+
+def coz(msg):
+    """Mesajı kayda çevirir; desteklenmeyen tipte None, geçersiz GPS'te ``ValueError``."""
+    cozucu = COZUCULER.get(msg.get_type())
+    return None if cozucu is None else cozucu[0](msg)
+
+
+class KayitDinleyici:
+    """Çözülmüş kayıtların tüketici arayüzü; gerekmeyen yöntemler boş bırakılır.
+
+    Yöntemler çözücüyü besleyen iş parçacığında (çoğunlukla telemetri
+    merkezinin okuma iş parçacığı) çağrılır ve kısa tutulmalıdır. ``msg`` ham
+    MAVLink mesajıdır; gecikme ölçümü gibi ham alan gerektiren işler içindir.
+    """
+
+    def konum(self, kayit, msg):
+        pass
+
+    def tutum(self, kayit, msg):
+        pass
+
+    def hiz(self, kayit, msg):
+        pass
+
+    def gecersiz(self, msg, hata):
+        """Çözülemeyen mesaj (ör. geçersiz GPS)."""
+
+
+class Cozucu:
+    """Mesajları bir kez çözüp kaydı ilgili dinleyicilere dağıtır.
+
+    ``isle`` doğrudan bir döngüden çağrılabilir ya da ``merkeze_bagla`` ile
+    ``TelemetriMerkezi`` aboneliği olarak kullanılabilir.
+    """
+
+    def __init__(self, *dinleyiciler):
+        self._kilit = threading.Lock()
+        self._dinleyiciler = []
+        self._tablo = {}
+        self.cozulen = {}
+        self.gecersiz = {}
+        self._tabloyu_kur()
+        for dinleyici in dinleyiciler:
+            self.dinleyici_ekle(dinleyici)
+
+    def dinleyici_ekle(self, dinleyici):
+        with self._kilit:
+            self._dinleyiciler.append(dinleyici)
+            self._tabloyu_kur()
+        return dinleyici
+
+    def dinleyici_cikar(self, dinleyici):
+        with self._kilit:
+            if dinleyici in self._dinleyiciler:
+                self._dinleyiciler.remove(dinleyici)
+                self._tabloyu_kur()
+
+    def _tabloyu_kur(self):
+        # Merkezdeki gibi: tablo yeniden kurulup tek atamayla değiştirilir
+        self._tablo = {
+            tip: (cozucu, tuple(getattr(d, yontem) for d in self._dinleyiciler))
+            for tip, (cozucu, yontem) in COZUCULER.items()
+        }
+        self._hatalar = tuple(d.gecersiz for d in self._dinleyiciler)
+
+    def tipler(self):
+        """Çözülebilen mesaj tipleri; merkeze abone olurken kullanılır."""
+        return tuple(COZUCULER)
+
+    def isle(self, msg):
+        """Mesajı çözüp dağıtır; kaydı ya da çözülemediyse None döndürür."""
+        tip = msg.get_type()
+        giris = self._tablo.get(tip)
+        if giris is None:
+            return None
+        cozucu, yontemler = giris
+        try:
+            kayit = cozucu(msg)
+        except ValueError as hata:
+            self.gecersiz[tip] = self.gecersiz.get(tip, 0) + 1
+            for yontem in self._hatalar:
+                yontem(msg, hata)
+            return None
+        self.cozulen[tip] = self.cozulen.get(tip, 0) + 1
+        for yontem in yontemler:
+            yontem(kayit, msg)
+        return kayit
+
+    def merkeze_bagla(self, merkez, ad="Cozucu"):
+        """Merkeze çözülebilen tipler için abone olur; ``Abone`` döndürür."""
+        return merkez.abone_ol(self.isle, tipler=self.tipler(), ad=ad)
+
+    def istatistik(self):
+        return {"cozulen": dict(self.cozulen), "gecersiz": dict(self.gecersiz)}
@@ -0,0 +1,183 @@
+"""Otopilottan ekrana telemetri gecikmesi izleme.
+
+Bir değerin yolu beş aşamada ölçülür:
+
+* ``ucus``   otopilot zaman damgası (``time_boot_ms``/``time_usec``) -> yer
+  istasyonunda alış. İki saat ortak olmadığından son 30 saniyedeki en küçük
+  fark sıfır kabul edilir; değer bu en iyi duruma göre ek gecikmedir.
+* ``cozum``  alış (``msg._timestamp``) -> çözülmüş mesajın aboneye ulaşması
+* ``iletim`` abone -> değerin GUI iş parçacığında sinyalle yayılması
+* ``cizim``  yayılma -> panelin çizimi bitirmesi
+* ``toplam`` alış -> çizim
+
+Tekrar oynatmada ``_timestamp`` kayıttaki alış zamanıdır; bir saniyeden eski
+(veya ileri) alış zamanları bu yüzden yok sayılır, ``toplam`` çözümden başlar.
+
+Okuma iş parçacığı ``alindi``, toplayıcı ``iletildi``, paneller ``cizildi``
+çağırır. Kanal başına yalnızca en son değer izlenir; ekrana hiç ulaşmadan
+eskiyen değerler örneklem dışında kalır. Aşama başına son ``pencere`` örnek
+tutulur, yüzdelikler istendiğinde hesaplanır.
+"""
+import json
+import time
+from collections import deque
+
+ASAMALAR = ("ucus", "cozum", "iletim", "cizim", "toplam")
+
+
+class KayanOrneklem:
+    """Son ``boyut`` örnekten yüzdelik hesaplayan kayan pencere."""
+
+    def __init__(self, boyut=2048):
+        self.ornekler = deque(maxlen=boyut)
+        self.adet = 0
+
+    def ekle(self, deger):
+        self.ornekler.append(deger)
+        self.adet += 1
+
+    def yuzdelikler(self):
+        sirali = sorted(self.ornekler)
+        if not sirali:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0, "adet": 0}
+
+        def yuzdelik(oran):
+            return sirali[min(len(sirali) - 1, int(oran * len(sirali)))]
+
+        return {
+            "p50": yuzdelik(0.50),
+            "p95": yuzdelik(0.95),
+            "p99": yuzdelik(0.99),
+            "max": sirali[-1],
+            "adet": self.adet,
+        }
+
+
+class SaatEslestirici:
+    """Otopilot saatini yer istasyonu saatine kayan en küçük farkla eşler."""
+
+    def __init__(self, pencere_s=30.0):
+        self.pencere_s = pencere_s
+        self._farklar = {}
+        self._son = {}
+
+    def ek_gecikme(self, kaynak, t_ucus, t_alim):
+        fark = t_alim - t_ucus
+        farklar = self._farklar.setdefault(kaynak, deque())
+        # Otopilot yeniden başladıysa saat geri gider; geçmiş geçersizdir
+        if t_ucus < self._son.get(kaynak, t_ucus) - 1.0:
+            farklar.clear()
+        self._son[kaynak] = t_ucus
+        # Artan farklardan oluşan kuyruk: baştaki her zaman penceredeki en küçüktür
+        while farklar and farklar[-1][1] >= fark:
+            farklar.pop()
+        farklar.append((t_alim, fark))
+        while farklar[0][0] < t_alim - self.pencere_s:
+            farklar.popleft()
+        return fark - farklar[0][1]
+
+
+def otopilot_zamani(msg):
+    """Mesajdaki otopilot zaman damgası (saniye); yoksa None."""
+    ms = getattr(msg, "time_boot_ms", None)
+    if ms is not None:
+        return ms / 1000.0
+    us = getattr(msg, "time_usec", None)
+    if us:
+        return us / 1e6
+    return None
+
+
+class GecikmeIzleyici:
+    """Kanal ve panel başına gecikme aşamalarını toplar."""
+
+    def __init__(self, pencere=2048, saat_penceresi=30.0, en_fazla_cozum=1.0):
+        self.pencere = pencere
+        self.en_fazla_cozum = en_fazla_cozum
+        self.saat = SaatEslestirici(saat_penceresi)
+        self._paneller = {}
+        self._ucan = {}
+        self._bekleyen = {}
+        self._orneklem = {}
+
+    def bagla(self, kanal, *paneller):
+        """``kanal`` sinyalinin hangi panelleri güncellediğini bildirir."""
+        self._paneller[kanal] = self._paneller.get(kanal, ()) + paneller
+
+    def alindi(self, kanal, msg):
+        """Okuma iş parçacığında, değer toplayıcıya konmadan hemen önce çağrılır."""
+        t_cozum = time.time()
+        t_alim = getattr(msg, "_timestamp", None) or t_cozum
+        t_ucus = otopilot_zamani(msg)
+        ucus = None
+        if t_ucus is not None:
+            ucus = self.saat.ek_gecikme((msg.get_srcSystem(), msg.get_type()), t_ucus, t_alim)
+        if not 0.0 <= t_cozum - t_alim <= self.en_fazla_cozum:
+            t_alim = t_cozum  # Kayıttan oynatılan mesaj
+        self._ucan[kanal] = (ucus, t_alim, t_cozum)
+
+    def iletildi(self, kanal):
+        """GUI iş parçacığında, ``kanal`` sinyali yayılırken çağrılır."""
+        iz = self._ucan.pop(kanal, None)
+        if iz is None:
+            return
+        iz = iz + (time.time(),)
+        for panel in self._paneller.get(kanal, ()):
+            self._bekleyen[panel] = iz
+
+    def cizildi(self, panel):
+        """Panelin çizimi bittiğinde çağrılır; bekleyen değer yoksa bir şey yapmaz."""
+        iz = self._bekleyen.pop(panel, None)
+        if iz is None:
+            return
+        ucus, t_alim, t_cozum, t_iletim = iz
+        t_cizim = time.time()
+        degerler = {
+            "ucus": ucus,
+            "cozum": (t_cozum - t_alim) if t_cozum != t_alim else None,
+            "iletim": t_iletim - t_cozum,
+            "cizim": t_cizim - t_iletim,
+            "toplam": t_cizim - t_alim,
+        }
+        for asama, deger in degerler.items():
+            if deger is None:
+                continue
+            anahtar = (panel, asama)
+            orneklem = self._orneklem.get(anahtar)
+            if orneklem is None:
+                orneklem = self._orneklem[anahtar] = KayanOrneklem(self.pencere)
+            orneklem.ekle(deger)
+
+    def ozet(self):
+        """{panel: {aşama: {p50, p95, p99, max (ms), adet}}}"""
+        sonuc = {}
+        for (panel, asama), orneklem in sorted(self._orneklem.items()):
+            yuzdelik = orneklem.yuzdelikler()
+            sonuc.setdefault(panel, {})[asama] = {
+                k: (v if k == "adet" else round(1000 * v, 3)) for k, v in yuzdelik.items()
+            }
+        return sonuc
+
+    def metin(self):
+        """Hata ayıklama katmanı için tablo."""
+        satirlar = ["{:<24}{:>8}{:>9}{:>9}{:>9}".format("panel/aşama (ms)", "p50", "p95", "p99", "max")]
+        for panel, asamalar in self.ozet().items():
+            satirlar.append(panel)
+            for asama in ASAMALAR:
+                if asama in asamalar:
+                    d = asamalar[asama]
+                    satirlar.append("  {:<22}{:>8.1f}{:>9.1f}{:>9.1f}{:>9.1f}".format(
+                        asama, d["p50"], d["p95"], d["p99"], d["max"]))
+        return "\n".join(satirlar)
+
+    def dosyaya_yaz(self, dosya, ornekler=True):
+        """Özeti ve istenirse ham örnekleri (ms) JSON olarak yazar."""
+        veri = {"zaman": time.strftime("%Y-%m-%d %H:%M:%S"), "ozet": self.ozet()}
+        if ornekler:
+            veri["ornekler"] = {
+                f"{panel}/{asama}": [round(1000 * d, 3) for d in orneklem.ornekler]
+                for (panel, asama), orneklem in sorted(self._orneklem.items())
+            }
+        with open(dosya, "w", encoding="utf-8") as f:
+            json.dump(veri, f, ensure_ascii=False, indent=1)
+        return dosya
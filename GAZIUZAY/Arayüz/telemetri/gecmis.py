@@ -0,0 +1,196 @@
+"""Kanal başına sabit bellekli telemetri geçmişi.
+
+Telemetri değerleri önceden yalnızca sinyal argümanı olarak yaşıyordu; gösterge
+güncellendikten sonra değer kayboluyordu. ``TelemetriGecmisi`` çözücünün
+kayıtlarını (tutum, hız, konum) kanal başına önceden ayrılmış bir
+``HalkaTampon``'da tutar; toplam bellek ``butce_mb`` ile sınırlıdır ve dolunca
+en eski örnekler üzerine yazılır.
+
+Tampon her örneği iki kez yazar (``i`` ve ``i + kapasite``); böylece son
+``kapasite`` örneğin her aralığı bellekte bitişiktir ve ``dilim`` kopya yerine
+numpy görünümü döndürebilir. Zaman aralığı sorgusu ikili aramayla O(log n)'dir.
+Görünüm salt okunurdur ve ``kapasite`` yeni örnek yazılana kadar geçerlidir;
+daha uzun tutacak tüketici ``gecerli`` ile denetler ya da kopyalar.
+"""
+import threading
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from .cozucu import KayitDinleyici
+
+# kanal: (alanlar, beklenen Hz); bütçe kanallara aynı süreyi kapsayacak şekilde bölünür
+KANALLAR = {
+    "tutum": (("pitch", "roll", "yaw"), 50),
+    "hiz": (("yer_hizi", "dikey_hiz", "hava_hizi"), 10),
+    "konum": (("enlem", "boylam", "irtifa", "rota"), 5),
+}
+
+# ``zaman`` (m,) ve ``degerler`` (alan, m) görünümleri; ``sira`` ilk örneğin toplam sıra numarası
+Dilim = namedtuple("Dilim", ["zaman", "degerler", "sira"])
+
+
+def satir_bayti(alan_sayisi):
+    """Bir örneğin tampondaki boyutu (zaman + alanlar, float64, iki kopya)."""
+    return 2 * 8 * (1 + alan_sayisi)
+
+
+class HalkaTampon:
+    """Zamana göre sıralı örnekler için önceden ayrılmış halka tampon.
+
+    Örnekler sırayla gelmelidir; son örnekten eski zamanlı örnek atılır ve
+    ``sirasiz``'da sayılır. ``degerler`` sütun düzenindedir: bir alanın
+    dilimi bitişik bir dizidir.
+    """
+
+    def __init__(self, alanlar, kapasite):
+        if kapasite < 1:
+            raise ValueError("kapasite en az 1 olmalı")
+        self.alanlar = tuple(alanlar)
+        self.sutun = {alan: i for i, alan in enumerate(self.alanlar)}
+        self.kapasite = kapasite
+        self._t = np.zeros(2 * kapasite)
+        self._v = np.zeros((len(self.alanlar), 2 * kapasite))
+        self._bas = 0
+        self._n = 0
+        self.toplam = 0
+        self.sirasiz = 0
+        self._kilit = threading.Lock()
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def nbayt(self):
+        return self._t.nbytes + self._v.nbytes
+
+    @property
+    def aralik(self):
+        """(ilk, son) örnek zamanı; boşsa None."""
+        with self._kilit:
+            if not self._n:
+                return None
+            return float(self._t[self._bas]), float(self._t[self._bas + self._n - 1])
+
+    def ekle(self, t, degerler):
+        """Örneği ekler; sırasızsa atıp False döndürür."""
+        with self._kilit:
+            n = self._n
+            if n and t < self._t[self._bas + n - 1]:
+                self.sirasiz += 1
+                return False
+            i = self.toplam % self.kapasite
+            self._t[i] = self._t[i + self.kapasite] = t
+            self._v[:, i] = self._v[:, i + self.kapasite] = degerler
+            self.toplam += 1
+            if n < self.kapasite:
+                self._n = n + 1
+            else:
+                self._bas = (self._bas + 1) % self.kapasite
+            return True
+
+    def toplu_ekle(self, zamanlar, degerler):
+        """Sıralı çok sayıda örneği tek seferde ekler (ör. kayıttan yükleme).
+
+        ``degerler`` (adet, alan) biçimindedir. Son örnekten eski olanlar atılır.
+        """
+        zamanlar = np.asarray(zamanlar, dtype=float)
+        degerler = np.asarray(degerler, dtype=float).reshape(len(zamanlar), len(self.alanlar))
+        with self._kilit:
+            if self._n:
+                gecerli = zamanlar >= self._t[self._bas + self._n - 1]
+                self.sirasiz += int(len(zamanlar) - gecerli.sum())
+                zamanlar, degerler = zamanlar[gecerli], degerler[gecerli]
+            # Tampondan büyük partide yalnızca son ``kapasite`` örnek kalır
+            atlanan = max(0, len(zamanlar) - self.kapasite)
+            self.toplam += atlanan
+            zamanlar, degerler = zamanlar[atlanan:], degerler[atlanan:].T
+            k = self.kapasite
+            sira = self.toplam
+            while len(zamanlar):
+                i = sira % k
+                adet = min(len(zamanlar), k - i)
+                for kayma in (0, k):
+                    self._t[i + kayma:i + kayma + adet] = zamanlar[:adet]
+                    self._v[:, i + kayma:i + kayma + adet] = degerler[:, :adet]
+                zamanlar, degerler = zamanlar[adet:], degerler[:, adet:]
+                sira += adet
+            eklenen = sira - self.toplam
+            self.toplam = sira
+            self._n = min(k, self._n + eklenen)
+            self._bas = (self.toplam - self._n) % k
+
+    def _gorunum(self, i, j):
+        # Pencere içi [i, j) sırası için salt okunur görünümler
+        bas = self._bas
+        t, v = self._t[bas + i:bas + j], self._v[:, bas + i:bas + j]
+        t.flags.writeable = v.flags.writeable = False
+        return Dilim(t, v, self.toplam - self._n + i)
+
+    def dilim(self, t0=None, t1=None):
+        """``t0 <= zaman <= t1`` örnekleri; sınır verilmezse o uç açıktır."""
+        with self._kilit:
+            pencere = self._t[self._bas:self._bas + self._n]
+            i = 0 if t0 is None else int(np.searchsorted(pencere, t0, side="left"))
+            j = self._n if t1 is None else int(np.searchsorted(pencere, t1, side="right"))
+            return self._gorunum(i, max(i, j))
+
+    def son(self, adet):
+        """En son ``adet`` örnek."""
+        with self._kilit:
+            return self._gorunum(max(0, self._n - adet), self._n)
+
+    def gecerli(self, dilim):
+        """Dilimin görünümü hâlâ yazılan örneklerle değişmemiş mi?"""
+        return self.toplam - dilim.sira <= self.kapasite
+
+
+class TelemetriGecmisi(KayitDinleyici):
+    """Çözücü kayıtlarını kanal başına ``HalkaTampon``'da saklar.
+
+    ``Cozucu``'ya dinleyici olarak eklenir (``pixhawk.cozucu.dinleyici_ekle``).
+    Zaman, kaydın alış zamanıdır (unix saniye); yoksa ekleme anı kullanılır.
+    """
+
+    def __init__(self, butce_mb=64, kanallar=KANALLAR):
+        self.butce_mb = butce_mb
+        # Bütün kanallar aynı süreyi kapsasın: kapasite = Hz x kapsam
+        saniye_bayti = sum(hz * satir_bayti(len(alanlar)) for alanlar, hz in kanallar.values())
+        self.kapsam_s = butce_mb * 2 ** 20 / saniye_bayti
+        self.tamponlar = {
+            kanal: HalkaTampon(alanlar, max(1, int(hz * self.kapsam_s)))
+            for kanal, (alanlar, hz) in kanallar.items()
+        }
+
+    def __getitem__(self, kanal):
+        return self.tamponlar[kanal]
+
+    @property
+    def nbayt(self):
+        return sum(tampon.nbayt for tampon in self.tamponlar.values())
+
+    def _ekle(self, kanal, kayit):
+        tampon = self.tamponlar.get(kanal)
+        if tampon is not None:
+            # İlk iki alan zaman ve sistem; geri kalanı kanal alanlarıyla aynı sırada
+            tampon.ekle(kayit.zaman or time.time(), kayit[2:])
+
+    def tutum(self, kayit, msg):
+        self._ekle("tutum", kayit)
+
+    def hiz(self, kayit, msg):
+        self._ekle("hiz", kayit)
+
+    def konum(self, kayit, msg):
+        self._ekle("konum", kayit)
+
+    def dilim(self, kanal, t0=None, t1=None):
+        return self.tamponlar[kanal].dilim(t0, t1)
+
+    def istatistik(self):
+        return {
+            kanal: {"adet": len(tampon), "kapasite": tampon.kapasite, "toplam": tampon.toplam,
+                    "sirasiz": tampon.sirasiz, "aralik": tampon.aralik}
+            for kanal, tampon in self.tamponlar.items()
+        }
@@ -0,0 +1,141 @@
+"""Mesaj başına akış hızı yönetimi.
+
+Her panel ihtiyaç duyduğu mesajları ve hızları bildirir; yönetici bunları
+birleştirip (aynı mesaj için en yüksek hız) ``MAV_CMD_SET_MESSAGE_INTERVAL``
+ile ister. Panel açılıp kapandıkça istekler yeniden hesaplanır, artık kimsenin
+istemediği mesajlar kapatılır. Ölçülen hızlar istenenlerle düzenli olarak
+karşılaştırılır; yetersiz kalan istekler birkaç kez yinelenir.
+"""
+import threading
+import time
+
+from pymavlink import mavutil
+
+# Artık kimsenin istemediği mesaj için gönderilen aralık (-1: kapat)
+KAPALI = -1
+
+
+def mesaj_kimligi(tip):
+    return getattr(mavutil.mavlink, "MAVLINK_MSG_ID_" + tip)
+
+
+class HizYoneticisi:
+    """Bir ``TelemetriMerkezi`` üzerindeki mesaj hızı isteklerini uzlaştırır."""
+
+    def __init__(self, merkez, tolerans=0.8, dogrulama_araligi=5.0, en_fazla_yineleme=3,
+                 eski_akislari_durdur=True):
+        self.merkez = merkez
+        self.tolerans = tolerans
+        self.dogrulama_araligi = dogrulama_araligi
+        self.en_fazla_yineleme = en_fazla_yineleme
+        self.eski_akislari_durdur = eski_akislari_durdur
+        self.onaylanan = 0
+        self.reddedilen = 0
+        self._talepler = {}
+        self._uygulanan = {}
+        self._yineleme = {}
+        self._uyarilan = set()
+        self._son_dogrulama = time.monotonic()
+        self._kilit = threading.RLock()
+        merkez.baglandiginda(self._baglandi)
+        merkez.abone_ol(self._mesaj, tipler=('COMMAND_ACK', 'HEARTBEAT'), ad="HizYoneticisi")
+
+    def talep_et(self, sahip, hizlar):
+        """``sahip`` için {mesaj tipi: Hz} isteğini kaydeder (öncekinin yerine geçer)."""
+        with self._kilit:
+            self._talepler[sahip] = dict(hizlar)
+            self._uzlas()
+
+    def talebi_kaldir(self, sahip):
+        with self._kilit:
+            if self._talepler.pop(sahip, None) is not None:
+                self._uzlas()
+
+    def istenen(self):
+        """Tüm sahiplerin isteklerinden mesaj başına en yüksek hız."""
+        with self._kilit:
+            sonuc = {}
+            for hizlar in self._talepler.values():
+                for tip, hz in hizlar.items():
+                    sonuc[tip] = max(hz, sonuc.get(tip, 0))
+            return sonuc
+
+    def dogrula(self):
+        """İstenen ve ölçülen hızları karşılaştırır; yetersizleri yeniden ister.
+
+        {tip: (istenen_hz, olculen_hz, yeterli_mi)} döndürür.
+        """
+        rapor = {}
+        with self._kilit:
+            for tip, hz in self.istenen().items():
+                olculen = self.merkez.mesaj_hz.get(tip, 0.0)
+                yeterli = olculen >= hz * self.tolerans
+                rapor[tip] = (hz, olculen, yeterli)
+                if yeterli or not self.merkez.bagli:
+                    self._yineleme.pop(tip, None)
+                    continue
+                sayi = self._yineleme.get(tip, 0)
+                if sayi < self.en_fazla_yineleme:
+                    self._yineleme[tip] = sayi + 1
+                    self._aralik_gonder(tip, hz)
+                elif tip not in self._uyarilan:
+                    self._uyarilan.add(tip)
+                    print(f"{tip} için {hz:.0f} Hz istendi, {olculen:.1f} Hz alınıyor")
+        return rapor
+
+    def _uzlas(self):
+        if not self.merkez.bagli:
+            return
+        istenen = self.istenen()
+        for tip, hz in istenen.items():
+            if self._uygulanan.get(tip) != hz:
+                self._aralik_gonder(tip, hz)
+        for tip in list(self._uygulanan):
+            if tip not in istenen:
+                self._aralik_gonder(tip, None)
+
+    def _aralik_gonder(self, tip, hz):
+        baglanti = self.merkez.baglanti
+        aralik_us = KAPALI if hz is None else int(1e6 / hz)
+        baglanti.mav.command_long_send(
+            baglanti.target_system,
+            baglanti.target_component,
+            mavutil.mavlink.MAV_CMD_SET_MESSAGE_INTERVAL,
+            0,
+            mesaj_kimligi(tip),
+            aralik_us,
+            0, 0, 0, 0, 0
+        )
+        if hz is None:
+            self._uygulanan.pop(tip, None)
+        else:
+            self._uygulanan[tip] = hz
+
+    def _baglandi(self, baglanti):
+        with self._kilit:
+            if self.eski_akislari_durdur:
+                # SRx_ parametreleriyle gelen toplu akışları durdur; yalnızca
+                # istenen mesajlar gelsin
+                baglanti.mav.request_data_stream_send(
+                    baglanti.target_system,
+                    baglanti.target_component,
+                    mavutil.mavlink.MAV_DATA_STREAM_ALL,
+                    0,
+                    0
+                )
+            self._uygulanan = {}
+            self._yineleme = {}
+            self._uzlas()
+
+    def _mesaj(self, msg):
+        if msg.get_type() == 'COMMAND_ACK':
+            if msg.command == mavutil.mavlink.MAV_CMD_SET_MESSAGE_INTERVAL:
+                if msg.result == mavutil.mavlink.MAV_RESULT_ACCEPTED:
+                    self.onaylanan += 1
+                else:
+                    self.reddedilen += 1
+            return
+        simdi = time.monotonic()
+        if simdi - self._son_dogrulama >= self.dogrulama_araligi:
+            self._son_dogrulama = simdi
+            self.dogrula()
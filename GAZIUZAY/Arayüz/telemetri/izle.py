@@ -0,0 +1,123 @@
+"""Arayüz açmadan bir bağlantıyı ya da uçuş kaydını çözüp yazdıran komut satırı aracı.
+
+Kaynak var olan bir dosyaysa ``TekrarOynatici`` ile beklemeden (tam hızda),
+değilse ``mavutil`` bağlantı dizgesi olarak (``udpin:0.0.0.0:14550``,
+``/dev/ttyACM0``) ``TelemetriMerkezi`` üzerinden okunur. Her mesaj ``Cozucu``'dan
+geçer; kayıtlar satır satır metin ya da JSON olarak standart çıktıya yazılır,
+``--bicim yok`` ile yalnızca sayılır. Sonunda tip başına çözülen ve geçersiz
+mesaj sayısı ile ulaşılan mesaj/s standart hataya yazılır.
+
+Kullanım: python -m telemetri.izle kayitlar/ucus.tlog --bicim json > ucus.jsonl
+          python -m telemetri.izle udpin:0.0.0.0:14550 --hiz ATTITUDE=50 --sure 10
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+
+from .cozucu import Cozucu, KayitDinleyici
+from .merkez import TelemetriMerkezi
+from .sanal_arac import _hiz_coz
+from .tekrar import TekrarOynatici
+
+
+class Yazici(KayitDinleyici):
+    """Kayıtları ``cikti``'ya satır satır yazar.
+
+    Çıktı ``head`` gibi erken kapanan bir komuta bağlıysa ``kapandi`` doğru olur
+    ve okuma döngüleri durur.
+    """
+
+    def __init__(self, bicim="metin", cikti=sys.stdout):
+        self.bicim = bicim
+        self.cikti = cikti
+        self.kapandi = False
+
+    def _yaz(self, tip, kayit):
+        if self.bicim == "yok" or self.kapandi:
+            return
+        if self.bicim == "json":
+            satir = json.dumps(dict(kayit._asdict(), tip=tip))
+        else:
+            alanlar = " ".join(f"{k}={v:.6g}" if isinstance(v, float) else f"{k}={v}"
+                               for k, v in kayit._asdict().items() if k not in ("zaman", "sistem"))
+            satir = f"{kayit.zaman or 0:.3f} {kayit.sistem} {tip} {alanlar}"
+        try:
+            self.cikti.write(satir + "\n")
+        except BrokenPipeError:
+            self.kapandi = True
+            # Çıkışta tamponu boşaltırken yeniden hata vermesin
+            os.dup2(os.open(os.devnull, os.O_WRONLY), self.cikti.fileno())
+
+    def konum(self, kayit, msg):
+        self._yaz("konum", kayit)
+
+    def tutum(self, kayit, msg):
+        self._yaz("tutum", kayit)
+
+    def hiz(self, kayit, msg):
+        self._yaz("hiz", kayit)
+
+
+def dosyadan(oynatici, cozucu, yazici, bitis=None):
+    """Kaydı bu iş parçacığında beklemeden sonuna kadar çözer; mesaj sayısını döndürür."""
+    adet = 0
+    while not yazici.kapandi:
+        # Süre her mesajda değil, 1024 mesajda bir denetlenir
+        if bitis is not None and adet % 1024 == 0 and time.perf_counter() >= bitis:
+            break
+        msg = oynatici.recv_match(blocking=False)
+        if msg is None:
+            break
+        cozucu.isle(msg)
+        adet += 1
+    return adet
+
+
+def baglantidan(port, baud, hizlar, cozucu, yazici, bitis=None):
+    """Canlı bağlantıyı merkez üzerinden okur; Ctrl+C ya da ``bitis``'e kadar sürer."""
+    merkez = TelemetriMerkezi(port=port, baud=baud)
+    cozucu.merkeze_bagla(merkez, ad="izle")
+    if hizlar:
+        merkez.hiz.talep_et(cozucu, hizlar)
+    merkez.baslat()
+    try:
+        while not yazici.kapandi and (bitis is None or time.perf_counter() < bitis):
+            time.sleep(0.1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        merkez.durdur()
+    return sum(merkez.toplam.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MAVLink bağlantısını ya da tlog kaydını arayüzsüz çözer")
+    parser.add_argument("kaynak", help="tlog dosyası ya da mavutil bağlantı dizgesi")
+    parser.add_argument("--baud", type=int, default=115200)
+    parser.add_argument("--bicim", choices=("metin", "json", "yok"), default="metin")
+    parser.add_argument("--hiz", nargs="*", type=_hiz_coz, default=[], metavar="TIP=HZ",
+                        help="canlı bağlantıda araçtan istenecek mesaj hızları")
+    parser.add_argument("--sure", type=float, help="bu kadar saniye sonra dur")
+    args = parser.parse_args()
+
+    # Kayıtlar asıl çıktıya; merkezin durum iletileri standart hataya gider
+    yazici = Yazici(args.bicim, sys.stdout)
+    cozucu = Cozucu(yazici)
+    baslangic = time.perf_counter()
+    bitis = None if args.sure is None else baslangic + args.sure
+    with contextlib.redirect_stdout(sys.stderr):
+        if os.path.isfile(args.kaynak):
+            adet = dosyadan(TekrarOynatici(args.kaynak, hiz=0), cozucu, yazici, bitis)
+        else:
+            adet = baglantidan(args.kaynak, args.baud, dict(args.hiz), cozucu, yazici, bitis)
+    gecen = time.perf_counter() - baslangic
+    istatistik = cozucu.istatistik()
+    print(f"{adet} mesaj, {gecen:.2f} s, {adet / max(gecen, 1e-9):.0f} mesaj/s; "
+          f"çözülen {istatistik['cozulen']}, geçersiz {istatistik['gecersiz']}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Ham MAVLink uçuş kaydedici.
+
+Merkezden gelen her mesaj, yer istasyonunun alış zamanıyla birlikte tlog
+biçiminde (8 bayt big-endian mikrosaniye zaman damgası + ham MAVLink çerçevesi)
+oturum başına ayrı bir dosyaya eklenir. Abone geri çağırması yalnızca kuyruğa
+ekleme yapar; yazma, toplu ve tamponlu olarak ayrı bir iş parçacığında yapılır.
+Dosyalar MAVProxy, Mission Planner ve ``mavutil.mavlink_connection`` ile açılabilir.
+
+Aynı merkezi kullanan pencereler ``UcusKaydedici.paylasilan`` ile tek kaydediciyi
+paylaşır; her mesaj bir kez yazılır.
+"""
+import os
+import queue
+import struct
+import threading
+import time
+
+_ZAMAN = struct.Struct(">Q")
+_BITTI = object()
+
+# Çalışma dizininden bağımsız: paketin bulunduğu arayüz dizininde
+KAYIT_DIZINI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "kayitlar")
+
+
+def oturum_dosyasi(dizin=KAYIT_DIZINI, onek="ucus"):
+    """Var olan kayıtların üzerine yazmayan yeni bir oturum dosya adı üretir."""
+    os.makedirs(dizin, exist_ok=True)
+    taban = os.path.join(dizin, time.strftime(f"{onek}_%Y%m%d_%H%M%S"))
+    yol, sira = taban + ".tlog", 1
+    while os.path.exists(yol):
+        yol = f"{taban}_{sira}.tlog"
+        sira += 1
+    return yol
+
+
+class UcusKaydedici:
+    """Bir ``TelemetriMerkezi``'nin tüm mesajlarını tlog dosyasına yazar."""
+
+    _paylasilanlar = {}
+    _paylasilan_kilit = threading.Lock()
+
+    def __init__(self, merkez, dosya=None, tampon=1024 * 1024, bosaltma_araligi=1.0):
+        self.merkez = merkez
+        self.dosya = dosya or oturum_dosyasi()
+        self.tampon = tampon
+        self.bosaltma_araligi = bosaltma_araligi
+        self.yazilan_mesaj = 0
+        self.yazilan_bayt = 0
+        self.en_buyuk_parti = 0
+        self._kuyruk = queue.SimpleQueue()
+        self._thread = None
+        self._abone = None
+        self._referans = 0
+
+    # ---------------------- Paylaşım ----------------------
+    @classmethod
+    def paylasilan(cls, merkez):
+        """Aynı merkez için süreç içinde tek bir kaydedici döndürür ve başlatır.
+
+        Her çağrı ``birak`` ile eşlenmelidir; son kullanıcı bıraktığında kayıt
+        kapanır.
+        """
+        with cls._paylasilan_kilit:
+            kaydedici = cls._paylasilanlar.get(merkez)
+            if kaydedici is None:
+                kaydedici = cls(merkez)
+                cls._paylasilanlar[merkez] = kaydedici
+                kaydedici.baslat()
+            kaydedici._referans += 1
+            return kaydedici
+
+    def birak(self):
+        with self._paylasilan_kilit:
+            self._referans -= 1
+            if self._referans > 0:
+                return
+            if self._paylasilanlar.get(self.merkez) is self:
+                del self._paylasilanlar[self.merkez]
+        self.durdur()
+
+    def baslat(self):
+        self._f = open(self.dosya, "xb", buffering=self.tampon)
+        self._thread = threading.Thread(target=self._yaz, name="UcusKaydedici", daemon=True)
+        self._thread.start()
+        self._abone = self.merkez.abone_ol(self.kaydet, ad="Uçuş kaydedici")
+        print(f"Uçuş kaydı: {self.dosya}")
+        return self
+
+    def kaydet(self, msg):
+        """Merkezin okuma iş parçacığında çağrılır; yalnızca kuyruğa ekler."""
+        zaman = getattr(msg, "_timestamp", None) or time.time()
+        self._kuyruk.put((zaman, msg.get_msgbuf()))
+
+    def durdur(self):
+        if self._abone is not None:
+            self.merkez.abonelikten_cik(self._abone)
+            self._abone = None
+        if self._thread is not None:
+            self._kuyruk.put(_BITTI)
+            self._thread.join()
+            self._thread = None
+
+    def istatistik(self):
+        return {
+            "dosya": self.dosya,
+            "yazilan_mesaj": self.yazilan_mesaj,
+            "yazilan_bayt": self.yazilan_bayt,
+            "kuyruk": self._kuyruk.qsize(),
+            "en_buyuk_parti": self.en_buyuk_parti,
+        }
+
+    def _yaz(self):
+        son_bosaltma = time.monotonic()
+        bitti = False
+        while not bitti:
+            try:
+                oge = self._kuyruk.get(timeout=self.bosaltma_araligi)
+            except queue.Empty:
+                oge = None
+            parti = []
+            # Kuyrukta biriken her şeyi tek yazma çağrısında topla
+            while oge is not None:
+                if oge is _BITTI:
+                    bitti = True
+                    break
+                zaman, cerceve = oge
+                parti.append(_ZAMAN.pack(int(zaman * 1e6)))
+                parti.append(bytes(cerceve))
+                try:
+                    oge = self._kuyruk.get_nowait()
+                except queue.Empty:
+                    oge = None
+            if parti:
+                veri = b"".join(parti)
+                self._f.write(veri)
+                self.yazilan_mesaj += len(parti) // 2
+                self.yazilan_bayt += len(veri)
+                self.en_buyuk_parti = max(self.en_buyuk_parti, len(parti) // 2)
+            simdi = time.monotonic()
+            if simdi - son_bosaltma >= self.bosaltma_araligi:
+                self._f.flush()
+                son_bosaltma = simdi
+        self._f.close()
@@ -0,0 +1,203 @@
+"""Paylaşılan MAVLink telemetri merkezi.
+
+Bir seri port aynı anda iki kez açılamaz ve ``recv_match(type=...)`` istenmeyen
+mesajları çöpe atar. Bu yüzden bağlantıyı tek bir okuma iş parçacığı açar,
+her mesajı bir kez çözer ve mesaj tipine göre bir arama tablosu üzerinden tüm
+abonelere dağıtır.
+"""
+import threading
+import time
+
+from pymavlink import mavutil
+
+from .hiz import HizYoneticisi
+
+
+class Abone:
+    """Merkeze kayıtlı tek bir tüketici.
+
+    ``tipler`` boşsa tüm mesajları alır. ``filtre`` verilirse mesaj ancak
+    ``filtre(msg)`` doğru döndüğünde iletilir (ör. sistem kimliğine göre).
+    """
+
+    def __init__(self, geri_cagirma, tipler=None, filtre=None, ad=None):
+        self.geri_cagirma = geri_cagirma
+        self.tipler = frozenset(tipler) if tipler else None
+        self.filtre = filtre
+        self.ad = ad or getattr(geri_cagirma, "__qualname__", repr(geri_cagirma))
+        self.teslim = 0
+        self.filtrelenen = 0
+        self.hata = 0
+
+    def ilet(self, msg):
+        if self.filtre is not None and not self.filtre(msg):
+            self.filtrelenen += 1
+            return
+        try:
+            self.geri_cagirma(msg)
+            self.teslim += 1
+        except Exception as e:
+            self.hata += 1
+            if self.hata == 1:
+                print(f"Abone hatası ({self.ad}): {e}")
+
+    def istatistik(self):
+        return {"ad": self.ad, "teslim": self.teslim, "filtrelenen": self.filtrelenen, "hata": self.hata}
+
+
+class TelemetriMerkezi:
+    """Bağlantının tek sahibi; mesajları tipe göre abonelere dağıtır.
+
+    ``baglanti`` verilirse port açılmaz; ``recv_match`` ve ``wait_heartbeat``
+    sunan herhangi bir nesne (ör. kayıt oynatıcı) kullanılabilir.
+    """
+
+    _paylasilanlar = {}
+    _paylasilan_kilit = threading.Lock()
+
+    def __init__(self, port=None, baud=115200, baglanti=None, hiz_penceresi=1.0):
+        self.port = port
+        self.baud = baud
+        self.baglanti = baglanti
+        self.calisiyor = False
+        self.bagli = False
+        self._thread = None
+        self._kilit = threading.Lock()
+        self._aboneler = []
+        self._tablo = {}
+        self._herkes = ()
+        self._baglanti_dinleyicileri = []
+        self._referans = 0
+        # Tip başına mesaj hızı ölçümü
+        self.hiz_penceresi = hiz_penceresi
+        self.toplam = {}
+        self.mesaj_hz = {}
+        self._pencere_sayac = {}
+        self._pencere_bas = time.monotonic()
+        # Panellerin mesaj hızı istekleri
+        self.hiz = HizYoneticisi(self)
+
+    # ---------------------- Paylaşım ----------------------
+    @classmethod
+    def paylasilan(cls, port, baud=115200, baglanti=None):
+        """Aynı port için süreç içinde tek bir merkez döndürür ve başlatır.
+
+        Her çağrı ``birak`` ile eşlenmelidir; son kullanıcı bıraktığında
+        bağlantı kapanır. ``baglanti`` yalnızca merkez ilk kez kurulurken
+        kullanılır (ör. ``TekrarOynatici``).
+        """
+        with cls._paylasilan_kilit:
+            merkez = cls._paylasilanlar.get(port)
+            if merkez is None:
+                merkez = cls(port, baud, baglanti)
+                cls._paylasilanlar[port] = merkez
+                merkez.baslat()
+            merkez._referans += 1
+            return merkez
+
+    def birak(self):
+        with self._paylasilan_kilit:
+            self._referans -= 1
+            if self._referans > 0:
+                return
+            if self._paylasilanlar.get(self.port) is self:
+                del self._paylasilanlar[self.port]
+        self.durdur()
+
+    # ---------------------- Abonelik ----------------------
+    def abone_ol(self, geri_cagirma, tipler=None, filtre=None, ad=None):
+        """``geri_cagirma(msg)`` okuma iş parçacığında çağrılır; kısa tutulmalıdır."""
+        abone = Abone(geri_cagirma, tipler, filtre, ad)
+        with self._kilit:
+            self._aboneler.append(abone)
+            self._tabloyu_kur()
+        return abone
+
+    def abonelikten_cik(self, abone):
+        with self._kilit:
+            if abone in self._aboneler:
+                self._aboneler.remove(abone)
+                self._tabloyu_kur()
+
+    def _tabloyu_kur(self):
+        # Okuma iş parçacığı kilit almadan okur; tablo her seferinde yeniden
+        # kurulup tek atamayla değiştirilir.
+        herkes = tuple(a for a in self._aboneler if a.tipler is None)
+        tipler = set().union(*(a.tipler for a in self._aboneler if a.tipler is not None))
+        self._tablo = {
+            tip: tuple(a for a in self._aboneler if a.tipler is None or tip in a.tipler)
+            for tip in tipler
+        }
+        self._herkes = herkes
+
+    def baglandiginda(self, geri_cagirma):
+        """Heartbeat alındıktan sonra ``geri_cagirma(baglanti)`` çağrılır."""
+        with self._kilit:
+            self._baglanti_dinleyicileri.append(geri_cagirma)
+            bagli = self.bagli
+        if bagli:
+            geri_cagirma(self.baglanti)
+
+    # ---------------------- Dağıtım ----------------------
+    def dagit(self, msg):
+        """Mesajı ilgili abonelere iletir ve hız sayaçlarını günceller."""
+        tip = msg.get_type()
+        if tip == 'BAD_DATA':
+            return
+        self.toplam[tip] = self.toplam.get(tip, 0) + 1
+        self._pencere_sayac[tip] = self._pencere_sayac.get(tip, 0) + 1
+        simdi = time.monotonic()
+        gecen = simdi - self._pencere_bas
+        if gecen >= self.hiz_penceresi:
+            self.mesaj_hz = {t: s / gecen for t, s in self._pencere_sayac.items()}
+            self._pencere_sayac = {}
+            self._pencere_bas = simdi
+        for abone in self._tablo.get(tip, self._herkes):
+            abone.ilet(msg)
+
+    def istatistik(self):
+        return {
+            "mesaj_hz": dict(self.mesaj_hz),
+            "toplam": dict(self.toplam),
+            "aboneler": [a.istatistik() for a in list(self._aboneler)],
+            "istenen_hz": self.hiz.istenen(),
+        }
+
+    # ---------------------- Okuma iş parçacığı ----------------------
+    def baslat(self):
+        self.calisiyor = True
+        self._thread = threading.Thread(target=self._calis, name="TelemetriMerkezi", daemon=True)
+        self._thread.start()
+        return self
+
+    def durdur(self):
+        self.calisiyor = False
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        if self.baglanti is not None and hasattr(self.baglanti, "close"):
+            self.baglanti.close()
+
+    def _calis(self):
+        try:
+            if self.baglanti is None:
+                self.baglanti = mavutil.mavlink_connection(self.port, baud=self.baud)
+            heartbeat = None
+            while self.calisiyor and heartbeat is None:
+                heartbeat = self.baglanti.wait_heartbeat(timeout=1)
+            if not self.calisiyor:
+                return
+            with self._kilit:
+                self.bagli = True
+                dinleyiciler = list(self._baglanti_dinleyicileri)
+            print("Pixhawk bağlantısı kuruldu!")
+            for geri_cagirma in dinleyiciler:
+                geri_cagirma(self.baglanti)
+            self.dagit(heartbeat)
+            while self.calisiyor:
+                msg = self.baglanti.recv_match(blocking=True, timeout=1)
+                if msg is not None:
+                    self.dagit(msg)
+        except Exception as e:
+            print(f"Pixhawk bağlantı hatası: {e}")
+        finally:
+            self.bagli = False
@@ -0,0 +1,172 @@
+"""Uçuş oturumlarını SQLite'ta saklayan kayıt deposu.
+
+``OturumDeposu`` çözücünün kayıtlarını (tutum, konum, hız) arayüz dizinindeki
+``ucuslar.db``'ye yazar (giriş sayfasının ``database.db``'si depoda izlenir,
+ona dokunulmaz): her bağlantı ``oturumlar``'da bir satır, her kayıt kanal
+tablosunda oturum numarasıyla bir satırdır. Dinleyici yöntemleri yalnızca
+kuyruğa ekler; yazma ayrı bir iş parçacığında, ``aralik`` saniyede ya da
+``parti`` kayıtta bir, tek işlemde (transaction) yapılır.
+
+Dosya WAL kipindedir: okuyucular (``OturumOkuyucu``) yazıcıyı beklemez,
+yazıcı da onları. Kanal tablolarındaki ``(oturum, zaman)`` dizini
+sayesinde bir oturumun zaman penceresi tablo boyundan bağımsız, dizin aralık
+taramasıyla ve zaten sıralı okunur.
+"""
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from .cozucu import HizKaydi, KayitDinleyici, KonumKaydi, TutumKaydi
+
+# Çalışma dizininden bağımsız: paketin bulunduğu arayüz dizininde
+VARSAYILAN_DOSYA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "ucuslar.db")
+
+# Tablo: kayıt tipi; sütunlar oturum + kayıt alanları, aynı ad ve sırada
+TABLOLAR = {"tutum": TutumKaydi, "konum": KonumKaydi, "hiz": HizKaydi}
+
+_BITTI = object()
+
+
+def _sema():
+    komutlar = ["""CREATE TABLE IF NOT EXISTS oturumlar (
+        id INTEGER PRIMARY KEY, baslangic REAL NOT NULL, bitis REAL, kaynak TEXT,
+        kayit_sayisi INTEGER NOT NULL DEFAULT 0)"""]
+    for tablo, tip in TABLOLAR.items():
+        alanlar = ", ".join(f"{alan} REAL" for alan in tip._fields[2:])
+        komutlar.append(f"CREATE TABLE IF NOT EXISTS {tablo} (oturum INTEGER NOT NULL REFERENCES oturumlar (id), "
+                        f"zaman REAL NOT NULL, sistem INTEGER, {alanlar})")
+        komutlar.append(f"CREATE INDEX IF NOT EXISTS {tablo}_oturum_zaman ON {tablo} (oturum, zaman)")
+    return ";\n".join(komutlar) + ";"
+
+
+_EKLE = {tablo: f"INSERT INTO {tablo} VALUES ({', '.join('?' * (1 + len(tip._fields)))})"
+         for tablo, tip in TABLOLAR.items()}
+
+
+def baglan(dosya=VARSAYILAN_DOSYA, check_same_thread=True):
+    """WAL kipinde bağlantı açar ve tabloları (yoksa) kurar."""
+    baglanti = sqlite3.connect(dosya, check_same_thread=check_same_thread)
+    baglanti.execute("PRAGMA journal_mode=WAL")
+    baglanti.execute("PRAGMA synchronous=NORMAL")
+    baglanti.executescript(_sema())
+    return baglanti
+
+
+class OturumDeposu(KayitDinleyici):
+    """Kayıtları yeni bir oturum olarak ``dosya``'ya yazar.
+
+    ``Cozucu``'ya dinleyici olarak eklenir; ``baslat`` oturum satırını açar ve
+    yazıcıyı başlatır, ``durdur`` kuyruktakileri yazıp oturumu kapatır.
+    Zamanı olmayan kayda kuyruğa girdiği an yazılır.
+    """
+
+    def __init__(self, dosya=VARSAYILAN_DOSYA, kaynak=None, parti=4096, aralik=0.5):
+        self.dosya = dosya
+        self.kaynak = kaynak
+        self.parti = parti
+        self.aralik = aralik
+        self.oturum = None
+        self.yazilan = dict.fromkeys(TABLOLAR, 0)
+        self.islem = 0
+        self.en_buyuk_parti = 0
+        self._kuyruk = queue.SimpleQueue()
+        self._thread = None
+
+    def baslat(self):
+        # Bağlantı bundan sonra yalnızca yazıcı iş parçacığında kullanılır
+        self._baglanti = baglan(self.dosya, check_same_thread=False)
+        with self._baglanti:
+            self.oturum = self._baglanti.execute(
+                "INSERT INTO oturumlar (baslangic, kaynak) VALUES (?, ?)", (time.time(), self.kaynak)).lastrowid
+        self._thread = threading.Thread(target=self._yaz, name="OturumDeposu", daemon=True)
+        self._thread.start()
+        return self
+
+    def _ekle(self, tablo, kayit):
+        if kayit.zaman is None:
+            kayit = kayit._replace(zaman=time.time())
+        self._kuyruk.put((tablo, kayit))
+
+    def tutum(self, kayit, msg):
+        self._ekle("tutum", kayit)
+
+    def konum(self, kayit, msg):
+        self._ekle("konum", kayit)
+
+    def hiz(self, kayit, msg):
+        self._ekle("hiz", kayit)
+
+    def durdur(self):
+        if self._thread is not None:
+            self._kuyruk.put(_BITTI)
+            self._thread.join()
+            self._thread = None
+
+    def istatistik(self):
+        return {
+            "dosya": self.dosya,
+            "oturum": self.oturum,
+            "yazilan": dict(self.yazilan),
+            "islem": self.islem,
+            "kuyruk": self._kuyruk.qsize(),
+            "en_buyuk_parti": self.en_buyuk_parti,
+        }
+
+    def _yaz(self):
+        bitti = False
+        while not bitti:
+            satirlar = {tablo: [] for tablo in TABLOLAR}
+            adet = 0
+            # İlk kayıttan sonra en çok ``aralik`` saniye ya da ``parti`` kayıt biriktirilir
+            son = None
+            while adet < self.parti:
+                try:
+                    kalan = self.aralik if son is None else max(0.0, son - time.monotonic())
+                    oge = self._kuyruk.get(timeout=kalan)
+                except queue.Empty:
+                    break
+                if oge is _BITTI:
+                    bitti = True
+                    break
+                tablo, kayit = oge
+                satirlar[tablo].append((self.oturum, *kayit))
+                adet += 1
+                if son is None:
+                    son = time.monotonic() + self.aralik
+            if adet:
+                with self._baglanti:
+                    for tablo, parti in satirlar.items():
+                        if parti:
+                            self._baglanti.executemany(_EKLE[tablo], parti)
+                            self.yazilan[tablo] += len(parti)
+                self.islem += 1
+                self.en_buyuk_parti = max(self.en_buyuk_parti, adet)
+        with self._baglanti:
+            self._baglanti.execute("UPDATE oturumlar SET bitis = ?, kayit_sayisi = ? WHERE id = ?",
+                                   (time.time(), sum(self.yazilan.values()), self.oturum))
+        self._baglanti.close()
+
+
+class OturumOkuyucu:
+    """Kayıtlı oturumları ve zaman pencerelerini okur; bağlantı oluşturan iş parçacığınındır."""
+
+    def __init__(self, dosya=VARSAYILAN_DOSYA):
+        self._baglanti = baglan(dosya)
+
+    def oturumlar(self):
+        """(id, baslangic, bitis, kaynak, kayit_sayisi) satırları, yeniden eskiye."""
+        return self._baglanti.execute(
+            "SELECT id, baslangic, bitis, kaynak, kayit_sayisi FROM oturumlar ORDER BY id DESC").fetchall()
+
+    def pencere(self, oturum, tablo, t0=None, t1=None):
+        """Oturumun ``t0 <= zaman <= t1`` kayıtları, zaman sırasıyla ve kayıt tipinde."""
+        tip = TABLOLAR[tablo]
+        satirlar = self._baglanti.execute(
+            f"SELECT {', '.join(tip._fields)} FROM {tablo} WHERE oturum = ? AND zaman BETWEEN ? AND ? ORDER BY zaman",
+            (oturum, float("-inf") if t0 is None else t0, float("inf") if t1 is None else t1))
+        return list(map(tip._make, satirlar))
+
+    def kapat(self):
+        self._baglanti.close()
@@ -0,0 +1,228 @@
+"""Yerel UDP üzerinden MAVLink konuşan sanal araç.
+
+``SanalArac`` bir veya birden çok sistem kimliği için ``SentetikUcus``
+mesajlarını istenen hızlarda (yüzlerce Hz'e kadar) bir UDP adresine gönderir.
+Yer istasyonu tarafı seri Pixhawk yerine ``udpin:127.0.0.1:14550`` ile
+bağlanır. Paket kaybı ve zamanlama titremesi ayarlanabilir; kayıp paketler
+sıra numarasında boşluk bırakır, böylece alıcı tarafında da sayılabilir.
+
+Araç gelen ``SET_MESSAGE_INTERVAL`` komutlarını uygulayıp ``COMMAND_ACK``
+döndürür, ``REQUEST_DATA_STREAM`` ile durdurulan akışları keser; hız
+yöneticisi gerçek araçtaki gibi sınanabilir.
+
+Kullanım: python -m telemetri.sanal_arac --hedef 127.0.0.1:14550 \\
+    --hiz ATTITUDE=200 GPS_RAW_INT=10 --sistem 1 2 --kayip 0.01 --titreme 0.002
+"""
+import argparse
+import heapq
+import random
+import select
+import socket
+import threading
+import time
+
+from pymavlink import mavutil
+
+from .sentetik import VARSAYILAN_HIZLAR, SentetikUcus
+
+mavlink = mavutil.mavlink
+
+
+class SanalArac:
+    """Sentetik uçuşları MAVLink/UDP olarak yayınlayan iş parçacığı."""
+
+    def __init__(self, hedef=("127.0.0.1", 14550), hizlar=None, sistemler=(1,),
+                 kayip=0.0, titreme=0.0, tohum=None):
+        self.hedef = hedef
+        self.varsayilan = dict(hizlar or VARSAYILAN_HIZLAR)
+        self.sistemler = tuple(sistemler)
+        self.kayip = kayip
+        self.titreme = titreme
+        self.calisiyor = False
+        self.gonderilen = {}
+        self.dusurulen = 0
+        self.komut = 0
+        self.en_buyuk_gecikme = 0.0
+        self._rastgele = random.Random(tohum)
+        self._mav = {s: mavlink.MAVLink(None, srcSystem=s, srcComponent=1) for s in self.sistemler}
+        self._ucus = {s: SentetikUcus(lat0=39.93 + 0.002 * i) for i, s in enumerate(self.sistemler)}
+        self._cozucu = mavlink.MAVLink(None)
+        self._cozucu.robust_parsing = True
+        self._hizlar = {(s, tip): hz for s in self.sistemler for tip, hz in self.varsayilan.items()}
+        self._nesil = {}
+        self._degisen = []
+        self._kilit = threading.Lock()
+        self._thread = None
+        self._soket = None
+
+    # ---------------------- Denetim ----------------------
+    def baslat(self):
+        self._soket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._soket.bind(("127.0.0.1", 0))
+        self._soket.setblocking(False)
+        self.calisiyor = True
+        self._thread = threading.Thread(target=self._calis, name="SanalArac", daemon=True)
+        self._thread.start()
+        return self
+
+    def durdur(self):
+        self.calisiyor = False
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self._soket is not None:
+            self._soket.close()
+            self._soket = None
+
+    def hiz_ayarla(self, tip, hz, sistem=None):
+        """``tip`` mesajının hızını değiştirir (0: kapat); ``sistem`` None ise hepsi."""
+        with self._kilit:
+            for s in self.sistemler if sistem is None else (sistem,):
+                self._hizlar[(s, tip)] = hz
+                self._degisen.append((s, tip))
+
+    def hizlar(self, sistem=None):
+        with self._kilit:
+            s = sistem or self.sistemler[0]
+            return {tip: hz for (sis, tip), hz in self._hizlar.items() if sis == s}
+
+    def istatistik(self):
+        return {
+            "gonderilen": dict(self.gonderilen),
+            "dusurulen": self.dusurulen,
+            "komut": self.komut,
+            "en_buyuk_gecikme_ms": round(1000 * self.en_buyuk_gecikme, 3),
+        }
+
+    # ---------------------- Gönderim döngüsü ----------------------
+    def _calis(self):
+        baslangic = time.monotonic()
+        yigin = []
+        sira = 0
+        with self._kilit:
+            self._degisen = list(self._hizlar)
+        while self.calisiyor:
+            # Hızı değişen akışlar eski kayıtları geçersiz kılınarak yeniden planlanır
+            with self._kilit:
+                degisen, self._degisen = self._degisen, []
+                for anahtar in degisen:
+                    nesil = self._nesil.get(anahtar, 0) + 1
+                    self._nesil[anahtar] = nesil
+                    hz = self._hizlar.get(anahtar, 0)
+                    if hz > 0:
+                        ideal = time.monotonic() - baslangic
+                        heapq.heappush(yigin, (ideal, sira, anahtar, nesil, ideal, hz))
+                        sira += 1
+            simdi = time.monotonic() - baslangic
+            while yigin and yigin[0][0] <= simdi:
+                zaman, _, anahtar, nesil, ideal, hz = heapq.heappop(yigin)
+                if nesil != self._nesil.get(anahtar):
+                    continue
+                self.en_buyuk_gecikme = max(self.en_buyuk_gecikme, simdi - zaman)
+                self._gonder(anahtar, simdi)
+                ideal += 1.0 / hz
+                zaman = ideal + (self._rastgele.uniform(0, self.titreme) if self.titreme else 0.0)
+                heapq.heappush(yigin, (zaman, sira, anahtar, nesil, ideal, hz))
+                sira += 1
+            bekle = 0.1
+            if yigin:
+                bekle = min(bekle, max(0.0, yigin[0][0] - (time.monotonic() - baslangic)))
+            hazir, _, _ = select.select([self._soket], [], [], bekle)
+            if hazir:
+                self._komutlari_oku()
+
+    def _gonder(self, anahtar, t):
+        sistem, tip = anahtar
+        # Kayıp paket de paketlenir; sıra numarası ilerler ve boşluk kalır
+        cerceve = self._ucus[sistem].mesaj(tip, t).pack(self._mav[sistem])
+        if self.kayip and self._rastgele.random() < self.kayip:
+            self.dusurulen += 1
+            return
+        try:
+            self._soket.sendto(cerceve, self.hedef)
+        except OSError:
+            self.dusurulen += 1
+            return
+        self.gonderilen[tip] = self.gonderilen.get(tip, 0) + 1
+
+    # ---------------------- Gelen komutlar ----------------------
+    def _komutlari_oku(self):
+        while True:
+            try:
+                veri, _ = self._soket.recvfrom(65535)
+            except (BlockingIOError, OSError):
+                return
+            for msg in self._cozucu.parse_buffer(veri) or ():
+                if msg.get_type() == 'COMMAND_LONG':
+                    self._komut_uygula(msg)
+                elif msg.get_type() == 'REQUEST_DATA_STREAM':
+                    self._akis_istegi(msg)
+
+    def _hedef_sistemler(self, hedef):
+        return self.sistemler if hedef == 0 else tuple(s for s in self.sistemler if s == hedef)
+
+    def _komut_uygula(self, msg):
+        if msg.command != mavlink.MAV_CMD_SET_MESSAGE_INTERVAL:
+            return
+        self.komut += 1
+        sinif = mavlink.mavlink_map.get(int(msg.param1))
+        tip = sinif.msgname if sinif is not None else None
+        sonuc = mavlink.MAV_RESULT_ACCEPTED
+        if tip not in VARSAYILAN_HIZLAR:
+            sonuc = mavlink.MAV_RESULT_UNSUPPORTED
+        for sistem in self._hedef_sistemler(msg.target_system):
+            if sonuc == mavlink.MAV_RESULT_ACCEPTED:
+                aralik = msg.param2
+                if aralik < 0:
+                    hz = 0
+                elif aralik == 0:
+                    hz = self.varsayilan.get(tip, VARSAYILAN_HIZLAR[tip])
+                else:
+                    hz = 1e6 / aralik
+                self.hiz_ayarla(tip, hz, sistem)
+            self._soket.sendto(
+                mavlink.MAVLink_command_ack_message(msg.command, sonuc).pack(self._mav[sistem]),
+                self.hedef)
+
+    def _akis_istegi(self, msg):
+        # ArduPilot gibi: toplu akış durdurulunca HEARTBEAT dışındaki mesajlar kesilir
+        if msg.start_stop or msg.req_stream_id != mavlink.MAV_DATA_STREAM_ALL:
+            return
+        for sistem in self._hedef_sistemler(msg.target_system):
+            for tip in VARSAYILAN_HIZLAR:
+                if tip != 'HEARTBEAT':
+                    self.hiz_ayarla(tip, 0, sistem)
+
+
+def _hiz_coz(metin):
+    tip, hz = metin.split("=")
+    return tip.upper(), float(hz)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UDP üzerinden sanal MAVLink aracı")
+    parser.add_argument("--hedef", default="127.0.0.1:14550", help="yer istasyonunun udpin adresi")
+    parser.add_argument("--hiz", nargs="*", type=_hiz_coz, default=[], metavar="TIP=HZ")
+    parser.add_argument("--sistem", nargs="+", type=int, default=[1])
+    parser.add_argument("--kayip", type=float, default=0.0, help="paket kaybı oranı (0-1)")
+    parser.add_argument("--titreme", type=float, default=0.0, help="en fazla gönderim gecikmesi (s)")
+    parser.add_argument("--sure", type=float, help="bu kadar saniye sonra dur")
+    args = parser.parse_args()
+
+    adres, port = args.hedef.rsplit(":", 1)
+    hizlar = dict(VARSAYILAN_HIZLAR, **dict(args.hiz))
+    arac = SanalArac((adres, int(port)), hizlar, args.sistem, args.kayip, args.titreme).baslat()
+    print(f"Sanal araç {args.hedef} adresine yayın yapıyor: {hizlar}")
+    bitis = None if args.sure is None else time.monotonic() + args.sure
+    try:
+        while bitis is None or time.monotonic() < bitis:
+            time.sleep(min(5.0, 5.0 if bitis is None else max(0.0, bitis - time.monotonic())))
+            print(arac.istatistik())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        arac.durdur()
+
+
+if __name__ == "__main__":
+    main()
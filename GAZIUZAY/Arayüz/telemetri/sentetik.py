@@ -0,0 +1,92 @@
+"""Donanımsız deneme için sentetik uçuş modeli.
+
+``SentetikUcus`` sabit yarıçaplı bir daire üzerinde hafif yunuslama ve
+irtifa salınımıyla uçan bir uçağın HEARTBEAT, ATTITUDE, GPS_RAW_INT ve
+VFR_HUD mesajlarını herhangi bir ``t`` anı için üretir. Aynı ``t`` her zaman
+aynı mesajı verir; kıyaslamalar ve tekrar dosyaları bu sayede tekrarlanabilir.
+"""
+import heapq
+import math
+import time
+
+from pymavlink import mavutil
+
+mavlink = mavutil.mavlink
+
+VARSAYILAN_HIZLAR = {'HEARTBEAT': 1, 'ATTITUDE': 50, 'VFR_HUD': 10, 'GPS_RAW_INT': 5}
+_DERECE_METRE = 111320.0
+
+
+class SentetikUcus:
+    """Daire çizen bir uçağın zamana bağlı durumu."""
+
+    def __init__(self, lat0=39.93, lon0=32.85, yaricap=200.0, hiz=20.0, irtifa=100.0):
+        self.lat0 = lat0
+        self.lon0 = lon0
+        self.yaricap = yaricap
+        self.hiz = hiz
+        self.irtifa = irtifa
+        self.acisal_hiz = hiz / yaricap  # rad/s
+
+    def durum(self, t):
+        aci = self.acisal_hiz * t
+        kuzey = self.yaricap * math.sin(aci)
+        dogu = self.yaricap * (1 - math.cos(aci))
+        # Saat yönünde dönüş: rota açıyla birlikte artar, uçak sağa yatıktır
+        rota = aci % (2 * math.pi)
+        return {
+            "lat": self.lat0 + kuzey / _DERECE_METRE,
+            "lon": self.lon0 + dogu / (_DERECE_METRE * math.cos(math.radians(self.lat0))),
+            "alt": self.irtifa + 10 * math.sin(0.1 * t),
+            "climb": math.cos(0.1 * t),
+            "roll": math.atan(self.hiz * self.acisal_hiz / 9.81) + 0.05 * math.sin(1.3 * t),
+            "pitch": 0.05 * math.sin(0.7 * t) + 0.1 * math.cos(0.1 * t),
+            "yaw": rota,
+        }
+
+    def mesaj(self, tip, t):
+        """``t`` saniyesindeki ``tip`` mesajını üretir."""
+        d = self.durum(t)
+        ms = int(t * 1000) & 0xFFFFFFFF
+        if tip == 'HEARTBEAT':
+            return mavlink.MAVLink_heartbeat_message(
+                mavlink.MAV_TYPE_FIXED_WING, mavlink.MAV_AUTOPILOT_ARDUPILOTMEGA,
+                mavlink.MAV_MODE_FLAG_CUSTOM_MODE_ENABLED, 10, mavlink.MAV_STATE_ACTIVE, 3)
+        if tip == 'ATTITUDE':
+            return mavlink.MAVLink_attitude_message(
+                ms, d["roll"], d["pitch"], d["yaw"] - (2 * math.pi if d["yaw"] > math.pi else 0),
+                0.0, 0.0, self.acisal_hiz)
+        if tip == 'GPS_RAW_INT':
+            return mavlink.MAVLink_gps_raw_int_message(
+                int(t * 1e6), 3, int(d["lat"] * 1e7), int(d["lon"] * 1e7), int(d["alt"] * 1000),
+                80, 120, int(self.hiz * 100), int(math.degrees(d["yaw"]) * 100), 14)
+        if tip == 'VFR_HUD':
+            return mavlink.MAVLink_vfr_hud_message(
+                self.hiz, self.hiz, int(math.degrees(d["yaw"])), 55, d["alt"], d["climb"])
+        raise ValueError(f"Desteklenmeyen mesaj tipi: {tip}")
+
+
+def zamanlama(hizlar, sure=None):
+    """{tip: Hz} için (t, tip) çiftlerini zaman sırasıyla üretir."""
+    yigin = [(0.0, tip, 0) for tip, hz in sorted(hizlar.items()) if hz > 0]
+    heapq.heapify(yigin)
+    while yigin:
+        t, tip, sira = heapq.heappop(yigin)
+        if sure is not None and t > sure:
+            return
+        yield t, tip
+        heapq.heappush(yigin, ((sira + 1) / hizlar[tip], tip, sira + 1))
+
+
+def tlog_yaz(dosya, sure, hizlar=None, sysid=1, baslangic=None, ucus=None):
+    """``sure`` saniyelik sentetik uçuşu tlog dosyasına yazar; mesaj sayısını döndürür."""
+    ucus = ucus or SentetikUcus()
+    baslangic = time.time() if baslangic is None else baslangic
+    mav = mavlink.MAVLink(None, srcSystem=sysid, srcComponent=1)
+    adet = 0
+    with open(dosya, "wb", buffering=1024 * 1024) as f:
+        for t, tip in zamanlama(hizlar or VARSAYILAN_HIZLAR, sure):
+            f.write(int((baslangic + t) * 1e6).to_bytes(8, "big"))
+            f.write(ucus.mesaj(tip, t).pack(mav))
+            adet += 1
+    return adet
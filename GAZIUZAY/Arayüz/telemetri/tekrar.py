@@ -0,0 +1,185 @@
+"""Kayıtlı uçuşları canlı bağlantı yerine oynatan kaynak.
+
+``TekrarOynatici`` bir tlog dosyasını (``UcusKaydedici`` çıktısı dahil) bir kez
+tarayıp her çerçevenin zaman damgası ve konumunu dizilerde tutar; mesajlar
+oynatıldıkça çözülür. Nesne ``wait_heartbeat``/``recv_match``/``mav`` sunduğu
+için ``TelemetriMerkezi``'ne seri bağlantı yerine verilebilir, böylece paneller
+donanım olmadan aynı sinyallerle beslenir.
+
+Hız 1× gerçek zamanlıdır; ``hiz=20`` yirmi kat hızlı, ``hiz=0`` bekleme
+olmadan oynatır. Oynatma duraklatılabilir, istenen saniyeye atlanabilir ve
+başa sarılarak döngüye alınabilir. Mesaj sırası her oynatmada aynıdır.
+"""
+import bisect
+import struct
+import threading
+import time
+from array import array
+
+from pymavlink import mavutil
+
+_V1, _V2 = 0xFE, 0xFD
+
+
+class _BosYazici:
+    """Tekrar sırasında panellerin gönderdiği komutları yutar."""
+
+    def write(self, veri):
+        pass
+
+
+def tlog_indeksle(veri):
+    """tlog baytlarından (zaman damgaları, başlangıç, uzunluk) dizilerini üretir.
+
+    Bozuk bölümler atlanır; zaman damgası bir önceki çerçeveden üç günden fazla
+    sapan kayıtlar geçersiz sayılır.
+    """
+    zamanlar, baslar, uzunluklar = array('d'), array('Q'), array('I')
+    i, n = 0, len(veri)
+    son_zaman = None
+    while i + 10 <= n:
+        stx = veri[i + 8]
+        if stx == _V1:
+            uzunluk = veri[i + 9] + 8
+        elif stx == _V2:
+            uzunluk = veri[i + 9] + 12 + (13 if veri[i + 10] & 0x01 else 0)
+        else:
+            i += 1
+            continue
+        zaman = struct.unpack_from(">Q", veri, i)[0] * 1e-6
+        if i + 8 + uzunluk > n or (son_zaman is not None and abs(zaman - son_zaman) > 3 * 24 * 3600):
+            i += 1
+            continue
+        zamanlar.append(zaman)
+        baslar.append(i + 8)
+        uzunluklar.append(uzunluk)
+        son_zaman = zaman
+        i += 8 + uzunluk
+    return zamanlar, baslar, uzunluklar
+
+
+class TekrarOynatici:
+    """tlog dosyasını canlı bir MAVLink bağlantısı gibi oynatır."""
+
+    def __init__(self, dosya, hiz=1.0, dongu=False):
+        self.dosya = dosya
+        with open(dosya, "rb") as f:
+            self._veri = f.read()
+        self._zamanlar, self._baslar, self._uzunluklar = tlog_indeksle(self._veri)
+        if not self._zamanlar:
+            raise ValueError(f"{dosya}: MAVLink çerçevesi bulunamadı")
+        self.mav = mavutil.mavlink.MAVLink(_BosYazici(), srcSystem=255, srcComponent=0)
+        self.mav.robust_parsing = True
+        self.target_system = 1
+        self.target_component = 1
+        self.hiz = hiz
+        self.dongu = dongu
+        self.duraklatildi = False
+        self.bitti = False
+        self.oynatilan = 0
+        self._sira = 0
+        self._kosul = threading.Condition()
+        self._capala()
+
+    # ---------------------- Bilgi ----------------------
+    def __len__(self):
+        return len(self._zamanlar)
+
+    @property
+    def sure(self):
+        """Kaydın toplam süresi (saniye)."""
+        return self._zamanlar[-1] - self._zamanlar[0]
+
+    @property
+    def konum(self):
+        """Kayıt başından itibaren oynatma konumu (saniye)."""
+        sira = min(self._sira, len(self._zamanlar) - 1)
+        return self._zamanlar[sira] - self._zamanlar[0]
+
+    # ---------------------- Denetim ----------------------
+    def _capala(self):
+        # Duvar saati ile kayıt saati arasındaki eşleme; hız, konum veya
+        # duraklatma değiştiğinde yeniden kurulur.
+        self._capa_duvar = time.monotonic()
+        self._capa_kayit = self._zamanlar[min(self._sira, len(self._zamanlar) - 1)]
+
+    def hiz_ayarla(self, hiz):
+        with self._kosul:
+            self.hiz = hiz
+            self._capala()
+            self._kosul.notify_all()
+
+    def duraklat(self):
+        with self._kosul:
+            self.duraklatildi = True
+            self._kosul.notify_all()
+
+    def devam(self):
+        with self._kosul:
+            self.duraklatildi = False
+            self._capala()
+            self._kosul.notify_all()
+
+    def ara(self, saniye):
+        """Kayıt başından ``saniye`` sonrasına atlar."""
+        with self._kosul:
+            hedef = self._zamanlar[0] + max(0.0, saniye)
+            self._sira = bisect.bisect_left(self._zamanlar, hedef)
+            self.bitti = self._sira >= len(self._zamanlar)
+            if not self.bitti:
+                self._capala()
+            self._kosul.notify_all()
+
+    # ---------------------- mavfile arayüzü ----------------------
+    def _coz(self, sira):
+        bas = self._baslar[sira]
+        msg = self.mav.parse_char(self._veri[bas:bas + self._uzunluklar[sira]])
+        if msg is not None:
+            msg._timestamp = self._zamanlar[sira]
+        return msg
+
+    def recv_match(self, blocking=True, timeout=None, type=None):
+        """Sıradaki mesajı zamanı geldiğinde döndürür; süre dolarsa None."""
+        son_an = None if timeout is None else time.monotonic() + timeout
+        with self._kosul:
+            while True:
+                if self._sira >= len(self._zamanlar):
+                    if self.dongu:
+                        self._sira = 0
+                        self._capala()
+                    else:
+                        self.bitti = True
+                if self.duraklatildi or self.bitti:
+                    bekle = None
+                else:
+                    bekle = 0.0
+                    if self.hiz:
+                        zamani = self._capa_duvar + (self._zamanlar[self._sira] - self._capa_kayit) / self.hiz
+                        bekle = zamani - time.monotonic()
+                if bekle is not None and bekle <= 0:
+                    msg = self._coz(self._sira)
+                    self._sira += 1
+                    if msg is None or (type is not None and msg.get_type() != type):
+                        continue
+                    self.oynatilan += 1
+                    return msg
+                if not blocking:
+                    return None
+                if son_an is not None:
+                    kalan = son_an - time.monotonic()
+                    if kalan <= 0:
+                        return None
+                    bekle = kalan if bekle is None else min(bekle, kalan)
+                self._kosul.wait(bekle)
+
+    def wait_heartbeat(self, blocking=True, timeout=None):
+        msg = self.recv_match(blocking=blocking, timeout=timeout, type='HEARTBEAT')
+        if msg is not None:
+            self.target_system = msg.get_srcSystem()
+            self.target_component = msg.get_srcComponent()
+        return msg
+
+    def close(self):
+        with self._kosul:
+            self.bitti = True
+            self._kosul.notify_all()
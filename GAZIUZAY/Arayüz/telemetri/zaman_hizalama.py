@@ -0,0 +1,262 @@
+"""Kamera kareleri ile telemetriyi ortak saatte eşleyen zaman indeksi.
+
+Kareler yakalandıkları anda ``time.monotonic`` ile damgalanır (``Kare.zaman``).
+MAVLink mesajlarının alış zamanı (``msg._timestamp``) duvar saatidir; bu zaman
+monotonik saate çevrilir. Mesajda otopilot zaman damgası varsa bağlantı ve
+kuyruk titremesi ``SaatEslestirici`` ile ayıklanır: mesaj, otopilot saatine göre
+en az gecikmeyle gelseydi alınacağı ana yerleştirilir.
+
+Her akış sıralı, dizi tabanlı bir ``ZamanDizisi``'dir; en yakın ve ara değerli
+(doğrusal, açılar en kısa yay üzerinden) sorgular ikili arama ile O(log n)'dir.
+``ZamanHizalayici.kare_icin(sira)`` bir karenin yakalandığı andaki tutum ve
+konumu verir; canlıda okuma ve yakalama iş parçacıkları besler, kayıttan
+``kayittan`` ile tlog ve ``VideoKaydedici`` zaman damgası dosyaları okunur.
+"""
+import csv
+import math
+import statistics
+import threading
+import time
+
+import numpy as np
+
+from .gecikme import SaatEslestirici, otopilot_zamani
+from .tekrar import TekrarOynatici
+
+_IKI_PI = 2 * math.pi
+
+# tip: (alanlar, {açısal alan: (periyot, alt sınır)}, mesajdan değerler)
+AKISLAR = {
+    'ATTITUDE': (
+        ("roll", "pitch", "yaw", "rollspeed", "pitchspeed", "yawspeed"),
+        {"roll": (_IKI_PI, -math.pi), "pitch": (_IKI_PI, -math.pi), "yaw": (_IKI_PI, -math.pi)},
+        lambda m: (m.roll, m.pitch, m.yaw, m.rollspeed, m.pitchspeed, m.yawspeed),
+    ),
+    'GPS_RAW_INT': (
+        ("lat", "lon", "alt", "vel", "cog"),
+        {"cog": (360.0, 0.0)},
+        lambda m: (m.lat * 1e-7, m.lon * 1e-7, m.alt * 1e-3, m.vel * 1e-2, m.cog * 1e-2),
+    ),
+}
+
+
+class ZamanDizisi:
+    """Zamana göre sıralı, numpy dizileriyle tutulan örnek akışı.
+
+    Örnekler çoğunlukla sırayla geldiğinden ekleme sona yapılır; geç gelen
+    örnek ikili aramayla yerine konur. ``en_fazla`` doluysa en eski yarı atılır.
+    """
+
+    def __init__(self, alanlar, acilar=None, kapasite=1024, en_fazla=None):
+        self.alanlar = tuple(alanlar)
+        self.en_fazla = en_fazla
+        sutun = {alan: i for i, alan in enumerate(self.alanlar)}
+        self._acilar = {sutun[alan]: aralik for alan, aralik in (acilar or {}).items()}
+        if en_fazla:
+            kapasite = min(kapasite, en_fazla)
+        self._t = np.empty(kapasite)
+        self._v = np.empty((kapasite, len(self.alanlar)))
+        self._n = 0
+        self._kilit = threading.Lock()
+
+    def __len__(self):
+        return self._n
+
+    @property
+    def aralik(self):
+        """(ilk, son) örnek zamanı; boşsa None."""
+        with self._kilit:
+            return (self._t[0], self._t[self._n - 1]) if self._n else None
+
+    def ekle(self, t, degerler):
+        with self._kilit:
+            n = self._n
+            if n == len(self._t):
+                n = self._yer_ac()
+            if n and t < self._t[n - 1]:
+                i = int(np.searchsorted(self._t[:n], t, side="right"))
+                self._t[i + 1:n + 1] = self._t[i:n]
+                self._v[i + 1:n + 1] = self._v[i:n]
+            else:
+                i = n
+            self._t[i] = t
+            self._v[i] = degerler
+            self._n = n + 1
+
+    def _yer_ac(self):
+        n = self._n
+        if self.en_fazla and n >= self.en_fazla:
+            yari = n // 2
+            self._t[:n - yari] = self._t[yari:n]
+            self._v[:n - yari] = self._v[yari:n]
+            self._n = n - yari
+            return self._n
+        kapasite = 2 * n if not self.en_fazla else min(2 * n, self.en_fazla)
+        t, v = np.empty(kapasite), np.empty((kapasite, len(self.alanlar)))
+        t[:n], v[:n] = self._t[:n], self._v[:n]
+        self._t, self._v = t, v
+        return n
+
+    def _ornek(self, t, degerler):
+        ornek = dict(zip(self.alanlar, (float(d) for d in degerler)))
+        ornek["zaman"] = float(t)
+        return ornek
+
+    def en_yakin(self, t, tolerans=None):
+        """``t``'ye en yakın örnek; ``tolerans`` saniyeden uzaksa None."""
+        with self._kilit:
+            n = self._n
+            if not n:
+                return None
+            i = int(np.searchsorted(self._t[:n], t))
+            if i == n or (i > 0 and t - self._t[i - 1] <= self._t[i] - t):
+                i -= 1
+            if tolerans is not None and abs(self._t[i] - t) > tolerans:
+                return None
+            return self._ornek(self._t[i], self._v[i])
+
+    def ara_deger(self, t, tolerans=None):
+        """``t`` anının iki komşu örnekten doğrusal ara değeri.
+
+        ``t`` kaydın dışındaysa ``tolerans`` içindeki uç örnek döner. Komşular
+        ``tolerans``'tan uzaksa (bağlantı kopmuş) en yakın örneğe düşülür.
+        """
+        with self._kilit:
+            n = self._n
+            if not n:
+                return None
+            i = int(np.searchsorted(self._t[:n], t))
+            if 0 < i < n:
+                t0, t1 = self._t[i - 1], self._t[i]
+                if tolerans is None or t1 - t0 <= 2 * tolerans:
+                    oran = (t - t0) / (t1 - t0) if t1 > t0 else 0.0
+                    a, b = self._v[i - 1], self._v[i]
+                    degerler = a + oran * (b - a)
+                    for sutun, (periyot, alt) in self._acilar.items():
+                        fark = (b[sutun] - a[sutun] + periyot / 2) % periyot - periyot / 2
+                        degerler[sutun] = (a[sutun] + oran * fark - alt) % periyot + alt
+                    return self._ornek(t, degerler)
+        return self.en_yakin(t, tolerans)
+
+    def toplu_ara_deger(self, zamanlar):
+        """Çok sayıda an için ara değerler; (len(zamanlar), alan) dizisi.
+
+        Kaydın dışında kalan satırlar NaN'dır. Açısal alanlar açılıp
+        (``np.unwrap``) ara değer alındıktan sonra yeniden sarılır.
+        """
+        zamanlar = np.asarray(zamanlar, dtype=float)
+        with self._kilit:
+            t, v = self._t[:self._n].copy(), self._v[:self._n].copy()
+        sonuc = np.full((len(zamanlar), len(self.alanlar)), np.nan)
+        if not len(t):
+            return sonuc
+        for sutun in range(len(self.alanlar)):
+            aci = self._acilar.get(sutun)
+            if aci is None:
+                sonuc[:, sutun] = np.interp(zamanlar, t, v[:, sutun], left=np.nan, right=np.nan)
+            else:
+                periyot, alt = aci
+                acik = np.unwrap(v[:, sutun], period=periyot)
+                sonuc[:, sutun] = (np.interp(zamanlar, t, acik, left=np.nan, right=np.nan) - alt) % periyot + alt
+        return sonuc
+
+    def zaman_bul(self, alan, deger):
+        """Zamanla birlikte artan ``alan`` sütununda ``deger``'in zamanı; yoksa None."""
+        sutun = self.alanlar.index(alan)
+        with self._kilit:
+            n = self._n
+            i = int(np.searchsorted(self._v[:n, sutun], deger))
+            if i < n and self._v[i, sutun] == deger:
+                return float(self._t[i])
+        return None
+
+
+class ZamanHizalayici:
+    """Kamera karelerini ve telemetri akışlarını tek monotonik saatte tutar."""
+
+    def __init__(self, tipler=tuple(AKISLAR), en_fazla=None, saat_penceresi=30.0, en_fazla_cozum=1.0):
+        self.kareler = ZamanDizisi(("sira",), en_fazla=en_fazla)
+        self.akislar = {}
+        for tip in tipler:
+            alanlar, acilar, _ = AKISLAR[tip]
+            self.akislar[tip] = ZamanDizisi(alanlar, acilar, en_fazla=en_fazla)
+        self.en_fazla_cozum = en_fazla_cozum
+        self.saat = SaatEslestirici(saat_penceresi)
+        # Duvar saatinden monotonik saate fark
+        self.saat_farki = time.monotonic() - time.time()
+
+    def abone_ol(self, merkez):
+        """Canlı kullanım: ``merkez``'in ilgili mesajlarını indekse ekler."""
+        return merkez.abone_ol(self.mesaj_ekle, tipler=tuple(self.akislar), ad="Zaman hizalama")
+
+    def _duzelt(self, msg, t_alim):
+        """Alış zamanından otopilot saatine göre titremeyi çıkarır (duvar saati)."""
+        t_ucus = otopilot_zamani(msg)
+        if t_ucus is None:
+            return t_alim
+        return t_alim - self.saat.ek_gecikme((msg.get_srcSystem(), msg.get_type()), t_ucus, t_alim)
+
+    def mesaj_ekle(self, msg, zaman=None):
+        """Mesajı akışına ekler; ``zaman`` verilmezse alış zamanından hesaplanır."""
+        akis = self.akislar.get(msg.get_type())
+        if akis is None:
+            return
+        if zaman is None:
+            simdi = time.time()
+            t_alim = getattr(msg, "_timestamp", None) or simdi
+            if not 0.0 <= simdi - t_alim <= self.en_fazla_cozum:
+                t_alim = simdi  # Kayıttan oynatılan mesaj
+            zaman = self._duzelt(msg, t_alim) + self.saat_farki
+        akis.ekle(zaman, AKISLAR[msg.get_type()][2](msg))
+
+    def kare_ekle(self, kare):
+        """Yakalama iş parçacığında her ``kamera_hatti.Kare`` için çağrılır."""
+        self.kareler.ekle(kare.zaman, (kare.sira,))
+
+    def kare_zamani(self, sira):
+        return self.kareler.zaman_bul("sira", sira)
+
+    def zaman_icin(self, t, ara=True, tolerans=0.5):
+        """{tip: örnek veya None} — ``t`` anındaki telemetri."""
+        return {
+            tip: akis.ara_deger(t, tolerans) if ara else akis.en_yakin(t, tolerans)
+            for tip, akis in self.akislar.items()
+        }
+
+    def kare_icin(self, sira, ara=True, tolerans=0.5):
+        """``sira`` numaralı karenin yakalandığı andaki telemetri; kare bilinmiyorsa None."""
+        t = self.kare_zamani(sira)
+        if t is None:
+            return None
+        sonuc = self.zaman_icin(t, ara, tolerans)
+        sonuc["zaman"] = t
+        return sonuc
+
+    @classmethod
+    def kayittan(cls, tlog, yan_dosyalar=(), tipler=tuple(AKISLAR)):
+        """Kayıtlı oturumdan indeks kurar.
+
+        ``yan_dosyalar`` ``VideoKaydedici``'nin parça başına yazdığı CSV'lerdir;
+        tlog'un duvar saati bu dosyalardaki unix/monotonik farkıyla karelerin
+        saatine çevrilir.
+        """
+        hizalayici = cls(tipler)
+        farklar = []
+        for yan in yan_dosyalar:
+            with open(yan, encoding="utf-8") as f:
+                for satir in csv.DictReader(f):
+                    monotonik = float(satir["monotonik_s"])
+                    hizalayici.kareler.ekle(monotonik, (int(satir["sira"]),))
+                    farklar.append(monotonik - float(satir["unix_s"]))
+        if farklar:
+            hizalayici.saat_farki = statistics.median(farklar)
+
+        oynatici = TekrarOynatici(tlog, hiz=0)
+        while True:
+            msg = oynatici.recv_match(blocking=False)
+            if msg is None:
+                break
+            if msg.get_type() in hizalayici.akislar:
+                zaman = hizalayici._duzelt(msg, msg._timestamp) + hizalayici.saat_farki
+                hizalayici.mesaj_ekle(msg, zaman)
+        return hizalayici
@@ -0,0 +1,163 @@
+"""Gösterge görselleri için süreç çapında paylaşılan varlık deposu.
+
+Göstergeler PNG'lerini çalışma dizinine göre ``QPixmap(...)`` ile yüklüyordu;
+betik başka bir dizinden çalıştırılınca görseller boş çıkıyor, MDI'da her yeni
+pencere aynı dosyaları yeniden çözüyordu. ``varlik(ad)`` görseli bir kez çözer
+ve aynı ``QPixmap``'i (Qt'de örtük paylaşımlı) herkese verir.
+
+Ad önce derlenmiş kaynak paketinde (``:/varliklar/<ad>``), yoksa bu modülün
+klasöründe aranır. Paket ``python varliklar.py`` ile ``varliklar_rc.py``
+olarak derlenir; içe aktarılınca görseller süreç belleğinden okunur, açılışta
+dosya başına disk okuması olmaz. Qt ``rcc -binary`` ile üretilmiş ``.rcc``
+dosyaları da ``paket_yukle`` ile kaydedilebilir.
+
+``QPixmap`` yalnızca GUI iş parçacığında oluşturulabilir; depo da yalnızca
+orada kullanılmalıdır.
+"""
+import importlib
+import os
+import sys
+import time
+
+from PyQt5.QtCore import QFile, QResource
+from PyQt5.QtGui import QPixmap
+
+VARLIK_DIZINI = os.path.dirname(os.path.abspath(__file__))
+KAYNAK_ONEKI = "/varliklar"
+
+# Pakete girecek görseller; depoda olmayanlar derlemede atlanır
+VARLIKLAR = (
+    "AirSpeedIndicator_Background.PNG",
+    "AirSpeedNeedle.PNG",
+    "VerticalSpeedIndicator_Background.PNG",
+    "VerticalSpeedNeedle.PNG",
+    "TurnCoordinator_Background2.png",
+    "TurnCoordinatorMarks.png",
+    "TurnCoordinatorBall,png.PNG",
+    "DJV JUL 2357-12.png",
+    "Dedector.PNG",
+    "logo.png",
+    "plane.png",
+)
+
+
+class VarlikDeposu:
+    """Adla anahtarlanmış ``QPixmap`` önbelleği ve yükleme ölçümleri."""
+
+    def __init__(self, dizin=VARLIK_DIZINI, onek=KAYNAK_ONEKI):
+        self.dizin = dizin
+        self.onek = onek
+        self.paketler = []
+        self._pixmapler = {}
+        self._olcumler = {}
+
+    def paket_yukle(self, paket=None):
+        """Kaynak paketini kaydeder; yoksa False döner.
+
+        ``paket`` bir ``.rcc`` dosyası ya da içe aktarılacak modül adıdır;
+        verilmezse ``varliklar_rc`` modülü denenir.
+        """
+        paket = paket or "varliklar_rc"
+        if paket.endswith(".rcc"):
+            yol = paket if os.path.isabs(paket) else os.path.join(self.dizin, paket)
+            if not QResource.registerResource(yol):
+                return False
+        else:
+            try:
+                importlib.import_module(paket)
+            except ImportError:
+                return False
+        self.paketler.append(paket)
+        return True
+
+    def yol(self, ad):
+        """Görselin Qt'nin açabileceği yolu: paketteyse ``:/...``, değilse dosya."""
+        kaynak = f":{self.onek}/{ad}"
+        if self.paketler and QFile.exists(kaynak):
+            return kaynak
+        return self.dosya_yolu(ad)
+
+    def dosya_yolu(self, ad):
+        """Paketten bağımsız disk yolu (ör. folium'un okuyacağı ikon)."""
+        return os.path.join(self.dizin, ad)
+
+    def pixmap(self, ad):
+        pixmap = self._pixmapler.get(ad)
+        if pixmap is not None:
+            self._olcumler[ad]["istek"] += 1
+            return pixmap
+        yol = self.yol(ad)
+        baslangic = time.perf_counter()
+        pixmap = QPixmap(yol)
+        sure = time.perf_counter() - baslangic
+        self._pixmapler[ad] = pixmap
+        self._olcumler[ad] = {
+            "kaynak": "yok" if pixmap.isNull() else ("paket" if yol.startswith(":") else "disk"),
+            "yukleme_ms": round(1000 * sure, 3),
+            "boyut": f"{pixmap.width()}x{pixmap.height()}",
+            "bellek_kb": round(pixmap.width() * pixmap.height() * pixmap.depth() / 8 / 1024, 1),
+            "istek": 1,
+        }
+        if pixmap.isNull():
+            print(f"Varlık bulunamadı: {ad}", file=sys.stderr)
+        return pixmap
+
+    def hazirla(self, adlar=VARLIKLAR):
+        """Görselleri önceden çözer (ör. açılış ekranında)."""
+        for ad in adlar:
+            self.pixmap(ad)
+
+    def istatistik(self):
+        olcumler = self._olcumler.values()
+        return {
+            "varlik": len(self._olcumler),
+            "istek": sum(o["istek"] for o in olcumler),
+            "disk": sum(o["kaynak"] == "disk" for o in olcumler),
+            "paket": sum(o["kaynak"] == "paket" for o in olcumler),
+            "eksik": sum(o["kaynak"] == "yok" for o in olcumler),
+            "yukleme_ms": round(sum(o["yukleme_ms"] for o in olcumler), 3),
+            "bellek_kb": round(sum(o["bellek_kb"] for o in olcumler), 1),
+        }
+
+    def rapor(self):
+        """Varlık başına ölçümler ve toplam, okunabilir metin olarak."""
+        satirlar = [f"{ad}: " + ", ".join(f"{k}={v}" for k, v in olcum.items())
+                    for ad, olcum in sorted(self._olcumler.items())]
+        satirlar.append("toplam: " + ", ".join(f"{k}={v}" for k, v in self.istatistik().items()))
+        return "\n".join(satirlar)
+
+
+depo = VarlikDeposu()
+
+
+def varlik(ad):
+    """Paylaşılan depodan görsel; ilk çağrıda çözülür."""
+    return depo.pixmap(ad)
+
+
+def qrc_yaz(dosya, dizin=VARLIK_DIZINI, adlar=VARLIKLAR, onek=KAYNAK_ONEKI):
+    """Dizinde bulunan varlıklar için bir ``.qrc`` yazar; eklenen adları döndürür."""
+    mevcut = [ad for ad in adlar if os.path.exists(os.path.join(dizin, ad))]
+    with open(dosya, "w", encoding="utf-8") as f:
+        f.write(f'<!DOCTYPE RCC><RCC version="1.0">\n<qresource prefix="{onek}">\n')
+        for ad in mevcut:
+            f.write(f"    <file>{ad}</file>\n")
+        f.write("</qresource>\n</RCC>\n")
+    return mevcut
+
+
+def paket_derle(cikti=None, dizin=VARLIK_DIZINI):
+    """Varlıkları ``pyrcc5`` ile ``varliklar_rc.py`` modülüne derler."""
+    from PyQt5.pyrcc_main import processResourceFile
+    qrc = os.path.join(dizin, "varliklar.qrc")
+    adlar = qrc_yaz(qrc, dizin)
+    cikti = cikti or os.path.join(dizin, "varliklar_rc.py")
+    if not processResourceFile([qrc], cikti, False):
+        raise RuntimeError(f"{qrc} derlenemedi")
+    return cikti, adlar
+
+
+if __name__ == "__main__":
+    # python varliklar.py [çıktı.py]: görselleri tek bir kaynak modülünde toplar
+    cikti, adlar = paket_derle(sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"{cikti}: {len(adlar)} varlık ({', '.join(adlar)})")
@@ -0,0 +1,154 @@
+"""Kamera görüntüsünü arka planda diske yazan video kaydedici.
+
+Yakalama iş parçacığı ``kaydet`` ile kareyi kaydedicinin kendi sabit sayıdaki
+tamponlarından birine kopyalar ve kuyruğa ekler; boş tampon yoksa (disk
+yetişemiyorsa) kare kayda alınmaz, yakalama hiçbir zaman beklemez. Yazma
+``cv2.VideoWriter`` ile ayrı bir iş parçacığında yapılır.
+
+Kayıt ``segment_s`` saniyelik parçalara bölünür
+(``kamera_YYYYmmdd_HHMMSS_000.avi``, ``_001.avi`` ...). Her parçanın yanında,
+telemetri kaydıyla (tlog) eşlemek için kare başına zaman damgalarını tutan
+aynı adlı bir ``.csv`` dosyası bulunur::
+
+    kare,sira,unix_s,monotonik_s
+
+``kare`` parçadaki kare numarası, ``sira`` kameranın yakalama sırası,
+``unix_s`` tlog'daki alış zamanlarıyla aynı saattir.
+"""
+import os
+import queue
+import threading
+import time
+
+import cv2
+import numpy as np
+
+_BITTI = object()
+# Çalışma dizininden bağımsız: modülün yanında
+KAYIT_DIZINI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "kayitlar")
+
+
+class VideoKaydedici:
+    """Kamera karelerini parçalara bölerek video dosyalarına yazar."""
+
+    def __init__(self, dizin=KAYIT_DIZINI, onek="kamera", fps=30.0, segment_s=300.0,
+                 tampon=16, fourcc="MJPG", uzanti=".avi"):
+        self.dizin = dizin
+        self.onek = onek
+        self.fps = fps
+        self.segment_s = segment_s
+        self.tampon = tampon
+        self.fourcc = cv2.VideoWriter_fourcc(*fourcc)
+        self.uzanti = uzanti
+        self.kaydedilen = 0
+        self.dusurulen = 0
+        self.en_uzun_yazma = 0.0
+        self.segmentler = []
+        self._bos = []
+        self._ayrilan = 0
+        self._kilit = threading.Lock()
+        self._kuyruk = queue.SimpleQueue()
+        self._thread = None
+        self._taban = None
+        self._yazici = None
+        self._yan_dosya = None
+        self._segment_kare = 0
+        self._segment_baslangic = 0.0
+        self._segment_sekil = None
+
+    def baslat(self):
+        os.makedirs(self.dizin, exist_ok=True)
+        self._taban = os.path.join(self.dizin, time.strftime(f"{self.onek}_%Y%m%d_%H%M%S"))
+        self._thread = threading.Thread(target=self._yaz, name="VideoKaydedici", daemon=True)
+        self._thread.start()
+        print(f"Video kaydı: {self._taban}_*{self.uzanti}")
+        return self
+
+    @property
+    def calisiyor(self):
+        return self._thread is not None
+
+    def kaydet(self, kare):
+        """Yakalama iş parçacığında çağrılır; kareyi kopyalayıp kuyruğa ekler.
+
+        ``kare`` bir ``kamera_hatti.Kare``'dir; kopyalandığı için çağıran kareyi
+        hemen gösterime ya da havuza verebilir.
+        """
+        if self._thread is None:
+            return False
+        dizi = kare.dizi
+        with self._kilit:
+            if self._bos:
+                tampon = self._bos.pop()
+            elif self._ayrilan < self.tampon:
+                tampon = None
+                self._ayrilan += 1
+            else:
+                # Bütün tamponlar kuyrukta: disk geride, kare kayda alınmaz
+                self.dusurulen += 1
+                return False
+        if tampon is None or tampon.shape != dizi.shape:
+            tampon = np.empty_like(dizi)
+        np.copyto(tampon, dizi)
+        # Kare monotonik saatle damgalanır; tlog ile eşleşmesi için duvar saatine çevrilir
+        unix = time.time() - (time.monotonic() - kare.zaman)
+        self._kuyruk.put((tampon, kare.sira, unix, kare.zaman))
+        return True
+
+    def durdur(self):
+        if self._thread is not None:
+            self._kuyruk.put(_BITTI)
+            self._thread.join()
+            self._thread = None
+
+    def istatistik(self):
+        return {
+            "kaydedilen": self.kaydedilen,
+            "dusurulen": self.dusurulen,
+            "kuyruk": self._kuyruk.qsize(),
+            "segment": len(self.segmentler),
+            "en_uzun_yazma_ms": round(1000 * self.en_uzun_yazma, 1),
+        }
+
+    def _segment_ac(self, sekil, baslangic):
+        yukseklik, genislik = sekil[:2]
+        yol = f"{self._taban}_{len(self.segmentler):03d}{self.uzanti}"
+        self._yazici = cv2.VideoWriter(yol, self.fourcc, self.fps, (genislik, yukseklik))
+        if not self._yazici.isOpened():
+            raise OSError(f"Video dosyası açılamadı: {yol}")
+        self._yan_dosya = open(os.path.splitext(yol)[0] + ".csv", "w", encoding="utf-8")
+        self._yan_dosya.write("kare,sira,unix_s,monotonik_s\n")
+        self.segmentler.append(yol)
+        self._segment_kare = 0
+        self._segment_baslangic = baslangic
+        self._segment_sekil = sekil
+
+    def _segment_kapat(self):
+        if self._yazici is not None:
+            self._yazici.release()
+            self._yan_dosya.close()
+            self._yazici = self._yan_dosya = None
+
+    def _yaz(self):
+        try:
+            while True:
+                oge = self._kuyruk.get()
+                if oge is _BITTI:
+                    break
+                tampon, sira, unix, monotonik = oge
+                if self._yazici is not None and (
+                        tampon.shape != self._segment_sekil
+                        or monotonik - self._segment_baslangic >= self.segment_s):
+                    self._segment_kapat()
+                if self._yazici is None:
+                    self._segment_ac(tampon.shape, monotonik)
+                baslangic = time.perf_counter()
+                self._yazici.write(tampon)
+                self.en_uzun_yazma = max(self.en_uzun_yazma, time.perf_counter() - baslangic)
+                self._yan_dosya.write(f"{self._segment_kare},{sira},{unix:.6f},{monotonik:.6f}\n")
+                self._segment_kare += 1
+                self.kaydedilen += 1
+                with self._kilit:
+                    self._bos.append(tampon)
+        finally:
+            self._segment_kapat()
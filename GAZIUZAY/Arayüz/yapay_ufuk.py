@@ -0,0 +1,178 @@
+"""QPainter ile çizilen yapay ufuk göstergesi.
+
+Eski gösterge 2000x6608'lik bir bitmap'i (çözülmüş hali ~50 MB) yükleyip her
+ATTITUDE güncellemesinde bütünüyle döndürüp kaydırıyordu. Burada gökyüzü, yer,
+yunuslama merdiveni ve yatış ölçeği pencere boyutunda doğrudan çizilir:
+
+* gökyüzü ve yer yalnızca görünen daireyi kaplayan iki dikdörtgendir,
+* merdiven bir kez kurulan çizgiler ile ``QStaticText`` etiketleridir; her
+  karede yalnızca dönüşüm değişir, görünmeyen basamaklar atlanır. Etiketler
+  döndürülmeden, merdiven çizgisiyle dönen noktalarına ortalanarak yazılır;
+  döndürülmüş metin glif önbelleğini kullanamaz ve karenin en pahalı kısmıdır,
+* yatış ölçeği, uçak sembolü ve merkez artısı boyut değişene kadar saydam bir
+  ``QPixmap`` önbelleğinde durur; her karede yalnızca dolu kısmı kopyalanır.
+
+Açılar ``PixhawkThread``'in yaydığı birimdedir (radyan x 60, yaklaşık derece);
+``derece_piksel`` eski bitmap'in ölçeğiyle aynıdır.
+"""
+import math
+
+from PyQt5.QtCore import QLineF, QPointF, QRectF, QSize, Qt
+from PyQt5.QtGui import QColor, QFont, QPainter, QPen, QPixmap, QPolygonF, QStaticText
+from PyQt5.QtWidgets import QWidget
+
+GOK = QColor(58, 130, 206)
+YER = QColor(140, 90, 40)
+CIZGI = QColor(255, 255, 255)
+SEMBOL = QColor(255, 210, 0)
+YATIS_ISARETLERI = (0, 10, 20, 30, 45, 60)
+
+
+class UfukCizici:
+    """Yapay ufku verilen boyutta bir ``QPainter``'a çizer; widget'tan bağımsızdır."""
+
+    def __init__(self, derece_piksel=12.8, merdiven_adim=5, merdiven_siniri=90):
+        self.derece_piksel = derece_piksel
+        self.merdiven_adim = merdiven_adim
+        self.merdiven_siniri = merdiven_siniri
+        self._yazi = QFont("Sans", 8)
+        self._merdiven, self._etiketler = self._merdiven_kur()
+        self._ortu = None
+        self._ortu_alani = QRectF()
+        self._ortu_anahtari = None
+
+    def _merdiven_kur(self):
+        cizgiler = []
+        etiketler = []
+        for derece in range(-self.merdiven_siniri, self.merdiven_siniri + 1, self.merdiven_adim):
+            if derece == 0:
+                continue
+            y = -derece * self.derece_piksel
+            yari = 40 if derece % 10 == 0 else 20
+            cizgiler.append((y, QLineF(-yari, y, yari, y)))
+            if derece % 10 == 0:
+                metin = QStaticText(str(abs(derece)))
+                metin.prepare(font=self._yazi)
+                etiketler.append((y, yari, metin))
+        return cizgiler, etiketler
+
+    def _ortu_kur(self, genislik, yukseklik, oran):
+        """Yatış ölçeği, uçak sembolü ve merkez artısı (ekrana sabit katman)."""
+        ortu = QPixmap(QSize(round(genislik * oran), round(yukseklik * oran)))
+        ortu.setDevicePixelRatio(oran)
+        ortu.fill(Qt.transparent)
+        p = QPainter(ortu)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.translate(genislik / 2, yukseklik / 2)
+        yaricap = self.yatis_yaricapi(genislik, yukseklik)
+
+        p.setPen(QPen(CIZGI, 2))
+        p.drawArc(QRectF(-yaricap, -yaricap, 2 * yaricap, 2 * yaricap), 30 * 16, 120 * 16)
+        for aci in YATIS_ISARETLERI:
+            uzunluk = 12 if aci in (0, 30, 60) else 7
+            for isaret in ((1, -1) if aci else (1,)):
+                p.save()
+                p.rotate(isaret * aci)
+                p.drawLine(QPointF(0, -yaricap), QPointF(0, -yaricap - uzunluk))
+                p.restore()
+
+        # Uçak sembolü: iki kanat ve merkez noktası
+        p.setPen(QPen(SEMBOL, 4, Qt.SolidLine, Qt.RoundCap))
+        p.drawLine(QPointF(-70, 0), QPointF(-25, 0))
+        p.drawLine(QPointF(-25, 0), QPointF(-25, 8))
+        p.drawLine(QPointF(25, 0), QPointF(70, 0))
+        p.drawLine(QPointF(25, 0), QPointF(25, 8))
+        # Eski göstergedeki kırmızı merkez artısı
+        p.setPen(QPen(QColor("red"), 2))
+        p.drawLine(QPointF(-20, 0), QPointF(20, 0))
+        p.drawLine(QPointF(0, -20), QPointF(0, 20))
+        p.end()
+        kenar = yaricap + 14
+        alan = QRectF(-max(kenar, 72), -kenar, 2 * max(kenar, 72), kenar + 22)
+        return ortu, alan.translated(genislik / 2, yukseklik / 2) & QRectF(0, 0, genislik, yukseklik)
+
+    @staticmethod
+    def yatis_yaricapi(genislik, yukseklik):
+        return 0.42 * min(genislik, yukseklik)
+
+    def ciz(self, painter, genislik, yukseklik, pitch, roll):
+        oran = painter.device().devicePixelRatioF()
+        anahtar = (genislik, yukseklik, oran)
+        if anahtar != self._ortu_anahtari:
+            self._ortu, self._ortu_alani = self._ortu_kur(genislik, yukseklik, oran)
+            self._ortu_anahtari = anahtar
+
+        painter.save()
+        painter.translate(genislik / 2, yukseklik / 2)
+        painter.rotate(-roll)
+
+        # Yerel koordinatta ekran merkezi (0, -kayma)'dadır; görünen alan R yarıçaplı daire
+        kayma = pitch * self.derece_piksel
+        r = math.hypot(genislik, yukseklik) / 2 + 2
+        ust, alt = -kayma - r, -kayma + r
+        painter.save()
+        painter.translate(0, kayma)
+        if ust < 0:
+            painter.fillRect(QRectF(-r, ust, 2 * r, min(0.0, alt) - ust), GOK)
+        if alt > 0:
+            painter.fillRect(QRectF(-r, max(0.0, ust), 2 * r, alt - max(0.0, ust)), YER)
+        # Dolgu kenarları ekran dışında ya da ufuk çizgisinin altında kalır; yumuşatma yalnızca çizgilere
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(CIZGI, 2))
+        if ust < 0 < alt:
+            painter.drawLine(QPointF(-r, 0), QPointF(r, 0))
+        painter.setPen(QPen(CIZGI, 1.5))
+        painter.drawLines([cizgi for y, cizgi in self._merdiven if ust < y < alt])
+        donusum = painter.transform()
+        painter.restore()
+
+        painter.save()
+        painter.resetTransform()
+        painter.setFont(self._yazi)
+        painter.setPen(CIZGI)
+        for y, yari, metin in self._etiketler:
+            if ust < y < alt:
+                boyut = metin.size()
+                for x in (yari + 4 + boyut.width() / 2, -yari - 4 - boyut.width() / 2):
+                    merkez = donusum.map(QPointF(x, y))
+                    painter.drawStaticText(
+                        QPointF(merkez.x() - boyut.width() / 2, merkez.y() - boyut.height() / 2), metin)
+        painter.restore()
+
+        # Yatış göstergesi ufukla birlikte döner, ölçek ekrana sabittir
+        yaricap = self.yatis_yaricapi(genislik, yukseklik)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(SEMBOL)
+        painter.drawPolygon(QPolygonF([
+            QPointF(0, -yaricap + 1), QPointF(-7, -yaricap + 13), QPointF(7, -yaricap + 13)]))
+        painter.restore()
+
+        alan = self._ortu_alani
+        painter.drawPixmap(alan, self._ortu, QRectF(
+            alan.x() * oran, alan.y() * oran, alan.width() * oran, alan.height() * oran))
+
+
+class YapayUfuk(QWidget):
+    """``UfukCizici`` ile çizilen yapay ufuk; ``yatay_guncelleme(pitch, roll)`` ile beslenir."""
+
+    def __init__(self, parent=None, cizici=None):
+        super().__init__(parent)
+        self.cizici = cizici or UfukCizici()
+        self.pitch = 0.0
+        self.roll = 0.0
+        # Her karede bütün alan boyanır; arka planın silinmesine gerek yok
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+    def sizeHint(self):
+        return QSize(400, 300)
+
+    def yatay_guncelleme(self, pitch, roll):
+        if pitch == self.pitch and roll == self.roll:
+            return
+        self.pitch, self.roll = pitch, roll
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        self.cizici.ciz(painter, self.width(), self.height(), self.pitch, self.roll)
+        painter.end()